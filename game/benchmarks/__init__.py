@@ -0,0 +1,7 @@
+"""
+Benchmarks package - Throughput and memory measurements of the simulated year
+
+The benchmarks are in game.benchmarks.throughput and game.benchmarks.startup.
+They are not imported here, so that running either as a module
+(python -m game.benchmarks.throughput) does not import it twice.
+"""
@@ -0,0 +1,7 @@
+"""
+Runs the throughput benchmarks: python -m game.benchmarks
+"""
+import sys
+from game.benchmarks.throughput import main
+
+sys.exit(main())
@@ -0,0 +1,165 @@
+"""
+Startup Benchmark - Reports import times and the time to a ready game, each in a fresh interpreter
+"""
+import json
+import os
+import subprocess
+import sys
+
+# Modules whose import cost is reported
+IMPORT_TARGETS = ["main", "game.game_manager", "game.simulation", "game.ui.gui_interface"]
+
+# Measures a headless game from a cold interpreter up to its first year
+HEADLESS_SCRIPT = """
+import sys, time
+start = time.perf_counter()
+from game.simulation.headless import HeadlessSimulation
+simulation = HeadlessSimulation(seed=0)
+simulation.game_manager.setup_new_game("Startup", "male", "merchant")
+ready = time.perf_counter() - start
+print(ready)
+print(sorted(name for name in sys.modules if name.startswith("game.")))
+print("pygame" in sys.modules)
+"""
+
+# Measures the GUI from a cold interpreter up to its first drawn frame
+GUI_SCRIPT = """
+import time
+start = time.perf_counter()
+from game.ui.gui_interface import GUIInterface
+interface = GUIInterface()
+interface.clear_screen()
+print(time.perf_counter() - start)
+"""
+
+def _run_python(args, env=None):
+    """Run a fresh interpreter in the repository root.
+
+    Args:
+        args: The arguments after the interpreter.
+        env: Extra environment variables (optional).
+
+    Returns:
+        The completed process.
+    """
+    root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    run_env = dict(os.environ)
+    run_env["PYTHONPATH"] = root + os.pathsep + run_env.get("PYTHONPATH", "")
+    run_env.update(env or {})
+    return subprocess.run([sys.executable] + args, cwd=root, env=run_env,
+                          capture_output=True, text=True)
+
+def measure_import(module, repeats=3):
+    """Measure the cumulative import time of a module in fresh interpreters.
+
+    Args:
+        module: The module name.
+        repeats: The number of interpreters to try; the fastest counts.
+
+    Returns:
+        A dictionary with the import time in milliseconds and the slowest
+        modules it pulled in, or an error if the import failed.
+    """
+    best = None
+    for _ in range(repeats):
+        result = _run_python(["-X", "importtime", "-c", f"import {module}"])
+        if result.returncode != 0:
+            return {"module": module, "error": result.stderr.strip().splitlines()[-1]}
+
+        # Lines look like: "import time:  self [us] | cumulative | imported package"
+        entries = []
+        for line in result.stderr.splitlines():
+            if not line.startswith("import time:") or "self [us]" in line:
+                continue
+            _, self_us, cumulative_us, name = [part.strip() for part in line.replace("import time:", "|", 1).split("|")]
+            entries.append((name, int(self_us), int(cumulative_us)))
+
+        total = next(cumulative for name, _, cumulative in reversed(entries) if name == module)
+        if best is None or total < best["total_us"]:
+            slowest = sorted(entries, key=lambda entry: entry[1], reverse=True)[:5]
+            best = {"total_us": total, "slowest": [{"module": name, "self_ms": self_us / 1000}
+                                                    for name, self_us, _ in slowest]}
+
+    return {"module": module, "import_ms": best["total_us"] / 1000, "slowest": best["slowest"]}
+
+def measure_headless(repeats=3):
+    """Measure the time from a cold interpreter to a headless game ready to play.
+
+    Args:
+        repeats: The number of interpreters to try; the fastest counts.
+
+    Returns:
+        A dictionary with the time in milliseconds and the modules loaded.
+    """
+    best = None
+    for _ in range(repeats):
+        result = _run_python(["-c", HEADLESS_SCRIPT])
+        if result.returncode != 0:
+            return {"error": result.stderr.strip().splitlines()[-1]}
+        ready, modules, pygame_loaded = result.stdout.strip().splitlines()
+        if best is None or float(ready) < best["ready_ms"] / 1000:
+            best = {
+                "ready_ms": float(ready) * 1000,
+                "game_modules_loaded": len(eval(modules)),
+                "pygame_loaded": pygame_loaded == "True"
+            }
+    return best
+
+def measure_gui(repeats=3):
+    """Measure the time from a cold interpreter to the first GUI frame.
+
+    Uses SDL's dummy video driver so no window is needed.
+
+    Args:
+        repeats: The number of interpreters to try; the fastest counts.
+
+    Returns:
+        A dictionary with the time in milliseconds, or an error if pygame is missing.
+    """
+    best = None
+    for _ in range(repeats):
+        result = _run_python(["-c", GUI_SCRIPT], env={"SDL_VIDEODRIVER": "dummy", "SDL_AUDIODRIVER": "dummy"})
+        if result.returncode != 0:
+            return {"error": result.stderr.strip().splitlines()[-1]}
+        elapsed = float(result.stdout.strip().splitlines()[-1]) * 1000
+        best = elapsed if best is None else min(best, elapsed)
+    return {"first_frame_ms": best}
+
+def make_report(repeats=3):
+    """Measure everything and build the startup report.
+
+    Args:
+        repeats: The number of interpreters per measurement.
+
+    Returns:
+        A dictionary ready to be written as JSON.
+    """
+    return {
+        "python": sys.version.split()[0],
+        "imports": [measure_import(module, repeats) for module in IMPORT_TARGETS],
+        "headless": measure_headless(repeats),
+        "gui": measure_gui(repeats)
+    }
+
+def main(argv=None):
+    """Print the startup report as JSON.
+
+    Returns:
+        The process exit code.
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Report import times and time to a ready game.")
+    parser.add_argument("--repeats", type=int, default=3, help="fresh interpreters per measurement")
+    parser.add_argument("--output", default=None, help="file to write the JSON report to")
+    args = parser.parse_args(argv)
+
+    output = json.dumps(make_report(args.repeats), indent=4)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output)
+    print(output)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,411 @@
+"""
+Throughput Benchmark - Measures simulated years per second against population and content size
+"""
+import copy
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+from game.characters.character import Character
+from game.characters.npc_manager import PopulationConfig, PARALLEL_MIN_NPCS
+from game.simulation.headless import HeadlessSimulation
+from game.world.world import Settlement
+
+# The world size a fresh game starts with; each sweep varies one of these
+DEFAULT_SCALE = {"npcs": 30, "settlements": 15, "story_arcs": None, "family": 0, "population": 0}
+
+# The populations compared serially and in worker processes by --compare-workers
+DEFAULT_WORKER_NPCS = [5000, 20000, 60000]
+
+# The values each sweep runs through (None keeps the game's own content)
+DEFAULT_SWEEPS = {
+    "npcs": [30, 100, 300, 1000],
+    "settlements": [15, 50, 150],
+    "story_arcs": [None, 50, 100],
+    "family": [0, 5, 20],
+    "population": [0, 10000, 100000]
+}
+
+@dataclass
+class BenchmarkResult:
+    """The measurements of one benchmark point."""
+    sweep: str
+    value: Optional[int]
+    years: int
+    years_per_second: float
+    peak_memory_kb: Optional[float]
+    phases: Dict[str, float] = field(default_factory=dict)  # Mean seconds per call
+
+    @property
+    def key(self) -> str:
+        """The identifier used to match this point against a baseline."""
+        return f"{self.sweep}={self.value}"
+
+    def to_dict(self) -> Dict[str, object]:
+        """Convert the result to a dictionary."""
+        return {
+            "sweep": self.sweep,
+            "value": self.value,
+            "years": self.years,
+            "years_per_second": self.years_per_second,
+            "peak_memory_kb": self.peak_memory_kb,
+            "phases": self.phases
+        }
+
+def build_game(seed, npcs=30, settlements=15, story_arcs=None, family=0, population=0, workers=None,
+               parallel_min_npcs=PARALLEL_MIN_NPCS):
+    """Create a headless game scaled to the requested size.
+
+    Args:
+        seed: The root seed of the game.
+        npcs: The number of NPCs to keep in the world.
+        settlements: The number of settlements in the world.
+        story_arcs: The number of story arcs available (None keeps the defaults).
+        family: The number of children the player starts with (plus a spouse).
+        population: The size of the columnar background population (0 for none).
+        workers: The worker processes of the yearly NPC update (optional).
+        parallel_min_npcs: The smallest population rolled in the workers.
+
+    Returns:
+        The GameManager, ready for its first year.
+    """
+    population_config = PopulationConfig(target_npcs=npcs, workers=workers, parallel_min_npcs=parallel_min_npcs)
+    simulation = HeadlessSimulation(seed=seed, population_config=population_config)
+    game = simulation.game_manager
+    game.setup_new_game("Benchmark", "male", "merchant")
+
+    _scale_settlements(game, settlements)
+    if story_arcs is not None:
+        _scale_story_arcs(game, story_arcs)
+    _scale_family(game, family)
+    if population:
+        game.npc_manager.enable_population_store(population)
+    return game
+
+def _scale_settlements(game, count):
+    """Add numbered settlements until the world has the requested count."""
+    world = game.world
+    settlement_types = ["city", "town", "village", "hamlet", "castle"]
+    while len(world.settlements) < count:
+        kingdom = world.rng.choice(world.kingdoms)
+        settlement = Settlement(f"Settlement {len(world.settlements) + 1}",
+                                world.rng.choice(settlement_types), kingdom, world.rng)
+        world.settlements.append(settlement)
+        kingdom.add_settlement(settlement)
+
+def _scale_story_arcs(game, count):
+    """Add copies of the existing story arcs until the requested count is reached."""
+    manager = game.story_arc_manager
+    originals = list(manager.story_arcs.values())
+    copy_number = 1
+    while len(manager.story_arcs) < count:
+        for arc in originals:
+            if len(manager.story_arcs) >= count:
+                break
+            clone = copy.deepcopy(arc)
+            clone.arc_id = f"{arc.arc_id}_{copy_number}"
+            clone.rng = manager.rng
+            manager.story_arcs[clone.arc_id] = clone
+        copy_number += 1
+
+def _scale_family(game, count):
+    """Give the player a spouse and the requested number of children."""
+    if count <= 0:
+        return
+
+    player = game.player
+    rng = game.random_streams.get("benchmark")
+    spouse_gender = "female" if player.gender == "male" else "male"
+    player.spouse = Character("Spouse", spouse_gender, player.role, player.birth_year, rng)
+    player.spouse.age = player.age
+
+    for idx in range(count):
+        child = Character(f"Child {idx + 1}", rng.choice(["male", "female"]), "child",
+                          game.game_year - idx % 18, rng)
+        child.age = idx % 18
+        player.children.append(child)
+
+def run_years(game, years):
+    """Advance a game by a number of years, keeping the player alive.
+
+    The player is held at working age and revived on death so every year runs
+    every phase of the pipeline.
+
+    Args:
+        game: The GameManager to advance.
+        years: The number of years to simulate.
+    """
+    player = game.player
+    for _ in range(years):
+        if player.age > 55:
+            player.age = 30
+        game._advance_year()
+        if not player.is_alive():
+            player.health = 100
+            game.game_running = True
+
+def measure(sweep, value, scale, years=50, repeats=3, seed=0, memory=True):
+    """Measure one benchmark point.
+
+    Throughput is the best of several timed runs; peak memory is measured in a
+    separate run because tracing allocations slows the game down.
+
+    Args:
+        sweep: The name of the dimension being varied.
+        value: The value of that dimension.
+        scale: The keyword arguments for build_game.
+        years: The number of years per run.
+        repeats: The number of timed runs.
+        seed: The root seed of every run.
+        memory: Whether to measure peak memory.
+
+    Returns:
+        A BenchmarkResult.
+    """
+    best = None
+    phases = {}
+    for _ in range(repeats):
+        game = build_game(seed, **scale)
+        game.year_pipeline.reset_stats()
+        start = time.perf_counter()
+        run_years(game, years)
+        elapsed = time.perf_counter() - start
+        game.npc_manager.close()
+        if best is None or elapsed < best:
+            best = elapsed
+            phases = {name: stats["mean_time"] for name, stats in game.year_pipeline.get_stats().items()}
+
+    peak_memory_kb = None
+    if memory:
+        tracemalloc.start()
+        try:
+            game = build_game(seed, **scale)
+            run_years(game, years)
+            peak_memory_kb = tracemalloc.get_traced_memory()[1] / 1024
+            game.npc_manager.close()
+        finally:
+            tracemalloc.stop()
+
+    return BenchmarkResult(sweep, value, years, years / best if best else 0.0, peak_memory_kb, phases)
+
+def run_benchmarks(sweeps=None, years=50, repeats=3, seed=0, memory=True, workers=None):
+    """Run every point of every sweep.
+
+    Args:
+        sweeps: A dictionary of sweep name to values (defaults to DEFAULT_SWEEPS).
+        years: The number of years per run.
+        repeats: The number of timed runs per point.
+        seed: The root seed of every run.
+        memory: Whether to measure peak memory.
+        workers: The worker processes of the yearly NPC update at every point (optional).
+
+    Returns:
+        A list of BenchmarkResult instances.
+    """
+    sweeps = sweeps or DEFAULT_SWEEPS
+    results = []
+    for sweep, values in sweeps.items():
+        if sweep not in DEFAULT_SCALE:
+            raise ValueError(f"Unknown sweep '{sweep}'")
+        for value in values:
+            scale = dict(DEFAULT_SCALE, workers=workers)
+            scale[sweep] = value
+            results.append(measure(sweep, value, scale, years, repeats, seed, memory))
+    return results
+
+def _time_npc_years(game, years):
+    """Time the yearly NPC update of a game.
+
+    Returns:
+        A dictionary with the seconds of the first year, which also starts any
+        worker processes, and the mean seconds of the years after it.
+    """
+    npc_manager = game.npc_manager
+    try:
+        start = time.perf_counter()
+        npc_manager.update_for_new_year()
+        first_year = time.perf_counter() - start
+        start = time.perf_counter()
+        for _ in range(years):
+            npc_manager.update_for_new_year()
+        return {"first_year_seconds": first_year, "seconds_per_year": (time.perf_counter() - start) / years}
+    finally:
+        npc_manager.close()
+
+def compare_workers(npc_counts=None, workers=None, years=5, seed=0):
+    """Time the yearly NPC update of populations in this process and in worker processes.
+
+    This is how PARALLEL_MIN_NPCS is chosen for a machine: workers pay off
+    from the smallest population at which they are faster, and stay faster
+    for every larger one. Set PopulationConfig.parallel_min_npcs to it.
+
+    Args:
+        npc_counts: The populations to compare (defaults to DEFAULT_WORKER_NPCS).
+        workers: The number of worker processes (defaults to all cores, and at least 2).
+        years: The number of timed years after the first.
+        seed: The root seed of every game.
+
+    Returns:
+        A dictionary with the worker count, the timings and speedup of every
+        population, and the smallest population from which workers are faster
+        (None if they never are).
+    """
+    workers = workers or max(2, os.cpu_count() or 1)
+    points = []
+    for npcs in npc_counts or DEFAULT_WORKER_NPCS:
+        serial = _time_npc_years(build_game(seed, npcs=npcs), years)
+        parallel = _time_npc_years(build_game(seed, npcs=npcs, workers=workers, parallel_min_npcs=0), years)
+        points.append({
+            "npcs": npcs,
+            "serial": serial,
+            "workers": parallel,
+            "speedup": serial["seconds_per_year"] / parallel["seconds_per_year"]
+        })
+
+    break_even = None
+    for point in sorted(points, key=lambda point: point["npcs"], reverse=True):
+        if point["speedup"] <= 1.0:
+            break
+        break_even = point["npcs"]
+    return {
+        "workers": workers,
+        "cpu_count": os.cpu_count(),
+        "years": years,
+        "points": points,
+        "parallel_min_npcs": break_even
+    }
+
+def compare_with_baseline(results, baseline, tolerance=0.1):
+    """Compare results with a stored baseline.
+
+    Args:
+        results: A list of BenchmarkResult instances.
+        baseline: A report dictionary previously written by make_report.
+        tolerance: The fractional slowdown allowed before a point counts as a regression.
+
+    Returns:
+        A list of comparison dictionaries, one per point found in the baseline.
+    """
+    baseline_points = {f"{point['sweep']}={point['value']}": point for point in baseline.get("results", [])}
+    comparisons = []
+    for result in results:
+        point = baseline_points.get(result.key)
+        if point is None or not point["years_per_second"]:
+            continue
+
+        speedup = result.years_per_second / point["years_per_second"]
+        comparisons.append({
+            "point": result.key,
+            "baseline_years_per_second": point["years_per_second"],
+            "years_per_second": result.years_per_second,
+            "speedup": speedup,
+            "baseline_peak_memory_kb": point.get("peak_memory_kb"),
+            "peak_memory_kb": result.peak_memory_kb,
+            "regression": speedup < 1.0 - tolerance
+        })
+    return comparisons
+
+def make_report(results, years, repeats, seed):
+    """Build the machine-readable report of a benchmark run.
+
+    Args:
+        results: A list of BenchmarkResult instances.
+        years: The number of years per run.
+        repeats: The number of timed runs per point.
+        seed: The root seed of every run.
+
+    Returns:
+        A dictionary ready to be written as JSON.
+    """
+    return {
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "years": years,
+        "repeats": repeats,
+        "seed": seed,
+        "results": [result.to_dict() for result in results]
+    }
+
+def _parse_sweeps(specs):
+    """Parse command line sweeps of the form name=1,2,3.
+
+    Raises:
+        ValueError: If a sweep is unknown or has no valid values.
+    """
+    sweeps = {}
+    for spec in specs:
+        name, _, values = spec.partition("=")
+        if name not in DEFAULT_SCALE:
+            raise ValueError(f"unknown sweep '{name}' (choose from {', '.join(DEFAULT_SCALE)})")
+        if not values:
+            raise ValueError(f"sweep '{name}' needs values, e.g. {name}=1,2,3")
+        try:
+            sweeps[name] = [None if value == "default" else int(value) for value in values.split(",")]
+        except ValueError:
+            raise ValueError(f"sweep '{name}' values must be integers or 'default', not '{values}'") from None
+    return sweeps
+
+def main(argv=None):
+    """Run the benchmarks from the command line.
+
+    Returns:
+        The process exit code (1 if any point regressed against the baseline).
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Measure simulated years per second and peak memory.")
+    parser.add_argument("--years", type=int, default=50, help="years per run")
+    parser.add_argument("--repeats", type=int, default=3, help="timed runs per point")
+    parser.add_argument("--seed", type=int, default=0, help="root seed")
+    parser.add_argument("--sweep", nargs="*", default=None,
+                        help="sweeps to run, e.g. npcs=30,300 story_arcs=default,50")
+    parser.add_argument("--no-memory", action="store_true", help="skip peak memory measurement")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="worker processes for the yearly update of large NPC populations")
+    parser.add_argument("--compare-workers", nargs="?", const=",".join(map(str, DEFAULT_WORKER_NPCS)),
+                        default=None, metavar="NPCS",
+                        help="instead of the sweeps, time the yearly NPC update of these populations "
+                             "(e.g. 5000,20000,60000) in this process and in --workers processes")
+    parser.add_argument("--output", default=None, help="file to write the JSON report to")
+    parser.add_argument("--baseline", default=None, help="JSON report to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.1, help="allowed fractional slowdown")
+    args = parser.parse_args(argv)
+
+    if args.compare_workers is not None:
+        try:
+            npc_counts = [int(value) for value in args.compare_workers.split(",")]
+        except ValueError:
+            parser.error(f"--compare-workers takes populations such as 5000,20000, not '{args.compare_workers}'")
+        report = {
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "seed": args.seed,
+            "compare_workers": compare_workers(npc_counts, args.workers, args.years, args.seed)
+        }
+    else:
+        try:
+            sweeps = _parse_sweeps(args.sweep) if args.sweep else None
+        except ValueError as error:
+            parser.error(str(error))
+        results = run_benchmarks(sweeps, args.years, args.repeats, args.seed, not args.no_memory, args.workers)
+        report = make_report(results, args.years, args.repeats, args.seed)
+
+        if args.baseline:
+            with open(args.baseline, "r") as f:
+                report["comparison"] = compare_with_baseline(results, json.load(f), args.tolerance)
+
+    output = json.dumps(report, indent=4)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output)
+    print(output)
+
+    regressions = [point for point in report.get("comparison", []) if point["regression"]]
+    return 1 if regressions else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,15 +2,39 @@
 Character - Base class for all character types in the game
 """
 import random
+from array import array
 from datetime import datetime
+from game.characters.relationship_store import RelationshipStore
 from game.characters.reputation import ReputationManager
+from game.characters.stat_view import StatLayout, StatView
 from game.mechanics.outcome_manager import OutcomeManager
-from game.mechanics.historical_constraints import HistoricalConstraints
+from game.mechanics.historical_constraints import HISTORICAL_CONSTRAINTS
+
+# Every character has these attributes and skills, stored in one small-int
+# array: the attributes first, then the skills
+ATTRIBUTES = StatLayout(("strength", "intelligence", "charisma", "wisdom", "dexterity"))
+SKILLS = StatLayout(("combat", "diplomacy", "stewardship", "trade", "farming", "crafting", "medicine"))
+
+RENEWED_RELATIONSHIP_GAIN = 10  # Level gained by meeting a known NPC again
 
 class Character:
-    """Base class for all characters in the game."""
+    """Base class for all characters in the game.
+    
+    The core fields are slotted and attributes and skills live in one array
+    behind dictionary views, so the many NPCs, spouses and children of a
+    long game stay small. Role subclasses keep an instance dictionary for
+    their own fields.
+    """
+    
+    __slots__ = ("name", "gender", "rng", "_role", "birth_year", "age", "health", "_wealth", "spouse",
+                 "children", "relationships", "traits", "happiness", "location", "reputation",
+                 "_stats", "_extra_skills", "_derived", "_outcome_manager", "marital_status",
+                 "personality_traits", "background", "completed_arcs", "last_action_result")
     
-    def __init__(self, name, gender, role, birth_year=None):
+    # Historical constraints are shared by every character
+    historical_constraints = HISTORICAL_CONSTRAINTS
+    
+    def __init__(self, name, gender, role, birth_year=None, rng=None):
         """Initialize a new character.
         
         Args:
@@ -18,12 +42,13 @@ class Character:
             gender: The character's gender ('male' or 'female').
             role: The character's role (e.g., 'king', 'farmer').
             birth_year: The year the character was born.
+            rng: The random generator for this character (optional, defaults to
+                the global random module).
         """
+        self._derived = None  # Cached derived values, see get_derived
         self.name = name
         self.gender = gender.lower()
-        
-        # Initialize historical constraints
-        self.historical_constraints = HistoricalConstraints()
+        self.rng = rng or random
         
         # Validate role based on gender
         allowed_roles = self.historical_constraints.get_allowed_roles(gender)
@@ -38,35 +63,22 @@ class Character:
         self.wealth = 0  # Will be set by specific role classes
         self.spouse = None
         self.children = []
-        self.relationships = {}  # Person -> Relationship
+        self.relationships = RelationshipStore()  # Relationships with NPCs, by serial number
         self.traits = []  # List of character traits
         self.happiness = 50  # Base happiness level (0-100)
+        self.location = None  # Name of the settlement the character lives in
         
         # Initialize reputation system
         self.reputation = ReputationManager()
         
-        # Initialize outcome manager
-        self.outcome_manager = OutcomeManager()
-        
-        # Base attributes (1-100)
-        self.attributes = {
-            'strength': random.randint(20, 80),
-            'intelligence': random.randint(20, 80),
-            'charisma': random.randint(20, 80),
-            'wisdom': random.randint(20, 80),
-            'dexterity': random.randint(20, 80)
-        }
+        # Outcome manager, created on the first action
+        self._outcome_manager = None
         
-        # Base skills (1-100)
-        self.skills = {
-            'combat': random.randint(10, 50),
-            'diplomacy': random.randint(10, 50),
-            'stewardship': random.randint(10, 50),
-            'trade': random.randint(10, 50),
-            'farming': random.randint(10, 50),
-            'crafting': random.randint(10, 50),
-            'medicine': random.randint(10, 50)
-        }
+        # Base attributes (1-100), then base skills (1-100)
+        randint = self.rng.randint
+        self._stats = array("h", [randint(20, 80) for _ in range(len(ATTRIBUTES))] +
+                                 [randint(10, 50) for _ in range(len(SKILLS))])
+        self._extra_skills = None  # Skills outside SKILLS, e.g. learned on rising in society
         
         # Adjust skills based on role
         self._adjust_skills_for_role()
@@ -77,6 +89,83 @@ class Character:
         # Initialize random traits
         self._initialize_traits()
     
+    @property
+    def attributes(self):
+        """The character's attributes, as a dictionary view."""
+        return StatView(self._stats, ATTRIBUTES, 0, self)
+    
+    @attributes.setter
+    def attributes(self, values):
+        self.attributes.update(values)
+    
+    @property
+    def skills(self):
+        """The character's skills, as a dictionary view."""
+        return StatView(self._stats, SKILLS, len(ATTRIBUTES), self, "_extra_skills")
+    
+    @skills.setter
+    def skills(self, values):
+        self.skills.update(values)
+    
+    @property
+    def role(self):
+        """The character's role (e.g., 'king', 'farmer')."""
+        return self._role
+    
+    @role.setter
+    def role(self, role):
+        self._role = role
+        self.invalidate_derived("status")
+    
+    @property
+    def wealth(self):
+        """The character's wealth in gold."""
+        return self._wealth
+    
+    @wealth.setter
+    def wealth(self, wealth):
+        self._wealth = wealth
+        self.invalidate_derived("status")
+    
+    def get_derived(self, dependency, key, compute):
+        """Get a value derived from the character, computing it only if not cached.
+        
+        Args:
+            dependency: What the value depends on: 'status' for role and
+                wealth, or 'stats' for attributes and skills.
+            key: The name of the value.
+            compute: A function of no arguments computing the value.
+            
+        Returns:
+            The value, cached until its dependency changes.
+        """
+        derived = self._derived
+        if derived is None:
+            derived = self._derived = {}
+        values = derived.get(dependency)
+        if values is None:
+            values = derived[dependency] = {}
+        elif key in values:
+            return values[key]
+        value = values[key] = compute()
+        return value
+    
+    def invalidate_derived(self, dependency):
+        """Forget the cached values derived from a dependency of get_derived."""
+        if self._derived is not None:
+            self._derived.pop(dependency, None)
+    
+    def stats_changed(self):
+        """Forget the values derived from attributes and skills; called by their views."""
+        self.invalidate_derived("stats")
+    
+    @property
+    def outcome_manager(self):
+        """The OutcomeManager rolling this character's actions."""
+        if self._outcome_manager is None:
+            self._outcome_manager = OutcomeManager(self.rng)
+        return self._outcome_manager
+    
     def _adjust_skills_for_role(self):
         """Adjust skills based on character role."""
         if self.role == "merchant":
@@ -132,7 +221,7 @@ class Character:
         }
         
         for trait, chance in possible_traits.items():
-            if random.random() < chance:
+            if self.rng.random() < chance:
                 self.traits.append(trait)
     
     def is_alive(self):
@@ -147,7 +236,7 @@ class Character:
         """Update character stats for a new year."""
         # Base health decline with age
         if self.age > 40:
-            self.health -= random.randint(0, 2)
+            self.health -= self.rng.randint(0, 2)
         
         # Ensure health stays within bounds
         self.health = max(0, min(100, self.health))
@@ -184,18 +273,50 @@ class Character:
         
         return actions
     
-    def perform_action(self, action_type: str, difficulty_modifier: int = 0):
-        """Perform an action and get its outcome.
+    def perform_action(self, action, game_manager):
+        """Perform one of the actions common to all characters.
+        
+        Role classes handle their own actions and fall back to this method.
+        
+        Args:
+            action: The name of the action to perform.
+            game_manager: The game manager.
+        """
+        interface = game_manager.interface
+        
+        if action == "Find Spouse":
+            self._find_spouse(game_manager)
+        elif action == "Socialize":
+            self._socialize(game_manager)
+        elif action == "Family Activities":
+            self._family_activities(game_manager)
+        elif action == "Rest and Recover":
+            self._rest_and_recover(game_manager)
+        elif action == "Train Skills":
+            self._train_skills(game_manager)
+        elif action == "Travel":
+            self._travel(game_manager)
+        elif action in ["Trade", "Combat", "Diplomacy", "Craft", "Study", "Farm", "Prayer"]:
+            message, rewards = self.resolve_action(action.lower())
+            self.last_action_result = message
+            interface.display_message(message)
+            interface.get_input("Press Enter to continue...")
+        else:
+            interface.display_message(f"Action '{action}' not implemented.")
+            interface.get_input("Press Enter to continue...")
+    
+    def resolve_action(self, action_type: str, difficulty_modifier: int = 0):
+        """Resolve an action and get its outcome.
         
         Args:
             action_type: The type of action to perform
             difficulty_modifier: Optional modifier to success chance
             
         Returns:
-            The outcome message and any gained rewards, or (None, None) if action is not permitted
+            The outcome message and any gained rewards, or (reason, None) if action is not permitted
         """
-        # Check historical constraints
-        allowed, reason = self.historical_constraints.can_perform_action(self, action_type)
+        # Check historical constraints (these use the capitalized action names)
+        allowed, reason = self.historical_constraints.can_perform_action(self, action_type.capitalize())
         if not allowed:
             return reason, None
         
@@ -215,7 +336,7 @@ class Character:
         
         # Check for social mobility opportunity
         potential_class, chance = self.historical_constraints.calculate_social_mobility(self)
-        if random.randint(1, 100) <= chance:
+        if self.rng.randint(1, 100) <= chance:
             # Character has opportunity to move up in society
             self.last_action_result = f"{outcome.message}\n\nYour success has opened up opportunities for social advancement!"
             # The actual class change would be handled by the game manager
@@ -226,13 +347,13 @@ class Character:
     
     def _trade(self):
         """Conduct a trade."""
-        message, rewards = self.perform_action("trade")
+        message, rewards = self.resolve_action("trade")
         self.last_action_result = message
         return message
     
     def _combat(self):
         """Engage in combat."""
-        message, rewards = self.perform_action("combat")
+        message, rewards = self.resolve_action("combat")
         self.last_action_result = message
         return message
     
@@ -257,31 +378,33 @@ class Character:
         # Get potential spouses from NPC manager
         potential_spouses = []
         if game_manager.npc_manager:
+            # Kin and friends of the NPCs the player knows come first
             potential_spouses = game_manager.npc_manager.get_suitable_npcs_for_arc(
                 "marriage",
                 count=3,
                 gender="female" if self.gender == "male" else "male",
                 age_min=16,
                 age_max=min(40, self.age + 10),
-                marital_status="single"
+                marital_status="single",
+                connected_to=[npc_id for npc_id, *_ in game_manager.npc_manager.get_relationships(self.relationships)]
             )
         
         # If not enough NPCs, generate some random ones
         while len(potential_spouses) < 3:
-            age = random.randint(16, min(40, self.age + 10))
+            age = self.rng.randint(16, min(40, self.age + 10))
             birth_year = game_manager.game_year - age
             gender = "female" if self.gender == "male" else "male"
             
             # Generate a random name based on gender
             if gender == "male":
-                name = random.choice(["John", "William", "Robert", "Thomas", "Henry"])
+                name = self.rng.choice(["John", "William", "Robert", "Thomas", "Henry"])
             else:
-                name = random.choice(["Mary", "Elizabeth", "Catherine", "Anne", "Margaret"])
+                name = self.rng.choice(["Mary", "Elizabeth", "Catherine", "Anne", "Margaret"])
             
             # Create a basic character with an appropriate role for their gender
             allowed_roles = self.historical_constraints.get_allowed_roles(gender)
-            role = random.choice(allowed_roles)
-            spouse = Character(name, gender, role, birth_year)
+            role = self.rng.choice(allowed_roles)
+            spouse = Character(name, gender, role, birth_year, self.rng)
             spouse.age = age
             
             potential_spouses.append((-1, spouse))
@@ -315,7 +438,11 @@ class Character:
         
         if choice < len(valid_spouses):
             # Marry the chosen spouse
-            _, chosen_spouse = valid_spouses[choice]
+            npc_id, chosen_spouse = valid_spouses[choice]
+            if npc_id != -1 and game_manager.npc_manager:
+                # Background NPCs become full characters once they join the family
+                chosen_spouse = game_manager.npc_manager.promote_npc(npc_id)
+                game_manager.npc_manager.set_npc_marital_status(npc_id, "married")
             self.spouse = chosen_spouse
             interface.display_message(f"You are now married to {self.spouse.name}!")
             
@@ -323,7 +450,7 @@ class Character:
             game_manager.achievements["married"] = True
             
             # Happiness boost from marriage
-            happiness_gain = random.randint(10, 20)
+            happiness_gain = self.rng.randint(10, 20)
             self.happiness = min(100, self.happiness + happiness_gain)
             
             interface.display_message(f"Your happiness increases by {happiness_gain} points.")
@@ -342,8 +469,8 @@ class Character:
         
         # Get NPCs from the NPC manager
         if game_manager.npc_manager:
-            # Get NPCs at the player's location (default to "town")
-            location_npcs = game_manager.npc_manager.get_npcs_by_location("town")
+            # Get NPCs in the player's settlement
+            location_npcs = game_manager.npc_manager.get_npcs_by_location(self.location)
             
             # If not enough NPCs at this location, get some random ones
             if len(location_npcs) < 3:
@@ -351,7 +478,7 @@ class Character:
                 all_npcs = location_npcs + additional_npcs
             else:
                 # Get a random selection if there are many NPCs at this location
-                all_npcs = random.sample(location_npcs, min(3, len(location_npcs)))
+                all_npcs = self.rng.sample(location_npcs, min(3, len(location_npcs)))
             
             # Check if any NPCs are involved in active story arcs with the player
             arc_npcs = []
@@ -371,20 +498,20 @@ class Character:
             # Fallback to generating random NPCs if NPC manager is not available
             npcs_to_show = []
             for _ in range(3):
-                age = random.randint(16, 70)
+                age = self.rng.randint(16, 70)
                 birth_year = game_manager.game_year - age
-                gender = random.choice(["male", "female"])
+                gender = self.rng.choice(["male", "female"])
                 
                 # Generate a random name based on gender
                 if gender == "male":
-                    name = random.choice(["John", "William", "Robert", "Thomas", "Henry", "Edward"])
+                    name = self.rng.choice(["John", "William", "Robert", "Thomas", "Henry", "Edward"])
                 else:
-                    name = random.choice(["Mary", "Elizabeth", "Catherine", "Anne", "Margaret", "Eleanor"])
+                    name = self.rng.choice(["Mary", "Elizabeth", "Catherine", "Anne", "Margaret", "Eleanor"])
                 
-                role = random.choice(["noble", "knight", "merchant", "farmer", "craftsman", "priest"])
+                role = self.rng.choice(["noble", "knight", "merchant", "farmer", "craftsman", "priest"])
                 
                 # Create a basic character
-                person = Character(name, gender, role, birth_year)
+                person = Character(name, gender, role, birth_year, self.rng)
                 person.age = age
                 
                 npcs_to_show.append((-1, person))  # Use -1 as a placeholder ID
@@ -410,6 +537,9 @@ class Character:
         if choice < len(npcs_to_show):
             # Socialize with the chosen person
             npc_id, npc = npcs_to_show[choice]
+            if npc_id != -1 and game_manager.npc_manager:
+                # Meeting a background NPC promotes it to a full character
+                npc = game_manager.npc_manager.promote_npc(npc_id)
             
             # Check if this NPC is involved in any active story arcs
             npc_in_arc = False
@@ -436,13 +566,13 @@ class Character:
             # If not in a story arc, proceed with normal socialization
             # Determine outcome based on charisma
             success_chance = 50 + (self.attributes['charisma'] - 50) // 2
-            success = random.randint(1, 100) <= success_chance
+            success = self.rng.randint(1, 100) <= success_chance
             
             if success:
                 interface.display_message(f"You had a pleasant conversation with {npc.name}.")
                 
                 # Check if there's a potential for a new story arc with this NPC
-                if game_manager.story_arc_manager and random.random() < 0.2:  # 20% chance
+                if game_manager.story_arc_manager and self.rng.random() < 0.2:  # 20% chance
                     # Find eligible arcs for this NPC
                     eligible_arcs = []
                     for arc_id, arc in game_manager.story_arc_manager.story_arcs.items():
@@ -474,7 +604,7 @@ class Character:
                     
                     # Start a new arc if eligible
                     if eligible_arcs and len(game_manager.story_arc_manager.active_arcs) < game_manager.story_arc_manager.max_active_arcs:
-                        arc_id, arc = random.choice(eligible_arcs)
+                        arc_id, arc = self.rng.choice(eligible_arcs)
                         arc.start()
                         game_manager.story_arc_manager.active_arcs.append(arc)
                         game_manager.story_arc_manager.assign_npc_to_arc(arc_id, npc_id)
@@ -497,9 +627,13 @@ class Character:
                 # If no story arc was started, continue with normal socialization
                 interface.display_message("You've made a new acquaintance!")
                 
-                # Add to relationships if this is a persistent NPC
+                # Add to relationships if this is a persistent NPC, or renew a known one
                 if npc_id != -1:
-                    self.relationships[npc] = Relationship(npc, "acquaintance", 30)
+                    serial = game_manager.npc_manager.get_serial(npc_id)
+                    if serial in self.relationships:
+                        self.relationships.adjust(serial, RENEWED_RELATIONSHIP_GAIN)
+                    else:
+                        self.relationships.add(serial, npc_id)
             else:
                 interface.display_message(f"Your conversation with {npc.name} didn't go well.")
                 interface.display_message("They don't seem interested in further interaction.")
@@ -522,7 +656,7 @@ class Character:
         # Calculate health recovery based on attributes and random chance
         base_recovery = 10
         wisdom_bonus = self.attributes["wisdom"] // 20  # 0-5 bonus based on wisdom
-        recovery = base_recovery + wisdom_bonus + random.randint(0, 5)
+        recovery = base_recovery + wisdom_bonus + self.rng.randint(0, 5)
         
         # Apply recovery
         old_health = self.health
@@ -533,8 +667,8 @@ class Character:
         interface.display_message(f"Current health: {self.health}/100")
         
         # Chance to improve wisdom
-        if random.random() < 0.2:  # 20% chance
-            wisdom_gain = random.randint(1, 3)
+        if self.rng.random() < 0.2:  # 20% chance
+            wisdom_gain = self.rng.randint(1, 3)
             self.attributes["wisdom"] = min(100, self.attributes["wisdom"] + wisdom_gain)
             interface.display_message(f"The time spent in reflection has improved your wisdom by {wisdom_gain} points.")
         
@@ -560,7 +694,7 @@ class Character:
         # Calculate training effectiveness based on attributes and random chance
         intelligence_factor = self.attributes["intelligence"] / 100  # 0-1 based on intelligence
         base_improvement = 3
-        improvement = base_improvement + int(intelligence_factor * 5) + random.randint(0, 2)
+        improvement = base_improvement + int(intelligence_factor * 5) + self.rng.randint(0, 2)
         
         # Apply improvement
         old_skill = self.skills[skill_to_train]
@@ -568,7 +702,7 @@ class Character:
         actual_improvement = self.skills[skill_to_train] - old_skill
         
         # Health cost of training
-        health_cost = random.randint(1, 5)
+        health_cost = self.rng.randint(1, 5)
         self.health = max(1, self.health - health_cost)
         
         interface.display_message(f"You spend time training your {skill_to_train} skill.")
@@ -601,21 +735,22 @@ class Character:
         
         choice = interface.display_menu("Where would you like to travel?", settlement_display)
         destination = settlements[choice]
+        self.location = destination.name
         
         # Calculate travel effects
-        travel_distance = random.randint(1, 10)  # Simulated distance
+        travel_distance = self.rng.randint(1, 10)  # Simulated distance
         health_cost = travel_distance // 2
         self.health = max(1, self.health - health_cost)
         
         # Chance to gain experience from travel
-        skill_gain = random.randint(1, 2)
-        random_skill = random.choice(list(self.skills.keys()))
+        skill_gain = self.rng.randint(1, 2)
+        random_skill = self.rng.choice(list(self.skills.keys()))
         self.skills[random_skill] = min(100, self.skills[random_skill] + skill_gain)
         
         # Chance to find wealth on the road
-        wealth_chance = random.random()
+        wealth_chance = self.rng.random()
         if wealth_chance < 0.1:  # 10% chance
-            wealth_gain = random.randint(10, 50)
+            wealth_gain = self.rng.randint(10, 50)
             self.wealth += wealth_gain
             interface.display_message(f"You travel to {destination.name} in the kingdom of {destination.kingdom.name}.")
             interface.display_message(f"On your journey, you find a small treasure worth {wealth_gain} coins!")
@@ -670,7 +805,7 @@ class Character:
         
         if activity == "Spend time with spouse":
             # Improve relationship with spouse
-            happiness_gain = random.randint(3, 8)
+            happiness_gain = self.rng.randint(3, 8)
             self.happiness = min(100, self.happiness + happiness_gain)
             
             # Random events
@@ -680,12 +815,12 @@ class Character:
                 "You and your spouse discuss plans for the future.",
                 "You help your spouse with their daily tasks."
             ]
-            interface.display_message(random.choice(events))
+            interface.display_message(self.rng.choice(events))
             interface.display_message(f"Your happiness increases by {happiness_gain} points.")
         
         elif activity == "Play with children":
             # Improve relationships with children
-            happiness_gain = random.randint(2, 6)
+            happiness_gain = self.rng.randint(2, 6)
             self.happiness = min(100, self.happiness + happiness_gain)
             
             # Random events
@@ -695,7 +830,7 @@ class Character:
                 "You teach your children a new game.",
                 "Your children show you their latest achievements."
             ]
-            interface.display_message(random.choice(events))
+            interface.display_message(self.rng.choice(events))
             interface.display_message(f"Your happiness increases by {happiness_gain} points.")
         
         elif activity == "Teach children":
@@ -715,7 +850,7 @@ class Character:
                 # Children learn and gain skills
                 for child in self.children:
                     if hasattr(child, 'skills') and child.age >= 5:
-                        skill_gain = random.randint(1, 3)
+                        skill_gain = self.rng.randint(1, 3)
                         adjusted_gain = int(skill_gain * effectiveness)
                         if skill in child.skills:
                             child.skills[skill] = min(100, child.skills[skill] + adjusted_gain)
@@ -725,11 +860,11 @@ class Character:
         
         elif activity == "Family meal":
             # Everyone gains happiness
-            happiness_gain = random.randint(2, 5)
+            happiness_gain = self.rng.randint(2, 5)
             self.happiness = min(100, self.happiness + happiness_gain)
             
             # Cost of the meal
-            meal_cost = random.randint(5, 15)
+            meal_cost = self.rng.randint(5, 15)
             self.wealth = max(0, self.wealth - meal_cost)
             
             interface.display_message(f"You share a wonderful meal with your family. (Cost: {meal_cost} coins)")
@@ -801,76 +936,30 @@ class Character:
 
     def _diplomacy(self):
         """Engage in diplomatic activities."""
-        message, rewards = self.perform_action("diplomacy")
+        message, rewards = self.resolve_action("diplomacy")
         self.last_action_result = message
         return message
 
     def _craft(self):
         """Perform crafting work."""
-        message, rewards = self.perform_action("craft")
+        message, rewards = self.resolve_action("craft")
         self.last_action_result = message
         return message
 
     def _study(self):
         """Study to gain knowledge."""
-        message, rewards = self.perform_action("study")
+        message, rewards = self.resolve_action("study")
         self.last_action_result = message
         return message
 
     def _farm(self):
         """Work on farming activities."""
-        message, rewards = self.perform_action("farm")
+        message, rewards = self.resolve_action("farm")
         self.last_action_result = message
         return message
 
     def _prayer(self):
         """Engage in religious activities."""
-        message, rewards = self.perform_action("prayer")
+        message, rewards = self.resolve_action("prayer")
         self.last_action_result = message
         return message
-
-class Relationship:
-    """Represents a relationship between two characters."""
-    
-    def __init__(self, person, status, level):
-        """Initialize a new relationship.
-        
-        Args:
-            person: The person this relationship is with.
-            status: The status of the relationship (e.g., 'friend', 'enemy').
-            level: The level of the relationship (1-100).
-        """
-        self.person = person
-        self.status = status
-        self.level = level
-    
-    def improve(self, amount):
-        """Improve the relationship.
-        
-        Args:
-            amount: The amount to improve the relationship by.
-        """
-        self.level = min(100, self.level + amount)
-        self._update_status()
-    
-    def worsen(self, amount):
-        """Worsen the relationship.
-        
-        Args:
-            amount: The amount to worsen the relationship by.
-        """
-        self.level = max(0, self.level - amount)
-        self._update_status()
-    
-    def _update_status(self):
-        """Update the relationship status based on the level."""
-        if self.level >= 80:
-            self.status = "close friend"
-        elif self.level >= 60:
-            self.status = "friend"
-        elif self.level >= 40:
-            self.status = "acquaintance"
-        elif self.level >= 20:
-            self.status = "distant"
-        else:
-            self.status = "enemy" 
\ No newline at end of file
@@ -1,19 +1,46 @@
 """
 Character Factory - Creates different character types based on role
 """
+import importlib
 from game.characters.character import Character
-from game.characters.roles.king import King
-from game.characters.roles.noble import Noble
-from game.characters.roles.knight import Knight
-from game.characters.roles.merchant import Merchant
-from game.characters.roles.farmer import Farmer
-from game.characters.roles.craftsman import Craftsman
-from game.characters.roles.priest import Priest
 
 class CharacterFactory:
     """Factory for creating characters of different roles."""
     
-    def create_character(self, role, name, gender, birth_year=None):
+    # Roles with a dedicated character class
+    ROLES = ["king", "noble", "knight", "merchant", "farmer", "craftsman", "priest"]
+    
+    # Module and class name of each role, imported the first time the role is used
+    ROLE_CLASSES = {
+        "king": ("game.characters.roles.king", "King"),
+        "noble": ("game.characters.roles.noble", "Noble"),
+        "knight": ("game.characters.roles.knight", "Knight"),
+        "merchant": ("game.characters.roles.merchant", "Merchant"),
+        "farmer": ("game.characters.roles.farmer", "Farmer"),
+        "craftsman": ("game.characters.roles.craftsman", "Craftsman"),
+        "priest": ("game.characters.roles.priest", "Priest")
+    }
+    
+    # Role classes imported so far, shared by all factories
+    _loaded_classes = {}
+    
+    def get_role_class(self, role):
+        """Get the character class of a role, importing its module on first use.
+        
+        Args:
+            role: The role name.
+            
+        Returns:
+            The role's character class, or None if the role has no dedicated class.
+        """
+        role_class = self._loaded_classes.get(role)
+        if role_class is None and role in self.ROLE_CLASSES:
+            module_name, class_name = self.ROLE_CLASSES[role]
+            role_class = getattr(importlib.import_module(module_name), class_name)
+            self._loaded_classes[role] = role_class
+        return role_class
+    
+    def create_character(self, role, name, gender, birth_year=None, rng=None):
         """Create a character of the specified role.
         
         Args:
@@ -21,29 +48,19 @@ class CharacterFactory:
             name: The name of the character.
             gender: The gender of the character.
             birth_year: The birth year of the character (optional).
+            rng: The random generator for the character (optional).
             
         Returns:
             A character of the specified role.
         """
         # If birth_year is not provided, it will be set in the game_manager
         # when creating a new character
-        if role == "king":
-            character = King(name, gender, birth_year)
-        elif role == "noble":
-            character = Noble(name, gender, birth_year)
-        elif role == "knight":
-            character = Knight(name, gender, birth_year)
-        elif role == "merchant":
-            character = Merchant(name, gender, birth_year)
-        elif role == "farmer":
-            character = Farmer(name, gender, birth_year)
-        elif role == "craftsman":
-            character = Craftsman(name, gender, birth_year)
-        elif role == "priest":
-            character = Priest(name, gender, birth_year)
+        role_class = self.get_role_class(role)
+        if role_class is not None:
+            character = role_class(name, gender, birth_year, rng)
         else:
             # Default to base character
-            character = Character(name, gender, role, birth_year)
+            character = Character(name, gender, role, birth_year, rng)
         
         # Set birth year if provided
         if birth_year is not None:
@@ -0,0 +1,81 @@
+"""
+ID Sampler - Constant-time random draws from a changing set of IDs
+"""
+
+class IDSampler:
+    """A set of IDs kept in a dense array, so random members can be drawn by index.
+
+    Removing an ID moves the last ID into its slot, so adds, removals and
+    draws all take constant time, and drawing k IDs costs O(k) rather than
+    the size of the set.
+    """
+
+    def __init__(self):
+        """Initialize an empty sampler."""
+        self.ids = []
+        self.positions = {}  # Maps ID to its index in ids
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __contains__(self, item_id):
+        return item_id in self.positions
+
+    def add(self, item_id):
+        """Add an ID, if not already present."""
+        if item_id not in self.positions:
+            self.positions[item_id] = len(self.ids)
+            self.ids.append(item_id)
+
+    def discard(self, item_id):
+        """Remove an ID, if present, by swapping the last ID into its slot."""
+        position = self.positions.pop(item_id, None)
+        if position is None:
+            return
+        last_id = self.ids.pop()
+        if last_id != item_id:
+            self.ids[position] = last_id
+            self.positions[last_id] = position
+
+    def sample(self, rng, k, exclude=None, accept=None, max_draws=None):
+        """Draw up to k distinct random IDs by rejection sampling.
+
+        Args:
+            rng: The random generator to draw with.
+            k: The number of IDs wanted.
+            exclude: A set of IDs never to draw (optional).
+            accept: A function of an ID returning whether it may be drawn (optional).
+            max_draws: Give up after this many draws (optional, unlimited by
+                default; required with accept, which may reject every ID).
+
+        Returns:
+            A list of at most k IDs in random order. Without accept it is only
+            shorter than k when fewer IDs are left after the exclusions.
+        """
+        ids = self.ids
+        size = len(ids)
+        exclude = exclude or ()
+        if accept is None:
+            available = size - sum(1 for item_id in exclude if item_id in self.positions)
+            if k >= available:
+                remaining = [item_id for item_id in ids if item_id not in exclude]
+                rng.shuffle(remaining)
+                return remaining
+            if available * 2 < size:
+                # Most IDs are excluded, so rejection would mostly miss
+                return rng.sample([item_id for item_id in ids if item_id not in exclude], k)
+        elif max_draws is None:
+            raise ValueError("max_draws is required with accept")
+
+        chosen = []
+        seen = set()
+        draws = 0
+        while len(chosen) < k and (max_draws is None or draws < max_draws) and len(seen) < size:
+            item_id = ids[rng.randrange(size)]
+            draws += 1
+            if item_id in seen:
+                continue
+            seen.add(item_id)
+            if item_id not in exclude and (accept is None or accept(item_id)):
+                chosen.append(item_id)
+        return chosen
@@ -0,0 +1,128 @@
+"""
+NPC Archive - Compact, append-only record of dead NPCs for genealogy
+"""
+from array import array
+
+class NPCArchive:
+    """Append-only archive of dead NPCs, kept as parallel typed columns.
+
+    Names, roles and genders are stored as codes into one shared string
+    table, and each NPC's kin as a slice of one flat array. NPCs are
+    identified by their serial number, which unlike their NPC ID is never
+    reused. Serials are handed out densely, so entries are found through an
+    array indexed by serial rather than a dictionary.
+
+    An entry takes 36 bytes plus 8 per kin, and the serial index 4 bytes for
+    every serial up to the highest archived, dead or not.
+    """
+
+    def __init__(self, first_serial=1):
+        """Initialize an empty archive.
+
+        Args:
+            first_serial: The lowest serial number NPCs are given.
+        """
+        self.serials = array("q")
+        self.names = array("I")
+        self.genders = array("I")
+        self.roles = array("I")
+        self.birth_years = array("i")
+        self.death_years = array("i")
+        self.kin_starts = array("q", [0])  # Entry i's kin are kin[kin_starts[i]:kin_starts[i + 1]]
+        self.kin = array("q")
+        self.strings = []
+        self._string_codes = {}
+        self.first_serial = first_serial
+        self._rows = array("i")  # Row of each serial from first_serial on, or -1 if not archived
+
+    def __len__(self):
+        return len(self.serials)
+
+    def __contains__(self, serial):
+        return self._row(serial) is not None
+
+    def append(self, serial, name, gender, role, birth_year, death_year, kin_serials=()):
+        """Archive a dead NPC.
+
+        Args:
+            serial: The NPC's serial number.
+            name: The NPC's name.
+            gender: The NPC's gender.
+            role: The NPC's role at death.
+            birth_year: The year the NPC was born.
+            death_year: The year the NPC died.
+            kin_serials: The serial numbers of the NPC's kin and spouse.
+
+        Returns:
+            The row of the new entry.
+        """
+        index = serial - self.first_serial
+        if index < 0:
+            raise ValueError(f"Serial {serial} is below the first serial {self.first_serial}")
+        row = len(self.serials)
+        self.serials.append(serial)
+        self.names.append(self._code(name))
+        self.genders.append(self._code(gender))
+        self.roles.append(self._code(role))
+        self.birth_years.append(birth_year)
+        self.death_years.append(death_year)
+        self.kin.extend(kin_serials)
+        self.kin_starts.append(len(self.kin))
+        if index >= len(self._rows):
+            self._rows.extend([-1] * (index + 1 - len(self._rows)))
+        self._rows[index] = row
+        return row
+
+    def get(self, serial):
+        """Get the entry of a dead NPC.
+
+        Args:
+            serial: The NPC's serial number.
+
+        Returns:
+            A dictionary with the NPC's serial, name, gender, role, birth and
+            death years and the serials of their kin, or None if not archived.
+        """
+        row = self._row(serial)
+        if row is None:
+            return None
+        strings = self.strings
+        return {
+            "serial": serial,
+            "name": strings[self.names[row]],
+            "gender": strings[self.genders[row]],
+            "role": strings[self.roles[row]],
+            "birth_year": self.birth_years[row],
+            "death_year": self.death_years[row],
+            "kin": list(self.kin[self.kin_starts[row]:self.kin_starts[row + 1]])
+        }
+
+    def get_kin(self, serial):
+        """Get the serial numbers of a dead NPC's kin and spouse.
+
+        Args:
+            serial: The NPC's serial number.
+
+        Returns:
+            A list of serial numbers, empty if the NPC is not archived.
+        """
+        row = self._row(serial)
+        if row is None:
+            return []
+        return list(self.kin[self.kin_starts[row]:self.kin_starts[row + 1]])
+
+    def _row(self, serial):
+        """Get the row of a serial, or None if not archived."""
+        index = serial - self.first_serial
+        if 0 <= index < len(self._rows) and self._rows[index] >= 0:
+            return self._rows[index]
+        return None
+
+    def _code(self, value):
+        """Get the code of a string, adding it to the string table if new."""
+        code = self._string_codes.get(value)
+        if code is None:
+            code = len(self.strings)
+            self.strings.append(value)
+            self._string_codes[value] = code
+        return code
@@ -1,37 +1,358 @@
 """
 NPC Manager - Manages persistent NPCs in the game world
 """
+import heapq
 import random
-from game.characters.character import Character, Relationship
+import uuid
+from collections import Counter
+from dataclasses import dataclass
+from typing import Optional
+
+from game.characters.character import Character
+from game.characters.id_sampler import IDSampler
+from game.characters.npc_archive import NPCArchive
+from game.characters.npc_shards import NPCShard, ShardUpdate, roll_shard_year, roll_worker_shards
+from game.characters.npc_store import create_npc_store
+from game.characters.social_graph import SocialGraph
+
+# Generation tables, shared by every NPC manager
+NPC_ROLES = ("noble", "knight", "merchant", "farmer", "craftsman", "priest")
+NPC_GENDERS = ("male", "female")
+DEFAULT_LOCATION = "town"  # Where NPCs live when the world has no settlements
+
+MALE_NAMES = (
+    "John", "William", "Robert", "Thomas", "Henry", "Edward", "Richard",
+    "James", "Walter", "Hugh", "Geoffrey", "Simon", "Peter", "Nicholas",
+    "Roger", "Adam", "Stephen", "Philip", "Gilbert", "Martin"
+)
+FEMALE_NAMES = (
+    "Mary", "Elizabeth", "Catherine", "Anne", "Margaret", "Eleanor", "Alice",
+    "Matilda", "Joan", "Isabella", "Agnes", "Cecily", "Emma", "Beatrice",
+    "Edith", "Maud", "Juliana", "Rose", "Lucy", "Avice"
+)
+
+PERSONALITY_TRAITS = (
+    "Kind", "Cruel", "Ambitious", "Lazy", "Honest", "Deceitful", "Brave", "Cowardly",
+    "Generous", "Greedy", "Patient", "Impatient", "Humble", "Proud", "Loyal", "Treacherous",
+    "Pious", "Cynical", "Lustful", "Chaste", "Temperate", "Gluttonous", "Trusting", "Suspicious"
+)
+
+BACKGROUNDS = {
+    "noble": (
+        "From an ancient noble family",
+        "Recently elevated to nobility",
+        "From a family known for military service",
+        "From a family known for scholarship",
+        "From a family with a scandalous past"
+    ),
+    "knight": (
+        "Knighted for valor in battle",
+        "From a family of knights",
+        "Rose from common origins",
+        "Served as a squire to a famous knight",
+        "Won fame in tournaments"
+    ),
+    "merchant": (
+        "Inherited a trading business",
+        "Started as a peddler",
+        "Specializes in exotic goods",
+        "Has trading connections abroad",
+        "Known for fair dealing"
+    ),
+    "farmer": (
+        "Owns a small plot of land",
+        "Works on a noble's estate",
+        "Known for quality produce",
+        "Struggling with recent harvests",
+        "Experimenting with new crops"
+    ),
+    "craftsman": (
+        "Master of their craft",
+        "Apprenticed under a famous artisan",
+        "Creates goods for nobility",
+        "Innovator in their field",
+        "Struggling to compete with imports"
+    ),
+    "priest": (
+        "From a noble family",
+        "Rose from humble origins",
+        "Known for scholarly work",
+        "Known for charitable works",
+        "Has political ambitions"
+    )
+}
+DEFAULT_BACKGROUNDS = ("Unknown background",)
+
+# Attributes each role gets a bonus of 5-15 in
+ROLE_ATTRIBUTE_BONUSES = {
+    "noble": ("charisma", "intelligence"),
+    "knight": ("strength", "endurance"),
+    "merchant": ("charisma", "cunning"),
+    "farmer": ("strength", "endurance"),
+    "craftsman": ("dexterity", "intelligence"),
+    "priest": ("intelligence", "wisdom")
+}
+
+# Age range of new NPCs by role
+ROLE_AGE_RANGES = {"noble": (20, 60), "knight": (20, 60), "priest": (25, 70)}
+DEFAULT_AGE_RANGE = (16, 70)
+
+# Population the yearly update tops up to when nothing else is configured
+DEFAULT_TARGET_NPCS = 30
+
+# Default smallest population whose yearly update is sent to worker processes;
+# measure it for a machine with python -m game.benchmarks.throughput --compare-workers
+PARALLEL_MIN_NPCS = 20000
+
+# Ties new NPCs form with the NPCs already at their location
+KIN_CHANCE = 0.25  # Chance of being kin to an NPC of the same role
+MAX_FRIENDS = 2
+RIVAL_CHANCE = 0.1
+LIEGE_ROLES = {"knight": "noble", "farmer": "noble"}  # Vassal role -> liege role
+
+@dataclass
+class PopulationConfig:
+    """How many NPCs the world keeps.
+
+    A fixed target wins over a density; with neither, the world keeps
+    DEFAULT_TARGET_NPCS NPCs. The yearly update runs in this process unless
+    more than one worker is configured, in which case populations of
+    parallel_min_npcs or more are rolled in worker processes.
+    """
+    target_npcs: Optional[int] = None
+    npcs_per_settlement: Optional[float] = None
+    workers: Optional[int] = None
+    parallel_min_npcs: int = PARALLEL_MIN_NPCS
+
+    def is_default(self) -> bool:
+        """Check whether neither a target nor a density is set."""
+        return self.target_npcs is None and self.npcs_per_settlement is None
+
+    def target_for(self, world) -> int:
+        """Get the target population for a world.
+
+        Args:
+            world: The World, whose settlements the density applies to (may be None).
+
+        Returns:
+            The number of NPCs to keep.
+        """
+        if self.target_npcs is not None:
+            return self.target_npcs
+        if self.npcs_per_settlement is not None and world is not None:
+            return round(self.npcs_per_settlement * len(world.settlements))
+        return DEFAULT_TARGET_NPCS
+
+def _age_range(role, age_min=None, age_max=None):
+    """Get the range new NPCs' ages are drawn from.
+
+    Args:
+        role: The NPC's role.
+        age_min: A minimum age replacing the role's (optional).
+        age_max: A maximum age replacing the role's (optional).
+
+    Returns:
+        A tuple of (lowest, highest) age.
+    """
+    low, high = ROLE_AGE_RANGES.get(role, DEFAULT_AGE_RANGE)
+    if age_min is not None:
+        low = age_min
+    if age_max is not None:
+        high = age_max
+    if low > high:
+        # The constraint falls outside the role's range, so it alone decides
+        low = high = age_min if age_min is not None else age_max
+    return low, high
+
+def _marital_status_chances(role, age):
+    """Get the chances of a new NPC being single or married; the rest are widowed.
+
+    Args:
+        role: The NPC's role.
+        age: The NPC's age.
+
+    Returns:
+        A tuple of (single chance, married chance).
+    """
+    if age < 16 or role == "priest":
+        return 1.0, 0.0
+    elif age < 20:
+        return 0.8, 0.2
+    elif age > 50:
+        return 0.2, 0.5
+    return 0.3, 0.6
+
+class PopulationClock:
+    """The number of years an NPC population has aged, shared by its NPC records."""
+    __slots__ = ("years_passed",)
+    
+    def __init__(self):
+        """Initialize the clock at year zero."""
+        self.years_passed = 0
+
+class NPCRecord:
+    """Compact record of a background NPC, holding only its demographic fields.
+    
+    Background NPCs stay records until the player meets them or they are cast
+    in a story arc; they are then promoted to a full Character, and demoted
+    back once nothing refers to them. Attributes are not stored: they are
+    rebuilt from the record's seed, so an NPC gets the same attributes every
+    time it is promoted. Records keep their cohort (age minus the years the
+    population has aged) rather than their age, so a year passing does not
+    touch them.
+    """
+    __slots__ = ("name", "gender", "role", "birth_year", "cohort", "clock", "marital_status",
+                 "personality_traits", "background", "seed", "serial")
+    
+    wealth = 0  # Background NPCs hold no wealth of their own
+    
+    def __init__(self, name, gender, role, birth_year, age, marital_status,
+                 personality_traits, background, seed, serial, clock):
+        """Initialize an NPC record.
+        
+        Args:
+            name: The NPC's name.
+            gender: The NPC's gender.
+            role: The NPC's role.
+            birth_year: The NPC's birth year.
+            age: The NPC's age.
+            marital_status: The NPC's marital status.
+            personality_traits: A tuple of the NPC's personality traits.
+            background: The NPC's background.
+            seed: The seed the NPC's attributes are rebuilt from.
+            serial: The NPC's serial number, unique over the whole game unlike its ID.
+            clock: The PopulationClock the NPC ages with.
+        """
+        self.name = name
+        self.gender = gender
+        self.role = role
+        self.birth_year = birth_year
+        self.clock = clock
+        self.age = age
+        self.marital_status = marital_status
+        self.personality_traits = personality_traits
+        self.background = background
+        self.seed = seed
+        self.serial = serial
+    
+    @property
+    def age(self):
+        """The NPC's age."""
+        return self.cohort + self.clock.years_passed
+    
+    @age.setter
+    def age(self, age):
+        self.cohort = age - self.clock.years_passed
+    
+    def to_character(self):
+        """Build the full Character for this NPC.
+        
+        Returns:
+            A new Character with the record's fields and attributes adjusted for its role.
+        """
+        rng = random.Random(self.seed)
+        character = Character(self.name, self.gender, self.role, self.birth_year, rng)
+        character.age = self.age
+        
+        # Adjust attributes based on role, with some randomness, within bounds
+        bonus_attributes = ROLE_ATTRIBUTE_BONUSES.get(self.role, ())
+        attributes = character.attributes
+        for attr in attributes:
+            value = attributes[attr]
+            if attr in bonus_attributes:
+                value += rng.randint(5, 15)
+            value += rng.randint(-10, 10)
+            attributes[attr] = max(1, min(100, value))
+        
+        character.marital_status = self.marital_status
+        character.personality_traits = list(self.personality_traits)
+        character.background = self.background
+        return character
+    
+    def update_from(self, character):
+        """Copy back the fields a promoted NPC may have changed.
+        
+        Args:
+            character: The Character this record was promoted to.
+        """
+        self.name = character.name
+        self.role = character.role
+        self.age = character.age
+        self.marital_status = getattr(character, "marital_status", self.marital_status)
 
 class NPCManager:
     """Manages persistent NPCs in the game world."""
     
-    def __init__(self, game_manager):
+    def __init__(self, game_manager, population_config=None):
         """Initialize the NPC manager.
         
         Args:
             game_manager: The game manager.
+            population_config: The PopulationConfig deciding how many NPCs the
+                world keeps (optional, defaults to DEFAULT_TARGET_NPCS).
         """
         self.game_manager = game_manager
-        self.npcs = {}  # Maps NPC ID to NPC character
+        self.rng = game_manager.random_streams.get("npcs")
+        self.population_config = population_config or PopulationConfig()
+        self.npcs = {}  # Maps NPC ID to NPC record, or to a Character while promoted
+        self.promoted = {}  # Maps the ID of each promoted NPC to its record
         self.npc_locations = {}  # Maps NPC ID to location
-        self.npc_relationships = {}  # Maps (NPC ID, NPC ID) to relationship level
+        self.id_sampler = IDSampler()  # Every NPC ID, for random draws
+        self.social_graph = SocialGraph()  # Kin, friend, rival, spouse and liege ties between NPCs
         self.next_npc_id = 1
+        self.free_ids = []  # Heap of the IDs of dead NPCs, reused smallest first
+        self.pending_free_ids = []  # IDs of removed NPCs that may still be referred to
+        self.next_serial = 1
+        # Serial numbers only name the same NPC within one population, which
+        # this tells apart from the populations of other games, e.g. in saves
+        self.population_id = uuid.uuid4().hex
+        self.archive = NPCArchive(self.next_serial)  # Dead NPCs, for genealogy
+        self.target_npc_count = self.population_config.target_for(game_manager.world)
+        
+        # Secondary indexes, each mapping a value to the set of NPC IDs that have it
+        self.role_index = {}
+        self.location_index = {}
+        self.gender_index = {}
+        self.marital_status_index = {}
+        # Ages all rise together, so NPCs are indexed by their age minus the
+        # number of years that have passed, which never changes
+        self.cohort_index = {}
+        self.clock = PopulationClock()  # Ages every NPC record at once
+        
+        # Worker processes for the yearly update of large populations, started on
+        # first use. Each keeps its kingdoms' shards between years and is only
+        # sent the NPCs changed since; None while the workers are out of date.
+        self._executors = None
+        self._kingdom_workers = {}  # Maps kingdom to the index of the worker rolling it
+        self._shard_kingdoms = None  # Maps NPC ID to the kingdom the workers hold it in
+        self._settlement_kingdoms = {}  # Maps settlement to kingdom, as the workers last saw it
+        self._changed_ids = set()  # NPCs changed since the workers were last updated
+        
+        # Optional columnar background population, see enable_population_store
+        self.population = None
         
         # Generate initial NPCs
         self._generate_initial_npcs()
     
+    @property
+    def years_passed(self):
+        """The number of years the NPCs have aged."""
+        return self.clock.years_passed
+    
+    @years_passed.setter
+    def years_passed(self, years_passed):
+        self.clock.years_passed = years_passed
+    
     def _generate_initial_npcs(self):
         """Generate initial NPCs for the game world."""
-        # Generate a mix of NPCs for each role
-        roles = ["noble", "knight", "merchant", "farmer", "craftsman", "priest"]
+        if not self.population_config.is_default():
+            # A configured population is generated in full straight away
+            self.generate_npcs(self.target_npc_count)
+            return
         
-        for role in roles:
-            # Generate 3-5 NPCs for each role
-            num_npcs = random.randint(3, 5)
-            for _ in range(num_npcs):
-                self.generate_npc(role=role)
+        # Generate 3-5 NPCs for each role
+        for role in NPC_ROLES:
+            self.generate_npcs(self.rng.randint(3, 5), role=role)
     
     def generate_npc(self, name=None, gender=None, role=None, age=None, location=None):
         """Generate a new NPC.
@@ -44,179 +365,262 @@ class NPCManager:
             location: The NPC's location (optional).
             
         Returns:
-            The generated NPC.
+            The generated NPC record.
         """
-        # Generate gender if not provided
-        if gender is None:
-            gender = random.choice(["male", "female"])
+        _, npc = self.generate_npcs(1, gender=gender, role=role, age=age, location=location)[0]
+        if name is not None:
+            npc.name = name
+        return npc
+    
+    def generate_npcs(self, n, gender=None, role=None, age=None, age_min=None, age_max=None,
+                      location=None, marital_status=None):
+        """Generate a cohort of NPCs in one pass.
         
-        # Generate name if not provided
-        if name is None:
-            if gender == "male":
-                name = random.choice([
-                    "John", "William", "Robert", "Thomas", "Henry", "Edward", "Richard",
-                    "James", "Walter", "Hugh", "Geoffrey", "Simon", "Peter", "Nicholas",
-                    "Roger", "Adam", "Stephen", "Philip", "Gilbert", "Martin"
-                ])
-            else:
-                name = random.choice([
-                    "Mary", "Elizabeth", "Catherine", "Anne", "Margaret", "Eleanor", "Alice",
-                    "Matilda", "Joan", "Isabella", "Agnes", "Cecily", "Emma", "Beatrice",
-                    "Edith", "Maud", "Juliana", "Rose", "Lucy", "Avice"
-                ])
-        
-        # Generate role if not provided
-        if role is None:
-            role = random.choice(["noble", "knight", "merchant", "farmer", "craftsman", "priest"])
-        
-        # Generate age if not provided
-        if age is None:
-            # Age range depends on role
-            if role in ["noble", "knight"]:
-                age = random.randint(20, 60)
-            elif role == "priest":
-                age = random.randint(25, 70)
+        Every constraint left as None is drawn at random for each NPC from the
+        module-level tables, so a cohort costs one draw per column rather than
+        one table build per NPC. The NPCs start as compact NPCRecords, with
+        friend, rival, kin and liege ties to NPCs already at their location
+        added to the social graph in one batch. Unless a location is given,
+        each NPC lives in a settlement drawn by the settlements' population.
+        
+        Args:
+            n: The number of NPCs.
+            gender: The gender of every NPC (optional).
+            role: The role of every NPC (optional).
+            age: The age of every NPC (optional, overrides age_min and age_max).
+            age_min: The minimum age (optional, defaults to the role's).
+            age_max: The maximum age (optional, defaults to the role's).
+            location: The settlement name of every NPC (optional).
+            marital_status: The marital status of every NPC (optional).
+            
+        Returns:
+            A list of (npc_id, npc record) tuples for the new NPCs.
+        """
+        if n <= 0:
+            return []
+        rng = self.rng
+        game_year = self.game_manager.game_year
+        
+        # Draw each column for the whole cohort
+        genders = [gender] * n if gender is not None else [rng.choice(NPC_GENDERS) for _ in range(n)]
+        roles = [role] * n if role is not None else [rng.choice(NPC_ROLES) for _ in range(n)]
+        if age is not None:
+            ages = [age] * n
+        else:
+            ages = [rng.randint(*_age_range(npc_role, age_min, age_max)) for npc_role in roles]
+        names = [rng.choice(MALE_NAMES if npc_gender == "male" else FEMALE_NAMES) for npc_gender in genders]
+        locations = [location] * n if location is not None else self.choose_settlements(n)
+        
+        # Roles the gender may not hold are replaced, as Character does
+        allowed_roles = {npc_gender: self.game_manager.historical_constraints.get_allowed_roles(npc_gender)
+                         for npc_gender in set(genders)}
+        
+        # NPCs at each location that new NPCs may form ties with, gathered once per location
+        peers_at = {}
+        peers_by_role = {}
+        ties = []
+        
+        generated = []
+        for npc_name, npc_gender, npc_role, npc_age, npc_location in zip(names, genders, roles, ages, locations):
+            if npc_role not in allowed_roles[npc_gender]:
+                npc_role = allowed_roles[npc_gender][0]
+            
+            if marital_status is not None:
+                npc_marital_status = marital_status
             else:
-                age = random.randint(16, 70)
-        
-        # Calculate birth year
-        birth_year = self.game_manager.game_year - age
-        
-        # Create the NPC
-        npc = Character(name, gender, role, birth_year)
-        npc.age = age
-        
-        # Add some randomization to attributes and skills
-        for attr in npc.attributes:
-            # Adjust attributes based on role
-            base_value = npc.attributes[attr]
-            if role == "noble" and attr in ["charisma", "intelligence"]:
-                base_value += random.randint(5, 15)
-            elif role == "knight" and attr in ["strength", "endurance"]:
-                base_value += random.randint(5, 15)
-            elif role == "merchant" and attr in ["charisma", "cunning"]:
-                base_value += random.randint(5, 15)
-            elif role == "farmer" and attr in ["strength", "endurance"]:
-                base_value += random.randint(5, 15)
-            elif role == "craftsman" and attr in ["dexterity", "intelligence"]:
-                base_value += random.randint(5, 15)
-            elif role == "priest" and attr in ["intelligence", "wisdom"]:
-                base_value += random.randint(5, 15)
+                single_chance, married_chance = _marital_status_chances(npc_role, npc_age)
+                roll = rng.random()
+                if roll < single_chance:
+                    npc_marital_status = "single"
+                elif roll < single_chance + married_chance:
+                    npc_marital_status = "married"
+                else:
+                    npc_marital_status = "widowed"
+            
+            npc = NPCRecord(npc_name, npc_gender, npc_role, game_year - npc_age, npc_age, npc_marital_status,
+                            tuple(rng.sample(PERSONALITY_TRAITS, rng.randint(1, 3))),
+                            rng.choice(BACKGROUNDS.get(npc_role, DEFAULT_BACKGROUNDS)),
+                            rng.getrandbits(32), self.next_serial, self.clock)
+            self.next_serial += 1
             
-            # Add some randomness
-            base_value += random.randint(-10, 10)
+            npc_id = self._allocate_id()
+            self.npcs[npc_id] = npc
+            self.npc_locations[npc_id] = npc_location
+            self._index_npc(npc_id, npc)
+            generated.append((npc_id, npc))
             
-            # Ensure within bounds
-            npc.attributes[attr] = max(1, min(100, base_value))
+            # Ties to the NPCs already at the location
+            if npc_location not in peers_at:
+                peers_at[npc_location] = sorted(self.location_index[npc_location] - {npc_id})
+            peers = peers_at[npc_location]
+            if peers:
+                for friend_id in rng.sample(peers, min(len(peers), rng.randint(0, MAX_FRIENDS))):
+                    ties.append((npc_id, friend_id, "friend", rng.uniform(0.3, 1.0)))
+                if rng.random() < RIVAL_CHANCE:
+                    ties.append((npc_id, rng.choice(peers), "rival", rng.uniform(0.3, 1.0)))
+                for role_name in (npc_role, LIEGE_ROLES.get(npc_role)):
+                    if role_name is not None and (npc_location, role_name) not in peers_by_role:
+                        peers_by_role[npc_location, role_name] = sorted(
+                            self.role_index.get(role_name, set()).intersection(peers))
+                kin = peers_by_role[npc_location, npc_role]
+                if kin and rng.random() < KIN_CHANCE:
+                    ties.append((npc_id, rng.choice(kin), "kin", 1.0))
+                lieges = peers_by_role.get((npc_location, LIEGE_ROLES.get(npc_role)))
+                if lieges:
+                    ties.append((npc_id, rng.choice(lieges), "vassal", 1.0))
+            peers.append(npc_id)
+            peers_by_role.setdefault((npc_location, npc_role), []).append(npc_id)
         
-        # Assign an ID to the NPC
-        npc_id = self.next_npc_id
-        self.next_npc_id += 1
+        self.social_graph.add_edges(ties)
+        metrics = self.game_manager.metrics
+        for npc_role, count in Counter(npc.role for _, npc in generated).items():
+            metrics.increment("npc_births_total", count, role=npc_role)
+        return generated
+    
+    def enable_population_store(self, size, use_numpy=None):
+        """Add a background population kept in a columnar NPC store.
+        
+        The background NPCs have no Character objects; they only age, marry,
+        move, change career and die, all in one vectorized update per year.
+        They live in the world's settlements, drawn by the settlements'
+        population as for the NPCs with records.
         
-        # Store the NPC
-        self.npcs[npc_id] = npc
+        Args:
+            size: The number of background NPCs.
+            use_numpy: Force (True) or forbid (False) the NumPy store (optional,
+                NumPy is used whenever it is installed if None).
+            
+        Returns:
+            The new NPC store.
+        """
+        seed = self.game_manager.random_streams.derive_seed("npc_store")
+        names, cum_weights = self._settlement_weights()
+        self.population = create_npc_store(size, seed, use_numpy, names, cum_weights)
+        return self.population
+    
+    def promote_npc(self, npc_id):
+        """Get the full Character of an NPC, promoting its record if needed.
         
-        # Store the NPC's location
-        if location is None:
-            # Default to the player's location
-            location = "town"  # Simple default
+        Args:
+            npc_id: The ID of the NPC.
+            
+        Returns:
+            The NPC's Character, or None if not found.
+        """
+        npc = self.npcs.get(npc_id)
+        if not isinstance(npc, NPCRecord):
+            return npc
         
-        self.npc_locations[npc_id] = location
+        character = npc.to_character()
+        self.npcs[npc_id] = character
+        self.promoted[npc_id] = npc
+        self.game_manager.metrics.increment("npc_promotions_total")
+        return character
+    
+    def demote_npc(self, npc_id):
+        """Replace a promoted NPC's Character with its compact record.
         
-        # Add some personality traits
-        npc.personality_traits = []
-        num_traits = random.randint(1, 3)
-        all_traits = [
-            "Kind", "Cruel", "Ambitious", "Lazy", "Honest", "Deceitful", "Brave", "Cowardly",
-            "Generous", "Greedy", "Patient", "Impatient", "Humble", "Proud", "Loyal", "Treacherous",
-            "Pious", "Cynical", "Lustful", "Chaste", "Temperate", "Gluttonous", "Trusting", "Suspicious"
-        ]
-        npc.personality_traits = random.sample(all_traits, num_traits)
-        
-        # Add some background details
-        backgrounds = {
-            "noble": [
-                "From an ancient noble family",
-                "Recently elevated to nobility",
-                "From a family known for military service",
-                "From a family known for scholarship",
-                "From a family with a scandalous past"
-            ],
-            "knight": [
-                "Knighted for valor in battle",
-                "From a family of knights",
-                "Rose from common origins",
-                "Served as a squire to a famous knight",
-                "Won fame in tournaments"
-            ],
-            "merchant": [
-                "Inherited a trading business",
-                "Started as a peddler",
-                "Specializes in exotic goods",
-                "Has trading connections abroad",
-                "Known for fair dealing"
-            ],
-            "farmer": [
-                "Owns a small plot of land",
-                "Works on a noble's estate",
-                "Known for quality produce",
-                "Struggling with recent harvests",
-                "Experimenting with new crops"
-            ],
-            "craftsman": [
-                "Master of their craft",
-                "Apprenticed under a famous artisan",
-                "Creates goods for nobility",
-                "Innovator in their field",
-                "Struggling to compete with imports"
-            ],
-            "priest": [
-                "From a noble family",
-                "Rose from humble origins",
-                "Known for scholarly work",
-                "Known for charitable works",
-                "Has political ambitions"
-            ]
-        }
-        
-        npc.background = random.choice(backgrounds.get(role, ["Unknown background"]))
-        
-        # Add marital status
-        if age >= 16:
-            marital_status_chances = {
-                "single": 0.3,
-                "married": 0.6,
-                "widowed": 0.1
-            }
+        Args:
+            npc_id: The ID of the NPC.
             
-            # Adjust based on age
-            if age < 20:
-                marital_status_chances["single"] = 0.8
-                marital_status_chances["married"] = 0.2
-                marital_status_chances["widowed"] = 0.0
-            elif age > 50:
-                marital_status_chances["single"] = 0.2
-                marital_status_chances["married"] = 0.5
-                marital_status_chances["widowed"] = 0.3
+        Returns:
+            The NPC's record, or None if the NPC was not promoted.
+        """
+        record = self.promoted.pop(npc_id, None)
+        if record is None:
+            return None
+        
+        record.update_from(self.npcs[npc_id])
+        self.npcs[npc_id] = record
+        self._mark_changed(npc_id)
+        self.game_manager.metrics.increment("npc_demotions_total")
+        return record
+    
+    def demote_unreferenced_npcs(self):
+        """Demote every promoted NPC that the player and story arcs no longer refer to.
+        
+        Returns:
+            The number of NPCs demoted.
+        """
+        if not self.promoted:
+            return 0
+        
+        referenced_ids = set()
+        story_arc_manager = self.game_manager.story_arc_manager
+        if story_arc_manager:
+            for npc_ids in story_arc_manager.arc_npcs.values():
+                referenced_ids.update(npc_ids)
+        
+        player = self.game_manager.player
+        demoted = 0
+        for npc_id in list(self.promoted):
+            if npc_id in referenced_ids:
+                continue
+            character = self.npcs[npc_id]
+            if player and character is player.spouse:
+                continue
+            self.demote_npc(npc_id)
+            demoted += 1
+        return demoted
+    
+    def choose_settlements(self, n, exclude=None, weights=None):
+        """Draw settlements for NPCs to live in, weighted by their population.
+        
+        Args:
+            n: The number of settlements to draw.
+            exclude: A settlement name not to draw, e.g. the one an NPC leaves (optional).
+            weights: The result of _settlement_weights, if already at hand (optional).
             
-            # Adjust based on role
-            if role == "priest":
-                marital_status_chances["single"] = 1.0
-                marital_status_chances["married"] = 0.0
-                marital_status_chances["widowed"] = 0.0
+        Returns:
+            A list of settlement names.
+        """
+        names, cum_weights = weights or self._settlement_weights()
+        if exclude is not None and len(names) > 1:
+            # Redraw the few that land on the excluded settlement
+            chosen = []
+            while len(chosen) < n:
+                chosen.extend(name for name in self.rng.choices(names, cum_weights=cum_weights, k=n - len(chosen))
+                              if name != exclude)
+            return chosen
+        return self.rng.choices(names, cum_weights=cum_weights, k=n)
+    
+    def _settlement_weights(self):
+        """Get the settlement names and their cumulative population weights.
+        
+        Returns:
+            A tuple of (names, cumulative weights).
+        """
+        world = self.game_manager.world
+        if not world or not world.settlements:
+            return [DEFAULT_LOCATION], [1]
+        
+        names = []
+        cum_weights = []
+        total = 0
+        for settlement in world.settlements:
+            total += max(1, settlement.population)
+            names.append(settlement.name)
+            cum_weights.append(total)
+        return names, cum_weights
+    
+    def get_settlement_npc_ids(self, settlement):
+        """Get the IDs of the NPCs living in a settlement.
+        
+        Args:
+            settlement: The Settlement or its name.
             
-            # Determine marital status
-            rand = random.random()
-            if rand < marital_status_chances["single"]:
-                npc.marital_status = "single"
-            elif rand < marital_status_chances["single"] + marital_status_chances["married"]:
-                npc.marital_status = "married"
-            else:
-                npc.marital_status = "widowed"
-        else:
-            npc.marital_status = "single"
+        Returns:
+            The set of NPC IDs kept by the location index; do not modify it.
+        """
+        return self.location_index.get(getattr(settlement, "name", settlement), frozenset())
+    
+    def get_settlement_npc_counts(self):
+        """Count the NPCs living in each settlement.
         
-        return npc
+        Returns:
+            A dictionary mapping settlement names to NPC counts.
+        """
+        return {location: len(npc_ids) for location, npc_ids in self.location_index.items()}
     
     def get_npc(self, npc_id):
         """Get an NPC by ID.
@@ -238,7 +642,7 @@ class NPCManager:
         Returns:
             A list of (npc_id, npc) tuples for NPCs with the specified role.
         """
-        return [(npc_id, npc) for npc_id, npc in self.npcs.items() if npc.role == role]
+        return self.find_npcs(role=role)
     
     def get_npcs_by_location(self, location):
         """Get all NPCs at a specific location.
@@ -249,8 +653,7 @@ class NPCManager:
         Returns:
             A list of (npc_id, npc) tuples for NPCs at the specified location.
         """
-        return [(npc_id, self.npcs[npc_id]) for npc_id in self.npc_locations 
-                if self.npc_locations[npc_id] == location and npc_id in self.npcs]
+        return self.find_npcs(location=location)
     
     def get_random_npcs(self, count=3, exclude_ids=None):
         """Get a random selection of NPCs.
@@ -262,15 +665,10 @@ class NPCManager:
         Returns:
             A list of (npc_id, npc) tuples.
         """
-        exclude_ids = exclude_ids or []
-        eligible_npcs = [(npc_id, npc) for npc_id, npc in self.npcs.items() if npc_id not in exclude_ids]
-        
-        if len(eligible_npcs) <= count:
-            return eligible_npcs
-        
-        return random.sample(eligible_npcs, count)
+        return self.sample_npcs(count, exclude_ids=exclude_ids)
     
-    def get_suitable_npcs_for_arc(self, arc_id, count=1, role=None, gender=None, age_min=None, age_max=None, marital_status=None):
+    def get_suitable_npcs_for_arc(self, arc_id, count=1, role=None, gender=None, age_min=None, age_max=None,
+                                  marital_status=None, connected_to=None):
         """Get NPCs suitable for a specific story arc.
         
         Args:
@@ -281,100 +679,571 @@ class NPCManager:
             age_min: Filter by minimum age (optional).
             age_max: Filter by maximum age (optional).
             marital_status: Filter by marital status (optional).
+            connected_to: NPC IDs whose kin and friends are preferred (optional).
             
         Returns:
             A list of (npc_id, npc) tuples.
         """
-        # Filter NPCs based on criteria
-        eligible_npcs = []
+        filters = {"role": role, "gender": gender, "marital_status": marital_status,
+                   "age_min": age_min, "age_max": age_max}
         
-        for npc_id, npc in self.npcs.items():
-            # Skip NPCs already involved in this arc
-            if arc_id in self.game_manager.story_arc_manager.arc_npcs and npc_id in self.game_manager.story_arc_manager.arc_npcs[arc_id]:
-                continue
-            
-            # Apply filters
-            if role is not None and npc.role != role:
-                continue
+        # Skip NPCs already involved in this arc
+        exclude_ids = list(self.game_manager.story_arc_manager.arc_npcs.get(arc_id, []))
+        
+        # Prefer NPCs tied to the given ones, found without scanning the population
+        selected = []
+        if connected_to:
+            connected = self.get_connected_npcs(connected_to, edge_types=("kin", "friend"),
+                                                exclude_ids=exclude_ids, **filters)
+            selected = connected if len(connected) <= count else self.rng.sample(connected, count)
+            exclude_ids.extend(npc_id for npc_id, _ in selected)
+        
+        if len(selected) < count:
+            # Draw a random selection matching the criteria
+            needed = count - len(selected)
+            eligible_npcs = self.sample_npcs(needed, exclude_ids=exclude_ids, **filters)
             
-            if gender is not None and npc.gender != gender:
-                continue
+            # If we don't have enough eligible NPCs, generate some new ones
+            if len(eligible_npcs) < needed:
+                eligible_npcs.extend(self.generate_npcs(needed - len(eligible_npcs), role=role,
+                                                        gender=gender, age_min=age_min, age_max=age_max,
+                                                        marital_status=marital_status))
+            selected.extend(eligible_npcs)
+        
+        return selected
+    
+    def sample_npcs(self, count, role=None, location=None, gender=None, marital_status=None,
+                    age_min=None, age_max=None, exclude_ids=None):
+        """Draw random NPCs matching every given filter, without listing every match.
+        
+        NPCs are drawn from the ID sampler and checked against the filters,
+        so the cost grows with the number wanted rather than the population.
+        When the filters are so selective that most draws would miss, the
+        smallest matching index set is searched instead.
+        
+        Args:
+            count: The number of NPCs wanted.
+            role: Filter by role (optional).
+            location: Filter by location (optional).
+            gender: Filter by gender (optional).
+            marital_status: Filter by marital status (optional).
+            age_min: Filter by minimum age (optional).
+            age_max: Filter by maximum age (optional).
+            exclude_ids: NPC IDs to leave out (optional).
             
-            if age_min is not None and npc.age < age_min:
-                continue
+        Returns:
+            A list of at most count (npc_id, npc) tuples in random order, only
+            shorter when fewer NPCs match.
+        """
+        excluded = set(exclude_ids) if exclude_ids else set()
+        filters = {"role": role, "location": location, "gender": gender, "marital_status": marital_status,
+                   "age_min": age_min, "age_max": age_max}
+        
+        if all(value is None for value in filters.values()):
+            npc_ids = self.id_sampler.sample(self.rng, count, excluded)
+            return [(npc_id, self.npcs[npc_id]) for npc_id in npc_ids]
+        
+        # The most selective index bounds the share of NPCs that can match
+        population = len(self.id_sampler)
+        matches = population
+        for index, value in ((self.role_index, role), (self.location_index, location),
+                             (self.gender_index, gender), (self.marital_status_index, marital_status)):
+            if value is not None:
+                matches = min(matches, len(index.get(value, ())))
+        if matches == 0 or count <= 0:
+            return []
+        
+        # Draw while that is expected to be cheaper than searching the smallest
+        # index set; a draw costs about as much as checking 16 set members
+        selected = []
+        max_draws = matches // 16
+        if 4 * count * population // matches < max_draws:
+            npc_ids = self.id_sampler.sample(self.rng, count, excluded, max_draws=max_draws,
+                                             accept=lambda npc_id: self._matches(npc_id, **filters))
+            selected = [(npc_id, self.npcs[npc_id]) for npc_id in npc_ids]
+            if len(selected) == count:
+                return selected
+            excluded.update(npc_ids)
+        
+        # Too few found by drawing, so search the indexes for the rest
+        eligible_npcs = self.find_npcs(exclude_ids=excluded, **filters)
+        needed = count - len(selected)
+        return selected + self.rng.sample(eligible_npcs, min(needed, len(eligible_npcs)))
+    
+    def _matches(self, npc_id, role=None, location=None, gender=None, marital_status=None,
+                 age_min=None, age_max=None):
+        """Check an NPC against the filters of find_npcs."""
+        npc = self.npcs[npc_id]
+        return ((role is None or npc.role == role)
+                and (location is None or self.npc_locations[npc_id] == location)
+                and (gender is None or npc.gender == gender)
+                and (marital_status is None or getattr(npc, "marital_status", "single") == marital_status)
+                and (age_min is None or npc.age >= age_min)
+                and (age_max is None or npc.age <= age_max))
+    
+    def get_connected_npcs(self, npc_ids, edge_types=None, **filters):
+        """Find the NPCs tied to any of several NPCs in the social graph.
+        
+        Args:
+            npc_ids: The IDs of the NPCs whose neighbours are wanted.
+            edge_types: Only follow ties of these types (optional).
+            **filters: Any of the filters of find_npcs.
             
-            if age_max is not None and npc.age > age_max:
-                continue
+        Returns:
+            A list of (npc_id, npc) tuples in ID order.
+        """
+        return self.find_npcs(within_ids=self.social_graph.neighbor_ids(npc_ids, edge_types), **filters)
+    
+    def resolve_npc(self, npc_id, serial):
+        """Get a living NPC by ID, checking the ID has not been reused since.
+        
+        Args:
+            npc_id: The ID the NPC had.
+            serial: The NPC's serial number.
             
-            if marital_status is not None and getattr(npc, "marital_status", "single") != marital_status:
-                continue
+        Returns:
+            The NPC, or None if they have left the world.
+        """
+        npc = self.npcs.get(npc_id)
+        if npc is None or self.get_serial(npc_id) != serial:
+            return None
+        return npc
+    
+    def get_relationships(self, relationships, k=None):
+        """Resolve a character's relationships to the living NPCs, strongest first.
+        
+        Args:
+            relationships: The character's RelationshipStore.
+            k: Only resolve the k strongest relationships (optional).
             
-            eligible_npcs.append((npc_id, npc))
+        Returns:
+            A list of (npc_id, npc, level, status) tuples.
+        """
+        resolved = []
+        for serial, npc_id, level, status in relationships.top(len(relationships) if k is None else k):
+            npc = self.resolve_npc(npc_id, serial)
+            if npc is not None:
+                resolved.append((npc_id, npc, level, status))
+        return resolved
+    
+    def prune_relationships(self, relationships):
+        """Remove the relationships with NPCs who have left the world.
         
-        # If we don't have enough eligible NPCs, generate some new ones
-        if len(eligible_npcs) < count:
-            for _ in range(count - len(eligible_npcs)):
-                new_npc = self.generate_npc(role=role, gender=gender, age=random.randint(age_min or 16, age_max or 70))
-                if marital_status is not None:
-                    new_npc.marital_status = marital_status
-                npc_id = self.next_npc_id - 1  # The ID assigned in generate_npc
-                eligible_npcs.append((npc_id, new_npc))
+        Unknown relationships, with NPCs who were never in this world, are kept.
         
-        # Return a random selection
-        if len(eligible_npcs) <= count:
-            return eligible_npcs
+        Args:
+            relationships: A character's RelationshipStore.
+            
+        Returns:
+            The number of relationships removed.
+        """
+        return relationships.retain(lambda serial, npc_id: serial < 0 or self.resolve_npc(npc_id, serial) is not None)
+    
+    def describe_relationship(self, relationships, serial, npc_id):
+        """Get the name and role of the NPC in a relationship, living, dead or unknown.
         
-        return random.sample(eligible_npcs, count)
+        Args:
+            relationships: The character's RelationshipStore.
+            serial: The NPC's serial number.
+            npc_id: The ID the NPC had.
+            
+        Returns:
+            A tuple of (name, role), or (None, None) if the NPC cannot be found.
+        """
+        npc = self.resolve_npc(npc_id, serial)
+        if npc is not None:
+            return npc.name, npc.role
+        snapshot = relationships.snapshot(serial)
+        if snapshot is not None:
+            return snapshot
+        entry = self.archive.get(serial)
+        if entry is not None:
+            return entry["name"], entry["role"]
+        return None, None
     
     def update_for_new_year(self):
         """Update NPCs for a new year."""
-        # Age all NPCs
-        for npc_id, npc in list(self.npcs.items()):
-            npc.age += 1
+        # Return NPCs nobody refers to any more to their compact records
+        self.demote_unreferenced_npcs()
+        
+        # Age all NPCs; records age with the clock, promoted Characters on their own
+        self.years_passed += 1
+        for npc_id in self.promoted:
+            self.npcs[npc_id].age += 1
+        
+        # Roll each kingdom's life events, in worker processes for large populations,
+        # and apply them in kingdom order
+        marrying = {"male": [], "female": []}
+        metrics = self.game_manager.metrics
+        for shard_year in self._roll_shards():
+            for npc_id in shard_year.married:
+                self.set_npc_marital_status(npc_id, "married")
+                marrying.setdefault(self.npcs[npc_id].gender, []).append(npc_id)
+            for npc_id in shard_year.died:
+                role = self.npcs[npc_id].role
+                self.record_death(npc_id)
+                metrics.increment("npc_deaths_total", role=role)
+            for npc_id, location in shard_year.moved:
+                self.set_npc_location(npc_id, location)
+            for npc_id, role in shard_year.promoted:
+                self.set_npc_role(npc_id, role)
+        
+        # Pair this year's brides and grooms; the rest marry outside the named NPCs
+        self.social_graph.add_edges((groom_id, bride_id, "spouse", 1.0)
+                                    for groom_id, bride_id in zip(marrying["male"], marrying["female"]))
+        
+        # Friendships and rivalries fade unless renewed
+        self.social_graph.decay()
+        
+        # Update the background population in one vectorized step
+        if self.population is not None:
+            population_year = self.population.update_for_new_year()
+            for role, count in population_year.deaths_by_role.items():
+                metrics.increment("population_deaths_total", count, role=role)
+            metrics.increment("population_births_total", population_year.died)
+        
+        # Clear references to the dead so their IDs can be reused
+        self.release_removed_ids()
+        
+        # Generate new NPCs to replace those who died, following the world's growth
+        if not self.population_config.is_default():
+            self.target_npc_count = self.population_config.target_for(self.game_manager.world)
+        self.generate_npcs(self.target_npc_count - len(self.npcs))
+    
+    def _make_shards(self):
+        """Split the NPCs into one shard per kingdom for this year's update.
+        
+        Returns:
+            A list of NPCShard objects in kingdom name order.
+        """
+        names, cum_weights = self._settlement_weights()
+        kingdom_of = self._kingdoms_by_settlement()
+        
+        # NPCs outside any kingdom's settlements share a shard with no name
+        members = {}
+        for location, npc_ids in self.location_index.items():
+            members.setdefault(kingdom_of.get(location, ""), []).extend(npc_ids)
+        
+        shards = []
+        for kingdom in sorted(members):
+            npc_ids = sorted(members[kingdom])
+            npcs = [self.npcs[npc_id] for npc_id in npc_ids]
+            shards.append(NPCShard(kingdom, self._shard_seed(kingdom), npc_ids,
+                                   [self.npc_locations[npc_id] for npc_id in npc_ids],
+                                   [npc.age for npc in npcs],
+                                   [npc.role for npc in npcs],
+                                   [getattr(npc, "marital_status", "single") for npc in npcs],
+                                   names, cum_weights))
+        return shards
+    
+    def _kingdoms_by_settlement(self):
+        """Map each settlement's name to its kingdom's name."""
+        world = self.game_manager.world
+        return {settlement.name: settlement.kingdom.name for settlement in world.settlements} if world else {}
+    
+    def _shard_seed(self, kingdom):
+        """Get the seed of a kingdom's shard for this year."""
+        return self.game_manager.random_streams.derive_seed(f"npc_shard:{kingdom}:{self.years_passed}")
+    
+    def _roll_shards(self):
+        """Roll the life events of every kingdom's shard.
+        
+        Each shard has its own random seed, so the results are the same
+        whether the shards are rolled here or in worker processes.
+        
+        Returns:
+            A list of ShardYear objects in kingdom order.
+        """
+        workers = self.population_config.workers
+        if not workers or workers <= 1 or len(self.npcs) < self.population_config.parallel_min_npcs:
+            # The workers, if any, fall out of date and are resent every NPC when next used
+            self._shard_kingdoms = None
+            self._changed_ids = set()
+            return [roll_shard_year(shard) for shard in self._make_shards()]
+        
+        if self._executors is None:
+            # Imported here so that games without workers never load it
+            from concurrent.futures import ProcessPoolExecutor
+            # One process per executor, so each kingdom is always rolled by the
+            # process holding its shard
+            self._executors = [ProcessPoolExecutor(max_workers=1) for _ in range(workers)]
+        updates = self._make_shard_updates()
+        futures = [executor.submit(roll_worker_shards, update)
+                   for executor, update in zip(self._executors, updates)]
+        shard_years = [shard_year for future in futures for shard_year in future.result()]
+        shard_years.sort(key=lambda shard_year: shard_year.name)
+        return shard_years
+    
+    def _make_shard_updates(self):
+        """Gather the NPCs changed since the workers' last year into one update per worker.
+        
+        Returns:
+            A list of ShardUpdate objects, one per worker.
+        """
+        names, cum_weights = self._settlement_weights()
+        kingdom_of = self._kingdoms_by_settlement()
+        reset = self._shard_kingdoms is None
+        updates = [ShardUpdate(self.years_passed, reset, names, cum_weights) for _ in self._executors]
+        
+        if reset:
+            # Send every NPC
+            self._shard_kingdoms = {}
+            self._kingdom_workers = {}
+            changed_ids = list(self.npcs)
+        else:
+            # Promoted Characters change without going through the indexes, and
+            # NPCs change shard when their settlement changes kingdom
+            changed_ids = self._changed_ids
+            changed_ids.update(self.promoted)
+            for location in set(kingdom_of) | set(self._settlement_kingdoms):
+                if kingdom_of.get(location) != self._settlement_kingdoms.get(location):
+                    changed_ids.update(self.location_index.get(location, ()))
+        self._settlement_kingdoms = kingdom_of
+        self._changed_ids = set()
+        
+        shard_kingdoms = self._shard_kingdoms
+        for npc_id in changed_ids:
+            old_kingdom = shard_kingdoms.get(npc_id)
+            npc = self.npcs.get(npc_id)
+            kingdom = None
+            if npc is not None:
+                location = self.npc_locations[npc_id]
+                kingdom = kingdom_of.get(location, "")
+                updates[self._worker_for(kingdom)].changed.append(
+                    (npc_id, kingdom, location, npc.age - self.years_passed, npc.role,
+                     getattr(npc, "marital_status", "single")))
+                shard_kingdoms[npc_id] = kingdom
+            elif old_kingdom is not None:
+                del shard_kingdoms[npc_id]
+            if old_kingdom is not None and old_kingdom != kingdom:
+                updates[self._kingdom_workers[old_kingdom]].removed.append((npc_id, old_kingdom))
+        
+        for kingdom, worker in self._kingdom_workers.items():
+            updates[worker].seeds[kingdom] = self._shard_seed(kingdom)
+        return updates
+    
+    def _worker_for(self, kingdom):
+        """Get the worker rolling a kingdom's shard, handing new kingdoms out in turn."""
+        worker = self._kingdom_workers.get(kingdom)
+        if worker is None:
+            worker = len(self._kingdom_workers) % len(self._executors)
+            self._kingdom_workers[kingdom] = worker
+        return worker
+    
+    def _mark_changed(self, npc_id):
+        """Note that an NPC changed, so the workers are sent it before the next year."""
+        if self._shard_kingdoms is not None:
+            self._changed_ids.add(npc_id)
+    
+    def close(self):
+        """Shut down the worker processes of the yearly update, if any were started."""
+        if self._executors is not None:
+            for executor in self._executors:
+                executor.shutdown()
+            self._executors = None
+            self._shard_kingdoms = None
+            self._changed_ids = set()
+    
+    def find_npcs(self, role=None, location=None, gender=None, marital_status=None,
+                  age_min=None, age_max=None, exclude_ids=None, within_ids=None):
+        """Find the NPCs matching every given filter using the secondary indexes.
+        
+        The smallest matching index set is checked against the other filters,
+        so the cost depends on how selective the filters are rather than on
+        the size of the population.
+        
+        Args:
+            role: Filter by role (optional).
+            location: Filter by location (optional).
+            gender: Filter by gender (optional).
+            marital_status: Filter by marital status (optional).
+            age_min: Filter by minimum age (optional).
+            age_max: Filter by maximum age (optional).
+            exclude_ids: NPC IDs to leave out (optional).
+            within_ids: A set of NPC IDs to search instead of every NPC (optional).
+            
+        Returns:
+            A list of (npc_id, npc) tuples in ID order.
+        """
+        candidate_sets = [] if within_ids is None else [within_ids]
+        for index, value in ((self.role_index, role), (self.location_index, location),
+                             (self.gender_index, gender), (self.marital_status_index, marital_status)):
+            if value is not None:
+                candidate_sets.append(index.get(value, set()))
+        
+        if candidate_sets:
+            candidate_sets.sort(key=len)
+            matching_ids = candidate_sets[0].intersection(*candidate_sets[1:])
+            
+            # Check the age range on the few NPCs left
+            if age_min is not None or age_max is not None:
+                low = age_min if age_min is not None else 0
+                high = age_max if age_max is not None else float("inf")
+                matching_ids = [npc_id for npc_id in matching_ids if low <= self.npcs[npc_id].age <= high]
+        elif age_min is not None or age_max is not None:
+            # Gather the cohorts whose current age is in range
+            matching_ids = []
+            for cohort, npc_ids in self.cohort_index.items():
+                age = cohort + self.years_passed
+                if (age_min is None or age >= age_min) and (age_max is None or age <= age_max):
+                    matching_ids.extend(npc_ids)
+        else:
+            matching_ids = self.npcs.keys()
+        
+        if exclude_ids:
+            excluded = set(exclude_ids)
+            matching_ids = [npc_id for npc_id in matching_ids if npc_id not in excluded]
+        
+        return [(npc_id, self.npcs[npc_id]) for npc_id in sorted(matching_ids)]
+    
+    def set_npc_location(self, npc_id, location):
+        """Move an NPC, keeping the location index up to date.
+        
+        Args:
+            npc_id: The ID of the NPC.
+            location: The new location.
+        """
+        self._reindex(self.location_index, npc_id, self.npc_locations.get(npc_id), location)
+        self.npc_locations[npc_id] = location
+    
+    def set_npc_role(self, npc_id, role):
+        """Change an NPC's role, keeping the role index up to date.
+        
+        Args:
+            npc_id: The ID of the NPC.
+            role: The new role.
+        """
+        npc = self.npcs[npc_id]
+        self._reindex(self.role_index, npc_id, npc.role, role)
+        npc.role = role
+    
+    def set_npc_marital_status(self, npc_id, marital_status):
+        """Change an NPC's marital status, keeping the marital status index up to date.
+        
+        Args:
+            npc_id: The ID of the NPC.
+            marital_status: The new marital status.
+        """
+        npc = self.npcs[npc_id]
+        self._reindex(self.marital_status_index, npc_id, getattr(npc, "marital_status", "single"), marital_status)
+        npc.marital_status = marital_status
+    
+    def remove_npc(self, npc_id):
+        """Remove an NPC from the world and from every index.
+        
+        Args:
+            npc_id: The ID of the NPC.
+            
+        Returns:
+            The removed NPC, or None if not found.
+        """
+        npc = self.npcs.pop(npc_id, None)
+        if npc is None:
+            return None
+        self.promoted.pop(npc_id, None)
+        self.pending_free_ids.append(npc_id)
+        
+        location = self.npc_locations.pop(npc_id, None)
+        self.id_sampler.discard(npc_id)
+        self.social_graph.remove_npc(npc_id)
+        self._reindex(self.role_index, npc_id, npc.role, None)
+        self._reindex(self.location_index, npc_id, location, None)
+        self._reindex(self.gender_index, npc_id, npc.gender, None)
+        self._reindex(self.marital_status_index, npc_id, getattr(npc, "marital_status", "single"), None)
+        self._reindex(self.cohort_index, npc_id, npc.age - self.years_passed, None)
+        return npc
+    
+    def record_death(self, npc_id):
+        """Move a dead NPC to the archive and remove them from the world.
+        
+        Args:
+            npc_id: The ID of the NPC.
+            
+        Returns:
+            The archive entry's row, or None if the NPC was not found.
+        """
+        npc = self.npcs.get(npc_id)
+        if npc is None:
+            return None
+        
+        kin_ids = self.social_graph.neighbor_ids([npc_id], edge_types=("kin", "spouse"))
+        kin_serials = sorted(self.get_serial(kin_id) for kin_id in kin_ids)
+        row = self.archive.append(self.get_serial(npc_id), npc.name, npc.gender, npc.role,
+                                  npc.birth_year, self.game_manager.game_year, kin_serials)
+        self.remove_npc(npc_id)
+        return row
+    
+    def get_serial(self, npc_id):
+        """Get the serial number of a living NPC.
+        
+        Args:
+            npc_id: The ID of the NPC.
             
-            # Random chance for life events
-            if random.random() < 0.1:  # 10% chance per year
-                event_type = random.choice(["marriage", "death", "relocation", "career"])
-                
-                if event_type == "marriage" and getattr(npc, "marital_status", "single") == "single" and npc.age >= 16:
-                    npc.marital_status = "married"
-                
-                elif event_type == "death":
-                    # Chance of death increases with age
-                    death_chance = 0.01  # Base 1% chance
-                    if npc.age > 60:
-                        death_chance += (npc.age - 60) * 0.01  # +1% per year over 60
-                    
-                    if random.random() < death_chance:
-                        # NPC dies
-                        del self.npcs[npc_id]
-                        if npc_id in self.npc_locations:
-                            del self.npc_locations[npc_id]
-                        continue
-                
-                elif event_type == "relocation":
-                    # NPC moves to a new location
-                    locations = ["town", "village", "castle", "monastery", "market"]
-                    current_location = self.npc_locations.get(npc_id, "town")
-                    new_location = random.choice([loc for loc in locations if loc != current_location])
-                    self.npc_locations[npc_id] = new_location
-                
-                elif event_type == "career" and random.random() < 0.3:  # 30% chance of career event
-                    # Possible career changes based on role
-                    if npc.role == "farmer" and random.random() < 0.2:
-                        npc.role = "merchant"  # Farmer becomes merchant
-                    elif npc.role == "craftsman" and random.random() < 0.1:
-                        npc.role = "merchant"  # Craftsman becomes merchant
-                    elif npc.role == "merchant" and random.random() < 0.05:
-                        npc.role = "noble"  # Very rare: merchant becomes noble
-        
-        # Generate new NPCs to replace those who died
-        current_count = len(self.npcs)
-        target_count = 30  # Maintain around 30 NPCs
-        
-        if current_count < target_count:
-            for _ in range(target_count - current_count):
-                self.generate_npc()
+        Returns:
+            The serial number, which unlike the ID is never reused.
+        """
+        record = self.promoted.get(npc_id) or self.npcs[npc_id]
+        return record.serial
+    
+    def release_removed_ids(self):
+        """Drop every reference to removed NPCs in one pass and free their IDs for reuse.
+        
+        Returns:
+            The number of IDs freed.
+        """
+        removed_ids = self.pending_free_ids
+        if not removed_ids:
+            return 0
+        
+        story_arc_manager = self.game_manager.story_arc_manager
+        if story_arc_manager:
+            story_arc_manager.remove_npcs(removed_ids)
+        
+        for npc_id in removed_ids:
+            heapq.heappush(self.free_ids, npc_id)
+        self.pending_free_ids = []
+        return len(removed_ids)
+    
+    def _allocate_id(self):
+        """Get an ID for a new NPC, reusing the smallest freed one if any."""
+        if self.free_ids:
+            return heapq.heappop(self.free_ids)
+        npc_id = self.next_npc_id
+        self.next_npc_id += 1
+        return npc_id
+    
+    def _index_npc(self, npc_id, npc):
+        """Add a new NPC to every index.
+        
+        Args:
+            npc_id: The ID of the NPC.
+            npc: The NPC.
+        """
+        self._mark_changed(npc_id)
+        self.id_sampler.add(npc_id)
+        self.role_index.setdefault(npc.role, set()).add(npc_id)
+        self.location_index.setdefault(self.npc_locations[npc_id], set()).add(npc_id)
+        self.gender_index.setdefault(npc.gender, set()).add(npc_id)
+        self.marital_status_index.setdefault(npc.marital_status, set()).add(npc_id)
+        self.cohort_index.setdefault(npc.age - self.years_passed, set()).add(npc_id)
+    
+    def _reindex(self, index, npc_id, old_value, new_value):
+        """Move an NPC ID from one value's set to another's in an index.
+        
+        Args:
+            index: The index to update.
+            npc_id: The ID of the NPC.
+            old_value: The value the NPC is indexed under (None if not indexed).
+            new_value: The value to index it under (None to only remove it).
+        """
+        if self._shard_kingdoms is not None:
+            self._changed_ids.add(npc_id)
+        if old_value is not None and old_value in index:
+            index[old_value].discard(npc_id)
+            if not index[old_value]:
+                del index[old_value]
+        if new_value is not None:
+            index.setdefault(new_value, set()).add(npc_id)
     
     def get_npc_description(self, npc_id):
         """Get a description of an NPC.
@@ -0,0 +1,167 @@
+"""
+NPC Shards - Independent per-kingdom shards of the yearly NPC update, for worker processes
+"""
+import random
+from dataclasses import dataclass, field
+from typing import Dict, List, Tuple
+from game.characters.npc_store import (EVENT_CHANCE, BASE_DEATH_CHANCE, OLD_AGE,
+                                       DEATH_CHANCE_PER_YEAR_OLD, CAREER_CHANCE)
+
+EVENT_TYPES = ("marriage", "death", "relocation", "career")
+
+# Career changes: role -> (new role, chance once a career event happens)
+PROMOTIONS = {"farmer": ("merchant", 0.2), "craftsman": ("merchant", 0.1), "merchant": ("noble", 0.05)}
+
+@dataclass
+class NPCShard:
+    """The NPCs of one kingdom, as plain columns a worker process can roll."""
+    name: str
+    seed: int
+    npc_ids: List[int]
+    locations: List[str]
+    ages: List[int]
+    roles: List[str]
+    marital_statuses: List[str]
+    settlement_names: List[str]  # Where NPCs may move to
+    cum_weights: List[int]  # Cumulative population weights of settlement_names
+
+@dataclass
+class ShardYear:
+    """The life events rolled for the NPCs of one shard."""
+    name: str
+    married: List[int] = field(default_factory=list)
+    died: List[int] = field(default_factory=list)
+    moved: List[Tuple[int, str]] = field(default_factory=list)  # (NPC ID, new settlement)
+    promoted: List[Tuple[int, str]] = field(default_factory=list)  # (NPC ID, new role)
+
+@dataclass
+class ShardUpdate:
+    """What a worker needs to roll its kingdoms' shards for a year.
+
+    Only the NPCs changed since the worker's last year are sent; the worker
+    keeps the rest from year to year.
+    """
+    years_passed: int
+    reset: bool  # Forget every NPC before applying the changes
+    settlement_names: List[str]
+    cum_weights: List[int]
+    seeds: Dict[str, int] = field(default_factory=dict)  # Kingdom -> this year's seed
+    # (NPC ID, kingdom, location, cohort, role, marital status) of new or changed NPCs
+    changed: List[Tuple[int, str, str, int, str, str]] = field(default_factory=list)
+    removed: List[Tuple[int, str]] = field(default_factory=list)  # (NPC ID, kingdom it was in)
+
+class ShardSet:
+    """The NPCs of some kingdoms, kept up to date by ShardUpdates between years.
+
+    Ages are kept as cohorts (age minus the years passed), so ageing the
+    shards costs nothing.
+    """
+
+    def __init__(self):
+        """Initialize an empty set of shards."""
+        self.members = {}  # Maps kingdom to {NPC ID: (location, cohort, role, marital status)}
+
+    def apply(self, update):
+        """Apply a year's changes.
+
+        Args:
+            update: The ShardUpdate.
+        """
+        if update.reset:
+            self.members = {}
+        members = self.members
+        for npc_id, kingdom in update.removed:
+            members.get(kingdom, {}).pop(npc_id, None)
+        for npc_id, kingdom, location, cohort, role, marital_status in update.changed:
+            members.setdefault(kingdom, {})[npc_id] = (location, cohort, role, marital_status)
+
+    def roll(self, update):
+        """Roll this year's life events for every kingdom with a seed in the update.
+
+        Args:
+            update: The ShardUpdate, already applied.
+
+        Returns:
+            A list of ShardYear objects, one per kingdom with NPCs, in kingdom order.
+        """
+        years = []
+        for kingdom in sorted(update.seeds):
+            members = self.members.get(kingdom)
+            if not members:
+                continue
+            npc_ids = sorted(members)
+            rows = [members[npc_id] for npc_id in npc_ids]
+            shard = NPCShard(kingdom, update.seeds[kingdom], npc_ids,
+                             [row[0] for row in rows],
+                             [row[1] + update.years_passed for row in rows],
+                             [row[2] for row in rows],
+                             [row[3] for row in rows],
+                             update.settlement_names, update.cum_weights)
+            years.append(roll_shard_year(shard))
+        return years
+
+# The shards of this worker process, kept between years
+_worker_shards = ShardSet()
+
+def roll_worker_shards(update):
+    """Apply a year's changes to this worker process's shards and roll them.
+
+    Each worker process must be sent the updates for its kingdoms only, in
+    year order.
+
+    Args:
+        update: The ShardUpdate.
+
+    Returns:
+        A list of ShardYear objects in kingdom order.
+    """
+    _worker_shards.apply(update)
+    return _worker_shards.roll(update)
+
+def roll_shard_year(shard):
+    """Roll this year's life events for the NPCs of a shard.
+
+    Only reads the shard and its own random generator, so shards can be
+    rolled in any order or process and always give the same events.
+
+    Args:
+        shard: The NPCShard, with ages already advanced for the new year.
+
+    Returns:
+        A ShardYear with the events, in the shard's NPC order.
+    """
+    rng = random.Random(shard.seed)
+    year = ShardYear(shard.name)
+    can_move = len(shard.settlement_names) > 1
+
+    for npc_id, location, age, role, marital_status in zip(shard.npc_ids, shard.locations, shard.ages,
+                                                           shard.roles, shard.marital_statuses):
+        # Random chance for life events
+        if rng.random() >= EVENT_CHANCE:
+            continue
+        event_type = rng.choice(EVENT_TYPES)
+
+        if event_type == "marriage":
+            if marital_status == "single" and age >= 16:
+                year.married.append(npc_id)
+
+        elif event_type == "death":
+            # Chance of death increases with age
+            death_chance = BASE_DEATH_CHANCE + max(age - OLD_AGE, 0) * DEATH_CHANCE_PER_YEAR_OLD
+            if rng.random() < death_chance:
+                year.died.append(npc_id)
+
+        elif event_type == "relocation":
+            # Move to another settlement, weighted by population
+            if can_move:
+                destination = location
+                while destination == location:
+                    destination = rng.choices(shard.settlement_names, cum_weights=shard.cum_weights)[0]
+                year.moved.append((npc_id, destination))
+
+        elif rng.random() < CAREER_CHANCE and role in PROMOTIONS:
+            new_role, chance = PROMOTIONS[role]
+            if rng.random() < chance:
+                year.promoted.append((npc_id, new_role))
+
+    return year
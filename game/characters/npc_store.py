@@ -0,0 +1,383 @@
+"""
+NPC Store - Columnar storage and vectorized yearly update for the background population
+"""
+import random
+from bisect import bisect_right
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict
+
+from game.mechanics.historical_constraints import HISTORICAL_CONSTRAINTS
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the pure Python store is used instead
+    np = None
+
+# Code tables: each column stores the index of its value in one of these, or,
+# for locations, in the store's settlement names
+ROLES = ("noble", "knight", "merchant", "farmer", "craftsman", "priest")
+GENDERS = ("male", "female")
+MARITAL_STATUSES = ("single", "married", "widowed")
+DEFAULT_LOCATIONS = ("town",)  # Where NPCs live when no settlements are given
+
+NOBLE, KNIGHT, MERCHANT, FARMER, CRAFTSMAN, PRIEST = range(len(ROLES))
+SINGLE, MARRIED, WIDOWED = range(len(MARITAL_STATUSES))
+
+def _build_gender_roles():
+    """Map each gender and drawn role to the role an NPC of that gender gets.
+
+    Roles a gender may not hold are replaced by its first allowed role, as
+    NPCManager.generate_npcs does.
+    """
+    table = []
+    for gender in GENDERS:
+        allowed = [ROLES.index(role) for role in HISTORICAL_CONSTRAINTS.get_allowed_roles(gender) if role in ROLES]
+        table.append(tuple(role if role in allowed else allowed[0] for role in range(len(ROLES))))
+    return tuple(table)
+
+# Indexed by gender code, then drawn role code
+GENDER_ROLES = _build_gender_roles()
+
+# Yearly life event chances, the same as NPCManager.update_for_new_year
+EVENT_CHANCE = 0.1  # Chance of any life event per year
+NUM_EVENT_TYPES = 4  # Marriage, death, relocation, career
+BASE_DEATH_CHANCE = 0.01
+OLD_AGE = 60
+DEATH_CHANCE_PER_YEAR_OLD = 0.01
+CAREER_CHANCE = 0.3
+PROMOTION_CHANCES = {FARMER: (MERCHANT, 0.2), CRAFTSMAN: (MERCHANT, 0.1), MERCHANT: (NOBLE, 0.05)}
+
+@dataclass
+class PopulationYear:
+    """What happened to the stored population during one year."""
+    married: int = 0
+    died: int = 0
+    relocated: int = 0
+    promoted: int = 0
+    deaths_by_role: Dict[str, int] = field(default_factory=dict)
+
+class NPCStore:
+    """A population of anonymous NPCs kept as parallel columns.
+
+    Dead NPCs are replaced by newly generated ones in the same rows, so the
+    population keeps its size and every row holds a living NPC. Subclasses
+    hold the columns as NumPy arrays or as Python lists; both follow the same
+    rules and code tables.
+    """
+
+    def __len__(self):
+        return self.size
+
+    def get_record(self, row):
+        """Decode one row.
+
+        Args:
+            row: The row number.
+
+        Returns:
+            A dictionary with the NPC's age, role, gender, location and marital status.
+        """
+        return {
+            "age": int(self.age[row]),
+            "role": ROLES[self.role[row]],
+            "gender": GENDERS[self.gender[row]],
+            "location": self.locations[self.location[row]],
+            "marital_status": MARITAL_STATUSES[self.marital_status[row]]
+        }
+
+    def count_by(self, column):
+        """Count the NPCs with each value of a column.
+
+        Args:
+            column: One of 'role', 'gender', 'location' or 'marital_status'.
+
+        Returns:
+            A dictionary mapping decoded values to counts.
+        """
+        table = {"role": ROLES, "gender": GENDERS, "location": self.locations,
+                 "marital_status": MARITAL_STATUSES}[column]
+        counts = self._count_codes(getattr(self, column), len(table))
+        return {table[code]: int(count) for code, count in enumerate(counts) if count}
+
+class NumpyNPCStore(NPCStore):
+    """NPC store backed by NumPy arrays, updated with vectorized masks and draws."""
+
+    def __init__(self, size, seed=None, locations=DEFAULT_LOCATIONS, cum_weights=None):
+        """Initialize the store with a randomly generated population.
+
+        Args:
+            size: The number of NPCs.
+            seed: The seed of the store's generator (optional).
+            locations: The names of the settlements NPCs live in.
+            cum_weights: The cumulative weights settlements are drawn with
+                (optional, every settlement is equally likely if None).
+        """
+        self.rng = np.random.default_rng(seed)
+        self.size = size
+        self.locations = tuple(locations)
+        if cum_weights is None:
+            cum_weights = range(1, len(self.locations) + 1)
+        self.cum_weights = np.asarray(cum_weights, dtype=np.float64)
+        self.age = np.zeros(size, dtype=np.int16)
+        self.role = np.zeros(size, dtype=np.int8)
+        self.gender = np.zeros(size, dtype=np.int8)
+        self.location = np.zeros(size, dtype=np.int16)
+        self.marital_status = np.zeros(size, dtype=np.int8)
+        self._generate(np.arange(size))
+
+    def _generate(self, rows):
+        """Fill rows with newly generated NPCs.
+
+        Args:
+            rows: An array of row numbers.
+        """
+        count = len(rows)
+        rng = self.rng
+        gender = rng.integers(0, len(GENDERS), count).astype(np.int8)
+        role = np.asarray(GENDER_ROLES, dtype=np.int8)[gender, rng.integers(0, len(ROLES), count)]
+
+        # Age range depends on role
+        low = np.full(count, 16)
+        high = np.full(count, 70)
+        martial = (role == NOBLE) | (role == KNIGHT)
+        low[martial], high[martial] = 20, 60
+        low[role == PRIEST], high[role == PRIEST] = 25, 70
+        age = rng.integers(low, high + 1).astype(np.int16)
+
+        # Marital status depends on age and role
+        single_chance = np.full(count, 0.3)
+        married_chance = np.full(count, 0.6)
+        single_chance[age < 20], married_chance[age < 20] = 0.8, 0.2
+        single_chance[age > 50], married_chance[age > 50] = 0.2, 0.5
+        single_chance[role == PRIEST], married_chance[role == PRIEST] = 1.0, 0.0
+        roll = rng.random(count)
+        marital_status = np.full(count, WIDOWED, dtype=np.int8)
+        marital_status[roll < single_chance + married_chance] = MARRIED
+        marital_status[roll < single_chance] = SINGLE
+
+        self.role[rows] = role
+        self.age[rows] = age
+        self.gender[rows] = gender
+        self.location[rows] = self._draw_locations(count)
+        self.marital_status[rows] = marital_status
+
+    def _draw_locations(self, count):
+        """Draw the settlements of count NPCs by the settlements' weights."""
+        cum_weights = self.cum_weights
+        return np.searchsorted(cum_weights, self.rng.random(count) * cum_weights[-1], side="right")
+
+    def update_for_new_year(self):
+        """Age every NPC and roll this year's life events.
+
+        Returns:
+            A PopulationYear with what happened.
+        """
+        rng = self.rng
+        size = self.size
+        year = PopulationYear()
+        self.age += 1
+
+        # Each NPC has a chance of one life event of a random type
+        has_event = rng.random(size) < EVENT_CHANCE
+        event_type = rng.integers(0, NUM_EVENT_TYPES, size)
+
+        # Marriage
+        marry = has_event & (event_type == 0) & (self.marital_status == SINGLE) & (self.age >= 16)
+        self.marital_status[marry] = MARRIED
+        year.married = int(marry.sum())
+
+        # Death, more likely with age
+        death_chance = BASE_DEATH_CHANCE + np.maximum(self.age - OLD_AGE, 0) * DEATH_CHANCE_PER_YEAR_OLD
+        die = has_event & (event_type == 1) & (rng.random(size) < death_chance)
+        dead_rows = np.flatnonzero(die)
+        year.died = len(dead_rows)
+        if year.died:
+            role_counts = np.bincount(self.role[dead_rows], minlength=len(ROLES))
+            year.deaths_by_role = {ROLES[code]: int(count) for code, count in enumerate(role_counts) if count}
+
+        # Relocation to another settlement, redrawing those that land where they are
+        if len(self.locations) > 1:
+            moving_rows = np.flatnonzero(has_event & (event_type == 2))
+            destination = self.location[moving_rows]
+            staying = np.arange(len(moving_rows))
+            while len(staying):
+                destination[staying] = self._draw_locations(len(staying))
+                staying = staying[destination[staying] == self.location[moving_rows[staying]]]
+            self.location[moving_rows] = destination
+            year.relocated = len(moving_rows)
+
+        # Career changes
+        career = has_event & (event_type == 3) & (rng.random(size) < CAREER_CHANCE)
+        career_roll = rng.random(size)
+        promote = np.zeros(size, dtype=bool)
+        new_role = self.role.copy()
+        for old_role, (target_role, chance) in PROMOTION_CHANCES.items():
+            mask = career & (self.role == old_role) & (career_roll < chance)
+            new_role[mask] = target_role
+            promote |= mask
+        self.role = new_role
+        year.promoted = int(promote.sum())
+
+        # Replace the dead with new NPCs
+        if year.died:
+            self._generate(dead_rows)
+        return year
+
+    def _count_codes(self, column, num_codes):
+        """Count each code in a column."""
+        return np.bincount(column, minlength=num_codes)
+
+class ListNPCStore(NPCStore):
+    """NPC store backed by Python lists, used when NumPy is not installed.
+
+    Follows the same rules as NumpyNPCStore one NPC at a time, so it is much
+    slower for large populations.
+    """
+
+    def __init__(self, size, seed=None, locations=DEFAULT_LOCATIONS, cum_weights=None):
+        """Initialize the store with a randomly generated population.
+
+        Args:
+            size: The number of NPCs.
+            seed: The seed of the store's generator (optional).
+            locations: The names of the settlements NPCs live in.
+            cum_weights: The cumulative weights settlements are drawn with
+                (optional, every settlement is equally likely if None).
+        """
+        self.rng = random.Random(seed)
+        self.size = size
+        self.locations = tuple(locations)
+        if cum_weights is None:
+            cum_weights = range(1, len(self.locations) + 1)
+        self.cum_weights = list(cum_weights)
+        self.age = [0] * size
+        self.role = [0] * size
+        self.gender = [0] * size
+        self.location = [0] * size
+        self.marital_status = [0] * size
+        for row in range(size):
+            self._generate(row)
+
+    def _generate(self, row):
+        """Fill a row with a newly generated NPC.
+
+        Args:
+            row: The row number.
+        """
+        rng = self.rng
+        gender = rng.randrange(len(GENDERS))
+        role = GENDER_ROLES[gender][rng.randrange(len(ROLES))]
+
+        # Age range depends on role
+        if role in (NOBLE, KNIGHT):
+            age = rng.randint(20, 60)
+        elif role == PRIEST:
+            age = rng.randint(25, 70)
+        else:
+            age = rng.randint(16, 70)
+
+        # Marital status depends on age and role
+        if role == PRIEST:
+            single_chance, married_chance = 1.0, 0.0
+        elif age < 20:
+            single_chance, married_chance = 0.8, 0.2
+        elif age > 50:
+            single_chance, married_chance = 0.2, 0.5
+        else:
+            single_chance, married_chance = 0.3, 0.6
+        roll = rng.random()
+        if roll < single_chance:
+            marital_status = SINGLE
+        elif roll < single_chance + married_chance:
+            marital_status = MARRIED
+        else:
+            marital_status = WIDOWED
+
+        self.role[row] = role
+        self.age[row] = age
+        self.gender[row] = gender
+        self.location[row] = self._draw_location()
+        self.marital_status[row] = marital_status
+
+    def _draw_location(self):
+        """Draw the settlement of one NPC by the settlements' weights."""
+        cum_weights = self.cum_weights
+        return bisect_right(cum_weights, self.rng.random() * cum_weights[-1])
+
+    def update_for_new_year(self):
+        """Age every NPC and roll this year's life events.
+
+        Returns:
+            A PopulationYear with what happened.
+        """
+        rng = self.rng
+        year = PopulationYear()
+        deaths_by_role = Counter()
+        dead_rows = []
+        can_move = len(self.locations) > 1
+
+        for row in range(self.size):
+            self.age[row] += 1
+            if rng.random() >= EVENT_CHANCE:
+                continue
+
+            event_type = rng.randrange(NUM_EVENT_TYPES)
+            if event_type == 0:
+                if self.marital_status[row] == SINGLE and self.age[row] >= 16:
+                    self.marital_status[row] = MARRIED
+                    year.married += 1
+            elif event_type == 1:
+                death_chance = BASE_DEATH_CHANCE + max(self.age[row] - OLD_AGE, 0) * DEATH_CHANCE_PER_YEAR_OLD
+                if rng.random() < death_chance:
+                    dead_rows.append(row)
+                    deaths_by_role[ROLES[self.role[row]]] += 1
+            elif event_type == 2:
+                if can_move:
+                    location = self.location[row]
+                    while location == self.location[row]:
+                        location = self._draw_location()
+                    self.location[row] = location
+                    year.relocated += 1
+            elif rng.random() < CAREER_CHANCE and self.role[row] in PROMOTION_CHANCES:
+                target_role, chance = PROMOTION_CHANCES[self.role[row]]
+                if rng.random() < chance:
+                    self.role[row] = target_role
+                    year.promoted += 1
+
+        # Replace the dead with new NPCs
+        year.died = len(dead_rows)
+        year.deaths_by_role = dict(deaths_by_role)
+        for row in dead_rows:
+            self._generate(row)
+        return year
+
+    def _count_codes(self, column, num_codes):
+        """Count each code in a column."""
+        counts = [0] * num_codes
+        for code in column:
+            counts[code] += 1
+        return counts
+
+def create_npc_store(size, seed=None, use_numpy=None, locations=DEFAULT_LOCATIONS, cum_weights=None):
+    """Create the fastest available NPC store.
+
+    Args:
+        size: The number of NPCs.
+        seed: The seed of the store's generator (optional).
+        use_numpy: Force (True) or forbid (False) the NumPy store (optional,
+            NumPy is used whenever it is installed if None).
+        locations: The names of the settlements NPCs live in.
+        cum_weights: The cumulative weights settlements are drawn with
+            (optional, every settlement is equally likely if None).
+
+    Returns:
+        A NumpyNPCStore or a ListNPCStore.
+    """
+    if use_numpy is None:
+        use_numpy = np is not None
+    if use_numpy:
+        if np is None:
+            raise ImportError("NumPy is required for the vectorized NPC store")
+        return NumpyNPCStore(size, seed, locations, cum_weights)
+    return ListNPCStore(size, seed, locations, cum_weights)
@@ -0,0 +1,223 @@
+"""
+Relationship Store - A character's relationships with NPCs, kept by serial number
+"""
+import heapq
+from array import array
+from bisect import bisect_right
+
+# Relationship statuses from worst to best, and the level each one starts at
+RELATIONSHIP_STATUSES = ("enemy", "distant", "acquaintance", "friend", "close friend")
+STATUS_THRESHOLDS = (20, 40, 60, 80)  # Starting levels of every status but the first
+
+# Unless renewed, relationships drift towards the lowest level of an acquaintance
+RESTING_LEVEL = 40
+NEW_RELATIONSHIP_LEVEL = RESTING_LEVEL  # New acquaintances start here
+YEARLY_DRIFT = 2  # How far levels drift each year
+
+def status_code(level):
+    """Get the code of the status of a relationship at a level."""
+    return bisect_right(STATUS_THRESHOLDS, level)
+
+class RelationshipStore:
+    """One character's relationships, as parallel arrays keyed by NPC serial number.
+
+    Each relationship keeps the other NPC's serial number, which is never
+    reused, and their current NPC ID, so it can be looked up through the
+    NPCManager without holding the NPC itself. Levels and statuses are small
+    integer codes, and each status always follows from its level. The arrays
+    are only created with the first relationship.
+
+    Relationships with NPCs outside the current world, such as those loaded
+    from a save of another game, are unknown: they get negative serial
+    numbers, which no NPC has, and keep the NPC's name and role instead.
+    """
+
+    __slots__ = ("serials", "npc_ids", "levels", "statuses", "snapshots")
+
+    def __init__(self):
+        """Initialize an empty store."""
+        self.serials = None
+        self.npc_ids = None
+        self.levels = None
+        self.statuses = None
+        self.snapshots = None  # Maps the serial of each unknown relationship to (name, role)
+
+    def __len__(self):
+        return len(self.serials) if self.serials is not None else 0
+
+    def __contains__(self, serial):
+        return self.serials is not None and serial in self.serials
+
+    def __iter__(self):
+        return iter(self.serials or ())
+
+    def add(self, serial, npc_id, level=NEW_RELATIONSHIP_LEVEL):
+        """Add a relationship, or replace the one with the same NPC.
+
+        Args:
+            serial: The NPC's serial number.
+            npc_id: The NPC's current ID.
+            level: The level of the relationship (0-100), which sets its status.
+        """
+        code = status_code(level)
+
+        if self.serials is None:
+            self.serials = array("q")
+            self.npc_ids = array("q")
+            self.levels = array("b")
+            self.statuses = array("b")
+        elif serial in self.serials:
+            row = self.serials.index(serial)
+            self.npc_ids[row] = npc_id
+            self.levels[row] = level
+            self.statuses[row] = code
+            return
+
+        self.serials.append(serial)
+        self.npc_ids.append(npc_id)
+        self.levels.append(level)
+        self.statuses.append(code)
+
+    def add_unknown(self, name, role, level=NEW_RELATIONSHIP_LEVEL):
+        """Add a relationship with an NPC who is not in the current world.
+
+        Args:
+            name: The NPC's name.
+            role: The NPC's role.
+            level: The level of the relationship (0-100), which sets its status.
+
+        Returns:
+            The relationship's serial number, which is negative.
+        """
+        if self.snapshots is None:
+            self.snapshots = {}
+        serial = min(self.snapshots, default=0) - 1
+        self.snapshots[serial] = (name, role)
+        self.add(serial, 0, level)
+        return serial
+
+    def snapshot(self, serial):
+        """Get the (name, role) kept for an unknown relationship, or None if it is not unknown."""
+        if self.snapshots is None:
+            return None
+        return self.snapshots.get(serial)
+
+    def unknown(self):
+        """Iterate over the unknown relationships as (name, role, level, status) tuples."""
+        if not self.snapshots:
+            return
+        for serial, _, level, status in self.items():
+            if serial in self.snapshots:
+                name, role = self.snapshots[serial]
+                yield name, role, level, status
+
+    def get(self, serial):
+        """Get a relationship.
+
+        Args:
+            serial: The NPC's serial number.
+
+        Returns:
+            A tuple of (npc_id, level, status), or None if there is no such relationship.
+        """
+        if serial not in self:
+            return None
+        row = self.serials.index(serial)
+        return self.npc_ids[row], self.levels[row], RELATIONSHIP_STATUSES[self.statuses[row]]
+
+    def adjust(self, serial, amount):
+        """Improve (positive amount) or worsen a relationship, updating its status.
+
+        Args:
+            serial: The NPC's serial number.
+            amount: The change in level.
+
+        Returns:
+            The new level, or None if there is no such relationship.
+        """
+        if serial not in self:
+            return None
+        row = self.serials.index(serial)
+        level = max(0, min(100, self.levels[row] + amount))
+        self.levels[row] = level
+        self.statuses[row] = status_code(level)
+        return level
+
+    def items(self):
+        """Iterate over the relationships as (serial, npc_id, level, status) tuples."""
+        if self.serials is None:
+            return
+        for serial, npc_id, level, code in zip(self.serials, self.npc_ids, self.levels, self.statuses):
+            yield serial, npc_id, level, RELATIONSHIP_STATUSES[code]
+
+    def top(self, k):
+        """Get the strongest relationships.
+
+        Args:
+            k: The number of relationships wanted.
+
+        Returns:
+            A list of up to k (serial, npc_id, level, status) tuples, highest level first.
+        """
+        if self.serials is None:
+            return []
+        rows = heapq.nlargest(k, range(len(self.serials)), key=self.levels.__getitem__)
+        return [(self.serials[row], self.npc_ids[row], self.levels[row],
+                 RELATIONSHIP_STATUSES[self.statuses[row]]) for row in rows]
+
+    def drift(self, amount, resting_level=RESTING_LEVEL):
+        """Move every relationship's level towards the resting level, as a year passes.
+
+        Statuses are updated in the same pass, and only for relationships
+        that crossed a status threshold.
+
+        Args:
+            amount: How far each level moves.
+            resting_level: The level relationships drift towards.
+
+        Returns:
+            The number of relationships whose status changed.
+        """
+        if self.serials is None:
+            return 0
+        levels = self.levels
+        statuses = self.statuses
+        changed = 0
+        for row, level in enumerate(levels):
+            if level > resting_level:
+                level = max(resting_level, level - amount)
+            elif level < resting_level:
+                level = min(resting_level, level + amount)
+            else:
+                continue
+            levels[row] = level
+            code = status_code(level)
+            if code != statuses[row]:
+                statuses[row] = code
+                changed += 1
+        return changed
+
+    def retain(self, keep):
+        """Remove every relationship not passing a test, e.g. with NPCs who died.
+
+        Args:
+            keep: A function of (serial, npc_id) returning whether to keep the relationship.
+
+        Returns:
+            The number of relationships removed.
+        """
+        if self.serials is None:
+            return 0
+        rows = [row for row, (serial, npc_id) in enumerate(zip(self.serials, self.npc_ids))
+                if keep(serial, npc_id)]
+        removed = len(self.serials) - len(rows)
+        if removed:
+            if self.snapshots:
+                kept = {self.serials[row] for row in rows}
+                self.snapshots = {serial: snapshot for serial, snapshot in self.snapshots.items()
+                                  if serial in kept}
+            self.serials = array("q", [self.serials[row] for row in rows])
+            self.npc_ids = array("q", [self.npc_ids[row] for row in rows])
+            self.levels = array("b", [self.levels[row] for row in rows])
+            self.statuses = array("b", [self.statuses[row] for row in rows])
+        return removed
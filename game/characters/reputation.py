@@ -1,31 +1,50 @@
 """
 Reputation System - Tracks player standing with different social groups
 """
+from game.characters.stat_view import StatLayout, StatView
+
+# Social groups and their starting standing
+REPUTATION_GROUPS = StatLayout((
+    "nobility",   # Standing with noble houses
+    "clergy",     # Standing with the church
+    "merchants",  # Standing with merchant guilds
+    "peasants",   # Standing with common folk
+    "military",   # Standing with knights and soldiers
+    "criminals"   # Standing with the criminal underworld
+))
+STARTING_REPUTATIONS = (50, 50, 50, 50, 50, 0)
+
+# Opposing groups where gaining reputation with one loses it with another
+OPPOSING_GROUPS = {
+    "nobility": "peasants",
+    "clergy": "criminals",
+    "merchants": "nobility",
+    "military": "criminals"
+}
 
 class ReputationManager:
     """Manages reputation with different social groups."""
     
+    __slots__ = ("_reputations", "specific_reputations")
+    
+    opposing_groups = OPPOSING_GROUPS
+    
     def __init__(self):
         """Initialize reputation manager."""
-        self.reputations = {
-            "nobility": 50,      # Standing with noble houses
-            "clergy": 50,        # Standing with the church
-            "merchants": 50,     # Standing with merchant guilds
-            "peasants": 50,      # Standing with common folk
-            "military": 50,      # Standing with knights and soldiers
-            "criminals": 0       # Standing with the criminal underworld
-        }
+        # Standing with each group, in REPUTATION_GROUPS order
+        self._reputations = list(STARTING_REPUTATIONS)
         
-        # Track specific houses/guilds/organizations
-        self.specific_reputations = {}
-        
-        # Define opposing groups where gaining reputation with one loses it with another
-        self.opposing_groups = {
-            "nobility": "peasants",
-            "clergy": "criminals",
-            "merchants": "nobility",
-            "military": "criminals"
-        }
+        # Track specific houses/guilds/organizations, created when the first is added
+        self.specific_reputations = None
+    
+    @property
+    def reputations(self):
+        """Standing with each social group, as a dictionary view."""
+        return StatView(self._reputations, REPUTATION_GROUPS)
+    
+    @reputations.setter
+    def reputations(self, values):
+        self.reputations.update(values)
     
     def adjust_reputation(self, group, amount):
         """Adjust reputation with a group.
@@ -34,16 +53,17 @@ class ReputationManager:
             group: The social group to adjust reputation with.
             amount: The amount to adjust by (positive or negative).
         """
-        if group in self.reputations:
-            old_rep = self.reputations[group]
-            self.reputations[group] = max(0, min(100, old_rep + amount))
+        reputations = self.reputations
+        if group in reputations:
+            old_rep = reputations[group]
+            reputations[group] = max(0, min(100, old_rep + amount))
             
             # Adjust opposing group reputation
             if group in self.opposing_groups:
                 opposing = self.opposing_groups[group]
                 # Smaller opposite effect
-                self.reputations[opposing] = max(0, min(100, 
-                    self.reputations[opposing] - amount * 0.5))
+                reputations[opposing] = max(0, min(100, 
+                    reputations[opposing] - amount * 0.5))
     
     def add_specific_reputation(self, category, name):
         """Add reputation tracking for a specific organization.
@@ -53,6 +73,8 @@ class ReputationManager:
             name: The name of the organization
         """
         key = f"{category}_{name}"
+        if self.specific_reputations is None:
+            self.specific_reputations = {}
         if key not in self.specific_reputations:
             self.specific_reputations[key] = 50
     
@@ -65,7 +87,7 @@ class ReputationManager:
             amount: The amount to adjust by
         """
         key = f"{category}_{name}"
-        if key in self.specific_reputations:
+        if self.specific_reputations and key in self.specific_reputations:
             self.specific_reputations[key] = max(0, min(100, 
                 self.specific_reputations[key] + amount))
     
@@ -1,17 +1,26 @@
 """
 Character roles package
+
+The role classes are imported on first access so that loading one role does
+not load them all.
 """
-from game.characters.roles.king import King
-from game.characters.roles.farmer import Farmer
-from game.characters.roles.noble import Noble
-from game.characters.roles.knight import Knight
-from game.characters.roles.merchant import Merchant
-from game.characters.roles.craftsman import Craftsman
-from game.characters.roles.priest import Priest
+import importlib
+
+# Maps each role class to the module that defines it
+_ROLE_MODULES = {
+    "King": "game.characters.roles.king",
+    "Farmer": "game.characters.roles.farmer",
+    "Noble": "game.characters.roles.noble",
+    "Knight": "game.characters.roles.knight",
+    "Merchant": "game.characters.roles.merchant",
+    "Craftsman": "game.characters.roles.craftsman",
+    "Priest": "game.characters.roles.priest"
+}
+
+__all__ = list(_ROLE_MODULES)
 
-# These will be implemented later
-# from game.characters.roles.noble import Noble
-# from game.characters.roles.knight import Knight
-# from game.characters.roles.merchant import Merchant
-# from game.characters.roles.craftsman import Craftsman
-# from game.characters.roles.priest import Priest
+def __getattr__(name):
+    """Import a role class the first time it is accessed."""
+    if name in _ROLE_MODULES:
+        return getattr(importlib.import_module(_ROLE_MODULES[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
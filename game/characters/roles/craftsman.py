@@ -1,24 +1,24 @@
 """
 Craftsman - Character role class for craftsmen (placeholder)
 """
-import random
 from game.characters.character import Character
 
 class Craftsman(Character):
     """Character role class for craftsmen."""
     
-    def __init__(self, name, gender, birth_year=None):
+    def __init__(self, name, gender, birth_year=None, rng=None):
         """Initialize a new craftsman character.
         
         Args:
             name: The character's name.
             gender: The character's gender.
             birth_year: The character's birth year (optional).
+            rng: The random generator for this character (optional).
         """
-        super().__init__(name, gender, "craftsman", birth_year)
+        super().__init__(name, gender, "craftsman", birth_year, rng)
         
         # Craftsmen start with modest wealth
-        self.wealth = random.randint(50, 200)
+        self.wealth = self.rng.randint(50, 200)
         
         # Adjust skills for role
         self._adjust_skills_for_role()
@@ -26,7 +26,7 @@ class Craftsman(Character):
     def _adjust_skills_for_role(self):
         """Adjust skills based on character role."""
         # Craftsmen are better at crafting
-        self.skills["crafting"] += random.randint(20, 40)
+        self.skills["crafting"] += self.rng.randint(20, 40)
         
         # Ensure skills stay within bounds
         for skill in self.skills:
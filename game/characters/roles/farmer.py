@@ -1,35 +1,35 @@
 """
 Farmer - Character role class for farmers
 """
-import random
 from game.characters.character import Character
 
 class Farmer(Character):
     """Character role class for farmers."""
     
-    def __init__(self, name, gender, birth_year=None):
+    def __init__(self, name, gender, birth_year=None, rng=None):
         """Initialize a new farmer character.
         
         Args:
             name: The character's name.
             gender: The character's gender ('male' or 'female').
             birth_year: The year the character was born.
+            rng: The random generator for this character (optional).
         """
-        super().__init__(name, gender, "farmer", birth_year)
+        super().__init__(name, gender, "farmer", birth_year, rng)
         
         # Set initial wealth
-        self.wealth = random.randint(10, 50)
+        self.wealth = self.rng.randint(10, 50)
         
         # Farm properties
-        self.land = random.randint(3, 10)  # Acres of land
+        self.land = self.rng.randint(3, 10)  # Acres of land
         self.crops = {}  # Crop type -> acres
         self.livestock = {}  # Animal type -> count
         self.storage = {}  # Crop type -> amount
         self.helpers = 0  # Number of hired workers
         
         # Farm quality metrics
-        self.soil_fertility = random.randint(40, 70)  # Quality of soil (0-100)
-        self.harvest_quality = random.randint(40, 70)  # Quality of harvests (0-100)
+        self.soil_fertility = self.rng.randint(40, 70)  # Quality of soil (0-100)
+        self.harvest_quality = self.rng.randint(40, 70)  # Quality of harvests (0-100)
         self.livestock_health = {}  # Animal type -> health (0-100)
         self.livestock_quality = {}  # Animal type -> quality (0-100)
         
@@ -48,20 +48,20 @@ class Farmer(Character):
         """Initialize the farm with crops and livestock."""
         # Initialize crops
         crop_types = ["wheat", "barley", "oats", "rye", "vegetables"]
-        for _ in range(random.randint(1, 3)):
-            crop_type = random.choice(crop_types)
-            self.crops[crop_type] = random.randint(1, 3)  # Acres of each crop
+        for _ in range(self.rng.randint(1, 3)):
+            crop_type = self.rng.choice(crop_types)
+            self.crops[crop_type] = self.rng.randint(1, 3)  # Acres of each crop
         
         # Initialize livestock
         livestock_types = ["chickens", "pigs", "cows", "sheep", "goats"]
-        for _ in range(random.randint(1, 3)):
-            livestock_type = random.choice(livestock_types)
-            self.livestock[livestock_type] = random.randint(1, 5)  # Number of each animal
+        for _ in range(self.rng.randint(1, 3)):
+            livestock_type = self.rng.choice(livestock_types)
+            self.livestock[livestock_type] = self.rng.randint(1, 5)  # Number of each animal
     
     def _adjust_skills_for_role(self):
         """Adjust skills based on character role."""
         # Farmers are better at farming
-        self.skills["farming"] += random.randint(20, 40)
+        self.skills["farming"] += self.rng.randint(20, 40)
         
         # Ensure skills stay within bounds
         for skill in self.skills:
@@ -197,16 +197,16 @@ class Farmer(Character):
         interface.display_message(f"You planted {amount} acre(s) of {crop_type}.")
         
         # Skill check for planting quality
-        planting_quality = min(100, self.skills["farming"] + random.randint(-20, 20))
+        planting_quality = min(100, self.skills["farming"] + self.rng.randint(-20, 20))
         if planting_quality >= 70:
             interface.display_message("The planting went very well!")
-            self.harvest_quality = min(100, self.harvest_quality + random.randint(5, 15))
+            self.harvest_quality = min(100, self.harvest_quality + self.rng.randint(5, 15))
         elif planting_quality >= 40:
             interface.display_message("The planting went reasonably well.")
-            self.harvest_quality = min(100, self.harvest_quality + random.randint(-5, 10))
+            self.harvest_quality = min(100, self.harvest_quality + self.rng.randint(-5, 10))
         else:
             interface.display_message("The planting didn't go very well.")
-            self.harvest_quality = max(0, self.harvest_quality - random.randint(5, 15))
+            self.harvest_quality = max(0, self.harvest_quality - self.rng.randint(5, 15))
         
         interface.get_input("\nPress Enter to continue...")
     
@@ -251,12 +251,12 @@ class Farmer(Character):
         interface.display_message(f"You spend time tending to your {animal_type}.")
         
         # Skill check for tending quality
-        tending_quality = min(100, self.skills["farming"] + random.randint(-20, 20))
+        tending_quality = min(100, self.skills["farming"] + self.rng.randint(-20, 20))
         if tending_quality >= 70:
             interface.display_message("Your animals are thriving under your care!")
             # Chance for animal reproduction
-            if random.random() < 0.3:
-                new_animals = random.randint(1, 2)
+            if self.rng.random() < 0.3:
+                new_animals = self.rng.randint(1, 2)
                 self.livestock[animal_type] += new_animals
                 interface.display_message(f"Your {animal_type} have produced {new_animals} offspring!")
         elif tending_quality >= 40:
@@ -264,7 +264,7 @@ class Farmer(Character):
         else:
             interface.display_message("Your animals aren't doing very well.")
             # Chance for animal loss
-            if random.random() < 0.2:
+            if self.rng.random() < 0.2:
                 lost_animals = min(1, self.livestock[animal_type])
                 self.livestock[animal_type] -= lost_animals
                 if self.livestock[animal_type] <= 0:
@@ -406,7 +406,7 @@ class Farmer(Character):
         # Calculate sale price based on harvest quality and market conditions
         base_price = {"wheat": 10, "barley": 8, "oats": 7, "rye": 9, "vegetables": 15}[crop_type]
         price_modifier = self.harvest_quality / 50.0  # 0.0 to 2.0
-        market_modifier = random.uniform(0.8, 1.2)
+        market_modifier = self.rng.uniform(0.8, 1.2)
         
         price_per_acre = int(base_price * price_modifier * market_modifier)
         total_price = price_per_acre * amount
@@ -427,7 +427,7 @@ class Farmer(Character):
             interface.display_message(f"You sold {amount} acre(s) of {crop_type} for {total_price} coins.")
             
             # Skill improvement
-            self.skills["trade"] = min(100, self.skills["trade"] + random.randint(1, 3))
+            self.skills["trade"] = min(100, self.skills["trade"] + self.rng.randint(1, 3))
         else:
             interface.display_message("You decided not to sell your crops.")
         
@@ -472,7 +472,7 @@ class Farmer(Character):
         
         # Calculate sale price
         base_price = {"chickens": 3, "pigs": 15, "cows": 40, "sheep": 20, "goats": 18}[animal_type]
-        market_modifier = random.uniform(0.8, 1.2)
+        market_modifier = self.rng.uniform(0.8, 1.2)
         
         price_per_animal = int(base_price * market_modifier)
         total_price = price_per_animal * amount
@@ -493,7 +493,7 @@ class Farmer(Character):
             interface.display_message(f"You sold {amount} {animal_type} for {total_price} coins.")
             
             # Skill improvement
-            self.skills["trade"] = min(100, self.skills["trade"] + random.randint(1, 3))
+            self.skills["trade"] = min(100, self.skills["trade"] + self.rng.randint(1, 3))
         else:
             interface.display_message("You decided not to sell your livestock.")
         
@@ -513,7 +513,7 @@ class Farmer(Character):
         interface.display_message(f"Current wealth: {self.wealth} coins")
         
         # Land price
-        land_price = random.randint(40, 60)
+        land_price = self.rng.randint(40, 60)
         interface.display_message(f"Current land price: {land_price} coins per acre")
         
         # Calculate maximum affordable
@@ -583,10 +583,10 @@ class Farmer(Character):
         
         if choice == 0:  # Farmhand
             cost = 20
-            benefit = random.randint(5, 15)
+            benefit = self.rng.randint(5, 15)
         else:  # Skilled Worker
             cost = 50
-            benefit = random.randint(15, 30)
+            benefit = self.rng.randint(15, 30)
         
         # Check if player has enough wealth
         if self.wealth < cost:
@@ -613,9 +613,9 @@ class Farmer(Character):
         # Harvest crops
         total_crop_value = 0
         for crop_type, acres in list(self.crops.items()):
-            base_yield = {"wheat": 10, "barley": 8, "oats": 7, "rye": 9, "vegetables": 15}[crop_type]
+            base_yield = {"wheat": 10, "barley": 8, "oats": 7, "rye": 9, "vegetables": 15, "legumes": 6}.get(crop_type, 0)
             yield_modifier = self.harvest_quality / 50.0  # 0.0 to 2.0
-            weather_modifier = random.uniform(0.5, 1.5)
+            weather_modifier = self.rng.uniform(0.5, 1.5)
             
             crop_yield = int(base_yield * yield_modifier * weather_modifier * acres)
             total_crop_value += crop_yield
@@ -632,8 +632,8 @@ class Farmer(Character):
         # Livestock reproduction
         for animal_type, count in list(self.livestock.items()):
             # Chance for reproduction
-            if count >= 2 and random.random() < 0.4:
-                new_animals = random.randint(1, max(1, count // 3))
+            if count >= 2 and self.rng.random() < 0.4:
+                new_animals = self.rng.randint(1, max(1, count // 3))
                 self.livestock[animal_type] += new_animals
     
     def display_status(self, interface):
@@ -692,7 +692,7 @@ class Farmer(Character):
         acres = self.crops[crop_type]
         base_yield = acres * 5  # Base yield per acre
         skill_bonus = self.skills["farming"] / 100  # 0-1 bonus based on skill
-        weather_factor = random.uniform(0.7, 1.3)  # Random weather effect
+        weather_factor = self.rng.uniform(0.7, 1.3)  # Random weather effect
         
         total_yield = int(base_yield * (1 + skill_bonus) * weather_factor)
         
@@ -708,11 +708,11 @@ class Farmer(Character):
             del self.crops[crop_type]
         
         # Health cost of harvesting
-        health_cost = random.randint(3, 8)
+        health_cost = self.rng.randint(3, 8)
         self.health = max(1, self.health - health_cost)
         
         # Skill improvement
-        skill_gain = random.randint(1, 3)
+        skill_gain = self.rng.randint(1, 3)
         self.skills["farming"] = min(100, self.skills["farming"] + skill_gain)
         
         # Display results
@@ -783,7 +783,7 @@ class Farmer(Character):
             interface.display_message("The soil fertility has improved.")
         
         # Skill improvement
-        skill_gain = random.randint(1, 2)
+        skill_gain = self.rng.randint(1, 2)
         self.skills["farming"] = min(100, self.skills["farming"] + skill_gain)
         interface.display_message(f"Your farming skill improved by {skill_gain} points.")
         
@@ -819,7 +819,7 @@ class Farmer(Character):
                 self.worker_assignment = "crops"
                 
                 # Skill improvement for workers
-                skill_gain = random.randint(1, 2)
+                skill_gain = self.rng.randint(1, 2)
                 interface.display_message(f"Your workers' farming skills improved by {skill_gain} points.")
         
         elif choice == 1:  # Assign to livestock
@@ -891,16 +891,16 @@ class Farmer(Character):
         skill_factor = self.skills["farming"] / 100  # 0-1 based on farming skill
         success_chance = 0.3 + (skill_factor * 0.4)  # 30-70% chance based on skill
         
-        if random.random() < success_chance:
+        if self.rng.random() < success_chance:
             # Successful breeding
-            foals = random.randint(1, 2)
+            foals = self.rng.randint(1, 2)
             self.livestock["horses"] += foals
             
             interface.display_message(f"Your breeding efforts were successful! You have {foals} new foal(s).")
             interface.display_message(f"You now have {self.livestock['horses']} horses.")
             
             # Skill improvement
-            skill_gain = random.randint(2, 4)
+            skill_gain = self.rng.randint(2, 4)
             self.skills["farming"] = min(100, self.skills["farming"] + skill_gain)
             interface.display_message(f"Your farming skill improved by {skill_gain} points.")
             
@@ -912,7 +912,7 @@ class Farmer(Character):
             interface.display_message("Unfortunately, your breeding efforts were unsuccessful this time.")
             
             # Small skill improvement
-            skill_gain = random.randint(1, 2)
+            skill_gain = self.rng.randint(1, 2)
             self.skills["farming"] = min(100, self.skills["farming"] + skill_gain)
             interface.display_message(f"Your farming skill still improved by {skill_gain} points from the experience.")
         
@@ -950,7 +950,7 @@ class Farmer(Character):
         # Calculate improvement based on farming skill and random factors
         skill_factor = self.skills["farming"] / 100  # 0-1 based on farming skill
         base_improvement = 5
-        improvement = base_improvement + int(skill_factor * 10) + random.randint(-2, 5)
+        improvement = base_improvement + int(skill_factor * 10) + self.rng.randint(-2, 5)
         
         # Cost of improvement
         cost = self.livestock[animal_type] * 5
@@ -966,7 +966,7 @@ class Farmer(Character):
         self.livestock_quality[animal_type] = min(100, current_quality + improvement)
         
         # Skill improvement
-        skill_gain = random.randint(1, 3)
+        skill_gain = self.rng.randint(1, 3)
         self.skills["farming"] = min(100, self.skills["farming"] + skill_gain)
         
         interface.display_message(f"You spend {cost} coins on better feed, care, and selective breeding for your {animal_type}.")
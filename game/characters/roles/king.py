@@ -1,21 +1,21 @@
 """
 King - Character role class for kings
 """
-import random
 from game.characters.character import Character
 
 class King(Character):
     """Character role class for kings."""
     
-    def __init__(self, name, gender, birth_year=None):
+    def __init__(self, name, gender, birth_year=None, rng=None):
         """Initialize a King character.
         
         Args:
             name: The character's name.
             gender: The character's gender.
             birth_year: The character's birth year (optional).
+            rng: The random generator for this character (optional).
         """
-        super().__init__(name, gender, "king", birth_year)
+        super().__init__(name, gender, "king", birth_year, rng)
         
         # Set role-specific properties
         self.role = "King"
@@ -32,11 +32,11 @@ class King(Character):
         
         # Royal advisors and their competence (0-100 scale)
         self.advisors = {
-            "Chancellor": random.randint(40, 70),  # Diplomacy
-            "Treasurer": random.randint(40, 70),   # Finance
-            "Marshal": random.randint(40, 70),     # Military
-            "Spymaster": random.randint(40, 70),   # Intelligence
-            "Court Chaplain": random.randint(40, 70)  # Religious affairs
+            "Chancellor": self.rng.randint(40, 70),  # Diplomacy
+            "Treasurer": self.rng.randint(40, 70),   # Finance
+            "Marshal": self.rng.randint(40, 70),     # Military
+            "Spymaster": self.rng.randint(40, 70),   # Intelligence
+            "Court Chaplain": self.rng.randint(40, 70)  # Religious affairs
         }
         
         # Adjust skills for role
@@ -45,9 +45,9 @@ class King(Character):
     def _adjust_skills_for_role(self):
         """Adjust skills based on character role."""
         # Kings are better at diplomacy and stewardship
-        self.skills["diplomacy"] += random.randint(10, 30)
-        self.skills["stewardship"] += random.randint(10, 30)
-        self.skills["combat"] += random.randint(0, 20)
+        self.skills["diplomacy"] += self.rng.randint(10, 30)
+        self.skills["stewardship"] += self.rng.randint(10, 30)
+        self.skills["combat"] += self.rng.randint(0, 20)
         
         # Ensure skills stay within bounds
         for skill in self.skills:
@@ -209,7 +209,7 @@ class King(Character):
         interface.display_message("You sit upon your throne as subjects bring their petitions.")
         
         # Number of petitions based on kingdom size (simplified)
-        num_petitions = random.randint(3, 5)
+        num_petitions = self.rng.randint(3, 5)
         
         # Chancellor's competence affects petition quality
         chancellor_bonus = (self.advisors["Chancellor"] - 50) / 100  # -0.5 to +0.5
@@ -218,7 +218,7 @@ class King(Character):
             interface.display_message(f"\nPetition {i+1} of {num_petitions}:")
             
             # Generate a random petition
-            petition_type = random.choice([
+            petition_type = self.rng.choice([
                 "Land Dispute",
                 "Criminal Case",
                 "Tax Exemption Request",
@@ -230,22 +230,22 @@ class King(Character):
             
             # Generate petitioners
             if petition_type in ["Land Dispute", "Tax Exemption Request", "Noble Title Request"]:
-                petitioner = f"Noble {random.choice(['Lord', 'Lady'])} {random.choice(['Smith', 'Jones', 'Williams', 'Brown', 'Taylor'])}"
+                petitioner = f"Noble {self.rng.choice(['Lord', 'Lady'])} {self.rng.choice(['Smith', 'Jones', 'Williams', 'Brown', 'Taylor'])}"
             elif petition_type == "Criminal Case":
-                petitioner = f"Sheriff of {random.choice(['Northshire', 'Westfall', 'Redridge', 'Duskwood'])}"
+                petitioner = f"Sheriff of {self.rng.choice(['Northshire', 'Westfall', 'Redridge', 'Duskwood'])}"
             elif petition_type == "Trade Agreement Proposal":
-                petitioner = f"Guild Master {random.choice(['Thomas', 'Richard', 'Harold', 'Elizabeth', 'Catherine'])}"
+                petitioner = f"Guild Master {self.rng.choice(['Thomas', 'Richard', 'Harold', 'Elizabeth', 'Catherine'])}"
             elif petition_type == "Religious Matter":
-                petitioner = f"Bishop {random.choice(['John', 'Peter', 'Matthew', 'Luke', 'Mark'])}"
+                petitioner = f"Bishop {self.rng.choice(['John', 'Peter', 'Matthew', 'Luke', 'Mark'])}"
             else:  # Military Request
-                petitioner = f"Captain {random.choice(['James', 'Robert', 'William', 'Edward', 'Henry'])}"
+                petitioner = f"Captain {self.rng.choice(['James', 'Robert', 'William', 'Edward', 'Henry'])}"
             
             # Generate petition details
             if petition_type == "Land Dispute":
                 details = f"A dispute over land boundaries between {petitioner} and another noble."
                 options = ["Rule in favor of the petitioner", "Rule against the petitioner", "Propose a compromise"]
             elif petition_type == "Criminal Case":
-                crime = random.choice(["theft", "assault", "treason", "tax evasion"])
+                crime = self.rng.choice(["theft", "assault", "treason", "tax evasion"])
                 details = f"A case of {crime} brought by {petitioner}."
                 options = ["Harsh punishment", "Lenient punishment", "Pardon the accused"]
             elif petition_type == "Tax Exemption Request":
@@ -278,112 +278,112 @@ class King(Character):
                     interface.display_message(f"You rule in favor of {petitioner}.")
                     interface.display_message("They are pleased with your judgment.")
                     # Gain favor with one noble, lose with another
-                    self.popularity += random.randint(-3, 3)
+                    self.popularity += self.rng.randint(-3, 3)
                 elif choice == 1:  # Rule against
                     interface.display_message(f"You rule against {petitioner}.")
                     interface.display_message("They are displeased with your judgment.")
                     # Lose favor with one noble, gain with another
-                    self.popularity += random.randint(-3, 3)
+                    self.popularity += self.rng.randint(-3, 3)
                 else:  # Compromise
                     interface.display_message("You propose a compromise that partially satisfies both parties.")
                     # Small popularity gain for wisdom
-                    self.popularity += random.randint(1, 3)
+                    self.popularity += self.rng.randint(1, 3)
             
             elif petition_type == "Criminal Case":
                 if choice == 0:  # Harsh
                     interface.display_message("You order a harsh punishment.")
                     # Deterrent effect, but may seem cruel
-                    self.popularity += random.randint(-5, 5)
+                    self.popularity += self.rng.randint(-5, 5)
                 elif choice == 1:  # Lenient
                     interface.display_message("You order a lenient punishment.")
                     # Seen as merciful, but may seem weak
-                    self.popularity += random.randint(-3, 5)
+                    self.popularity += self.rng.randint(-3, 5)
                 else:  # Pardon
                     interface.display_message("You pardon the accused.")
                     # Could be seen as very merciful or very weak
-                    self.popularity += random.randint(-10, 10)
+                    self.popularity += self.rng.randint(-10, 10)
             
             elif petition_type == "Tax Exemption Request":
                 if choice == 0:  # Full exemption
                     interface.display_message("You grant a full tax exemption.")
                     # Noble is happy, but treasury suffers
-                    self.popularity += random.randint(1, 5)
-                    self.treasury_reserves -= random.randint(100, 300)
+                    self.popularity += self.rng.randint(1, 5)
+                    self.treasury_reserves -= self.rng.randint(100, 300)
                 elif choice == 1:  # Partial exemption
                     interface.display_message("You grant a partial tax exemption.")
                     # Balanced approach
-                    self.popularity += random.randint(0, 3)
-                    self.treasury_reserves -= random.randint(50, 150)
+                    self.popularity += self.rng.randint(0, 3)
+                    self.treasury_reserves -= self.rng.randint(50, 150)
                 else:  # Deny
                     interface.display_message("You deny the tax exemption request.")
                     # Treasury intact, but noble is unhappy
-                    self.popularity -= random.randint(1, 5)
+                    self.popularity -= self.rng.randint(1, 5)
             
             elif petition_type == "Noble Title Request":
                 if choice == 0:  # Grant title
                     interface.display_message("You grant the requested title.")
                     # Noble is very happy, but others may be jealous
-                    self.popularity += random.randint(-2, 8)
+                    self.popularity += self.rng.randint(-2, 8)
                 elif choice == 1:  # Deny
                     interface.display_message("You deny the title request.")
                     # Noble is unhappy
-                    self.popularity -= random.randint(1, 5)
+                    self.popularity -= self.rng.randint(1, 5)
                 else:  # Different honor
                     interface.display_message("You offer a different honor instead of the requested title.")
                     # Compromise
-                    self.popularity += random.randint(-1, 5)
+                    self.popularity += self.rng.randint(-1, 5)
             
             elif petition_type == "Trade Agreement Proposal":
                 if choice == 0:  # Accept
                     interface.display_message("You accept the trade agreement proposal.")
                     # Economic benefit, but terms might not be ideal
-                    self.treasury_reserves += random.randint(200, 500)
+                    self.treasury_reserves += self.rng.randint(200, 500)
                 elif choice == 1:  # Reject
                     interface.display_message("You reject the trade agreement proposal.")
                     # No economic benefit, guild master unhappy
-                    self.popularity -= random.randint(1, 3)
+                    self.popularity -= self.rng.randint(1, 3)
                 else:  # Negotiate
                     interface.display_message("You negotiate for better terms.")
                     # Better economic benefit if successful
-                    if random.random() < 0.6 + chancellor_bonus:
+                    if self.rng.random() < 0.6 + chancellor_bonus:
                         interface.display_message("Negotiations are successful!")
-                        self.treasury_reserves += random.randint(300, 700)
-                        self.popularity += random.randint(1, 3)
+                        self.treasury_reserves += self.rng.randint(300, 700)
+                        self.popularity += self.rng.randint(1, 3)
                     else:
                         interface.display_message("Negotiations fail and the deal falls through.")
-                        self.popularity -= random.randint(1, 5)
+                        self.popularity -= self.rng.randint(1, 5)
             
             elif petition_type == "Religious Matter":
                 if choice == 0:  # Full funding
                     interface.display_message("You provide full funding for the cathedral.")
                     # Church is very happy, treasury suffers
-                    self.popularity += random.randint(5, 10)
-                    self.treasury_reserves -= random.randint(500, 1000)
+                    self.popularity += self.rng.randint(5, 10)
+                    self.treasury_reserves -= self.rng.randint(500, 1000)
                 elif choice == 1:  # Partial funding
                     interface.display_message("You provide partial funding for the cathedral.")
                     # Balanced approach
-                    self.popularity += random.randint(2, 5)
-                    self.treasury_reserves -= random.randint(200, 500)
+                    self.popularity += self.rng.randint(2, 5)
+                    self.treasury_reserves -= self.rng.randint(200, 500)
                 else:  # Deny funding
                     interface.display_message("You deny funding for the cathedral.")
                     # Church is unhappy
-                    self.popularity -= random.randint(3, 8)
+                    self.popularity -= self.rng.randint(3, 8)
             
             else:  # Military Request
                 if choice == 0:  # Grant
                     interface.display_message("You grant the military request.")
                     # Military is strengthened, treasury suffers
-                    self.military_strength = min(100, self.military_strength + random.randint(3, 8))
-                    self.treasury_reserves -= random.randint(300, 700)
+                    self.military_strength = min(100, self.military_strength + self.rng.randint(3, 8))
+                    self.treasury_reserves -= self.rng.randint(300, 700)
                 elif choice == 1:  # Partial
                     interface.display_message("You partially grant the military request.")
                     # Balanced approach
-                    self.military_strength = min(100, self.military_strength + random.randint(1, 4))
-                    self.treasury_reserves -= random.randint(100, 300)
+                    self.military_strength = min(100, self.military_strength + self.rng.randint(1, 4))
+                    self.treasury_reserves -= self.rng.randint(100, 300)
                 else:  # Deny
                     interface.display_message("You deny the military request.")
                     # Military is unhappy
-                    self.military_strength = max(1, self.military_strength - random.randint(1, 3))
+                    self.military_strength = max(1, self.military_strength - self.rng.randint(1, 3))
             
             # Pause between petitions
             interface.get_input("\nPress Enter to continue to the next petition...")
@@ -394,10 +394,10 @@ class King(Character):
         # Chancellor's competence affects overall court effectiveness
         if self.advisors["Chancellor"] >= 70:
             interface.display_message("Your Chancellor managed the proceedings expertly.")
-            self.popularity += random.randint(1, 3)
+            self.popularity += self.rng.randint(1, 3)
         elif self.advisors["Chancellor"] <= 30:
             interface.display_message("Your Chancellor struggled to maintain order in court.")
-            self.popularity -= random.randint(1, 3)
+            self.popularity -= self.rng.randint(1, 3)
         
         # Ensure values stay within bounds
         self.popularity = max(0, min(100, self.popularity))
@@ -443,7 +443,7 @@ class King(Character):
         kingdom_options = []
         for kingdom in available_kingdoms:
             # Estimate kingdom strength (would be a property of Kingdom in a full implementation)
-            kingdom_strength = random.randint(40, 100)
+            kingdom_strength = self.rng.randint(40, 100)
             strength_comparison = ""
             
             if kingdom_strength > self.military_strength + 20:
@@ -495,16 +495,16 @@ class King(Character):
                 # Popularity effects based on justification
                 if justification in ["Border Dispute", "Trade Conflict"]:
                     # Practical reasons are moderately popular
-                    self.popularity += random.randint(-5, 10)
+                    self.popularity += self.rng.randint(-5, 10)
                 elif justification == "Personal Insult":
                     # Personal reasons are unpopular
-                    self.popularity -= random.randint(5, 15)
+                    self.popularity -= self.rng.randint(5, 15)
                 elif justification == "Dynastic Claim":
                     # Dynastic reasons are popular with nobles
-                    self.popularity += random.randint(0, 5)
+                    self.popularity += self.rng.randint(0, 5)
                 else:  # Religious Differences
                     # Religious reasons can be divisive
-                    self.popularity += random.randint(-10, 15)
+                    self.popularity += self.rng.randint(-10, 15)
                 
                 # Marshal's competence affects initial military preparation
                 marshal_bonus = int((self.advisors["Marshal"] - 50) / 10)  # -5 to +5
@@ -578,7 +578,7 @@ class King(Character):
             success_chance = max(0.1, min(0.95, success_chance))
             
             # Determine outcome
-            if random.random() < success_chance:
+            if self.rng.random() < success_chance:
                 # Peace negotiation successful
                 interface.display_message(f"Peace negotiations with {target_kingdom} are successful!")
                 
@@ -588,22 +588,22 @@ class King(Character):
                 # Effects based on terms
                 if chosen_terms == "White Peace (No Concessions)":
                     interface.display_message("The war ends with no territorial changes or reparations.")
-                    self.popularity += random.randint(5, 10)
+                    self.popularity += self.rng.randint(5, 10)
                 
                 elif chosen_terms == "Favorable Terms (Demand Tribute)":
-                    tribute = random.randint(1000, 3000)
+                    tribute = self.rng.randint(1000, 3000)
                     self.treasury_reserves += tribute
                     interface.display_message(f"You secure a tribute of {tribute} coins from {target_kingdom}.")
-                    self.popularity += random.randint(10, 20)
+                    self.popularity += self.rng.randint(10, 20)
                 
                 else:  # Unfavorable Terms
-                    tribute = random.randint(1000, 3000)
+                    tribute = self.rng.randint(1000, 3000)
                     self.treasury_reserves -= tribute
                     interface.display_message(f"You agree to pay {tribute} coins to {target_kingdom} as reparations.")
-                    self.popularity -= random.randint(5, 15)
+                    self.popularity -= self.rng.randint(5, 15)
                 
                 # Military recovery
-                recovery = random.randint(5, 15)
+                recovery = self.rng.randint(5, 15)
                 self.military_strength = min(100, self.military_strength + recovery)
                 interface.display_message(f"Your military begins to recover, gaining {recovery} strength points.")
             
@@ -613,7 +613,7 @@ class King(Character):
                 interface.display_message("The war continues...")
                 
                 # Diplomatic penalty
-                chancellor_penalty = random.randint(1, 5)
+                chancellor_penalty = self.rng.randint(1, 5)
                 self.advisors["Chancellor"] = max(1, self.advisors["Chancellor"] - chancellor_penalty)
                 interface.display_message(f"Your Chancellor's reputation suffers, losing {chancellor_penalty} competence points.")
         else:
@@ -639,35 +639,35 @@ class King(Character):
                 "name": "Statue",
                 "description": "A statue of yourself in the town square.",
                 "cost": 1000,
-                "popularity_gain": random.randint(5, 10),
+                "popularity_gain": self.rng.randint(5, 10),
                 "time_to_build": 1  # years
             },
             {
                 "name": "Triumphal Arch",
                 "description": "A grand arch celebrating your military victories.",
                 "cost": 2000,
-                "popularity_gain": random.randint(8, 15),
+                "popularity_gain": self.rng.randint(8, 15),
                 "time_to_build": 2  # years
             },
             {
                 "name": "Royal Gardens",
                 "description": "Extensive gardens open to the public.",
                 "cost": 3000,
-                "popularity_gain": random.randint(10, 20),
+                "popularity_gain": self.rng.randint(10, 20),
                 "time_to_build": 2  # years
             },
             {
                 "name": "Cathedral",
                 "description": "A magnificent cathedral to demonstrate your piety.",
                 "cost": 5000,
-                "popularity_gain": random.randint(15, 25),
+                "popularity_gain": self.rng.randint(15, 25),
                 "time_to_build": 3  # years
             },
             {
                 "name": "Palace",
                 "description": "A grand palace to showcase your wealth and power.",
                 "cost": 8000,
-                "popularity_gain": random.randint(20, 30),
+                "popularity_gain": self.rng.randint(20, 30),
                 "time_to_build": 4  # years
             }
         ]
@@ -723,7 +723,7 @@ class King(Character):
                 interface.display_message(f"Estimated completion time: {selected_monument['time_to_build']} years.")
                 
                 # Immediate small popularity boost for starting project
-                popularity_boost = random.randint(1, 5)
+                popularity_boost = self.rng.randint(1, 5)
                 self.popularity += popularity_boost
                 interface.display_message(f"Your subjects are excited about the new project! Popularity increased by {popularity_boost}.")
             else:
@@ -754,35 +754,35 @@ class King(Character):
                 "name": "Small Banquet",
                 "description": "A modest banquet for local nobles.",
                 "cost": 500,
-                "popularity_gain": random.randint(3, 8),
+                "popularity_gain": self.rng.randint(3, 8),
                 "guests": "Local Nobles"
             },
             {
                 "name": "Royal Feast",
                 "description": "A grand feast for nobles from across the kingdom.",
                 "cost": 1000,
-                "popularity_gain": random.randint(5, 12),
+                "popularity_gain": self.rng.randint(5, 12),
                 "guests": "Kingdom Nobles"
             },
             {
                 "name": "Festival",
                 "description": "A public festival for all your subjects.",
                 "cost": 1500,
-                "popularity_gain": random.randint(8, 15),
+                "popularity_gain": self.rng.randint(8, 15),
                 "guests": "All Subjects"
             },
             {
                 "name": "Grand Tournament",
                 "description": "A tournament with feasting and entertainment.",
                 "cost": 2500,
-                "popularity_gain": random.randint(10, 20),
+                "popularity_gain": self.rng.randint(10, 20),
                 "guests": "Nobles and Knights"
             },
             {
                 "name": "Royal Wedding",
                 "description": "A celebration of a royal marriage (requires an unmarried royal).",
                 "cost": 3000,
-                "popularity_gain": random.randint(15, 25),
+                "popularity_gain": self.rng.randint(15, 25),
                 "guests": "Royalty and Nobility"
             }
         ]
@@ -829,7 +829,7 @@ class King(Character):
                 chancellor_bonus = int((self.advisors["Chancellor"] - 50) / 10)  # -5 to +5
                 
                 # Determine feast quality
-                feast_quality_roll = random.random() + (chancellor_bonus / 20)  # -0.25 to +0.25 modifier
+                feast_quality_roll = self.rng.random() + (chancellor_bonus / 20)  # -0.25 to +0.25 modifier
                 
                 if feast_quality_roll > 0.8:
                     feast_quality = "exceptional"
@@ -868,7 +868,7 @@ class King(Character):
                 
                 # Special effects based on feast type
                 if selected_feast["name"] == "Grand Tournament":
-                    military_boost = random.randint(1, 5)
+                    military_boost = self.rng.randint(1, 5)
                     self.military_strength = min(100, self.military_strength + military_boost)
                     interface.display_message(f"The tournament attracts skilled warriors to your service. Military strength increased by {military_boost}.")
                 
@@ -955,7 +955,7 @@ class King(Character):
                     # Higher cost means better chance of high competence
                     min_competence = max(30, current_competence - 20)
                     max_competence = min(100, current_competence + 40)
-                    new_competence = random.randint(min_competence, max_competence)
+                    new_competence = self.rng.randint(min_competence, max_competence)
                     
                     # Update advisor
                     self.advisors[position] = new_competence
@@ -965,10 +965,10 @@ class King(Character):
                     
                     # Temporary popularity effect
                     if new_competence > current_competence + 10:
-                        self.popularity += random.randint(1, 5)
+                        self.popularity += self.rng.randint(1, 5)
                         interface.display_message("Your subjects approve of the new appointment.")
                     elif new_competence < current_competence - 10:
-                        self.popularity -= random.randint(1, 5)
+                        self.popularity -= self.rng.randint(1, 5)
                         interface.display_message("Your subjects question your judgment in this appointment.")
                 else:
                     interface.display_message("You decided not to replace your advisor.")
@@ -995,7 +995,7 @@ class King(Character):
                     self.treasury_reserves -= cost
                     
                     # Calculate improvement
-                    improvement = random.randint(3, 8)
+                    improvement = self.rng.randint(3, 8)
                     new_competence = min(100, current_competence + improvement)
                     
                     # Update advisor
@@ -1026,22 +1026,22 @@ class King(Character):
         # War effects
         for enemy in self.at_war_with:
             # Wars are costly
-            war_cost = random.randint(500, 1500)
+            war_cost = self.rng.randint(500, 1500)
             self.treasury_reserves -= war_cost
             
             # Wars affect popularity
-            self.popularity -= random.randint(3, 8)
+            self.popularity -= self.rng.randint(3, 8)
             
             # Wars affect military strength
-            battle_outcome = random.random()
+            battle_outcome = self.rng.random()
             if battle_outcome < 0.4:  # Victory
-                self.military_strength = min(100, self.military_strength + random.randint(1, 5))
-                self.popularity += random.randint(5, 10)
+                self.military_strength = min(100, self.military_strength + self.rng.randint(1, 5))
+                self.popularity += self.rng.randint(5, 10)
             elif battle_outcome < 0.7:  # Stalemate
-                self.military_strength = max(1, self.military_strength - random.randint(1, 3))
+                self.military_strength = max(1, self.military_strength - self.rng.randint(1, 3))
             else:  # Defeat
-                self.military_strength = max(1, self.military_strength - random.randint(5, 10))
-                self.popularity -= random.randint(5, 15)
+                self.military_strength = max(1, self.military_strength - self.rng.randint(5, 10))
+                self.popularity -= self.rng.randint(5, 15)
         
         # Military maintenance costs
         military_upkeep = int(self.military_strength * 20)
@@ -1065,21 +1065,21 @@ class King(Character):
             self.construction_projects = remaining_projects
         
         # Random events
-        event_roll = random.random()
+        event_roll = self.rng.random()
         if event_roll < 0.1:
             # Scandal
-            self.popularity -= random.randint(5, 15)
+            self.popularity -= self.rng.randint(5, 15)
         elif event_roll < 0.2:
             # Good harvest
-            self.treasury_reserves += random.randint(500, 1000)
-            self.popularity += random.randint(3, 8)
+            self.treasury_reserves += self.rng.randint(500, 1000)
+            self.popularity += self.rng.randint(3, 8)
         
         # Ensure values stay within bounds
         self.popularity = max(0, min(100, self.popularity))
         
         # If treasury is negative, take debt penalties
         if self.treasury_reserves < 0:
-            self.popularity -= random.randint(5, 15)
+            self.popularity -= self.rng.randint(5, 15)
             # In a real game, you might add more severe consequences
     
     def display_status(self, interface):
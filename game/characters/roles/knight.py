@@ -1,31 +1,32 @@
 """
 Knight - Character role class for knights
 """
-import random
 from game.characters.character import Character
 
 class Knight(Character):
     """Character role class for knights."""
     
-    def __init__(self, name, gender, birth_year=None):
+    def __init__(self, name, gender, birth_year=None, rng=None):
         """Initialize a new knight character.
         
         Args:
             name: The character's name.
             gender: The character's gender.
             birth_year: The character's birth year (optional).
+            rng: The random generator for this character (optional).
         """
-        super().__init__(name, gender, "knight", birth_year)
+        super().__init__(name, gender, "knight", birth_year, rng)
         
         # Knights start with moderate wealth
-        self.wealth = random.randint(200, 400)
+        self.wealth = self.rng.randint(200, 400)
         
         # Knight-specific properties
         self.lord = None  # The knight's lord (if any)
-        self.reputation = random.randint(30, 70)  # Reputation among peers (0-100)
+        self.peer_reputation = self.rng.randint(30, 70)  # Reputation among peers (0-100)
         self.tournament_wins = 0  # Number of tournament wins
         self.tournament_losses = 0  # Number of tournament losses
         self.equipment_level = 1
+        self.equipment_quality = 50  # Quality of arms and armour (0-100)
         self.squires = 0
         self.last_battle_result = None
         
@@ -35,10 +36,10 @@ class Knight(Character):
     def _adjust_skills_for_role(self):
         """Adjust skills based on character role."""
         # Knights are better at combat
-        self.skills["combat"] = random.randint(40, 60)
+        self.skills["combat"] = self.rng.randint(40, 60)
         
         # Knights also have some diplomacy skills
-        self.skills["diplomacy"] += random.randint(5, 15)
+        self.skills["diplomacy"] += self.rng.randint(5, 15)
         
         # Ensure skills stay within bounds
         for skill in self.skills:
@@ -105,7 +106,7 @@ class Knight(Character):
             self.squires += 1
             
             # Training effectiveness affects skill gain
-            skill_gain = int(random.randint(2, 5) * military_mod)
+            skill_gain = int(self.rng.randint(2, 5) * military_mod)
             self.skills["combat"] = min(100, self.skills["combat"] + skill_gain)
             
             # Improve reputation
@@ -130,7 +131,7 @@ class Knight(Character):
             self.equipment_level += 1
             
             # Equipment quality affects skill gain
-            skill_gain = int(random.randint(3, 7) * military_mod)
+            skill_gain = int(self.rng.randint(3, 7) * military_mod)
             self.skills["combat"] = min(100, self.skills["combat"] + skill_gain)
             
             # Improve reputation
@@ -159,18 +160,18 @@ class Knight(Character):
             success_chance = min(0.95, (base_chance + equipment_bonus + squire_bonus) * 
                                ((noble_mod + military_mod) / 2))
             
-            if random.random() < success_chance:
+            if self.rng.random() < success_chance:
                 # Tournament victory
-                prize_money = random.randint(200, 400)
+                prize_money = self.rng.randint(200, 400)
                 self.wealth += prize_money
                 self.tournament_wins += 1
                 
                 # Significant reputation gains
-                self.reputation.adjust_reputation("nobility", random.randint(3, 5))
-                self.reputation.adjust_reputation("military", random.randint(3, 5))
+                self.reputation.adjust_reputation("nobility", self.rng.randint(3, 5))
+                self.reputation.adjust_reputation("military", self.rng.randint(3, 5))
                 
                 # Skill improvement
-                skill_gain = random.randint(2, 4)
+                skill_gain = self.rng.randint(2, 4)
                 self.skills["combat"] = min(100, self.skills["combat"] + skill_gain)
                 
                 self.last_battle_result = f"Victory! Won tournament and {prize_money} coins."
@@ -200,7 +201,7 @@ class Knight(Character):
         dexterity_factor = self.attributes["dexterity"] / 100  # 0-1 based on dexterity
         
         base_improvement = 3
-        improvement = base_improvement + int(strength_factor * 3) + int(dexterity_factor * 3) + random.randint(0, 2)
+        improvement = base_improvement + int(strength_factor * 3) + int(dexterity_factor * 3) + self.rng.randint(0, 2)
         
         # Apply improvement
         old_skill = self.skills["combat"]
@@ -208,7 +209,7 @@ class Knight(Character):
         actual_improvement = self.skills["combat"] - old_skill
         
         # Health cost of training
-        health_cost = random.randint(3, 8)
+        health_cost = self.rng.randint(3, 8)
         self.health = max(1, self.health - health_cost)
         
         # Display results
@@ -218,9 +219,9 @@ class Knight(Character):
         interface.display_message(f"Current health: {self.health}/100")
         
         # Chance to improve strength or dexterity
-        if random.random() < 0.2:  # 20% chance
-            attribute = random.choice(["strength", "dexterity"])
-            gain = random.randint(1, 2)
+        if self.rng.random() < 0.2:  # 20% chance
+            attribute = self.rng.choice(["strength", "dexterity"])
+            gain = self.rng.randint(1, 2)
             self.attributes[attribute] = min(100, self.attributes[attribute] + gain)
             interface.display_message(f"Your {attribute} improved by {gain} points from the training.")
         
@@ -248,7 +249,7 @@ class Knight(Character):
         interface.display_message(f"You pay the entry fee of {entry_fee} coins to participate in the tournament.")
         
         # Determine tournament difficulty (1-5)
-        tournament_tier = random.randint(1, 5)
+        tournament_tier = self.rng.randint(1, 5)
         tier_names = ["local", "regional", "kingdom", "grand", "royal"]
         tournament_name = f"{tier_names[tournament_tier-1]} tournament"
         
@@ -262,7 +263,7 @@ class Knight(Character):
         while current_round <= rounds and not eliminated:
             # Opponent skill increases with rounds and tournament tier
             opponent_base_skill = 30 + (tournament_tier * 10) + (current_round * 5)
-            opponent_skill = max(10, min(95, opponent_base_skill + random.randint(-10, 10)))
+            opponent_skill = max(10, min(95, opponent_base_skill + self.rng.randint(-10, 10)))
             
             interface.display_message(f"\nRound {current_round}:")
             interface.display_message(f"You face an opponent with combat skill of approximately {opponent_skill}.")
@@ -275,16 +276,16 @@ class Knight(Character):
             success_chance = max(0.1, min(0.9, success_chance))  # Bound between 10% and 90%
             
             # Determine outcome
-            if random.random() < success_chance:
+            if self.rng.random() < success_chance:
                 # Win the round
                 interface.display_message("You defeat your opponent and advance to the next round!")
                 
                 # Small health cost
-                health_cost = random.randint(1, 5)
+                health_cost = self.rng.randint(1, 5)
                 self.health = max(1, self.health - health_cost)
                 
                 # Small combat skill improvement
-                skill_gain = random.randint(1, 2)
+                skill_gain = self.rng.randint(1, 2)
                 self.skills["combat"] = min(100, self.skills["combat"] + skill_gain)
                 
                 current_round += 1
@@ -293,7 +294,7 @@ class Knight(Character):
                 interface.display_message("Your opponent defeats you. You are eliminated from the tournament.")
                 
                 # Larger health cost from defeat
-                health_cost = random.randint(5, 15)
+                health_cost = self.rng.randint(5, 15)
                 self.health = max(1, self.health - health_cost)
                 
                 eliminated = True
@@ -311,7 +312,7 @@ class Knight(Character):
             
             # Reputation gain
             rep_gain = tournament_tier * 5
-            self.reputation = min(100, self.reputation + rep_gain)
+            self.peer_reputation = min(100, self.peer_reputation + rep_gain)
             interface.display_message(f"Your reputation increases by {rep_gain} points.")
             
             # Record win
@@ -321,14 +322,14 @@ class Knight(Character):
             interface.display_message("\nDespite not winning, you gained valuable experience in the tournament.")
             
             # Small reputation gain just for participating
-            rep_gain = random.randint(1, 3)
-            self.reputation = min(100, self.reputation + rep_gain)
+            rep_gain = self.rng.randint(1, 3)
+            self.peer_reputation = min(100, self.peer_reputation + rep_gain)
             interface.display_message(f"Your reputation increases slightly by {rep_gain} points.")
         
         interface.display_message(f"\nTournament record: {self.tournament_wins} wins, {self.tournament_losses} losses")
         interface.display_message(f"Current health: {self.health}/100")
         interface.display_message(f"Current wealth: {self.wealth} coins")
-        interface.display_message(f"Current reputation: {self.reputation}/100")
+        interface.display_message(f"Current reputation: {self.peer_reputation}/100")
         
         interface.get_input("\nPress Enter to continue...")
     
@@ -356,7 +357,7 @@ class Knight(Character):
         available_lords = []
         for lord in potential_lords:
             required_reputation = (lord["prestige"] * 15) + 10
-            if self.reputation >= required_reputation:
+            if self.peer_reputation >= required_reputation:
                 available_lords.append(lord)
         
         if not available_lords:
@@ -391,7 +392,7 @@ class Knight(Character):
             
             # Reputation gain
             rep_gain = chosen_lord["prestige"] * 2
-            self.reputation = min(100, self.reputation + rep_gain)
+            self.peer_reputation = min(100, self.peer_reputation + rep_gain)
             interface.display_message(f"Your reputation increases by {rep_gain} points.")
             
             # Initial payment
@@ -457,33 +458,33 @@ class Knight(Character):
         success_chance = max(0.1, min(0.9, success_chance))  # Bound between 10% and 90%
         
         # Determine outcome
-        if random.random() < success_chance:
+        if self.rng.random() < success_chance:
             # Success
             interface.display_message("You successfully complete your duty!")
             
             # Calculate rewards based on duty difficulty
             base_payment = 20 + (difficulty / 2)
-            payment = int(base_payment + random.randint(-5, 5))
+            payment = int(base_payment + self.rng.randint(-5, 5))
             self.wealth += payment
             interface.display_message(f"You receive a payment of {payment} coins.")
             
             # Reputation gain
-            rep_gain = int(difficulty / 10) + random.randint(1, 3)
-            self.reputation = min(100, self.reputation + rep_gain)
+            rep_gain = int(difficulty / 10) + self.rng.randint(1, 3)
+            self.peer_reputation = min(100, self.peer_reputation + rep_gain)
             interface.display_message(f"Your reputation increases by {rep_gain} points.")
             
             # Skill improvement
             if chosen_duty in ["Guard duty", "Border patrol", "Hunt bandits"]:
-                skill_gain = random.randint(1, 2)
+                skill_gain = self.rng.randint(1, 2)
                 self.skills["combat"] = min(100, self.skills["combat"] + skill_gain)
                 interface.display_message(f"Your combat skill improved by {skill_gain} points.")
             elif chosen_duty == "Escort mission":
-                skill_gain = random.randint(1, 2)
+                skill_gain = self.rng.randint(1, 2)
                 self.skills["diplomacy"] = min(100, self.skills["diplomacy"] + skill_gain)
                 interface.display_message(f"Your diplomacy skill improved by {skill_gain} points.")
             elif chosen_duty == "Training recruits":
-                skill_gain = random.randint(1, 2)
-                if random.random() < 0.5:
+                skill_gain = self.rng.randint(1, 2)
+                if self.rng.random() < 0.5:
                     self.skills["combat"] = min(100, self.skills["combat"] + skill_gain)
                     interface.display_message(f"Your combat skill improved by {skill_gain} points.")
                 else:
@@ -499,24 +500,24 @@ class Knight(Character):
             interface.display_message(f"You receive a reduced payment of {payment} coins.")
             
             # Reputation loss
-            rep_loss = random.randint(1, 5)
-            self.reputation = max(0, self.reputation - rep_loss)
+            rep_loss = self.rng.randint(1, 5)
+            self.peer_reputation = max(0, self.peer_reputation - rep_loss)
             interface.display_message(f"Your reputation decreases by {rep_loss} points.")
         
         # Health cost based on duty
         if chosen_duty in ["Guard duty", "Training recruits"]:
-            health_cost = random.randint(1, 5)  # Light duty
+            health_cost = self.rng.randint(1, 5)  # Light duty
         elif chosen_duty in ["Escort mission", "Border patrol"]:
-            health_cost = random.randint(3, 8)  # Moderate duty
+            health_cost = self.rng.randint(3, 8)  # Moderate duty
         else:  # Hunt bandits
-            health_cost = random.randint(5, 15)  # Heavy duty
+            health_cost = self.rng.randint(5, 15)  # Heavy duty
         
         self.health = max(1, self.health - health_cost)
         interface.display_message(f"The duty was tiring. You lost {health_cost} health points.")
         
         interface.display_message(f"Current health: {self.health}/100")
         interface.display_message(f"Current wealth: {self.wealth} coins")
-        interface.display_message(f"Current reputation: {self.reputation}/100")
+        interface.display_message(f"Current reputation: {self.peer_reputation}/100")
         
         interface.get_input("\nPress Enter to continue...")
     
@@ -563,7 +564,7 @@ class Knight(Character):
         interface.display_message(f"You spend {cost} coins on equipment improvements.")
         
         # Calculate actual improvement with some randomness
-        improvement = base_improvement + random.randint(-2, 2)
+        improvement = base_improvement + self.rng.randint(-2, 2)
         improvement = max(1, improvement)  # Ensure at least some improvement
         
         # Apply improvement
@@ -589,7 +590,7 @@ class Knight(Character):
         """
         interface.display_message(f"Combat Skill: {self.skills['combat']}/100")
         interface.display_message(f"Equipment Quality: {self.equipment_quality}/100")
-        interface.display_message(f"Reputation: {self.reputation}/100")
+        interface.display_message(f"Reputation: {self.peer_reputation}/100")
         interface.display_message(f"Tournament Record: {self.tournament_wins} wins, {self.tournament_losses} losses")
         
         if self.lord:
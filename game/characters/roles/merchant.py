@@ -1,24 +1,24 @@
 """
 Merchant - Character role class for merchants
 """
-import random
 from game.characters.character import Character
 
 class Merchant(Character):
     """Character role class for merchants."""
     
-    def __init__(self, name, gender, birth_year=None):
+    def __init__(self, name, gender, birth_year=None, rng=None):
         """Initialize a new merchant character.
         
         Args:
             name: The character's name.
             gender: The character's gender.
             birth_year: The character's birth year (optional).
+            rng: The random generator for this character (optional).
         """
-        super().__init__(name, gender, "merchant", birth_year)
+        super().__init__(name, gender, "merchant", birth_year, rng)
         
         # Merchants start with moderate wealth
-        self.wealth = random.randint(100, 300)
+        self.wealth = self.rng.randint(100, 300)
         
         # Merchant-specific properties
         self.inventory = {}  # Type -> quantity
@@ -29,9 +29,9 @@ class Merchant(Character):
         
         # Initialize starting inventory
         self.inventory = {
-            "food": random.randint(5, 15),
-            "cloth": random.randint(3, 8),
-            "tools": random.randint(2, 5)
+            "food": self.rng.randint(5, 15),
+            "cloth": self.rng.randint(3, 8),
+            "tools": self.rng.randint(2, 5)
         }
         
         # Adjust skills for role
@@ -42,10 +42,10 @@ class Merchant(Character):
         possible_goods = ["cloth", "spices", "grain", "tools", "leather", "pottery", "wine"]
         
         # Add 2-4 random goods to inventory
-        num_goods = random.randint(2, 4)
+        num_goods = self.rng.randint(2, 4)
         for _ in range(num_goods):
-            good = random.choice(possible_goods)
-            quantity = random.randint(5, 20)
+            good = self.rng.choice(possible_goods)
+            quantity = self.rng.randint(5, 20)
             
             if good in self.inventory:
                 self.inventory[good] += quantity
@@ -55,10 +55,10 @@ class Merchant(Character):
     def _adjust_skills_for_role(self):
         """Adjust skills based on character role."""
         # Merchants are better at trade
-        self.skills["trade"] += random.randint(20, 40)
+        self.skills["trade"] += self.rng.randint(20, 40)
         
         # Merchants also have some diplomacy skills
-        self.skills["diplomacy"] += random.randint(5, 15)
+        self.skills["diplomacy"] += self.rng.randint(5, 15)
         
         # Ensure skills stay within bounds
         for skill in self.skills:
@@ -87,7 +87,7 @@ class Merchant(Character):
             game_manager: The game manager.
         """
         if action == "Trade Goods":
-            self._trade(game_manager)
+            self._trade_goods(game_manager)
         elif action == "Hire Employee":
             self._hire_employee(game_manager)
         elif action == "Upgrade Shop":
@@ -96,7 +96,7 @@ class Merchant(Character):
             # Use base class implementation for common actions
             super().perform_action(action, game_manager)
     
-    def _trade(self, game_manager):
+    def _trade_goods(self, game_manager):
         """Conduct trade with consideration for reputation effects."""
         # Get reputation modifiers
         merchant_mod = self.reputation.get_reputation_effects("merchants").get("buy_discount", 1.0)
@@ -105,16 +105,16 @@ class Merchant(Character):
         base_success_chance = 0.6 + (self.skills["trade"] / 200)  # 60-85% base chance
         success_chance = min(0.95, base_success_chance * merchant_mod)
         
-        if random.random() < success_chance:
+        if self.rng.random() < success_chance:
             # Successful trade
-            base_profit = random.randint(20, 50) * self.shop_level
+            base_profit = self.rng.randint(20, 50) * self.shop_level
             profit = int(base_profit * noble_mod)
             
             self.wealth += profit
-            self.skills["trade"] = min(100, self.skills["trade"] + random.randint(1, 3))
+            self.skills["trade"] = min(100, self.skills["trade"] + self.rng.randint(1, 3))
             
             # Improve reputation with merchants and nobility
-            self.reputation.adjust_reputation("merchants", random.randint(1, 3))
+            self.reputation.adjust_reputation("merchants", self.rng.randint(1, 3))
             if profit > 30:
                 self.reputation.adjust_reputation("nobility", 1)
             
@@ -122,7 +122,7 @@ class Merchant(Character):
             return True
         else:
             # Failed trade
-            loss = random.randint(10, 30) * self.shop_level
+            loss = self.rng.randint(10, 30) * self.shop_level
             self.wealth = max(0, self.wealth - loss)
             
             # Small reputation loss
@@ -147,7 +147,7 @@ class Merchant(Character):
             self.employees += 1
             
             # Employee quality affects skill gain
-            skill_gain = int(random.randint(2, 5) * peasant_mod)
+            skill_gain = int(self.rng.randint(2, 5) * peasant_mod)
             self.skills["trade"] = min(100, self.skills["trade"] + skill_gain)
             
             # Improve reputation with peasants
@@ -1,31 +1,31 @@
 """
 Noble - Character role class for nobles
 """
-import random
 from game.characters.character import Character
 
 class Noble(Character):
     """Character role class for nobles."""
     
-    def __init__(self, name, gender, birth_year=None):
+    def __init__(self, name, gender, birth_year=None, rng=None):
         """Initialize a new noble character.
         
         Args:
             name: The character's name.
             gender: The character's gender.
             birth_year: The character's birth year (optional).
+            rng: The random generator for this character (optional).
         """
-        super().__init__(name, gender, "noble", birth_year)
+        super().__init__(name, gender, "noble", birth_year, rng)
         
         # Nobles start with more wealth than commoners
-        self.wealth = random.randint(500, 2000)
+        self.wealth = self.rng.randint(500, 2000)
         
         # Noble-specific properties
-        self.estate_size = random.randint(1, 3)  # 1=Small, 2=Medium, 3=Large
-        self.estate_income = self.estate_size * random.randint(30, 50)  # Annual income
-        self.prestige = random.randint(30, 70)  # Social standing (0-100)
-        self.vassals = random.randint(0, self.estate_size)  # Number of vassals
-        self.court_influence = random.randint(10, 40)  # Influence at court (0-100)
+        self.estate_size = self.rng.randint(1, 3)  # 1=Small, 2=Medium, 3=Large
+        self.estate_income = self.estate_size * self.rng.randint(30, 50)  # Annual income
+        self.prestige = self.rng.randint(30, 70)  # Social standing (0-100)
+        self.vassals = self.rng.randint(0, self.estate_size)  # Number of vassals
+        self.court_influence = self.rng.randint(10, 40)  # Influence at court (0-100)
         
         # Adjust skills for role
         self._adjust_skills_for_role()
@@ -33,10 +33,10 @@ class Noble(Character):
     def _adjust_skills_for_role(self):
         """Adjust skills based on character role."""
         # Nobles are better at diplomacy
-        self.skills["diplomacy"] += random.randint(10, 30)
+        self.skills["diplomacy"] += self.rng.randint(10, 30)
         
         # Nobles also have some stewardship skills
-        self.skills["stewardship"] += random.randint(5, 15)
+        self.skills["stewardship"] += self.rng.randint(5, 15)
         
         # Ensure skills stay within bounds
         for skill in self.skills:
@@ -120,7 +120,7 @@ class Noble(Character):
         # Calculate tax collection based on estate size, stewardship skill, and random factors
         base_amount = self.estate_income
         stewardship_bonus = self.skills["stewardship"] / 100  # 0-1 bonus
-        random_factor = random.uniform(0.8, 1.2)  # Random fluctuation
+        random_factor = self.rng.uniform(0.8, 1.2)  # Random fluctuation
         
         collected_amount = int(base_amount * (1 + stewardship_bonus) * random_factor)
         
@@ -132,7 +132,7 @@ class Noble(Character):
         interface.display_message(f"Current wealth: {self.wealth} coins")
         
         # Skill improvement
-        skill_gain = random.randint(1, 2)
+        skill_gain = self.rng.randint(1, 2)
         self.skills["stewardship"] = min(100, self.skills["stewardship"] + skill_gain)
         interface.display_message(f"Your stewardship skill improved by {skill_gain} points.")
         
@@ -181,11 +181,11 @@ class Noble(Character):
         
         # Increase estate income
         old_income = self.estate_income
-        self.estate_income = self.estate_size * random.randint(30, 50)
+        self.estate_income = self.estate_size * self.rng.randint(30, 50)
         income_increase = self.estate_income - old_income
         
         # Increase prestige
-        prestige_gain = random.randint(5, 15)
+        prestige_gain = self.rng.randint(5, 15)
         self.prestige = min(100, self.prestige + prestige_gain)
         
         # Display results
@@ -231,7 +231,7 @@ class Noble(Character):
         
         # Calculate feast success based on diplomacy skill and random factors
         diplomacy_factor = self.skills["diplomacy"] / 100  # 0-1 bonus
-        random_factor = random.uniform(0.7, 1.3)  # Random fluctuation
+        random_factor = self.rng.uniform(0.7, 1.3)  # Random fluctuation
         success_level = (0.5 + diplomacy_factor) * random_factor  # 0.35-1.3
         
         # Determine outcome based on success level
@@ -239,12 +239,12 @@ class Noble(Character):
             interface.display_message("Your feast is poorly received. The food is mediocre, and few notable guests attend.")
             
             # Small prestige gain
-            prestige_gain = random.randint(1, 3)
+            prestige_gain = self.rng.randint(1, 3)
             self.prestige = min(100, self.prestige + prestige_gain)
             interface.display_message(f"Your prestige increased by only {prestige_gain} points.")
             
             # Small influence gain
-            influence_gain = random.randint(0, 2)
+            influence_gain = self.rng.randint(0, 2)
             self.court_influence = min(100, self.court_influence + influence_gain)
             if influence_gain > 0:
                 interface.display_message(f"Your court influence increased by {influence_gain} points.")
@@ -255,12 +255,12 @@ class Noble(Character):
             interface.display_message("Your feast is well-received. The food is good, and several notable guests attend.")
             
             # Moderate prestige gain
-            prestige_gain = random.randint(3, 8)
+            prestige_gain = self.rng.randint(3, 8)
             self.prestige = min(100, self.prestige + prestige_gain)
             interface.display_message(f"Your prestige increased by {prestige_gain} points.")
             
             # Moderate influence gain
-            influence_gain = random.randint(2, 5)
+            influence_gain = self.rng.randint(2, 5)
             self.court_influence = min(100, self.court_influence + influence_gain)
             interface.display_message(f"Your court influence increased by {influence_gain} points.")
         
@@ -268,23 +268,23 @@ class Noble(Character):
             interface.display_message("Your feast is a tremendous success! The food is exquisite, and many important guests attend.")
             
             # Large prestige gain
-            prestige_gain = random.randint(8, 15)
+            prestige_gain = self.rng.randint(8, 15)
             self.prestige = min(100, self.prestige + prestige_gain)
             interface.display_message(f"Your prestige increased by {prestige_gain} points.")
             
             # Large influence gain
-            influence_gain = random.randint(5, 10)
+            influence_gain = self.rng.randint(5, 10)
             self.court_influence = min(100, self.court_influence + influence_gain)
             interface.display_message(f"Your court influence increased by {influence_gain} points.")
             
             # Chance to gain a vassal
-            if self.vassals < self.estate_size * 2 and random.random() < 0.3:  # 30% chance
+            if self.vassals < self.estate_size * 2 and self.rng.random() < 0.3:  # 30% chance
                 self.vassals += 1
                 interface.display_message("A minor noble is so impressed that they offer to become your vassal!")
                 interface.display_message(f"You now have {self.vassals} vassals.")
         
         # Skill improvement
-        diplomacy_gain = random.randint(1, 3)
+        diplomacy_gain = self.rng.randint(1, 3)
         self.skills["diplomacy"] = min(100, self.skills["diplomacy"] + diplomacy_gain)
         interface.display_message(f"Your diplomacy skill improved by {diplomacy_gain} points.")
         
@@ -339,26 +339,26 @@ class Noble(Character):
         interface.display_message("You engage in political discussions and debates at court.")
         
         # Adjust success chance based on random factors
-        random_factor = random.uniform(0.7, 1.3)
+        random_factor = self.rng.uniform(0.7, 1.3)
         success_chance = base_success_chance * random_factor
         
         # Determine outcome
-        if random.random() < success_chance:
+        if self.rng.random() < success_chance:
             # Success
             interface.display_message("Your political maneuvering is successful!")
             
             # Influence gain
-            influence_gain = random.randint(3, 8)
+            influence_gain = self.rng.randint(3, 8)
             self.court_influence = min(100, self.court_influence + influence_gain)
             interface.display_message(f"Your court influence increased by {influence_gain} points.")
             
             # Prestige gain
-            prestige_gain = random.randint(1, 4)
+            prestige_gain = self.rng.randint(1, 4)
             self.prestige = min(100, self.prestige + prestige_gain)
             interface.display_message(f"Your prestige increased by {prestige_gain} points.")
             
             # Skill improvement
-            diplomacy_gain = random.randint(1, 3)
+            diplomacy_gain = self.rng.randint(1, 3)
             self.skills["diplomacy"] = min(100, self.skills["diplomacy"] + diplomacy_gain)
             interface.display_message(f"Your diplomacy skill improved by {diplomacy_gain} points.")
         else:
@@ -366,12 +366,12 @@ class Noble(Character):
             interface.display_message("Your political maneuvering is unsuccessful.")
             
             # Influence loss
-            influence_loss = random.randint(1, 5)
+            influence_loss = self.rng.randint(1, 5)
             self.court_influence = max(0, self.court_influence - influence_loss)
             interface.display_message(f"Your court influence decreased by {influence_loss} points.")
             
             # Small skill improvement (learning from mistakes)
-            diplomacy_gain = random.randint(0, 1)
+            diplomacy_gain = self.rng.randint(0, 1)
             if diplomacy_gain > 0:
                 self.skills["diplomacy"] = min(100, self.skills["diplomacy"] + diplomacy_gain)
                 interface.display_message(f"Despite the setback, your diplomacy skill improved by {diplomacy_gain} points.")
@@ -391,32 +391,32 @@ class Noble(Character):
         
         # Adjust success chance based on random factors and prestige
         prestige_factor = self.prestige / 200  # 0-0.5 based on prestige
-        random_factor = random.uniform(0.7, 1.3)
+        random_factor = self.rng.uniform(0.7, 1.3)
         success_chance = (base_success_chance + prestige_factor) * random_factor
         
         # Determine outcome
-        if random.random() < success_chance:
+        if self.rng.random() < success_chance:
             # Success
             interface.display_message("The monarch looks upon you with favor!")
             
             # Influence gain
-            influence_gain = random.randint(5, 12)
+            influence_gain = self.rng.randint(5, 12)
             self.court_influence = min(100, self.court_influence + influence_gain)
             interface.display_message(f"Your court influence increased by {influence_gain} points.")
             
             # Prestige gain
-            prestige_gain = random.randint(3, 8)
+            prestige_gain = self.rng.randint(3, 8)
             self.prestige = min(100, self.prestige + prestige_gain)
             interface.display_message(f"Your prestige increased by {prestige_gain} points.")
             
             # Possible wealth gain (royal gift)
-            if random.random() < 0.3:  # 30% chance
-                wealth_gain = random.randint(50, 200)
+            if self.rng.random() < 0.3:  # 30% chance
+                wealth_gain = self.rng.randint(50, 200)
                 self.wealth += wealth_gain
                 interface.display_message(f"The monarch grants you a gift of {wealth_gain} coins!")
             
             # Skill improvement
-            diplomacy_gain = random.randint(1, 3)
+            diplomacy_gain = self.rng.randint(1, 3)
             self.skills["diplomacy"] = min(100, self.skills["diplomacy"] + diplomacy_gain)
             interface.display_message(f"Your diplomacy skill improved by {diplomacy_gain} points.")
         else:
@@ -424,13 +424,13 @@ class Noble(Character):
             interface.display_message("The monarch ignores your attempts to gain favor.")
             
             # Small influence loss
-            influence_loss = random.randint(0, 3)
+            influence_loss = self.rng.randint(0, 3)
             if influence_loss > 0:
                 self.court_influence = max(0, self.court_influence - influence_loss)
                 interface.display_message(f"Your court influence decreased by {influence_loss} points.")
             
             # Small skill improvement (learning from mistakes)
-            diplomacy_gain = random.randint(0, 1)
+            diplomacy_gain = self.rng.randint(0, 1)
             if diplomacy_gain > 0:
                 self.skills["diplomacy"] = min(100, self.skills["diplomacy"] + diplomacy_gain)
                 interface.display_message(f"Despite the setback, your diplomacy skill improved by {diplomacy_gain} points.")
@@ -449,21 +449,21 @@ class Noble(Character):
         interface.display_message("You carefully spread rumors to undermine your rivals at court.")
         
         # Adjust success chance based on random factors
-        random_factor = random.uniform(0.7, 1.3)
+        random_factor = self.rng.uniform(0.7, 1.3)
         success_chance = base_success_chance * random_factor
         
         # Determine outcome
-        if random.random() < success_chance:
+        if self.rng.random() < success_chance:
             # Success
             interface.display_message("Your rumors successfully undermine your rivals!")
             
             # Influence gain
-            influence_gain = random.randint(4, 10)
+            influence_gain = self.rng.randint(4, 10)
             self.court_influence = min(100, self.court_influence + influence_gain)
             interface.display_message(f"Your court influence increased by {influence_gain} points.")
             
             # Skill improvement
-            diplomacy_gain = random.randint(1, 3)
+            diplomacy_gain = self.rng.randint(1, 3)
             self.skills["diplomacy"] = min(100, self.skills["diplomacy"] + diplomacy_gain)
             interface.display_message(f"Your diplomacy skill improved by {diplomacy_gain} points.")
         else:
@@ -471,17 +471,17 @@ class Noble(Character):
             interface.display_message("Your rumors are traced back to you, damaging your reputation!")
             
             # Influence loss
-            influence_loss = random.randint(5, 15)
+            influence_loss = self.rng.randint(5, 15)
             self.court_influence = max(0, self.court_influence - influence_loss)
             interface.display_message(f"Your court influence decreased by {influence_loss} points.")
             
             # Prestige loss
-            prestige_loss = random.randint(3, 8)
+            prestige_loss = self.rng.randint(3, 8)
             self.prestige = max(0, self.prestige - prestige_loss)
             interface.display_message(f"Your prestige decreased by {prestige_loss} points.")
             
             # Small skill improvement (learning from mistakes)
-            diplomacy_gain = random.randint(0, 1)
+            diplomacy_gain = self.rng.randint(0, 1)
             if diplomacy_gain > 0:
                 self.skills["diplomacy"] = min(100, self.skills["diplomacy"] + diplomacy_gain)
                 interface.display_message(f"Despite the setback, your diplomacy skill improved by {diplomacy_gain} points.")
@@ -501,32 +501,32 @@ class Noble(Character):
         
         # Adjust success chance based on random factors and prestige
         prestige_factor = self.prestige / 200  # 0-0.5 based on prestige
-        random_factor = random.uniform(0.7, 1.3)
+        random_factor = self.rng.uniform(0.7, 1.3)
         success_chance = (base_success_chance + prestige_factor) * random_factor
         
         # Determine outcome
-        if random.random() < success_chance:
+        if self.rng.random() < success_chance:
             # Success
             interface.display_message("You successfully form valuable alliances with other nobles!")
             
             # Influence gain
-            influence_gain = random.randint(5, 10)
+            influence_gain = self.rng.randint(5, 10)
             self.court_influence = min(100, self.court_influence + influence_gain)
             interface.display_message(f"Your court influence increased by {influence_gain} points.")
             
             # Prestige gain
-            prestige_gain = random.randint(2, 5)
+            prestige_gain = self.rng.randint(2, 5)
             self.prestige = min(100, self.prestige + prestige_gain)
             interface.display_message(f"Your prestige increased by {prestige_gain} points.")
             
             # Chance to gain a vassal
-            if self.vassals < self.estate_size * 2 and random.random() < 0.2:  # 20% chance
+            if self.vassals < self.estate_size * 2 and self.rng.random() < 0.2:  # 20% chance
                 self.vassals += 1
                 interface.display_message("A minor noble agrees to become your vassal as part of the alliance!")
                 interface.display_message(f"You now have {self.vassals} vassals.")
             
             # Skill improvement
-            diplomacy_gain = random.randint(2, 4)
+            diplomacy_gain = self.rng.randint(2, 4)
             self.skills["diplomacy"] = min(100, self.skills["diplomacy"] + diplomacy_gain)
             interface.display_message(f"Your diplomacy skill improved by {diplomacy_gain} points.")
         else:
@@ -534,12 +534,12 @@ class Noble(Character):
             interface.display_message("Your attempts to form alliances are rebuffed.")
             
             # Small influence loss
-            influence_loss = random.randint(1, 4)
+            influence_loss = self.rng.randint(1, 4)
             self.court_influence = max(0, self.court_influence - influence_loss)
             interface.display_message(f"Your court influence decreased by {influence_loss} points.")
             
             # Small skill improvement (learning from mistakes)
-            diplomacy_gain = random.randint(0, 2)
+            diplomacy_gain = self.rng.randint(0, 2)
             if diplomacy_gain > 0:
                 self.skills["diplomacy"] = min(100, self.skills["diplomacy"] + diplomacy_gain)
                 interface.display_message(f"Despite the setback, your diplomacy skill improved by {diplomacy_gain} points.")
@@ -555,7 +555,7 @@ class Noble(Character):
         self.wealth += self.estate_income
         
         # Income from vassals
-        vassal_income = self.vassals * random.randint(10, 30)
+        vassal_income = self.vassals * self.rng.randint(10, 30)
         if vassal_income > 0:
             self.wealth += vassal_income
     
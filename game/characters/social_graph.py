@@ -0,0 +1,296 @@
+"""
+Social Graph - Sparse, typed and weighted ties between NPCs
+"""
+import math
+
+# Edge types; each is stored as its index in this table
+EDGE_TYPES = ("kin", "friend", "rival", "spouse", "liege", "vassal")
+KIN, FRIEND, RIVAL, SPOUSE, LIEGE, VASSAL = range(len(EDGE_TYPES))
+EDGE_CODES = {name: code for code, name in enumerate(EDGE_TYPES)}
+
+# The type of the edge seen from the other end; every other type is symmetric
+REVERSE_TYPES = {LIEGE: VASSAL, VASSAL: LIEGE}
+
+# Ties that fade unless renewed, and how much of their weight is lost each year
+DECAY_RATES = {FRIEND: 0.1, RIVAL: 0.05}
+MIN_WEIGHT = 0.1  # Decayed ties below this weight are dropped
+
+class SocialGraph:
+    """Sparse adjacency of typed, weighted ties between NPC IDs.
+
+    Each NPC maps (neighbour ID, edge type code) to the tie's weight, and
+    every tie is stored from both ends, so the neighbours of an NPC are found
+    in time proportional to its number of ties. An NPC with no ties takes no
+    space at all.
+
+    Fading ties decay lazily: they keep the weight they were set to and the
+    year it was set in, their current weight is worked out when read, and
+    each is scheduled for removal in the year it will drop below the minimum
+    weight. The yearly decay only visits the ties expiring that year.
+    """
+
+    def __init__(self, decay_rates=None, min_weight=MIN_WEIGHT):
+        """Initialize an empty social graph.
+
+        Args:
+            decay_rates: A dictionary mapping edge types to the share of weight
+                they lose each year (optional, defaults to DECAY_RATES).
+            min_weight: Fading ties weaker than this are removed.
+        """
+        self.adjacency = {}
+        self.edge_count = 0
+        if decay_rates is None:
+            self.decay_factors = {code: 1.0 - rate for code, rate in DECAY_RATES.items()}
+        else:
+            self.decay_factors = {EDGE_CODES[edge_type]: 1.0 - rate for edge_type, rate in decay_rates.items()}
+        self.min_weight = min_weight
+        self.year = 0  # Number of yearly decays so far
+        self.fading = {}  # Maps the key of each fading tie to (year its weight was set, year it expires)
+        self.expiries = {}  # Maps a year to the keys of the fading ties expiring in it
+
+    def __len__(self):
+        return self.edge_count
+
+    def add_edge(self, npc_id, other_id, edge_type, weight=1.0):
+        """Add a tie, or set its weight if it already exists.
+
+        Args:
+            npc_id: The ID of one NPC.
+            other_id: The ID of the other NPC.
+            edge_type: The type of tie, seen from npc_id (e.g., 'friend', 'liege').
+            weight: The strength of the tie, from 0.0 to 1.0.
+        """
+        if npc_id == other_id:
+            return
+        code = EDGE_CODES[edge_type]
+        edges = self.adjacency.setdefault(npc_id, {})
+        if (other_id, code) not in edges:
+            self.edge_count += 1
+        edges[(other_id, code)] = weight
+        self.adjacency.setdefault(other_id, {})[(npc_id, REVERSE_TYPES.get(code, code))] = weight
+
+        # Schedule the removal of fading ties
+        factor = self._decay_factor(code)
+        if factor is not None:
+            key = self._fading_key(npc_id, other_id, code)
+            expiry = self._expiry_year(weight, factor)
+            self.fading[key] = (self.year, expiry)
+            if expiry is not None:
+                self.expiries.setdefault(expiry, []).append(key)
+
+    def add_edges(self, edges):
+        """Add many ties at once, e.g. for a year's marriages or a new cohort.
+
+        Args:
+            edges: An iterable of (npc_id, other_id, edge_type, weight) tuples.
+        """
+        for npc_id, other_id, edge_type, weight in edges:
+            self.add_edge(npc_id, other_id, edge_type, weight)
+
+    def remove_edge(self, npc_id, other_id, edge_type):
+        """Remove a tie from both ends.
+
+        Args:
+            npc_id: The ID of one NPC.
+            other_id: The ID of the other NPC.
+            edge_type: The type of tie, seen from npc_id.
+
+        Returns:
+            bool: True if the tie existed.
+        """
+        code = EDGE_CODES[edge_type]
+        if self.adjacency.get(npc_id, {}).pop((other_id, code), None) is None:
+            return False
+        self._discard(other_id, npc_id, REVERSE_TYPES.get(code, code))
+        self._drop_if_empty(npc_id)
+        self.fading.pop(self._fading_key(npc_id, other_id, code), None)
+        self.edge_count -= 1
+        return True
+
+    def remove_npc(self, npc_id):
+        """Remove every tie of an NPC.
+
+        Args:
+            npc_id: The ID of the NPC.
+        """
+        edges = self.adjacency.pop(npc_id, {})
+        for other_id, code in edges:
+            self._discard(other_id, npc_id, REVERSE_TYPES.get(code, code))
+            self.fading.pop(self._fading_key(npc_id, other_id, code), None)
+        self.edge_count -= len(edges)
+
+    def get_weight(self, npc_id, other_id, edge_type):
+        """Get the weight of a tie.
+
+        Args:
+            npc_id: The ID of one NPC.
+            other_id: The ID of the other NPC.
+            edge_type: The type of tie, seen from npc_id.
+
+        Returns:
+            The tie's weight, or None if there is no such tie.
+        """
+        code = EDGE_CODES[edge_type]
+        weight = self.adjacency.get(npc_id, {}).get((other_id, code))
+        if weight is None:
+            return None
+        return self._current_weight(npc_id, other_id, code, weight)
+
+    def degree(self, npc_id):
+        """Count the ties of an NPC."""
+        return len(self.adjacency.get(npc_id, ()))
+
+    def neighbors(self, npc_id, edge_type=None, min_weight=None):
+        """Get the ties of an NPC.
+
+        Args:
+            npc_id: The ID of the NPC.
+            edge_type: Only return ties of this type (optional).
+            min_weight: Only return ties at least this strong (optional).
+
+        Returns:
+            A list of (neighbour ID, edge type, weight) tuples, strongest first.
+        """
+        code = EDGE_CODES[edge_type] if edge_type is not None else None
+        ties = []
+        for (other_id, edge_code), weight in self.adjacency.get(npc_id, {}).items():
+            if code is not None and edge_code != code:
+                continue
+            weight = self._current_weight(npc_id, other_id, edge_code, weight)
+            if min_weight is None or weight >= min_weight:
+                ties.append((other_id, EDGE_TYPES[edge_code], weight))
+        ties.sort(key=lambda tie: (-tie[2], tie[0], tie[1]))
+        return ties
+
+    def neighbor_ids(self, npc_ids, edge_types=None):
+        """Get the IDs of every NPC tied to any of several NPCs.
+
+        Args:
+            npc_ids: The IDs of the NPCs whose neighbours are wanted.
+            edge_types: Only follow ties of these types (optional).
+
+        Returns:
+            A set of neighbour IDs, leaving out the given NPCs themselves.
+        """
+        codes = {EDGE_CODES[edge_type] for edge_type in edge_types} if edge_types else None
+        sources = set(npc_ids)
+        found = set()
+        for npc_id in sources:
+            for other_id, code in self.adjacency.get(npc_id, ()):
+                if codes is None or code in codes:
+                    found.add(other_id)
+        return found - sources
+
+    def decay(self, rates=None, min_weight=MIN_WEIGHT):
+        """Weaken the fading ties of every NPC by a year, dropping the weakest.
+
+        With the graph's own rates and minimum weight this only visits the
+        ties expiring this year. Other rates or a different minimum weight
+        apply one year of decay to every tie in one pass, as a one-off.
+
+        Args:
+            rates: A dictionary mapping edge types to the share of weight lost
+                (optional, defaults to the graph's decay rates).
+            min_weight: Ties left weaker than this are removed.
+
+        Returns:
+            The number of ties removed.
+        """
+        if rates is not None or min_weight != self.min_weight:
+            return self._decay_all(rates, min_weight)
+
+        self.year += 1
+        removed = 0
+        for key in self.expiries.pop(self.year, ()):
+            # Skip ties removed or renewed since this expiry was scheduled
+            scheduled = self.fading.get(key)
+            if scheduled is None or scheduled[1] != self.year:
+                continue
+            npc_id, other_id, code = key
+            self.remove_edge(npc_id, other_id, EDGE_TYPES[code])
+            removed += 1
+        return removed
+
+    def _decay_all(self, rates, min_weight):
+        """Apply one year of decay at other rates to every tie, dropping the weakest.
+
+        Each tie's weight is set to its decayed weight now, so the graph's
+        own decay carries on from there.
+
+        Returns:
+            The number of ties removed.
+        """
+        if rates is None:
+            factors = self.decay_factors
+        else:
+            factors = {EDGE_CODES[edge_type]: 1.0 - rate for edge_type, rate in rates.items()}
+
+        # Visit each tie once, from the end its fading key names
+        ties = {self._fading_key(npc_id, other_id, code)
+                for npc_id, edges in self.adjacency.items() for other_id, code in edges}
+        removed = 0
+        for npc_id, other_id, code in ties:
+            factor = factors.get(code)
+            if factor is None:
+                factor = factors.get(REVERSE_TYPES.get(code, code))
+            if factor is None:
+                continue
+            weight = self.get_weight(npc_id, other_id, EDGE_TYPES[code]) * factor
+            if weight < min_weight:
+                self.remove_edge(npc_id, other_id, EDGE_TYPES[code])
+                removed += 1
+            else:
+                self.add_edge(npc_id, other_id, EDGE_TYPES[code], weight)
+        return removed
+
+    def _decay_factor(self, code):
+        """Get the share of weight a tie of this type keeps each year, or None if it does not fade."""
+        factor = self.decay_factors.get(code)
+        if factor is None:
+            factor = self.decay_factors.get(REVERSE_TYPES.get(code, code))
+        return factor
+
+    def _expiry_year(self, weight, factor):
+        """Get the year a tie set to this weight now drops below the minimum weight.
+
+        Returns:
+            The year, or None if the tie never expires.
+        """
+        if weight < self.min_weight or factor <= 0:
+            return self.year + 1
+        if factor >= 1.0:
+            return None
+
+        # The first whole number of years after which the weight is too low
+        years = max(1, math.ceil(math.log(self.min_weight / weight) / math.log(factor)))
+        while weight * factor ** years >= self.min_weight:
+            years += 1
+        while years > 1 and weight * factor ** (years - 1) < self.min_weight:
+            years -= 1
+        return self.year + years
+
+    def _current_weight(self, npc_id, other_id, code, weight):
+        """Apply the decay since a tie's weight was set."""
+        factor = self._decay_factor(code)
+        if factor is None:
+            return weight
+        set_year, _ = self.fading[self._fading_key(npc_id, other_id, code)]
+        return weight * factor ** (self.year - set_year)
+
+    def _fading_key(self, npc_id, other_id, code):
+        """Get the key of a fading tie, the same from either end."""
+        if npc_id < other_id:
+            return (npc_id, other_id, code)
+        return (other_id, npc_id, REVERSE_TYPES.get(code, code))
+
+    def _discard(self, npc_id, other_id, code):
+        """Remove one end of a tie."""
+        edges = self.adjacency.get(npc_id)
+        if edges is not None:
+            edges.pop((other_id, code), None)
+            self._drop_if_empty(npc_id)
+
+    def _drop_if_empty(self, npc_id):
+        """Forget an NPC with no ties left."""
+        if not self.adjacency.get(npc_id, True):
+            del self.adjacency[npc_id]
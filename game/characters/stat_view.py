@@ -0,0 +1,125 @@
+"""
+Stat View - Dictionary views of fixed sets of stats kept in compact arrays
+"""
+from collections.abc import MutableMapping
+
+class StatLayout:
+    """A fixed, ordered set of stat names and their indexes, shared by every character."""
+
+    __slots__ = ("names", "indexes")
+
+    def __init__(self, names):
+        """Initialize the layout.
+
+        Args:
+            names: The stat names, in display order.
+        """
+        self.names = tuple(names)
+        self.indexes = {name: index for index, name in enumerate(self.names)}
+
+    def __len__(self):
+        return len(self.names)
+
+class StatView(MutableMapping):
+    """A dictionary view of stats stored at fixed indexes of an array or list.
+
+    Reads and writes go straight to the underlying storage, so a view is
+    cheap to make and several views can share one array. An owner object is
+    told of every write through its stats_changed method. Stats outside the
+    layout, such as skills learned on rising in society, are kept in a
+    dictionary on the owner, created when the first one is set; without
+    that dictionary's name they raise KeyError. Stats in the layout cannot
+    be deleted.
+    """
+
+    __slots__ = ("values", "layout", "offset", "owner", "extras_name")
+
+    def __init__(self, values, layout, offset=0, owner=None, extras_name=None):
+        """Initialize the view.
+
+        Args:
+            values: The array or list holding the stats.
+            layout: The StatLayout naming the stats.
+            offset: The index of the first stat in values.
+            owner: The object to notify of writes, which also holds the
+                dictionary of extra stats (optional).
+            extras_name: The name of the owner's attribute holding that
+                dictionary, which is None while there are no extra stats
+                (optional, extra stats are refused if not given).
+        """
+        self.values = values
+        self.layout = layout
+        self.offset = offset
+        self.owner = owner
+        self.extras_name = extras_name
+
+    def _extras(self):
+        """Get the dictionary of extra stats, or None if there is none."""
+        if self.extras_name is None:
+            return None
+        return getattr(self.owner, self.extras_name)
+
+    def __getitem__(self, name):
+        index = self.layout.indexes.get(name)
+        if index is not None:
+            return self.values[self.offset + index]
+        extras = self._extras()
+        if extras is None:
+            raise KeyError(name)
+        return extras[name]
+
+    def __setitem__(self, name, value):
+        index = self.layout.indexes.get(name)
+        if index is not None:
+            self.values[self.offset + index] = value
+        elif self.extras_name is None:
+            raise KeyError(name)
+        else:
+            extras = self._extras()
+            if extras is None:
+                extras = {}
+                setattr(self.owner, self.extras_name, extras)
+            extras[name] = value
+        if self.owner is not None:
+            self.owner.stats_changed()
+
+    def __delitem__(self, name):
+        if name in self.layout.indexes:
+            raise TypeError(f"Cannot remove the stat {name!r}")
+        extras = self._extras()
+        if extras is None:
+            raise KeyError(name)
+        del extras[name]
+        self.owner.stats_changed()
+
+    def __contains__(self, name):
+        if name in self.layout.indexes:
+            return True
+        extras = self._extras()
+        return extras is not None and name in extras
+
+    def __iter__(self):
+        yield from self.layout.names
+        extras = self._extras()
+        if extras:
+            yield from list(extras)
+
+    def __len__(self):
+        extras = self._extras()
+        return len(self.layout.names) + (len(extras) if extras else 0)
+
+    def __repr__(self):
+        return repr(dict(self))
+
+    def get(self, name, default=None):
+        index = self.layout.indexes.get(name)
+        if index is not None:
+            return self.values[self.offset + index]
+        extras = self._extras()
+        if extras is None:
+            return default
+        return extras.get(name, default)
+
+    def copy(self):
+        """Get the stats as a plain dictionary."""
+        return dict(self)
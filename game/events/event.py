@@ -6,7 +6,7 @@ import random
 class Event:
     """Represents a game event."""
     
-    def __init__(self, title, description, effects, choices=None):
+    def __init__(self, title, description, effects, choices=None, rng=None):
         """Initialize a new event.
         
         Args:
@@ -14,11 +14,13 @@ class Event:
             description: The event description.
             effects: A dictionary of effects (e.g., {'health': -10}).
             choices: A list of choices for the player, each with its own effects.
+            rng: The random generator for random effects (optional).
         """
         self.title = title
         self.description = description
         self.effects = effects
         self.choices = choices or []
+        self.rng = rng or random
     
     def execute(self, player, interface):
         """Execute the event.
@@ -70,9 +72,9 @@ class Event:
                     player.attributes[attr_name] = max(0, min(100, player.attributes[attr_name] + value))
             elif stat == "random_skill":
                 # Improve a random skill
-                skill_name = random.choice(list(player.skills.keys()))
+                skill_name = self.rng.choice(list(player.skills.keys()))
                 player.skills[skill_name] = max(0, min(100, player.skills[skill_name] + value))
             elif stat == "random_attribute":
                 # Improve a random attribute
-                attr_name = random.choice(list(player.attributes.keys()))
+                attr_name = self.rng.choice(list(player.attributes.keys()))
                 player.attributes[attr_name] = max(0, min(100, player.attributes[attr_name] + value)) 
\ No newline at end of file
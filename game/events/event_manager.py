@@ -1,7 +1,6 @@
 """
 Event Manager - Manages random events in the game
 """
-import random
 from game.events.event import Event
 from game.events.seasonal_events import get_seasonal_events, get_season
 
@@ -15,6 +14,7 @@ class EventManager:
             game_manager: The game manager.
         """
         self.game_manager = game_manager
+        self.rng = game_manager.random_streams.get("events")
         self.event_types = self._initialize_event_types()
         self.seasonal_events = get_seasonal_events()
         self.current_month = 1  # Start in January
@@ -188,12 +188,13 @@ class EventManager:
                 continue
             
             # Check if the event occurs
-            if random.random() < event_data["probability"]:
+            if self.rng.random() < event_data["probability"]:
                 # Create the event
                 event = Event(
                     event_data["title"],
                     event_data["description"],
-                    event_data["effects"]
+                    event_data["effects"],
+                    rng=self.rng
                 )
                 events.append(event)
         
@@ -215,18 +216,19 @@ class EventManager:
                 continue
             
             # Check if the event occurs
-            if random.random() < event_data["probability"]:
+            if self.rng.random() < event_data["probability"]:
                 # Create the event
                 event = Event(
                     event_data["title"],
                     event_data["description"],
-                    event_data["effects"]
+                    event_data["effects"],
+                    rng=self.rng
                 )
                 events.append(event)
         
         # Limit to a reasonable number of events per year
         if len(events) > 3:
-            events = random.sample(events, 3)
+            events = self.rng.sample(events, 3)
         
         # Advance to the next month (for the next call)
         self.current_month = (self.current_month % 12) + 1
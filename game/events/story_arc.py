@@ -1,11 +1,8 @@
 """
 Story Arc - Represents a multi-year story arc with cascading consequences
 """
-import random
 from game.events.event import Event
 from game.events.story_arc_base import StoryArc
-from game.events.illicit_arcs import get_illicit_arcs
-from game.events.criminal_arcs import get_criminal_arcs
 
 class StoryArcManager:
     """Manages story arcs in the game."""
@@ -17,7 +14,8 @@ class StoryArcManager:
             game_manager: The game manager.
         """
         self.game_manager = game_manager
-        self.story_arcs = self._initialize_story_arcs()
+        self.rng = game_manager.random_streams.get("story_arcs")
+        self._story_arcs = None  # Built on first use, see the story_arcs property
         self.active_arcs = []
         self.completed_arcs = []
         self.arc_cooldown = {}  # To prevent the same arc from triggering too frequently
@@ -32,7 +30,20 @@ class StoryArcManager:
         }
         
         # Track NPCs involved in story arcs
-        self.arc_npcs = {}  # Maps arc_id to list of NPCs
+        self.arc_npcs = {}  # Maps arc_id to list of NPC IDs
+    
+    @property
+    def story_arcs(self):
+        """The available story arcs, built the first time they are needed.
+        
+        Returns:
+            A dictionary of story arcs.
+        """
+        if self._story_arcs is None:
+            self._story_arcs = self._initialize_story_arcs()
+            for arc in self._story_arcs.values():
+                arc.rng = self.rng
+        return self._story_arcs
     
     def _initialize_story_arcs(self):
         """Initialize the available story arcs.
@@ -461,6 +472,10 @@ class StoryArcManager:
             )
         }
         
+        # The arc content modules are only imported once the arcs are needed
+        from game.events.illicit_arcs import get_illicit_arcs
+        from game.events.criminal_arcs import get_criminal_arcs
+        
         # Add illicit relationship arcs
         illicit_arcs = get_illicit_arcs()
         story_arcs.update(illicit_arcs)
@@ -528,10 +543,11 @@ class StoryArcManager:
                     eligible_arcs.append((arc_id, arc))
             
             # Randomly select one arc to start (if any are eligible)
-            if eligible_arcs and random.random() < 0.3:  # 30% chance per year to start a new arc
-                arc_id, arc = random.choice(eligible_arcs)
+            if eligible_arcs and self.rng.random() < 0.3:  # 30% chance per year to start a new arc
+                arc_id, arc = self.rng.choice(eligible_arcs)
                 arc.start()
                 self.active_arcs.append(arc)
+                self.game_manager.metrics.increment("story_arc_starts_total", arc=arc_id)
                 
                 # Add the first event from this arc
                 event = arc.get_current_event(player)
@@ -558,6 +574,7 @@ class StoryArcManager:
         if arc.completed:
             self.active_arcs.remove(arc)
             self.completed_arcs.append(arc)
+            self.game_manager.metrics.increment("story_arc_completions_total", arc=arc.arc_id)
             
             # Add to player's completed arcs
             if not hasattr(self.game_manager.player, "completed_arcs"):
@@ -577,13 +594,29 @@ class StoryArcManager:
         
         Args:
             arc_id: The ID of the story arc.
-            npc: The NPC to assign to the arc.
+            npc: The ID of the NPC to assign to the arc.
         """
+        # NPCs cast in an arc are promoted to full characters
+        if self.game_manager.npc_manager:
+            self.game_manager.npc_manager.promote_npc(npc)
+        
         if arc_id not in self.arc_npcs:
             self.arc_npcs[arc_id] = []
         
         self.arc_npcs[arc_id].append(npc)
     
+    def remove_npcs(self, npc_ids):
+        """Remove NPCs from every story arc, e.g. after they die.
+        
+        Args:
+            npc_ids: The IDs of the NPCs to remove.
+        """
+        removed = set(npc_ids)
+        for arc_id, arc_npc_ids in list(self.arc_npcs.items()):
+            kept = [npc_id for npc_id in arc_npc_ids if npc_id not in removed]
+            if len(kept) != len(arc_npc_ids):
+                self.arc_npcs[arc_id] = kept
+    
     def get_arc_npcs(self, arc_id):
         """Get the NPCs assigned to a story arc.
         
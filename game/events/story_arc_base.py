@@ -32,6 +32,7 @@ class StoryArc:
         self.player_choices = []
         self.years_since_last_stage = 0
         self.state = {}  # For tracking arc-specific state
+        self.rng = random  # Replaced by the StoryArcManager's stream
     
     def start(self):
         """Start the story arc."""
@@ -97,7 +98,8 @@ class StoryArc:
                         f"{self.title}: {stage['title']}",
                         condition["description"],
                         condition["effects"],
-                        condition.get("choices", [])
+                        condition.get("choices", []),
+                        rng=self.rng
                     )
         
         # Create an event based on the current stage
@@ -105,7 +107,8 @@ class StoryArc:
             f"{self.title}: {stage['title']}",
             stage["description"],
             stage["effects"],
-            stage.get("choices", [])
+            stage.get("choices", []),
+            rng=self.rng
         )
     
     def advance_stage(self, choice_idx=None):
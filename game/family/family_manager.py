@@ -1,8 +1,7 @@
 """
 Family Manager - Handles family relationships and dynamics
 """
-import random
-from game.characters.character import Character, Relationship
+from game.characters.character import Character
 
 class FamilyManager:
     """Manages family relationships and dynamics."""
@@ -14,6 +13,7 @@ class FamilyManager:
             game_manager: The game manager.
         """
         self.game_manager = game_manager
+        self.rng = game_manager.random_streams.get("family")
         self.family_events = self._initialize_family_events()
         self.family_traits = self._initialize_family_traits()
         
@@ -96,7 +96,7 @@ class FamilyManager:
         
         for event_id, event_data in self.family_events.items():
             if self._meets_requirements(player, event_data["requirements"]):
-                if random.random() < event_data["probability"]:
+                if self.rng.random() < event_data["probability"]:
                     events.append(self._process_family_event(event_id, event_data))
         
         return events
@@ -152,12 +152,12 @@ class FamilyManager:
         
         if event_id == "child_birth":
             # Create a new child
-            child_gender = random.choice(["male", "female"])
+            child_gender = self.rng.choice(["male", "female"])
             child = self._create_child(player, child_gender)
             player.children.append(child)
             
             # Update achievements
-            if not self.game_manager.achievements["first_child"]:
+            if not self.game_manager.achievements.get("first_child"):
                 self.game_manager.achievements["first_child"] = True
             
             return {
@@ -167,7 +167,7 @@ class FamilyManager:
             }
             
         elif event_id == "child_milestone":
-            child = random.choice(player.children)
+            child = self.rng.choice(player.children)
             milestone = self._generate_child_milestone(child)
             return {
                 "title": event_data["title"],
@@ -211,13 +211,14 @@ class FamilyManager:
         """
         # Generate name based on gender and medieval setting
         if gender == "male":
-            name = random.choice(["John", "William", "Robert", "Richard", "Henry", "Thomas"])
+            name = self.rng.choice(["John", "William", "Robert", "Richard", "Henry", "Thomas"])
         else:
-            name = random.choice(["Mary", "Elizabeth", "Margaret", "Alice", "Joan", "Catherine"])
+            name = self.rng.choice(["Mary", "Elizabeth", "Margaret", "Alice", "Joan", "Catherine"])
         
         # Create child with current year as birth year
-        child = Character(name, gender, "child", self.game_manager.game_year)
+        child = Character(name, gender, "child", self.game_manager.game_year, self.rng)
         child.age = 0
+        child.location = player.location
         
         # Inherit traits
         self._inherit_traits(child, player)
@@ -239,14 +240,14 @@ class FamilyManager:
             for trait in parent.traits:
                 if trait in self.family_traits:
                     # Check if trait is inherited
-                    if random.random() < self.family_traits[trait]["hereditary_chance"]:
+                    if self.rng.random() < self.family_traits[trait]["hereditary_chance"]:
                         child.traits.append(trait)
         
         # Small chance for new traits
-        if random.random() < 0.1:  # 10% chance
+        if self.rng.random() < 0.1:  # 10% chance
             possible_new_traits = [t for t in self.family_traits if t not in child.traits]
             if possible_new_traits:
-                child.traits.append(random.choice(possible_new_traits))
+                child.traits.append(self.rng.choice(possible_new_traits))
     
     def _generate_child_milestone(self, child):
         """Generate a milestone event for a child.
@@ -306,7 +307,7 @@ class FamilyManager:
             }
         ]
         
-        return random.choice(gatherings)
+        return self.rng.choice(gatherings)
     
     def _generate_spouse_career_event(self):
         """Generate a career event for the spouse.
@@ -329,7 +330,7 @@ class FamilyManager:
             }
         ]
         
-        return random.choice(events)
+        return self.rng.choice(events)
     
     def _generate_inheritance_event(self):
         """Generate an inheritance event.
@@ -352,7 +353,7 @@ class FamilyManager:
             }
         ]
         
-        return random.choice(events)
+        return self.rng.choice(events)
     
     def update_family_for_new_year(self):
         """Update family members for the new year.
@@ -370,6 +371,7 @@ class FamilyManager:
             # Check for milestones
             if child.age in [5, 12, 16]:
                 milestone = self._generate_child_milestone(child)
+                milestone["title"] = self.family_events["child_milestone"]["title"]
                 events.append(milestone)
         
         # Check for new family events
@@ -1,28 +1,43 @@
 """
 Game Manager - Handles the core game logic and state
 """
-import random
 import time
 from game.characters.character_factory import CharacterFactory
 from game.world.world import World
 from game.events.event_manager import EventManager
 from game.events.story_arc import StoryArcManager
 from game.characters.npc_manager import NPCManager
+from game.characters.relationship_store import YEARLY_DRIFT
 from game.events.seasonal_events import get_season
 from game.save_system import SaveSystem
 from game.family.family_manager import FamilyManager
-from game.mechanics.historical_constraints import HistoricalConstraints
+from game.mechanics.historical_constraints import HISTORICAL_CONSTRAINTS
+from game.mechanics.year_tick import YearTickPipeline
+from game.ui.fast_forward import FastForwardInterface, summarize_fast_forward
+from game.utils.metrics import NULL_METRICS
+from game.utils.random_streams import RandomStreams
 
 class GameManager:
     """Manages the game state and core game loop."""
     
-    def __init__(self, interface):
+    def __init__(self, interface, seed=None, metrics=None, population_config=None):
         """Initialize the game manager.
         
         Args:
             interface: The user interface to use for the game.
+            seed: The root seed for all random streams (optional). Runs with the
+                same seed and the same player choices replay identically.
+            metrics: The Metrics to record counters and phase timings in
+                (optional, nothing is recorded if None).
+            population_config: The PopulationConfig deciding how many NPCs the
+                world keeps (optional).
         """
         self.interface = interface
+        self.metrics = metrics or NULL_METRICS
+        self.population_config = population_config
+        self.random_streams = RandomStreams(seed)
+        self.seed = self.random_streams.seed
+        self.rng = self.random_streams.get("game")
         self.character_factory = CharacterFactory()
         self.world = None
         self.player = None
@@ -33,12 +48,38 @@ class GameManager:
         self.game_year = 1200
         self.game_running = True
         self.tutorial_shown = False
-        self.achievements = []
+        self.achievements = {}
         self.save_system = SaveSystem()
-        self.historical_constraints = HistoricalConstraints()
+        self.historical_constraints = HISTORICAL_CONSTRAINTS
+        self.year_pipeline = self._build_year_pipeline()
+        self.fast_forward_policy = None  # Answers choice events while fast forwarding
         
     def start_new_game(self, player_name, gender, role, birth_year=None):
         """Start a new game with the given player details."""
+        if not self.setup_new_game(player_name, gender, role, birth_year):
+            return False
+        
+        # Show tutorial for new players
+        if not self.tutorial_shown:
+            self._show_tutorial()
+            self.tutorial_shown = True
+        
+        # Start the game loop
+        self.game_running = True
+        self.game_loop()
+    
+    def setup_new_game(self, player_name, gender, role, birth_year=None):
+        """Create the world, managers and player without entering the game loop.
+        
+        Args:
+            player_name: The player character's name.
+            gender: The player character's gender.
+            role: The player character's role.
+            birth_year: The player character's birth year (optional).
+            
+        Returns:
+            bool: True if the game was set up, False if the role was not allowed.
+        """
         # Validate role based on gender before creating character
         allowed_roles = self.historical_constraints.get_allowed_roles(gender)
         if role.lower() not in allowed_roles:
@@ -48,26 +89,20 @@ class GameManager:
         self.interface.display_message("Starting new game...")
         
         # Create the world
-        self.world = World()
+        self.world = World(self.random_streams.get("world"))
         self.interface.display_message("World created.")
         
         # Create managers
         self.event_manager = EventManager(self)
         self.story_arc_manager = StoryArcManager(self)
-        self.npc_manager = NPCManager(self)
+        self.npc_manager = NPCManager(self, self.population_config)
         self.family_manager = FamilyManager(self)
         
         # Create player character
         self._create_player(player_name, gender, role, birth_year)
         
-        # Show tutorial for new players
-        if not self.tutorial_shown:
-            self._show_tutorial()
-            self.tutorial_shown = True
-        
-        # Start the game loop
         self.game_running = True
-        self.game_loop()
+        return True
     
     def _create_player(self, player_name, gender, role, birth_year=None):
         """Create a new character based on player choices."""
@@ -79,7 +114,8 @@ class GameManager:
             birth_year = self.game_year - starting_age
         
         # Create the character
-        character = self.character_factory.create_character(role.lower(), player_name, gender, birth_year)
+        character = self.character_factory.create_character(role.lower(), player_name, gender, birth_year,
+                                                            self.random_streams.get("player"))
         character.age = starting_age
         
         # Initialize basic attributes
@@ -88,15 +124,15 @@ class GameManager:
         
         # Initialize starting wealth based on role
         if role == "noble":
-            character.wealth = random.randint(500, 1000)
+            character.wealth = self.rng.randint(500, 1000)
         elif role == "knight":
-            character.wealth = random.randint(200, 400)
+            character.wealth = self.rng.randint(200, 400)
         elif role == "merchant":
-            character.wealth = random.randint(300, 600)
+            character.wealth = self.rng.randint(300, 600)
         elif role == "priest":
-            character.wealth = random.randint(100, 200)
+            character.wealth = self.rng.randint(100, 200)
         else:  # farmer or craftsman
-            character.wealth = random.randint(50, 150)
+            character.wealth = self.rng.randint(50, 150)
         
         # Initialize skills based on role
         character._adjust_skills_for_role()
@@ -107,6 +143,9 @@ class GameManager:
         # Initialize random traits
         character._initialize_traits()
         
+        # Settle in a settlement drawn like an NPC's home
+        character.location = self.npc_manager.choose_settlements(1)[0]
+        
         self.interface.display_message(f"\nWelcome, {player_name} the {role.capitalize()}!")
         self.interface.display_message(f"You were born in the year {birth_year}.")
         
@@ -126,7 +165,16 @@ class GameManager:
         
         self.interface.get_input("\nPress Enter to continue...")
         
+        self._set_player(character)
+    
+    def _set_player(self, character):
+        """Make a character the player character.
+        
+        Args:
+            character: The new player character.
+        """
         self.player = character
+        character.outcome_manager.metrics = self.metrics
     
     def game_loop(self):
         """Main game loop."""
@@ -136,15 +184,18 @@ class GameManager:
             
             # If the player chose to advance the year
             if action == "Advance Year":
-                # Process events
-                self._process_events()
-                
-                # Advance time
-                self._advance_time()
+                # Run the year pipeline
+                self._advance_year()
                 
                 # Display notification about the new year
                 self.interface.display_notification(f"The year is now {self.game_year}")
             
+            # If the player chose to skip several years
+            elif action == "Fast Forward":
+                years = self._choose_fast_forward_years()
+                if years:
+                    self.fast_forward(years)
+            
             # Check if the interface is still running (user might have closed the window)
             if not self.interface.running:
                 break
@@ -198,7 +249,7 @@ class GameManager:
         actions.extend(role_actions)
         
         # Add general actions
-        actions.extend(["Advance Year", "Save Game", "Quit"])
+        actions.extend(["Advance Year", "Fast Forward", "Save Game", "Quit"])
         
         return actions
     
@@ -214,7 +265,7 @@ class GameManager:
             self._view_family()
         elif action == "View Relationships":
             self._view_relationships()
-        elif action == "Advance Year":
+        elif action in ["Advance Year", "Fast Forward"]:
             # This is now handled in the game loop
             pass
         elif action == "Save Game":
@@ -284,9 +335,14 @@ class GameManager:
         """Display relationship information."""
         relationship_info = []
         
-        if self.player.relationships:
-            for person, relation in self.player.relationships.items():
-                relationship_info.append(f"{person.name}: {relation.level}/100 ({relation.status})")
+        relationships = self.npc_manager.get_relationships(self.player.relationships) if self.npc_manager else []
+        # People known from another world, e.g. before loading a save
+        unknown = list(self.player.relationships.unknown())
+        if relationships or unknown:
+            for _, person, level, status in relationships:
+                relationship_info.append(f"{person.name}: {level}/100 ({status})")
+            for name, role, level, status in unknown:
+                relationship_info.append(f"{name}: {level}/100 ({status}, whereabouts unknown)")
         else:
             relationship_info.append("You have no significant relationships.")
         
@@ -325,8 +381,102 @@ class GameManager:
         ]
         return month_names[month - 1]
     
-    def _process_events(self):
-        """Process random events for the current year."""
+    def _build_year_pipeline(self):
+        """Register the phases of a simulated year in their default order.
+        
+        Returns:
+            A YearTickPipeline for this game.
+        """
+        observer = self._observe_phase if self.metrics.enabled else None
+        pipeline = YearTickPipeline(observer=observer)
+        pipeline.add_phase("events", self._tick_events)
+        pipeline.add_phase("story_arcs", self._tick_story_arcs)
+        pipeline.add_phase("family", self._tick_family)
+        pipeline.add_phase("npcs", self._tick_npcs)
+        pipeline.add_phase("world", self._tick_world)
+        pipeline.add_phase("ageing", self._tick_ageing)
+        return pipeline
+    
+    def _advance_year(self):
+        """Advance the game by one year by running every phase of the year pipeline.
+        
+        The remaining phases are skipped as soon as the player dies, so the
+        death happens in the current year and the heir picks up from there.
+        """
+        self.year_pipeline.run(should_stop=self._check_death)
+        self.metrics.increment("years_total")
+        
+        # Check for death
+        if self._check_death():
+            self.game_running = False
+            return
+        
+        # Update achievements
+        self._update_achievements()
+    
+    def fast_forward(self, years, choice_policy=None):
+        """Advance several years in a row without stopping for the player.
+        
+        Choice events are answered by the choice policy and everything that
+        happens is collapsed into a single summary shown at the end. The fast
+        forward stops early if the player dies.
+        
+        Args:
+            years: The number of years to advance.
+            choice_policy: A callable taking a menu title and options and returning
+                the chosen index (optional, defaults to fast_forward_policy, then
+                to the first option).
+            
+        Returns:
+            The number of years actually advanced.
+        """
+        start_year = self.game_year
+        start_stats = {
+            "health": self.player.health,
+            "wealth": self.player.wealth,
+            "children": len(self.player.children)
+        }
+        
+        interface = self.interface
+        batch = FastForwardInterface(interface, choice_policy or self.fast_forward_policy)
+        self.interface = batch
+        advanced = 0
+        try:
+            while advanced < years and self.game_running and self.player.is_alive():
+                self._advance_year()
+                advanced += 1
+        finally:
+            self.interface = interface
+        
+        summary = summarize_fast_forward(start_year, self.game_year, start_stats, self.player,
+                                         batch.events, batch.decisions)
+        self.interface.display_event("Fast Forward", summary)
+        return advanced
+    
+    def _choose_fast_forward_years(self):
+        """Ask the player how many years to skip.
+        
+        Returns:
+            The number of years, or 0 if the player cancelled.
+        """
+        options = [5, 10, 20]
+        choice = self.interface.display_menu("Fast forward how many years?",
+                                             [f"{years} years" for years in options] + ["Cancel"])
+        if choice is None or choice >= len(options):
+            return 0
+        return options[choice]
+    
+    def _observe_phase(self, name, seconds):
+        """Record the wall time of a year phase in the metrics.
+        
+        Args:
+            name: The name of the phase.
+            seconds: The time the phase took.
+        """
+        self.metrics.observe_time("year_phase_seconds", seconds, phase=name)
+    
+    def _tick_events(self):
+        """Year phase: process random events for the current year."""
         # Get the current month and season
         current_month = self.event_manager.current_month
         month_name = self._get_month_name(current_month)
@@ -338,11 +488,15 @@ class GameManager:
         # Process regular random events
         events = self.event_manager.get_events_for_year()
         for event in events:
+            self.metrics.increment("events_total", category="random", event=event.title)
             event.execute(self.player, self.interface)
-        
-        # Process story arc events
+    
+    def _tick_story_arcs(self):
+        """Year phase: advance the active story arcs and handle their events."""
         story_events = self.story_arc_manager.update_for_new_year()
         for arc, event in story_events:
+            self.metrics.increment("events_total", category="story_arc", event=event.title)
+            
             # Display the event
             event.execute(self.player, self.interface)
             
@@ -351,10 +505,12 @@ class GameManager:
                 # The choice_idx is set by the event's execute method
                 choice_idx = self.interface.menu_result
                 self.story_arc_manager.handle_event_outcome(arc, choice_idx)
-        
-        # Process family events
+    
+    def _tick_family(self):
+        """Year phase: process family events."""
         family_events = self.family_manager.update_family_for_new_year()
         for event in family_events:
+            self.metrics.increment("events_total", category="family", event=event["title"])
             self.interface.display_event(event["title"], event["description"])
             
             # Apply effects
@@ -366,44 +522,34 @@ class GameManager:
                         # Happiness affects health
                         health_change = value // 2
                         self.player.health = max(1, min(100, self.player.health + health_change))
-        
-        # Update NPCs
-        self.npc_manager.update_for_new_year()
-        
-        # Age the player
-        self.player.age += 1
-        
-        # Check for death
-        if self._check_death():
-            self.game_running = False
-            return
-        
-        # Update achievements
-        self._update_achievements()
-        
-        # Advance year
-        self.game_year += 1
     
-    def _advance_time(self):
-        """Advance the game time by one year."""
+    def _tick_npcs(self):
+        """Year phase: age, marry and retire NPCs."""
+        if self.npc_manager:
+            self.npc_manager.update_for_new_year()
+            
+            # The player's relationships fade unless renewed, and end when the NPC dies
+            self.player.relationships.drift(YEARLY_DRIFT)
+            self.npc_manager.prune_relationships(self.player.relationships)
+    
+    def _tick_world(self):
+        """Year phase: update kingdoms and settlements."""
+        if self.world:
+            npc_counts = self.npc_manager.get_settlement_npc_counts() if self.npc_manager else None
+            self.world.update_for_new_year(npc_counts)
+    
+    def _tick_ageing(self):
+        """Year phase: advance the calendar and age the player."""
         self.game_year += 1
         self.player.age += 1
         
         # Update character stats based on age
         self.player.update_for_new_year()
         
-        # Update NPCs
-        if self.npc_manager:
-            self.npc_manager.update_for_new_year()
-        
-        # Update the world
-        if self.world:
-            self.world.update_for_new_year()
-        
         # Check for natural death due to old age
         if self.player.age > 60:
             death_chance = (self.player.age - 60) * 5  # 5% per year after 60
-            if random.randint(1, 100) <= death_chance:
+            if self.rng.randint(1, 100) <= death_chance:
                 self.player.health = 0
     
     def _handle_death(self):
@@ -412,20 +558,36 @@ class GameManager:
         self.interface.display_event("You Have Died", death_message)
         
         # Check for heirs
-        heirs = [child for child in self.player.children if child.age >= 16]
+        heirs = self._get_heirs()
         
         if heirs:
             heir_names = [f"{heir.name}, {heir.age} years old, {heir.role.capitalize()}" for heir in heirs]
             heir_idx = self.interface.display_menu("Choose your heir:", heir_names)
             
             # Continue as heir
-            self.player = heirs[heir_idx]
-            self.interface.display_event("New Heir", f"You now continue as {self.player.name} the {self.player.role.capitalize()}.")
-            self.game_running = True
+            self._continue_as_heir(heirs[heir_idx])
         else:
             self.interface.display_event("Game Over", "You have no eligible heirs. Your legacy ends here.")
             self.game_running = False
     
+    def _get_heirs(self):
+        """Get the player's children who are old enough to inherit.
+        
+        Returns:
+            A list of eligible heir characters.
+        """
+        return [child for child in self.player.children if child.age >= 16]
+    
+    def _continue_as_heir(self, heir):
+        """Make an heir the new player character.
+        
+        Args:
+            heir: The heir to continue playing as.
+        """
+        self._set_player(heir)
+        self.interface.display_event("New Heir", f"You now continue as {self.player.name} the {self.player.role.capitalize()}.")
+        self.game_running = True
+    
     def _show_tutorial(self):
         """Show the tutorial for new players."""
         tutorial_pages = [
@@ -498,7 +660,7 @@ class GameManager:
         Returns:
             bool: True if load was successful, False otherwise.
         """
-        if self.save_system.load_game(save_file, self):
+        if self.save_system.load_game(self, save_file):
             self.interface.display_event("Load Game", "Game loaded successfully!")
             return True
         else:
@@ -514,47 +676,6 @@ class GameManager:
         # Implementation of updating achievements based on the game state
         pass
 
-    def _advance_year(self):
-        """Advance the game by one year."""
-        self.game_year += 1
-        self.player.age += 1
-        
-        # Process random events
-        self._process_events()
-        
-        # Update character status
-        self._update_character_status()
-        
-        # Check for game over conditions
-        if not self._check_game_over():
-            self.interface.display_message(f"\nYear {self.game_year} begins...")
-            self.interface.get_input("Press Enter to continue...")
-    
-    def _update_character_status(self):
-        """Update the character's status for the new year."""
-        # Natural health recovery
-        if self.player.health < 100:
-            self.player.health = min(100, self.player.health + 10)
-        
-        # Apply age effects
-        if self.player.age > 50:
-            health_loss = (self.player.age - 50) // 10
-            self.player.health = max(1, self.player.health - health_loss)
-    
-    def _check_game_over(self):
-        """Check if the game should end.
-        
-        Returns:
-            bool: True if the game should end, False otherwise.
-        """
-        if self.player.health <= 0:
-            self.interface.display_message("\nYou have died!")
-            return True
-        elif self.player.age >= 80:
-            self.interface.display_message("\nYou have reached old age and retire from active life.")
-            return True
-        return False
-
     def handle_action(self, action):
         """Handle a player action."""
         if not self.player:
@@ -630,9 +751,9 @@ class GameManager:
         skill_index = int(choice) - 1
         if 0 <= skill_index < len(skills):
             skill = skills[skill_index]
-            message, rewards = self.player.perform_action("study", difficulty_modifier=0)
+            message, rewards = self.player.resolve_action("study", difficulty_modifier=0)
             self.interface.display_message(f"\n{message}")
-            if "gold" in rewards:
+            if rewards and "gold" in rewards:
                 self.interface.display_message(f"Cost: {rewards['gold']} gold")
             self.interface.get_input("\nPress Enter to continue...")
         else:
@@ -644,7 +765,7 @@ class GameManager:
         potential_class, chance = self.historical_constraints.calculate_social_mobility(self.player)
         current_class = self.historical_constraints._determine_social_class(self.player)
         
-        if potential_class != current_class and random.randint(1, 100) <= chance:
+        if potential_class != current_class and self.rng.randint(1, 100) <= chance:
             # Character has opportunity to move up in society
             message = f"Your actions and success have drawn attention. "
             
@@ -15,6 +15,16 @@ class SocialClass:
     wealth_range: tuple  # (min, max)
     mobility_chance: int  # 0-100, chance to move up in society per year
 
+# The social class of each role; craftsmen are merchants once wealthy enough
+ROLE_CLASSES = {
+    "king": "nobility",
+    "noble": "nobility",
+    "priest": "clergy",
+    "monk": "clergy",
+    "merchant": "merchants",
+    "farmer": "peasants"
+}
+
 class HistoricalConstraints:
     """Manages historical accuracy and social barriers."""
     
@@ -195,20 +205,33 @@ class HistoricalConstraints:
         return current_class, 0  # No mobility for nobility or clergy
     
     def _determine_social_class(self, character) -> str:
-        """Determine a character's social class based on their role and wealth."""
-        role_to_class = {
-            "king": "nobility",
-            "noble": "nobility",
-            "priest": "clergy",
-            "monk": "clergy",
-            "merchant": "merchants",
-            "craftsman": "merchants" if character.wealth >= 500 else "peasants",
-            "farmer": "peasants"
-        }
-        return role_to_class.get(character.role, "peasants")
+        """Determine a character's social class based on their role and wealth.
+        
+        Cached on characters until their role or wealth changes.
+        """
+        get_derived = getattr(character, "get_derived", None)
+        if get_derived is None:
+            return self._compute_social_class(character)
+        return get_derived("status", "social_class", lambda: self._compute_social_class(character))
+    
+    def _compute_social_class(self, character) -> str:
+        """Work out a character's social class from their role and wealth."""
+        if character.role == "craftsman":
+            return "merchants" if character.wealth >= 500 else "peasants"
+        return ROLE_CLASSES.get(character.role, "peasants")
     
     def _calculate_education_level(self, character) -> int:
-        """Calculate a character's effective education level."""
+        """Calculate a character's effective education level.
+        
+        Cached on characters until their attributes or skills change.
+        """
+        get_derived = getattr(character, "get_derived", None)
+        if get_derived is None:
+            return self._compute_education_level(character)
+        return get_derived("stats", "education_level", lambda: self._compute_education_level(character))
+    
+    def _compute_education_level(self, character) -> int:
+        """Work out a character's effective education level from their skills and attributes."""
         # Base education from skills
         base_education = (
             character.skills.get("diplomacy", 0) +
@@ -236,4 +259,7 @@ class HistoricalConstraints:
         Returns:
             A list of allowed role names
         """
-        return self.gender_restrictions[gender]["allowed_roles"] 
\ No newline at end of file
+        return self.gender_restrictions[gender]["allowed_roles"] 
+
+# Shared instance used by every character; the rule tables never change
+HISTORICAL_CONSTRAINTS = HistoricalConstraints()
@@ -2,8 +2,392 @@
 Outcome Manager - Handles variable outcomes and critical success/failure mechanics
 """
 import random
+from array import array
+from collections.abc import Iterable
 from dataclasses import dataclass
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, Sequence
+from game.utils.metrics import NULL_METRICS
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; batches are resolved in pure Python instead
+    np = None
+
+CRITICAL_THRESHOLD = 95  # Threshold for critical success/failure (95% or 5%)
+
+# Outcome codes of batch resolution: each is the index of its outcome type here
+OUTCOME_TYPES = ("critical_failure", "failure", "success", "critical_success")
+CRITICAL_FAILURE, FAILURE, SUCCESS, CRITICAL_SUCCESS = range(len(OUTCOME_TYPES))
+
+# Base success chances for different action types
+BASE_SUCCESS_RATES = {
+    "trade": 70,
+    "combat": 60,
+    "diplomacy": 65,
+    "craft": 75,
+    "study": 80,
+    "farm": 70,
+    "prayer": 90,
+    "social": 75
+}
+
+# Templates for the outcomes of each action type
+OUTCOME_TEMPLATES = {
+    "trade": {
+        "critical_success": {
+            "messages": [
+                "Your exceptional bargaining leads to an incredible deal!",
+                "You discover a rare and valuable item during the trade!",
+                "Your reputation as a shrewd trader spreads far and wide!"
+            ],
+            "reward_multiplier": 2.0,
+            "reputation_gain": {"merchants": 5, "nobility": 2}
+        },
+        "success": {
+            "messages": [
+                "The trade is completed successfully.",
+                "Both parties are satisfied with the deal.",
+                "You make a modest profit from the trade."
+            ],
+            "reward_multiplier": 1.0,
+            "reputation_gain": {"merchants": 1}
+        },
+        "failure": {
+            "messages": [
+                "The trade falls through.",
+                "You fail to reach an agreement.",
+                "The deal wasn't profitable enough."
+            ],
+            "reward_multiplier": 0.5,
+            "reputation_loss": {"merchants": -1}
+        },
+        "critical_failure": {
+            "messages": [
+                "Your goods are discovered to be defective!",
+                "You're accused of attempting to cheat in the trade!",
+                "You make a terrible miscalculation, resulting in significant losses!"
+            ],
+            "reward_multiplier": 0.0,
+            "reputation_loss": {"merchants": -5, "nobility": -2}
+        }
+    },
+    "combat": {
+        "critical_success": {
+            "messages": [
+                "Your exceptional combat prowess leads to a legendary victory!",
+                "Your perfect technique becomes the talk of the realm!",
+                "Songs will be sung of this glorious triumph!"
+            ],
+            "reward_multiplier": 2.0,
+            "reputation_gain": {"military": 5, "nobility": 3}
+        },
+        "success": {
+            "messages": [
+                "You emerge victorious from the battle.",
+                "Your combat training pays off.",
+                "You prove your worth in combat."
+            ],
+            "reward_multiplier": 1.0,
+            "reputation_gain": {"military": 1}
+        },
+        "failure": {
+            "messages": [
+                "You are defeated in combat.",
+                "Your opponent proves too skilled.",
+                "You fail to achieve victory."
+            ],
+            "reward_multiplier": 0.5,
+            "reputation_loss": {"military": -1}
+        },
+        "critical_failure": {
+            "messages": [
+                "You suffer a humiliating defeat!",
+                "Your poor performance becomes a cautionary tale!",
+                "Your reputation as a warrior takes a severe blow!"
+            ],
+            "reward_multiplier": 0.0,
+            "reputation_loss": {"military": -5, "nobility": -2}
+        }
+    },
+    "diplomacy": {
+        "critical_success": {
+            "messages": [
+                "Your masterful negotiation creates a lasting alliance!",
+                "Your diplomatic genius resolves a complex dispute!",
+                "Your words will be remembered as a triumph of diplomacy!"
+            ],
+            "reward_multiplier": 2.0,
+            "reputation_gain": {"nobility": 5, "clergy": 3}
+        },
+        "success": {
+            "messages": [
+                "Your diplomatic efforts bear fruit.",
+                "You successfully mediate the situation.",
+                "Your words help reach an agreement."
+            ],
+            "reward_multiplier": 1.0,
+            "reputation_gain": {"nobility": 2}
+        },
+        "failure": {
+            "messages": [
+                "Your diplomatic approach falls flat.",
+                "The negotiations break down.",
+                "You fail to reach an agreement."
+            ],
+            "reward_multiplier": 0.5,
+            "reputation_loss": {"nobility": -1}
+        },
+        "critical_failure": {
+            "messages": [
+                "Your diplomatic blunder causes an international incident!",
+                "Your words accidentally insult everyone involved!",
+                "Your failure at diplomacy will be remembered for years!"
+            ],
+            "reward_multiplier": 0.0,
+            "reputation_loss": {"nobility": -4, "clergy": -2}
+        }
+    },
+    "craft": {
+        "critical_success": {
+            "messages": [
+                "You create a masterpiece that will be admired for generations!",
+                "Your craftsmanship reaches new heights of excellence!",
+                "Your creation draws amazement from all who see it!"
+            ],
+            "reward_multiplier": 2.5,
+            "reputation_gain": {"merchants": 4, "peasants": 3}
+        },
+        "success": {
+            "messages": [
+                "Your crafting work is completed successfully.",
+                "The finished product meets expectations.",
+                "Your creation is well-made."
+            ],
+            "reward_multiplier": 1.0,
+            "reputation_gain": {"merchants": 1}
+        },
+        "failure": {
+            "messages": [
+                "The crafting attempt fails.",
+                "The materials are wasted.",
+                "The finished product is flawed."
+            ],
+            "reward_multiplier": 0.3,
+            "reputation_loss": {"merchants": -1}
+        },
+        "critical_failure": {
+            "messages": [
+                "Your workshop catches fire during the crafting attempt!",
+                "You completely destroy valuable materials!",
+                "Your spectacular failure becomes local gossip!"
+            ],
+            "reward_multiplier": 0.0,
+            "reputation_loss": {"merchants": -3, "peasants": -2}
+        }
+    },
+    "study": {
+        "critical_success": {
+            "messages": [
+                "You make a breakthrough in your studies!",
+                "Your dedication leads to exceptional understanding!",
+                "You master complex concepts with remarkable ease!"
+            ],
+            "reward_multiplier": 2.0,
+            "reputation_gain": {"clergy": 3, "nobility": 2}
+        },
+        "success": {
+            "messages": [
+                "Your studies progress well.",
+                "You learn new concepts successfully.",
+                "Your understanding grows steadily."
+            ],
+            "reward_multiplier": 1.0,
+            "reputation_gain": {"clergy": 1}
+        },
+        "failure": {
+            "messages": [
+                "You struggle to grasp the concepts.",
+                "Your studies yield little progress.",
+                "The material proves too challenging."
+            ],
+            "reward_multiplier": 0.5,
+            "reputation_loss": {}
+        },
+        "critical_failure": {
+            "messages": [
+                "You completely misunderstand fundamental concepts!",
+                "Your confusion leads to embarrassing mistakes!",
+                "Your studies leave you more confused than before!"
+            ],
+            "reward_multiplier": 0.0,
+            "reputation_loss": {"clergy": -2}
+        }
+    },
+    "farm": {
+        "critical_success": {
+            "messages": [
+                "Your crops yield an extraordinary harvest!",
+                "Your innovative farming methods produce amazing results!",
+                "Your farm becomes a model for the entire region!"
+            ],
+            "reward_multiplier": 2.0,
+            "reputation_gain": {"peasants": 5, "merchants": 2}
+        },
+        "success": {
+            "messages": [
+                "Your crops grow well.",
+                "The harvest is satisfactory.",
+                "Your farming efforts pay off."
+            ],
+            "reward_multiplier": 1.0,
+            "reputation_gain": {"peasants": 1}
+        },
+        "failure": {
+            "messages": [
+                "The crops yield poorly.",
+                "Pests damage your harvest.",
+                "The weather affects your crops negatively."
+            ],
+            "reward_multiplier": 0.4,
+            "reputation_loss": {"peasants": -1}
+        },
+        "critical_failure": {
+            "messages": [
+                "A devastating blight destroys your entire crop!",
+                "Severe weather ruins your farm!",
+                "Your farming mistakes lead to total crop failure!"
+            ],
+            "reward_multiplier": 0.0,
+            "reputation_loss": {"peasants": -3, "merchants": -2}
+        }
+    },
+    "prayer": {
+        "critical_success": {
+            "messages": [
+                "Your deep devotion brings divine inspiration!",
+                "Your prayers move the hearts of all present!",
+                "Your spiritual leadership inspires miraculous events!"
+            ],
+            "reward_multiplier": 2.0,
+            "reputation_gain": {"clergy": 5, "peasants": 3}
+        },
+        "success": {
+            "messages": [
+                "Your prayers are well-received.",
+                "Your devotion strengthens the faithful.",
+                "Your spiritual guidance helps others."
+            ],
+            "reward_multiplier": 1.0,
+            "reputation_gain": {"clergy": 1}
+        },
+        "failure": {
+            "messages": [
+                "Your prayers seem to go unanswered.",
+                "Your spiritual focus wavers.",
+                "Your message fails to resonate."
+            ],
+            "reward_multiplier": 0.5,
+            "reputation_loss": {}
+        },
+        "critical_failure": {
+            "messages": [
+                "You accidentally quote heretical texts!",
+                "Your spiritual guidance leads others astray!",
+                "Your religious mistakes cause a local scandal!"
+            ],
+            "reward_multiplier": 0.0,
+            "reputation_loss": {"clergy": -4, "nobility": -2}
+        }
+    },
+    "social": {
+        "critical_success": {
+            "messages": [
+                "Your charm and wit make you the star of the gathering!",
+                "You forge valuable new friendships and alliances!",
+                "Your social grace impresses everyone present!"
+            ],
+            "reward_multiplier": 2.0,
+            "reputation_gain": {"nobility": 3, "merchants": 2}
+        },
+        "success": {
+            "messages": [
+                "You make a good impression.",
+                "Your social interactions go well.",
+                "You strengthen your relationships."
+            ],
+            "reward_multiplier": 1.0,
+            "reputation_gain": {"nobility": 1}
+        },
+        "failure": {
+            "messages": [
+                "Your social attempts fall flat.",
+                "You struggle to connect with others.",
+                "The gathering proves awkward."
+            ],
+            "reward_multiplier": 0.5,
+            "reputation_loss": {"nobility": -1}
+        },
+        "critical_failure": {
+            "messages": [
+                "You cause a major social scandal!",
+                "Your behavior shocks and offends everyone!",
+                "Your social blunder becomes notorious gossip!"
+            ],
+            "reward_multiplier": 0.0,
+            "reputation_loss": {"nobility": -4, "merchants": -2}
+        }
+    }
+}
+
+# The attributes adding to the success chance of an action, a quarter of their sum
+ACTION_ATTRIBUTES = {
+    "trade": ("charisma", "intelligence"),
+    "combat": ("strength", "dexterity")
+}
+
+MAX_STAT = 100  # Skills and attributes are kept within 0-100
+SKILL_BUCKET = 10  # Every 10 skill points give +1%
+ATTRIBUTE_BUCKET = 4  # Every 4 points of the summed attributes give +1%
+SKILL_BUCKETS = MAX_STAT // SKILL_BUCKET + 1
+ATTRIBUTE_BUCKETS = 2 * MAX_STAT // ATTRIBUTE_BUCKET + 1
+
+def _success_chance(base_chance, skill, attribute_sum):
+    """Work out a success chance from its parts, within 5-95 (leaving room for critical outcomes)."""
+    success_chance = base_chance + skill // SKILL_BUCKET + attribute_sum // ATTRIBUTE_BUCKET
+    return max(100 - CRITICAL_THRESHOLD, min(CRITICAL_THRESHOLD, success_chance))
+
+def _build_success_chance_table(base_chance):
+    """Build the success chances of one action, indexed by skill bucket * ATTRIBUTE_BUCKETS + attribute bucket."""
+    return bytes(_success_chance(base_chance, skill_bucket * SKILL_BUCKET, attribute_bucket * ATTRIBUTE_BUCKET)
+                 for skill_bucket in range(SKILL_BUCKETS) for attribute_bucket in range(ATTRIBUTE_BUCKETS))
+
+def _build_outcome_table():
+    """Build the outcome code of every roll (1-100) at every success chance (0-100).
+
+    Row chance, column roll holds the code, so row 0 column 0 is unused.
+    """
+    table = bytearray()
+    for success_chance in range(101):
+        for roll in range(101):
+            if roll <= 100 - CRITICAL_THRESHOLD:
+                table.append(CRITICAL_FAILURE)
+            elif roll >= CRITICAL_THRESHOLD:
+                table.append(CRITICAL_SUCCESS)
+            elif roll <= success_chance:
+                table.append(SUCCESS)
+            else:
+                table.append(FAILURE)
+    return bytes(table)
+
+# Success chances of each action, built once at startup
+SUCCESS_CHANCE_TABLES = {action_type: _build_success_chance_table(base_chance)
+                         for action_type, base_chance in BASE_SUCCESS_RATES.items()}
+# Outcome codes indexed by success chance * 101 + roll
+OUTCOME_TABLE = _build_outcome_table()
+
+def outcome_code(success_chance, roll):
+    """Classify a roll (1-100) against a success chance, as an index into OUTCOME_TYPES."""
+    return OUTCOME_TABLE[max(0, min(100, success_chance)) * 101 + roll]
 
 @dataclass
 class ActionOutcome:
@@ -15,336 +399,54 @@ class ActionOutcome:
     reputation_changes: Dict[str, int]
     skill_gains: Dict[str, int]
 
+@dataclass
+class BatchOutcomes:
+    """The outcomes of a batch of actions, as parallel arrays.
+    
+    The arrays are NumPy arrays when NumPy is installed, and arrays from the
+    array module otherwise.
+    """
+    codes: Sequence[int]  # Outcome code of each action, an index into OUTCOME_TYPES
+    gold: Sequence[int]  # Gold reward of each action
+    
+    def __len__(self):
+        return len(self.codes)
+    
+    def outcome_type(self, index):
+        """Get the outcome type (e.g., 'success') of one action."""
+        return OUTCOME_TYPES[self.codes[index]]
+
+def _gold_reward(action_type, outcome_type):
+    """Get the gold reward of an outcome, as given by get_outcome."""
+    template = OUTCOME_TEMPLATES.get(action_type, {}).get(outcome_type, {})
+    return int(10 * template.get("reward_multiplier", 1.0))
+
+def _as_sequence(items):
+    """Get a list, tuple or NumPy array as is, and any other iterable as a list."""
+    if isinstance(items, (list, tuple)) or (np is not None and isinstance(items, np.ndarray)):
+        return items
+    return list(items)
+
 class OutcomeManager:
     """Manages variable outcomes for character actions."""
     
-    def __init__(self):
-        """Initialize the outcome manager."""
-        self.critical_threshold = 95  # Threshold for critical success/failure (95% or 5%)
-        
-        # Define base success chances for different action types
-        self.base_success_rates = {
-            "trade": 70,
-            "combat": 60,
-            "diplomacy": 65,
-            "craft": 75,
-            "study": 80,
-            "farm": 70,
-            "prayer": 90,
-            "social": 75
-        }
-        
-        # Initialize outcome templates
-        self._initialize_outcome_templates()
+    # The rule tables are shared by every outcome manager; only the random
+    # generator and metrics belong to one character
+    __slots__ = ("rng", "metrics")
+    critical_threshold = CRITICAL_THRESHOLD
+    base_success_rates = BASE_SUCCESS_RATES
+    outcome_templates = OUTCOME_TEMPLATES
     
-    def _initialize_outcome_templates(self):
-        """Initialize templates for different outcome types."""
-        self.outcome_templates = {
-            "trade": {
-                "critical_success": {
-                    "messages": [
-                        "Your exceptional bargaining leads to an incredible deal!",
-                        "You discover a rare and valuable item during the trade!",
-                        "Your reputation as a shrewd trader spreads far and wide!"
-                    ],
-                    "reward_multiplier": 2.0,
-                    "reputation_gain": {"merchants": 5, "nobility": 2}
-                },
-                "success": {
-                    "messages": [
-                        "The trade is completed successfully.",
-                        "Both parties are satisfied with the deal.",
-                        "You make a modest profit from the trade."
-                    ],
-                    "reward_multiplier": 1.0,
-                    "reputation_gain": {"merchants": 1}
-                },
-                "failure": {
-                    "messages": [
-                        "The trade falls through.",
-                        "You fail to reach an agreement.",
-                        "The deal wasn't profitable enough."
-                    ],
-                    "reward_multiplier": 0.5,
-                    "reputation_loss": {"merchants": -1}
-                },
-                "critical_failure": {
-                    "messages": [
-                        "Your goods are discovered to be defective!",
-                        "You're accused of attempting to cheat in the trade!",
-                        "You make a terrible miscalculation, resulting in significant losses!"
-                    ],
-                    "reward_multiplier": 0.0,
-                    "reputation_loss": {"merchants": -5, "nobility": -2}
-                }
-            },
-            "combat": {
-                "critical_success": {
-                    "messages": [
-                        "Your exceptional combat prowess leads to a legendary victory!",
-                        "Your perfect technique becomes the talk of the realm!",
-                        "Songs will be sung of this glorious triumph!"
-                    ],
-                    "reward_multiplier": 2.0,
-                    "reputation_gain": {"military": 5, "nobility": 3}
-                },
-                "success": {
-                    "messages": [
-                        "You emerge victorious from the battle.",
-                        "Your combat training pays off.",
-                        "You prove your worth in combat."
-                    ],
-                    "reward_multiplier": 1.0,
-                    "reputation_gain": {"military": 1}
-                },
-                "failure": {
-                    "messages": [
-                        "You are defeated in combat.",
-                        "Your opponent proves too skilled.",
-                        "You fail to achieve victory."
-                    ],
-                    "reward_multiplier": 0.5,
-                    "reputation_loss": {"military": -1}
-                },
-                "critical_failure": {
-                    "messages": [
-                        "You suffer a humiliating defeat!",
-                        "Your poor performance becomes a cautionary tale!",
-                        "Your reputation as a warrior takes a severe blow!"
-                    ],
-                    "reward_multiplier": 0.0,
-                    "reputation_loss": {"military": -5, "nobility": -2}
-                }
-            },
-            "diplomacy": {
-                "critical_success": {
-                    "messages": [
-                        "Your masterful negotiation creates a lasting alliance!",
-                        "Your diplomatic genius resolves a complex dispute!",
-                        "Your words will be remembered as a triumph of diplomacy!"
-                    ],
-                    "reward_multiplier": 2.0,
-                    "reputation_gain": {"nobility": 5, "clergy": 3}
-                },
-                "success": {
-                    "messages": [
-                        "Your diplomatic efforts bear fruit.",
-                        "You successfully mediate the situation.",
-                        "Your words help reach an agreement."
-                    ],
-                    "reward_multiplier": 1.0,
-                    "reputation_gain": {"nobility": 2}
-                },
-                "failure": {
-                    "messages": [
-                        "Your diplomatic approach falls flat.",
-                        "The negotiations break down.",
-                        "You fail to reach an agreement."
-                    ],
-                    "reward_multiplier": 0.5,
-                    "reputation_loss": {"nobility": -1}
-                },
-                "critical_failure": {
-                    "messages": [
-                        "Your diplomatic blunder causes an international incident!",
-                        "Your words accidentally insult everyone involved!",
-                        "Your failure at diplomacy will be remembered for years!"
-                    ],
-                    "reward_multiplier": 0.0,
-                    "reputation_loss": {"nobility": -4, "clergy": -2}
-                }
-            },
-            "craft": {
-                "critical_success": {
-                    "messages": [
-                        "You create a masterpiece that will be admired for generations!",
-                        "Your craftsmanship reaches new heights of excellence!",
-                        "Your creation draws amazement from all who see it!"
-                    ],
-                    "reward_multiplier": 2.5,
-                    "reputation_gain": {"merchants": 4, "peasants": 3}
-                },
-                "success": {
-                    "messages": [
-                        "Your crafting work is completed successfully.",
-                        "The finished product meets expectations.",
-                        "Your creation is well-made."
-                    ],
-                    "reward_multiplier": 1.0,
-                    "reputation_gain": {"merchants": 1}
-                },
-                "failure": {
-                    "messages": [
-                        "The crafting attempt fails.",
-                        "The materials are wasted.",
-                        "The finished product is flawed."
-                    ],
-                    "reward_multiplier": 0.3,
-                    "reputation_loss": {"merchants": -1}
-                },
-                "critical_failure": {
-                    "messages": [
-                        "Your workshop catches fire during the crafting attempt!",
-                        "You completely destroy valuable materials!",
-                        "Your spectacular failure becomes local gossip!"
-                    ],
-                    "reward_multiplier": 0.0,
-                    "reputation_loss": {"merchants": -3, "peasants": -2}
-                }
-            },
-            "study": {
-                "critical_success": {
-                    "messages": [
-                        "You make a breakthrough in your studies!",
-                        "Your dedication leads to exceptional understanding!",
-                        "You master complex concepts with remarkable ease!"
-                    ],
-                    "reward_multiplier": 2.0,
-                    "reputation_gain": {"clergy": 3, "nobility": 2}
-                },
-                "success": {
-                    "messages": [
-                        "Your studies progress well.",
-                        "You learn new concepts successfully.",
-                        "Your understanding grows steadily."
-                    ],
-                    "reward_multiplier": 1.0,
-                    "reputation_gain": {"clergy": 1}
-                },
-                "failure": {
-                    "messages": [
-                        "You struggle to grasp the concepts.",
-                        "Your studies yield little progress.",
-                        "The material proves too challenging."
-                    ],
-                    "reward_multiplier": 0.5,
-                    "reputation_loss": {}
-                },
-                "critical_failure": {
-                    "messages": [
-                        "You completely misunderstand fundamental concepts!",
-                        "Your confusion leads to embarrassing mistakes!",
-                        "Your studies leave you more confused than before!"
-                    ],
-                    "reward_multiplier": 0.0,
-                    "reputation_loss": {"clergy": -2}
-                }
-            },
-            "farm": {
-                "critical_success": {
-                    "messages": [
-                        "Your crops yield an extraordinary harvest!",
-                        "Your innovative farming methods produce amazing results!",
-                        "Your farm becomes a model for the entire region!"
-                    ],
-                    "reward_multiplier": 2.0,
-                    "reputation_gain": {"peasants": 5, "merchants": 2}
-                },
-                "success": {
-                    "messages": [
-                        "Your crops grow well.",
-                        "The harvest is satisfactory.",
-                        "Your farming efforts pay off."
-                    ],
-                    "reward_multiplier": 1.0,
-                    "reputation_gain": {"peasants": 1}
-                },
-                "failure": {
-                    "messages": [
-                        "The crops yield poorly.",
-                        "Pests damage your harvest.",
-                        "The weather affects your crops negatively."
-                    ],
-                    "reward_multiplier": 0.4,
-                    "reputation_loss": {"peasants": -1}
-                },
-                "critical_failure": {
-                    "messages": [
-                        "A devastating blight destroys your entire crop!",
-                        "Severe weather ruins your farm!",
-                        "Your farming mistakes lead to total crop failure!"
-                    ],
-                    "reward_multiplier": 0.0,
-                    "reputation_loss": {"peasants": -3, "merchants": -2}
-                }
-            },
-            "prayer": {
-                "critical_success": {
-                    "messages": [
-                        "Your deep devotion brings divine inspiration!",
-                        "Your prayers move the hearts of all present!",
-                        "Your spiritual leadership inspires miraculous events!"
-                    ],
-                    "reward_multiplier": 2.0,
-                    "reputation_gain": {"clergy": 5, "peasants": 3}
-                },
-                "success": {
-                    "messages": [
-                        "Your prayers are well-received.",
-                        "Your devotion strengthens the faithful.",
-                        "Your spiritual guidance helps others."
-                    ],
-                    "reward_multiplier": 1.0,
-                    "reputation_gain": {"clergy": 1}
-                },
-                "failure": {
-                    "messages": [
-                        "Your prayers seem to go unanswered.",
-                        "Your spiritual focus wavers.",
-                        "Your message fails to resonate."
-                    ],
-                    "reward_multiplier": 0.5,
-                    "reputation_loss": {}
-                },
-                "critical_failure": {
-                    "messages": [
-                        "You accidentally quote heretical texts!",
-                        "Your spiritual guidance leads others astray!",
-                        "Your religious mistakes cause a local scandal!"
-                    ],
-                    "reward_multiplier": 0.0,
-                    "reputation_loss": {"clergy": -4, "nobility": -2}
-                }
-            },
-            "social": {
-                "critical_success": {
-                    "messages": [
-                        "Your charm and wit make you the star of the gathering!",
-                        "You forge valuable new friendships and alliances!",
-                        "Your social grace impresses everyone present!"
-                    ],
-                    "reward_multiplier": 2.0,
-                    "reputation_gain": {"nobility": 3, "merchants": 2}
-                },
-                "success": {
-                    "messages": [
-                        "You make a good impression.",
-                        "Your social interactions go well.",
-                        "You strengthen your relationships."
-                    ],
-                    "reward_multiplier": 1.0,
-                    "reputation_gain": {"nobility": 1}
-                },
-                "failure": {
-                    "messages": [
-                        "Your social attempts fall flat.",
-                        "You struggle to connect with others.",
-                        "The gathering proves awkward."
-                    ],
-                    "reward_multiplier": 0.5,
-                    "reputation_loss": {"nobility": -1}
-                },
-                "critical_failure": {
-                    "messages": [
-                        "You cause a major social scandal!",
-                        "Your behavior shocks and offends everyone!",
-                        "Your social blunder becomes notorious gossip!"
-                    ],
-                    "reward_multiplier": 0.0,
-                    "reputation_loss": {"nobility": -4, "merchants": -2}
-                }
-            }
-        }
+    def __init__(self, rng=None, metrics=None):
+        """Initialize the outcome manager.
+        
+        Args:
+            rng: The random generator used for rolls (optional, defaults to
+                the global random module).
+            metrics: The Metrics to count outcomes in (optional).
+        """
+        self.rng = rng or random
+        self.metrics = metrics or NULL_METRICS
     
     def calculate_success_chance(self, character, action_type: str) -> int:
         """Calculate the success chance for an action based on character attributes and skills.
@@ -354,29 +456,28 @@ class OutcomeManager:
             action_type: The type of action being performed
             
         Returns:
-            The calculated success chance (0-100)
+            The calculated success chance (0-100), cached on characters until
+            their attributes or skills change
         """
-        base_chance = self.base_success_rates.get(action_type, 50)
-        
-        # Add relevant skill bonus
-        skill_bonus = 0
-        if action_type in character.skills:
-            skill_bonus = character.skills[action_type] // 10  # Every 10 points gives +1%
-        
-        # Add relevant attribute bonus
-        attribute_bonus = 0
-        if action_type == "trade":
-            attribute_bonus = (character.attributes.get("charisma", 0) + 
-                            character.attributes.get("intelligence", 0)) // 4
-        elif action_type == "combat":
-            attribute_bonus = (character.attributes.get("strength", 0) + 
-                            character.attributes.get("dexterity", 0)) // 4
-        
-        # Calculate final chance
-        success_chance = base_chance + skill_bonus + attribute_bonus
+        get_derived = getattr(character, "get_derived", None)
+        if get_derived is None:
+            return self._compute_success_chance(character, action_type)
+        return get_derived("stats", ("success_chance", action_type),
+                           lambda: self._compute_success_chance(character, action_type))
+    
+    def _compute_success_chance(self, character, action_type: str) -> int:
+        """Work out the success chance for an action from the character's attributes and skills."""
+        skill = character.skills.get(action_type, 0)
+        attribute_sum = 0
+        if action_type in ACTION_ATTRIBUTES:
+            attributes = character.attributes
+            attribute_sum = sum(attributes.get(attribute, 0) for attribute in ACTION_ATTRIBUTES[action_type])
         
-        # Ensure chance stays within 5-95 range (leaving room for critical outcomes)
-        return max(5, min(95, success_chance))
+        # Look the chance up, unless the stats are outside the table
+        table = SUCCESS_CHANCE_TABLES.get(action_type)
+        if table is not None and 0 <= skill <= MAX_STAT and 0 <= attribute_sum <= 2 * MAX_STAT:
+            return table[skill // SKILL_BUCKET * ATTRIBUTE_BUCKETS + attribute_sum // ATTRIBUTE_BUCKET]
+        return _success_chance(self.base_success_rates.get(action_type, 50), skill, attribute_sum)
     
     def get_outcome(self, character, action_type: str, difficulty_modifier: int = 0) -> ActionOutcome:
         """Determine the outcome of an action.
@@ -394,33 +495,24 @@ class OutcomeManager:
         success_chance += difficulty_modifier
         
         # Roll for outcome
-        roll = random.randint(1, 100)
+        roll = self.rng.randint(1, 100)
         
         # Determine outcome type
-        if roll <= 5:  # Critical failure
-            success = False
-            is_critical = True
-            outcome_type = "critical_failure"
-        elif roll >= 95:  # Critical success
-            success = True
-            is_critical = True
-            outcome_type = "critical_success"
-        elif roll <= success_chance:  # Normal success
-            success = True
-            is_critical = False
-            outcome_type = "success"
-        else:  # Normal failure
-            success = False
-            is_critical = False
-            outcome_type = "failure"
+        code = outcome_code(success_chance, roll)
+        outcome_type = OUTCOME_TYPES[code]
+        success = code >= SUCCESS
+        is_critical = code in (CRITICAL_FAILURE, CRITICAL_SUCCESS)
+        
+        self.metrics.increment("action_outcomes_total", action=action_type, outcome=outcome_type)
         
         # Get outcome template
         template = self.outcome_templates.get(action_type, {}).get(outcome_type, {})
         
         # Generate outcome
-        message = random.choice(template.get("messages", ["The action is completed."]))
+        message = self.rng.choice(template.get("messages", ["The action is completed."]))
         reward_multiplier = template.get("reward_multiplier", 1.0)
-        reputation_changes = template.get("reputation_gain", {}) if success else template.get("reputation_loss", {})
+        # Copied, since the templates are shared by every character
+        reputation_changes = dict(template.get("reputation_gain", {}) if success else template.get("reputation_loss", {}))
         
         # Calculate skill gains (more on critical success, less on failure)
         skill_gains = {}
@@ -441,4 +533,146 @@ class OutcomeManager:
             rewards={"gold": int(10 * reward_multiplier)},  # Example reward
             reputation_changes=reputation_changes,
             skill_gains=skill_gains
-        ) 
\ No newline at end of file
+        ) 
+    
+    def resolve_batch(self, characters, action_types, modifiers=None, use_numpy=None):
+        """Resolve many actions at once, e.g. for NPC autonomy or Monte Carlo runs.
+        
+        Follows the rules of get_outcome, but rolls every action in one
+        vectorized draw and returns outcome codes and gold rewards instead of
+        messages. Success chances come from calculate_success_chance, which
+        is cached on each character.
+        
+        Args:
+            characters: The character doing each action (any iterable, e.g.
+                a list, NumPy array or generator), or one character doing
+                every action.
+            action_types: The type of each action, or one type for every action.
+            modifiers: The difficulty modifier of each action, or one for
+                every action (optional).
+            use_numpy: Force (True) or forbid (False) NumPy (optional, NumPy
+                is used whenever it is installed if None).
+            
+        Returns:
+            A BatchOutcomes with the outcome code and gold reward of each action.
+        """
+        # Characters are not iterable, so anything iterable is a sequence of them;
+        # iterators are read once, into lists
+        single_character = not isinstance(characters, Iterable)
+        single_action = isinstance(action_types, str)
+        if not single_character:
+            characters = _as_sequence(characters)
+        if not single_action:
+            action_types = _as_sequence(action_types)
+        if single_character and single_action:
+            count = 1
+        elif single_character:
+            count = len(action_types)
+        else:
+            count = len(characters)
+            if not single_action and len(action_types) != count:
+                raise ValueError("characters and action_types must have the same length")
+        if modifiers is not None and not isinstance(modifiers, int):
+            modifiers = _as_sequence(modifiers)
+            if len(modifiers) != count:
+                raise ValueError("modifiers must have one value for each action")
+        
+        # Number the action types of this batch, for the table lookups
+        action_names = [action_types] if single_action else sorted(set(action_types))
+        action_codes = {action_type: code for code, action_type in enumerate(action_names)}
+        gold_table = [_gold_reward(action_type, outcome_type)
+                      for action_type in action_names for outcome_type in OUTCOME_TYPES]
+        
+        # Success chances, worked out once for each distinct character and action
+        chance = self.calculate_success_chance
+        if single_character and single_action:
+            chances = [chance(characters, action_types)]
+        elif single_character:
+            by_action = {action_type: chance(characters, action_type) for action_type in action_names}
+            chances = list(map(by_action.__getitem__, action_types))
+        elif single_action:
+            by_character = {}
+            for character in characters:
+                if character not in by_character:
+                    by_character[character] = chance(character, action_types)
+            chances = list(map(by_character.__getitem__, characters))
+        else:
+            by_pair = {}
+            for pair in zip(characters, action_types):
+                if pair not in by_pair:
+                    by_pair[pair] = chance(*pair)
+            chances = list(map(by_pair.__getitem__, zip(characters, action_types)))
+        
+        if use_numpy is None:
+            use_numpy = np is not None
+        if use_numpy:
+            if np is None:
+                raise ImportError("NumPy is required for vectorized batch resolution")
+            codes, action_column = self._roll_batch_numpy(count, chances, modifiers, action_types,
+                                                          action_codes, single_action)
+            gold = np.asarray(gold_table, dtype=np.int32)[action_column * len(OUTCOME_TYPES) + codes]
+            counts = np.bincount(action_column * len(OUTCOME_TYPES) + codes,
+                                 minlength=len(gold_table)).tolist()
+        else:
+            codes, action_column = self._roll_batch_python(count, chances, modifiers, action_types,
+                                                           action_codes, single_action)
+            cells = [action * len(OUTCOME_TYPES) + code for action, code in zip(action_column, codes)]
+            gold = array("i", [gold_table[cell] for cell in cells])
+            counts = [0] * len(gold_table)
+            for cell in cells:
+                counts[cell] += 1
+        
+        # Count outcomes in one increment per action and outcome type
+        for cell, amount in enumerate(counts):
+            if amount:
+                action_type = action_names[cell // len(OUTCOME_TYPES)]
+                outcome_type = OUTCOME_TYPES[cell % len(OUTCOME_TYPES)]
+                self.metrics.increment("action_outcomes_total", amount, action=action_type, outcome=outcome_type)
+        return BatchOutcomes(codes, gold)
+    
+    def _roll_batch_numpy(self, count, chances, modifiers, action_types, action_codes, single_action):
+        """Roll a batch with NumPy.
+        
+        Returns:
+            A tuple of (outcome codes, action type codes) as arrays.
+        """
+        rng = np.random.default_rng(self.rng.getrandbits(64))
+        chance = np.fromiter(chances, dtype=np.int16, count=len(chances))
+        if modifiers is not None:
+            chance = chance + np.asarray(modifiers, dtype=np.int16)
+        rolls = rng.integers(1, 101, count, dtype=np.int16)
+        
+        # Classify every roll with one lookup in the outcome table
+        outcome_table = np.frombuffer(OUTCOME_TABLE, dtype=np.int8)
+        codes = outcome_table[np.clip(chance, 0, 100).astype(np.intp) * 101 + rolls]
+        
+        if single_action:
+            action_column = np.zeros(count, dtype=np.intp)
+        else:
+            action_column = np.fromiter(map(action_codes.__getitem__, action_types), dtype=np.intp, count=count)
+        return codes, action_column
+    
+    def _roll_batch_python(self, count, chances, modifiers, action_types, action_codes, single_action):
+        """Roll a batch one action at a time, for when NumPy is not installed.
+        
+        Returns:
+            A tuple of (outcome codes, action type codes) as arrays.
+        """
+        rng = random.Random(self.rng.getrandbits(64))
+        if len(chances) == 1 and count > 1:
+            chances = chances * count
+        if isinstance(modifiers, int):
+            modifiers = [modifiers] * count
+        if modifiers is not None:
+            chances = [chance + modifier for chance, modifier in zip(chances, modifiers)]
+        
+        # Start of each success chance's row in the outcome table
+        rows = {chance: max(0, min(100, chance)) * 101 for chance in set(chances)}
+        randint = rng.randint
+        codes = array("b", [OUTCOME_TABLE[rows[chance] + randint(1, 100)] for chance in chances])
+        
+        if single_action:
+            action_column = array("b", bytes(count))
+        else:
+            action_column = array("i", map(action_codes.__getitem__, action_types))
+        return codes, action_column
@@ -0,0 +1,188 @@
+"""
+Year Tick - Runs the phases of a simulated year in a fixed, configurable order
+"""
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+
+@dataclass
+class TickPhase:
+    """A named step of the yearly tick and its timing counters."""
+    name: str
+    handler: Callable[[], None]
+    enabled: bool = True
+    calls: int = 0
+    skips: int = 0
+    total_time: float = 0.0  # Seconds spent in the handler over all calls
+    last_time: float = 0.0  # Seconds spent in the handler on the last call
+
+    @property
+    def mean_time(self) -> float:
+        """The average number of seconds per call."""
+        return self.total_time / self.calls if self.calls else 0.0
+
+    def reset(self):
+        """Clear the timing counters."""
+        self.calls = 0
+        self.skips = 0
+        self.total_time = 0.0
+        self.last_time = 0.0
+
+    def to_dict(self) -> Dict[str, float]:
+        """Convert the phase counters to a dictionary."""
+        return {
+            "enabled": self.enabled,
+            "calls": self.calls,
+            "skips": self.skips,
+            "total_time": self.total_time,
+            "mean_time": self.mean_time,
+            "last_time": self.last_time
+        }
+
+class YearTickPipeline:
+    """Ordered list of phases that together advance the game by one year.
+
+    Phases can be added, removed, reordered and disabled, and each one keeps
+    its own call count and wall time so the cost of a year can be broken down.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter,
+                 observer: Optional[Callable[[str, float], None]] = None):
+        """Initialize an empty pipeline.
+
+        Args:
+            clock: The timer used to measure phases (defaults to time.perf_counter).
+            observer: A callable receiving the name and wall time of every phase
+                run (optional).
+        """
+        self.clock = clock
+        self.observer = observer
+        self.phases: List[TickPhase] = []
+        self.ticks = 0
+
+    def add_phase(self, name: str, handler: Callable[[], None], before: Optional[str] = None,
+                  after: Optional[str] = None) -> TickPhase:
+        """Register a phase, at the end or next to an existing phase.
+
+        Args:
+            name: The unique name of the phase.
+            handler: A callable taking no arguments that runs the phase.
+            before: The name of the phase to insert this one before (optional).
+            after: The name of the phase to insert this one after (optional).
+
+        Returns:
+            The new TickPhase.
+        """
+        if self._find(name) is not None:
+            raise ValueError(f"Phase '{name}' is already registered")
+
+        phase = TickPhase(name, handler)
+        if before is not None:
+            self.phases.insert(self._index(before), phase)
+        elif after is not None:
+            self.phases.insert(self._index(after) + 1, phase)
+        else:
+            self.phases.append(phase)
+        return phase
+
+    def remove_phase(self, name: str) -> TickPhase:
+        """Unregister a phase.
+
+        Args:
+            name: The name of the phase.
+
+        Returns:
+            The removed TickPhase.
+        """
+        return self.phases.pop(self._index(name))
+
+    def get_phase(self, name: str) -> TickPhase:
+        """Get a registered phase by name.
+
+        Args:
+            name: The name of the phase.
+
+        Returns:
+            The TickPhase.
+        """
+        return self.phases[self._index(name)]
+
+    def phase_names(self) -> List[str]:
+        """Get the names of all phases in run order."""
+        return [phase.name for phase in self.phases]
+
+    def reorder(self, names: List[str]):
+        """Set the run order of the phases.
+
+        Args:
+            names: The names of all registered phases, in the new order.
+        """
+        if sorted(names) != sorted(self.phase_names()):
+            raise ValueError("The new order must list every registered phase exactly once")
+        by_name = {phase.name: phase for phase in self.phases}
+        self.phases = [by_name[name] for name in names]
+
+    def set_enabled(self, name: str, enabled: bool):
+        """Enable or skip a phase.
+
+        Args:
+            name: The name of the phase.
+            enabled: Whether the phase runs during a tick.
+        """
+        self.get_phase(name).enabled = enabled
+
+    def run(self, should_stop: Optional[Callable[[], bool]] = None) -> bool:
+        """Run one tick through every enabled phase in order.
+
+        Args:
+            should_stop: A callable checked after each phase; when it returns
+                True the remaining phases are not run (optional).
+
+        Returns:
+            True if every phase ran, False if the tick was stopped early.
+        """
+        self.ticks += 1
+        for phase in self.phases:
+            if not phase.enabled:
+                phase.skips += 1
+                continue
+
+            start = self.clock()
+            phase.handler()
+            phase.last_time = self.clock() - start
+            phase.total_time += phase.last_time
+            phase.calls += 1
+            if self.observer is not None:
+                self.observer(phase.name, phase.last_time)
+
+            if should_stop is not None and should_stop():
+                return False
+        return True
+
+    def reset_stats(self):
+        """Clear the counters of every phase."""
+        self.ticks = 0
+        for phase in self.phases:
+            phase.reset()
+
+    def get_stats(self) -> Dict[str, Dict[str, float]]:
+        """Get the counters of every phase in run order.
+
+        Returns:
+            A dictionary mapping phase names to their counters.
+        """
+        return {phase.name: phase.to_dict() for phase in self.phases}
+
+    def _find(self, name: str) -> Optional[int]:
+        """Find the position of a phase, or None if it is not registered."""
+        for idx, phase in enumerate(self.phases):
+            if phase.name == name:
+                return idx
+        return None
+
+    def _index(self, name: str) -> int:
+        """Find the position of a phase, raising if it is not registered."""
+        idx = self._find(name)
+        if idx is None:
+            raise KeyError(f"Unknown phase '{name}'")
+        return idx
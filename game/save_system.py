@@ -25,9 +25,11 @@ class SaveSystem:
         """
         try:
             # Create save data dictionary
+            npc_manager = game_manager.npc_manager
             save_data = {
                 "game_year": game_manager.game_year,
-                "player": self._serialize_character(game_manager.player),
+                "npc_population": npc_manager.population_id if npc_manager else None,
+                "player": self._serialize_character(game_manager.player, npc_manager),
                 "achievements": game_manager.achievements
             }
             
@@ -60,9 +62,13 @@ class SaveSystem:
             # Load game year
             game_manager.game_year = save_data["game_year"]
             
-            # Load player character
+            # Load player character; relationships only keep their NPCs when
+            # loaded back into the population they were saved from
+            npc_manager = game_manager.npc_manager
+            if npc_manager and save_data.get("npc_population") != npc_manager.population_id:
+                npc_manager = None
             player_data = save_data["player"]
-            game_manager.player = self._deserialize_character(player_data)
+            game_manager._set_player(self._deserialize_character(player_data, npc_manager))
             
             # Load achievements
             game_manager.achievements = save_data["achievements"]
@@ -72,11 +78,12 @@ class SaveSystem:
             print(f"Error loading game: {e}")
             return False
     
-    def _serialize_character(self, character):
+    def _serialize_character(self, character, npc_manager=None):
         """Serialize a character object to a dictionary.
         
         Args:
             character: The character to serialize.
+            npc_manager: The NPCManager the character's relationships refer to (optional).
             
         Returns:
             A dictionary containing the character's data.
@@ -90,44 +97,54 @@ class SaveSystem:
             "health": character.health,
             "wealth": character.wealth,
             "happiness": character.happiness,
-            "skills": character.skills,
-            "attributes": character.attributes,
+            "skills": dict(character.skills),
+            "attributes": dict(character.attributes),
             "traits": character.traits,
-            "is_alive": character.is_alive,
-            "reputations": character.reputation.reputations
+            "is_alive": character.is_alive(),
+            "location": character.location,
+            "reputations": dict(character.reputation.reputations)
         }
         
         # Serialize spouse if exists
         if character.spouse:
-            data["spouse"] = self._serialize_character(character.spouse)
+            data["spouse"] = self._serialize_character(character.spouse, npc_manager)
         else:
             data["spouse"] = None
         
         # Serialize children
-        data["children"] = [self._serialize_character(child) for child in character.children]
-        
-        # Serialize relationships
-        data["relationships"] = [
-            {
-                "person": self._serialize_character(person),
-                "level": rel.level,
-                "status": rel.status
-            }
-            for person, rel in character.relationships.items()
-        ]
+        data["children"] = [self._serialize_character(child, npc_manager) for child in character.children]
+        
+        # Serialize relationships, with who the NPC was in case they cannot be found on loading
+        relationships = character.relationships
+        data["relationships"] = []
+        for serial, npc_id, level, status in relationships.items():
+            if npc_manager:
+                name, role = npc_manager.describe_relationship(relationships, serial, npc_id)
+            else:
+                name, role = relationships.snapshot(serial) or (None, None)
+            data["relationships"].append({
+                "serial": serial,
+                "npc_id": npc_id,
+                "name": name,
+                "role": role,
+                "level": level,
+                "status": status
+            })
         
         return data
     
-    def _deserialize_character(self, data):
+    def _deserialize_character(self, data, npc_manager=None):
         """Deserialize a character from a dictionary.
         
         Args:
             data: The dictionary containing character data.
+            npc_manager: The NPCManager of the population the character was
+                saved from (optional; without it every relationship is unknown).
             
         Returns:
             A Character object.
         """
-        from game.characters.character import Character, Relationship
+        from game.characters.character import Character
         
         # Create base character
         character = Character(
@@ -145,24 +162,28 @@ class SaveSystem:
         character.skills = data["skills"]
         character.attributes = data["attributes"]
         character.traits = data["traits"]
-        character.is_alive = data["is_alive"]
+        character.location = data.get("location")
         
         # Set reputations
         character.reputation.reputations = data["reputations"]
         
         # Deserialize spouse if exists
         if data["spouse"]:
-            character.spouse = self._deserialize_character(data["spouse"])
+            character.spouse = self._deserialize_character(data["spouse"], npc_manager)
         
         # Deserialize children
-        character.children = [self._deserialize_character(child) for child in data["children"]]
+        character.children = [self._deserialize_character(child, npc_manager) for child in data["children"]]
         
-        # Deserialize relationships
-        character.relationships = {}
+        # Deserialize relationships; those whose NPC cannot be found are unknown
+        # rather than bound to whoever now has the serial number. Statuses are
+        # worked out again from the levels
         for rel_data in data["relationships"]:
-            person = self._deserialize_character(rel_data["person"])
-            relationship = Relationship(person, rel_data["status"], rel_data["level"])
-            character.relationships[person] = relationship
+            serial = rel_data["serial"]
+            npc_id = rel_data["npc_id"]
+            if serial > 0 and npc_manager and npc_manager.resolve_npc(npc_id, serial) is not None:
+                character.relationships.add(serial, npc_id, rel_data["level"])
+            elif rel_data.get("name") is not None:
+                character.relationships.add_unknown(rel_data["name"], rel_data.get("role"), rel_data["level"])
         
         return character
     
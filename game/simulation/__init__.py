@@ -0,0 +1,13 @@
+"""
+Simulation package - Headless drivers for batch runs
+"""
+from game.simulation.headless import (
+    HeadlessInterface,
+    HeadlessSimulation,
+    LifeRecord,
+    RandomPolicy,
+    SimulationPolicy,
+    SimulationTrace,
+    YearRecord
+)
+from game.simulation.campaign import RoleStats, SummaryStats, run_campaign
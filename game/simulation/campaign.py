@@ -0,0 +1,205 @@
+"""
+Campaign Runner - Runs Monte Carlo batches of headless lifetimes across processes
+"""
+import math
+import os
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+from game.characters.character_factory import CharacterFactory
+from game.mechanics.historical_constraints import HISTORICAL_CONSTRAINTS
+from game.simulation.headless import HeadlessSimulation, RandomPolicy
+
+@dataclass
+class SummaryStats:
+    """Running count, total, minimum and maximum of an integer statistic."""
+    count: int = 0
+    total: int = 0
+    minimum: Optional[int] = None
+    maximum: Optional[int] = None
+
+    @property
+    def mean(self) -> float:
+        """The mean of the values added so far."""
+        return self.total / self.count if self.count else 0.0
+
+    def add(self, value: int):
+        """Add a single value."""
+        self.count += 1
+        self.total += value
+        self.minimum = value if self.minimum is None else min(self.minimum, value)
+        self.maximum = value if self.maximum is None else max(self.maximum, value)
+
+    def merge(self, other: "SummaryStats"):
+        """Fold another set of statistics into this one."""
+        if not other.count:
+            return
+        self.count += other.count
+        self.total += other.total
+        self.minimum = other.minimum if self.minimum is None else min(self.minimum, other.minimum)
+        self.maximum = other.maximum if self.maximum is None else max(self.maximum, other.maximum)
+
+    def to_dict(self) -> Dict[str, float]:
+        """Convert the statistics to a plain dictionary."""
+        return {"count": self.count, "mean": self.mean, "min": self.minimum, "max": self.maximum}
+
+@dataclass
+class RoleStats:
+    """Per-role statistics of a campaign."""
+    role: str
+    runs: int = 0
+    lifespan: SummaryStats = field(default_factory=SummaryStats)
+    peak_wealth: SummaryStats = field(default_factory=SummaryStats)
+    arcs_completed: SummaryStats = field(default_factory=SummaryStats)
+    heirs: SummaryStats = field(default_factory=SummaryStats)
+
+    def add_life(self, life):
+        """Add the LifeRecord of a single run."""
+        self.runs += 1
+        self.lifespan.add(life.end_age)
+        self.peak_wealth.add(life.peak_wealth)
+        self.arcs_completed.add(life.arcs_completed)
+        self.heirs.add(life.heirs)
+
+    def merge(self, other: "RoleStats"):
+        """Fold the statistics of another shard of the same role into this one."""
+        self.runs += other.runs
+        self.lifespan.merge(other.lifespan)
+        self.peak_wealth.merge(other.peak_wealth)
+        self.arcs_completed.merge(other.arcs_completed)
+        self.heirs.merge(other.heirs)
+
+    def to_dict(self) -> Dict[str, object]:
+        """Convert the statistics to a plain dictionary."""
+        return {
+            "role": self.role,
+            "runs": self.runs,
+            "lifespan": self.lifespan.to_dict(),
+            "peak_wealth": self.peak_wealth.to_dict(),
+            "arcs_completed": self.arcs_completed.to_dict(),
+            "heirs": self.heirs.to_dict()
+        }
+
+@dataclass
+class Shard:
+    """A contiguous block of runs of one role, executed by a single worker."""
+    role: str
+    start: int
+    count: int
+    seed: int
+    max_years: int
+
+def _run_seed(seed, role, index):
+    """Derive the seed of a single run from the campaign seed."""
+    return f"{seed}:{role}:{index}"
+
+def run_shard(shard):
+    """Run every lifetime in a shard.
+
+    Args:
+        shard: The Shard to run.
+
+    Returns:
+        The RoleStats of the shard.
+    """
+    genders = [gender for gender in ("male", "female") if shard.role in HISTORICAL_CONSTRAINTS.get_allowed_roles(gender)]
+    stats = RoleStats(shard.role)
+
+    for index in range(shard.start, shard.start + shard.count):
+        run_seed = _run_seed(shard.seed, shard.role, index)
+        simulation = HeadlessSimulation(RandomPolicy(seed=run_seed), seed=run_seed)
+        trace = simulation.run(f"{shard.role.capitalize()} {index}", genders[index % len(genders)],
+                               shard.role, max_years=shard.max_years, follow_heirs=False)
+        for life in trace.lives:
+            stats.add_life(life)
+
+    return stats
+
+def make_shards(runs_per_role, roles, seed, max_years, shard_size):
+    """Split a campaign into shards.
+
+    Args:
+        runs_per_role: The number of runs for each role.
+        roles: The roles to run.
+        seed: The campaign seed.
+        max_years: The maximum number of years per run.
+        shard_size: The number of runs per shard.
+
+    Returns:
+        A list of Shard objects in role order, then run order.
+    """
+    shards = []
+    for role in roles:
+        for start in range(0, runs_per_role, shard_size):
+            shards.append(Shard(role, start, min(shard_size, runs_per_role - start), seed, max_years))
+    return shards
+
+def run_campaign(runs_per_role, roles=None, workers=None, seed=0, max_years=100, shard_size=None):
+    """Run a Monte Carlo campaign of headless lifetimes.
+
+    Shards are executed in a process pool and merged in shard order, so the
+    result only depends on the arguments, never on worker scheduling.
+
+    Args:
+        runs_per_role: The number of lifetimes to simulate for each role.
+        roles: The roles to run (defaults to every CharacterFactory role).
+        workers: The number of worker processes (defaults to all cores).
+            With a single worker the campaign runs in this process.
+        seed: The campaign seed.
+        max_years: The maximum number of years per lifetime.
+        shard_size: The number of runs per shard (optional).
+
+    Returns:
+        A dictionary mapping each role to its RoleStats.
+    """
+    roles = roles or CharacterFactory.ROLES
+    workers = workers or os.cpu_count() or 1
+
+    # Aim for several shards per worker to keep the pool busy
+    if shard_size is None:
+        total_runs = runs_per_role * len(roles)
+        shard_size = max(1, min(50, math.ceil(total_runs / (workers * 4))))
+
+    shards = make_shards(runs_per_role, roles, seed, max_years, shard_size)
+
+    if workers == 1:
+        shard_stats = map(run_shard, shards)
+        return _merge(roles, shard_stats)
+
+    # Imported here so that importing the simulation package stays cheap
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        shard_stats = executor.map(run_shard, shards)
+        return _merge(roles, shard_stats)
+
+def _merge(roles, shard_stats):
+    """Merge shard results into per-role statistics, in shard order."""
+    results = {role: RoleStats(role) for role in roles}
+    for stats in shard_stats:
+        results[stats.role].merge(stats)
+    return results
+
+def main():
+    """Run a campaign from the command line and print the results as JSON."""
+    import argparse
+    import json
+    import time
+
+    parser = argparse.ArgumentParser(description="Run a Monte Carlo campaign of headless lifetimes.")
+    parser.add_argument("--runs", type=int, default=100, help="lifetimes per role")
+    parser.add_argument("--roles", nargs="*", default=None, help="roles to run")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes")
+    parser.add_argument("--seed", type=int, default=0, help="campaign seed")
+    parser.add_argument("--max-years", type=int, default=100, help="maximum years per lifetime")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    results = run_campaign(args.runs, args.roles, args.workers, args.seed, args.max_years)
+    elapsed = time.perf_counter() - start
+
+    print(json.dumps({
+        "elapsed_seconds": elapsed,
+        "roles": [stats.to_dict() for stats in results.values()]
+    }, indent=4))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,341 @@
+"""
+Headless Simulation - Drives the game without rendering, sleeps or input prompts
+"""
+import random
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+from game.game_manager import GameManager
+from game.ui.message_sink import NULL_MESSAGE_SINK, MessageLog
+
+class SimulationPolicy:
+    """Scripted player that makes every decision during a headless run.
+
+    The base policy never takes an action, always picks the first menu option
+    and continues as the oldest heir. Subclasses override any of the three
+    choices.
+    """
+
+    def choose_action(self, game_manager, actions):
+        """Choose the action to take before the year advances.
+
+        Args:
+            game_manager: The game manager.
+            actions: A list of available action names.
+
+        Returns:
+            The chosen action name, or None to just advance the year.
+        """
+        return None
+
+    def choose_menu_option(self, title, options):
+        """Choose an option from a menu shown by the game.
+
+        Args:
+            title: The menu title.
+            options: A list of options.
+
+        Returns:
+            The index of the chosen option.
+        """
+        return 0
+
+    def choose_heir(self, game_manager, heirs):
+        """Choose the heir to continue as after the player dies.
+
+        Args:
+            game_manager: The game manager.
+            heirs: A list of eligible heir characters.
+
+        Returns:
+            The index of the chosen heir.
+        """
+        return max(range(len(heirs)), key=lambda i: heirs[i].age)
+
+class RandomPolicy(SimulationPolicy):
+    """Policy that acts and answers menus at random."""
+
+    # Actions that only show information or leave the simulation
+    PASSIVE_ACTIONS = ["View Character Details", "View Family", "View Relationships",
+                       "Advance Year", "Fast Forward", "Save Game", "Quit"]
+
+    def __init__(self, action_chance=0.8, seed=None):
+        """Initialize the random policy.
+
+        Args:
+            action_chance: The chance to take an action each year (0-1).
+            seed: Seed for the policy's own random generator (optional).
+        """
+        self.action_chance = action_chance
+        self.rng = random.Random(seed)
+
+    def choose_action(self, game_manager, actions):
+        """Choose a random non-passive action, or none at all."""
+        candidates = [action for action in actions if action not in self.PASSIVE_ACTIONS]
+        if not candidates or self.rng.random() >= self.action_chance:
+            return None
+        return self.rng.choice(candidates)
+
+    def choose_menu_option(self, title, options):
+        """Choose a random menu option."""
+        return self.rng.randrange(len(options))
+
+    def choose_heir(self, game_manager, heirs):
+        """Choose a random heir."""
+        return self.rng.randrange(len(heirs))
+
+class HeadlessInterface:
+    """User interface that renders nothing and delegates every choice to a policy."""
+
+    def __init__(self, policy, record_messages=False):
+        """Initialize the headless interface.
+
+        Args:
+            policy: The SimulationPolicy answering menus.
+            record_messages: Whether to keep plain messages for the trace.
+        """
+        self.policy = policy
+        self.record_messages = record_messages
+        self.running = True
+        self.game_manager = None
+        self.menu_result = None
+        self.input_result = ""
+        self.events = []
+        self.messages = MessageLog() if record_messages else NULL_MESSAGE_SINK
+
+    def drain(self):
+        """Return and clear the events and messages collected so far.
+
+        Returns:
+            A tuple of (events, messages).
+        """
+        events, messages = self.events, list(self.messages)
+        self.events = []
+        self.messages.clear()
+        return events, messages
+
+    def clear_screen(self):
+        """Nothing to clear."""
+
+    def display_message(self, message):
+        """Record a message if message recording is enabled."""
+        self.messages.append(message)
+
+    def get_input(self, prompt):
+        """Answer every text prompt with an empty string."""
+        self.input_result = ""
+        return self.input_result
+
+    def display_menu(self, title, options):
+        """Let the policy pick a menu option.
+
+        Returns:
+            The index of the chosen option.
+        """
+        self.menu_result = self.policy.choose_menu_option(title, options) if options else None
+        return self.menu_result
+
+    def display_event(self, event_title, event_description):
+        """Record an event."""
+        self.events.append(event_title)
+
+    def display_notification(self, message):
+        """Record a notification if message recording is enabled."""
+        self.messages.append(message)
+
+    def display_character_sheet(self, character):
+        """Nothing to show."""
+
+    def display_game_status(self, game_year, player, actions, month=None, season=None):
+        """Let the policy pick an action from the status screen.
+
+        Returns:
+            The index of the chosen action, or the index of "Advance Year".
+        """
+        action = self.policy.choose_action(self.game_manager, actions)
+        if action is None:
+            action = "Advance Year"
+        self.menu_result = actions.index(action)
+        return self.menu_result
+
+    def display_start_screen(self):
+        """Always start a new game."""
+        return True
+
+@dataclass
+class YearRecord:
+    """The state of a headless run at the end of one simulated year."""
+    year: int
+    generation: int
+    name: str
+    role: str
+    age: int
+    action: Optional[str]
+    health: int
+    wealth: int
+    happiness: int
+    children: int
+    arcs_completed: int
+    alive: bool
+    events: List[str] = field(default_factory=list)
+    messages: List[str] = field(default_factory=list)
+
+@dataclass
+class LifeRecord:
+    """Summary of one character's life during a headless run."""
+    generation: int
+    name: str
+    role: str
+    start_age: int
+    end_age: int
+    peak_wealth: int
+    arcs_completed: int
+    children: int
+    heirs: int
+    died: bool
+
+@dataclass
+class SimulationTrace:
+    """The structured result of a headless run."""
+    years: List[YearRecord] = field(default_factory=list)
+    lives: List[LifeRecord] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, list]:
+        """Convert the trace to plain dictionaries and lists."""
+        return {
+            "years": [vars(record) for record in self.years],
+            "lives": [vars(record) for record in self.lives]
+        }
+
+class HeadlessSimulation:
+    """Runs a GameManager lifetime at full speed under a scripted policy."""
+
+    def __init__(self, policy=None, record_messages=False, seed=None, metrics=None, population_config=None):
+        """Initialize the headless simulation.
+
+        Args:
+            policy: The SimulationPolicy to use (defaults to SimulationPolicy()).
+            record_messages: Whether to keep plain messages in the trace.
+            seed: The root seed of the game's random streams (optional).
+            metrics: The Metrics to record the run in (optional).
+            population_config: The PopulationConfig of the game's NPCs (optional).
+        """
+        self.policy = policy or SimulationPolicy()
+        self.interface = HeadlessInterface(self.policy, record_messages)
+        self.game_manager = GameManager(self.interface, seed, metrics, population_config)
+        self.interface.game_manager = self.game_manager
+
+    def run(self, player_name, gender, role, max_years=100, follow_heirs=True):
+        """Simulate a lifetime, and optionally the lives of the heirs.
+
+        Args:
+            player_name: The player character's name.
+            gender: The player character's gender.
+            role: The player character's role.
+            max_years: The maximum number of years to simulate.
+            follow_heirs: Whether to continue as an heir after death.
+
+        Returns:
+            A SimulationTrace of the run.
+        """
+        game = self.game_manager
+        trace = SimulationTrace()
+
+        if not game.setup_new_game(player_name, gender, role):
+            return trace
+        self.interface.drain()
+
+        generation = 0
+        life = self._start_life(generation)
+
+        while game.game_running and len(trace.years) < max_years:
+            player = game.player
+
+            # Let the policy act before the year advances
+            action = self.policy.choose_action(game, game._get_available_actions())
+            if action is not None:
+                game._perform_action(action)
+
+            # Advance the year
+            if game.game_running and player.is_alive():
+                game._advance_year()
+
+            events, messages = self.interface.drain()
+            trace.years.append(YearRecord(
+                year=game.game_year,
+                generation=generation,
+                name=player.name,
+                role=player.role,
+                age=player.age,
+                action=action,
+                health=player.health,
+                wealth=player.wealth,
+                happiness=player.happiness,
+                children=len(player.children),
+                arcs_completed=len(getattr(player, "completed_arcs", [])),
+                alive=player.is_alive(),
+                events=events,
+                messages=messages
+            ))
+            life.peak_wealth = max(life.peak_wealth, player.wealth)
+
+            if not player.is_alive():
+                heirs = game._get_heirs()
+                self._end_life(life, player, len(heirs), died=True)
+                trace.lives.append(life)
+                life = None
+
+                if not heirs or not follow_heirs:
+                    game.game_running = False
+                    break
+
+                heir_idx = self.policy.choose_heir(game, heirs)
+                game._continue_as_heir(heirs[heir_idx])
+                self.interface.drain()
+                generation += 1
+                life = self._start_life(generation)
+
+        # Close the record of a life cut short by the year limit or by quitting
+        if life is not None:
+            self._end_life(life, game.player, len(game._get_heirs()), died=False)
+            trace.lives.append(life)
+
+        return trace
+
+    def _start_life(self, generation):
+        """Begin the life record for the current player.
+
+        Args:
+            generation: The generation number of the current player.
+
+        Returns:
+            A new LifeRecord.
+        """
+        player = self.game_manager.player
+        return LifeRecord(
+            generation=generation,
+            name=player.name,
+            role=player.role,
+            start_age=player.age,
+            end_age=player.age,
+            peak_wealth=player.wealth,
+            arcs_completed=0,
+            children=0,
+            heirs=0,
+            died=False
+        )
+
+    def _end_life(self, life, player, heirs, died):
+        """Fill in the final values of a life record.
+
+        Args:
+            life: The LifeRecord to complete.
+            player: The character whose life ended.
+            heirs: The number of eligible heirs.
+            died: Whether the character died.
+        """
+        life.end_age = player.age
+        life.peak_wealth = max(life.peak_wealth, player.wealth)
+        life.arcs_completed = len(getattr(player, "completed_arcs", []))
+        life.children = len(player.children)
+        life.heirs = heirs
+        life.died = died
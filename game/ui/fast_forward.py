@@ -0,0 +1,112 @@
+"""
+Fast Forward - Interface wrapper that resolves several years without stopping for the player
+"""
+
+def choose_first_option(title, options):
+    """Default choice policy: always pick the first option of a menu.
+
+    Args:
+        title: The menu title.
+        options: A list of options.
+
+    Returns:
+        The index of the chosen option.
+    """
+    return 0
+
+class FastForwardInterface:
+    """Stands in for the real interface while several years are skipped.
+
+    Messages, events and notifications are collected instead of shown, menus
+    are answered by a choice policy and text prompts are answered with an
+    empty string. Everything else is passed through to the wrapped interface.
+    """
+
+    def __init__(self, interface, choice_policy=None):
+        """Initialize the fast forward interface.
+
+        Args:
+            interface: The interface to wrap.
+            choice_policy: A callable taking a menu title and options and
+                returning the chosen index (defaults to choose_first_option).
+        """
+        self.interface = interface
+        self.choice_policy = choice_policy or choose_first_option
+        self.menu_result = None
+        self.events = []  # (title, description) of every event shown
+        self.decisions = []  # (question, chosen option) of every menu answered
+
+    def __getattr__(self, name):
+        """Pass anything not overridden here through to the wrapped interface."""
+        return getattr(self.interface, name)
+
+    def clear_screen(self):
+        """Nothing to clear."""
+
+    def display_message(self, message):
+        """Drop plain messages; the summary replaces them."""
+
+    def display_notification(self, message):
+        """Drop notifications; the summary replaces them."""
+
+    def get_input(self, prompt):
+        """Answer every text prompt with an empty string."""
+        return ""
+
+    def display_event(self, event_title, event_description):
+        """Collect an event for the summary."""
+        self.events.append((event_title, event_description))
+
+    def display_menu(self, title, options):
+        """Answer a menu with the choice policy.
+
+        Returns:
+            The index of the chosen option.
+        """
+        self.menu_result = self.choice_policy(title, options) if options else None
+        if self.menu_result is not None:
+            self.decisions.append((title, options[self.menu_result]))
+        return self.menu_result
+
+def summarize_fast_forward(start_year, end_year, start_stats, player, events, decisions):
+    """Build the summary text shown after a fast forward.
+
+    Args:
+        start_year: The year the fast forward started in.
+        end_year: The year it ended in.
+        start_stats: A dictionary of the player's health, wealth and children at the start.
+        player: The player character.
+        events: The (title, description) pairs collected during the fast forward.
+        decisions: The (question, chosen option) pairs made by the choice policy.
+
+    Returns:
+        The summary text.
+    """
+    lines = [f"{end_year - start_year} years pass ({start_year} - {end_year})."]
+
+    wealth_change = player.wealth - start_stats["wealth"]
+    health_change = player.health - start_stats["health"]
+    new_children = len(player.children) - start_stats["children"]
+    lines.append(f"Wealth: {player.wealth} ({wealth_change:+d})")
+    lines.append(f"Health: {player.health} ({health_change:+d})")
+    if new_children > 0:
+        lines.append(f"New children: {new_children}")
+
+    # Count each event title once, skipping the outcome screens of choices
+    counts = {}
+    for title, _ in events:
+        if title.startswith("Outcome: "):
+            continue
+        counts[title] = counts.get(title, 0) + 1
+
+    if counts:
+        lines.append("")
+        lines.append("Events:")
+        for title, count in sorted(counts.items(), key=lambda item: (-item[1], item[0])):
+            lines.append(f"- {title}" + (f" (x{count})" if count > 1 else ""))
+
+    if decisions:
+        lines.append("")
+        lines.append(f"Decisions made on your behalf: {len(decisions)}")
+
+    return "\n".join(lines)
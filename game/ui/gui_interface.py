@@ -2,16 +2,21 @@
 GUI Interface - Handles the graphical user interface for the game using Pygame
 """
 import os
-import time
 import pygame
 import pygame.freetype
 import random
+from game.ui.message_sink import MessageLog
+from game.ui.notifications import NotificationQueue
 
 class GUIInterface:
     """Graphical user interface for the game using Pygame."""
     
-    def __init__(self):
-        """Initialize the GUI interface."""
+    def __init__(self, notifications=True):
+        """Initialize the GUI interface.
+        
+        Args:
+            notifications: Whether to show toast notifications.
+        """
         pygame.init()
         
         # Screen dimensions
@@ -72,23 +77,16 @@ class GUIInterface:
         self.font_medium = pygame.freetype.SysFont("Times New Roman", 24)
         self.font_large = pygame.freetype.SysFont("Times New Roman", 32)
         self.font_title = pygame.freetype.SysFont("Times New Roman", 48)
+        self.font_notification = pygame.freetype.SysFont("Times New Roman", 20)
         
-        # Load background image
-        self.background = pygame.Surface((self.width, self.height))
-        self.background.fill(self.PARCHMENT)
-        
-        # Create a parchment texture effect
-        for i in range(2000):
-            x = random.randint(0, self.width)
-            y = random.randint(0, self.height)
-            radius = random.randint(1, 3)
-            shade = random.randint(0, 20)
-            color = (255 - shade, 252 - shade, 220 - shade)
-            pygame.draw.circle(self.background, color, (x, y), radius)
+        # Background image, built on first use (see the background property)
+        self._background = None
         
         # Message log
-        self.message_log = []
         self.max_messages = 10
+        self.message_log = MessageLog(self.max_messages)
+        self.last_redraw = 0  # Ticks of the last message log redraw
+        self.log_shown = False  # Whether the screen shows the message log, rather than e.g. an event
         
         # Input field
         self.input_text = ""
@@ -100,6 +98,11 @@ class GUIInterface:
         self.menu_active = False
         self.selected_option = 0
         
+        # Toast notifications drawn on top of the last frame
+        self.notifications = NotificationQueue(enabled=notifications)
+        self.frame = None
+        self.toast_visible = False
+        
         # Clock for controlling frame rate
         self.clock = pygame.time.Clock()
         self.fps = 60
@@ -111,10 +114,41 @@ class GUIInterface:
         self.input_result = None
         self.menu_result = None
     
+    @property
+    def background(self):
+        """The parchment background, built the first time it is drawn.
+        
+        The texture is drawn once on a small tile that is then repeated across
+        the screen, which costs a fraction of speckling the whole screen.
+        
+        Returns:
+            A surface the size of the screen.
+        """
+        if self._background is None:
+            tile_width, tile_height = 256, 192
+            tile = pygame.Surface((tile_width, tile_height))
+            tile.fill(self.PARCHMENT)
+            
+            # Create a parchment texture effect, as dense as the full-screen version
+            num_specks = 2000 * tile_width * tile_height // (self.width * self.height)
+            for i in range(num_specks):
+                x = random.randint(0, tile_width)
+                y = random.randint(0, tile_height)
+                radius = random.randint(1, 3)
+                shade = random.randint(0, 20)
+                color = (255 - shade, 252 - shade, 220 - shade)
+                pygame.draw.circle(tile, color, (x, y), radius)
+            
+            self._background = pygame.Surface((self.width, self.height))
+            for x in range(0, self.width, tile_width):
+                for y in range(0, self.height, tile_height):
+                    self._background.blit(tile, (x, y))
+        return self._background
+    
     def clear_screen(self):
         """Clear the screen."""
         self.screen.blit(self.background, (0, 0))
-        pygame.display.flip()
+        self._flip()
     
     def display_message(self, message):
         """Display a message on the screen.
@@ -122,13 +156,19 @@ class GUIInterface:
         Args:
             message: The message to display.
         """
-        # Add message to log
+        # Add message to log; it is drawn at most once per frame
         self.message_log.append(message)
-        if len(self.message_log) > self.max_messages:
-            self.message_log.pop(0)
+        self._request_redraw()
+    
+    def _request_redraw(self):
+        """Redraw the message log now, unless it was already redrawn this frame.
         
-        # Update display
-        self._update_display()
+        Messages that arrive within the same frame are drawn by the next
+        redraw, which happens at the latest in the next frame of any wait for
+        the player (see _pump_frame).
+        """
+        if pygame.time.get_ticks() - self.last_redraw >= 1000 // self.fps:
+            self._update_display()
     
     def get_input(self, prompt):
         """Get input from the user.
@@ -168,8 +208,6 @@ class GUIInterface:
         """
         # Add message to log
         self.message_log.append(f">>> {title}")
-        if len(self.message_log) > self.max_messages:
-            self.message_log.pop(0)
         
         # Set up menu
         self.menu_title = title
@@ -185,7 +223,7 @@ class GUIInterface:
         # Wait for menu selection
         while self.waiting_for_menu and self.running:
             self._handle_events()
-            self.clock.tick(self.fps)
+            self._pump_frame()
         
         # Clean up
         self.menu_active = False
@@ -279,7 +317,7 @@ class GUIInterface:
         self.font_medium.render_to(self.screen, (self.width // 2 - 30, self.height - 65), "Back", self.WHITE)
         
         # Update display
-        pygame.display.flip()
+        self._flip()
         
         # Wait for tab selection or back button
         waiting = True
@@ -309,7 +347,7 @@ class GUIInterface:
                         # Redraw the screen with the new active tab
                         self.display_character_sheet(character)
             
-            self.clock.tick(self.fps)
+            self._pump_frame()
     
     def _display_basic_info(self, character, content_rect):
         """Display basic character information.
@@ -641,6 +679,7 @@ class GUIInterface:
         self.menu_result = None
         while self.menu_result is None and self.running:
             self._handle_events()
+            self._pump_frame()
         
         return self.menu_result
     
@@ -723,7 +762,7 @@ class GUIInterface:
         self.font_medium.render_to(self.screen, (button_x, button_y), button_text, self.WHITE)
         
         # Update display
-        pygame.display.flip()
+        self._flip()
         
         # Wait for button click or key press
         waiting = True
@@ -739,14 +778,56 @@ class GUIInterface:
                     if event.key in (pygame.K_RETURN, pygame.K_SPACE, pygame.K_ESCAPE):
                         waiting = False
             
-            self.clock.tick(self.fps)
+            self._pump_frame()
     
     def display_notification(self, message):
-        """Display a notification message.
+        """Queue a toast notification and return immediately.
+        
+        The toast is drawn over the current screen while the game keeps
+        running, and fades out after its duration.
         
         Args:
             message: The notification message to display.
         """
+        self.notifications.push(message)
+        self._refresh_notifications()
+    
+    def _pump_frame(self):
+        """Finish one frame of a wait for the player.
+        
+        Draws the messages logged since the last redraw if the message log is
+        on screen, refreshes the toast and waits for the next frame.
+        """
+        if self.log_shown and self.message_log.dirty:
+            self._update_display()
+        else:
+            self._refresh_notifications()
+        self.clock.tick(self.fps)
+    
+    def _flip(self):
+        """Show the frame just drawn, with the current toast on top."""
+        self.log_shown = False
+        self.frame = self.screen.copy()
+        self._draw_notification()
+        pygame.display.flip()
+    
+    def _refresh_notifications(self):
+        """Redraw the last frame if a toast is on screen or has just gone."""
+        if not self.toast_visible and not self.notifications.is_active():
+            return
+        if self.frame is not None:
+            self.screen.blit(self.frame, (0, 0))
+        self._draw_notification()
+        pygame.display.flip()
+    
+    def _draw_notification(self):
+        """Draw the current toast, if any, at the top of the screen."""
+        toast = self.notifications.current()
+        self.toast_visible = toast is not None
+        if toast is None:
+            return
+        message, opacity = toast
+        
         # Create notification surface
         notification_width = min(len(message) * 12 + 40, self.width - 100)
         notification_height = 60
@@ -770,17 +851,14 @@ class GUIInterface:
                           (icon_radius + 10, notification_height // 2 + 10), 3)
         
         # Render message text with shadow for better readability
-        font = pygame.freetype.SysFont("Times New Roman", 20)
-        font.render_to(notification, (icon_radius * 2 + 12, notification_height // 2 - 10), message, self.BLACK)
-        font.render_to(notification, (icon_radius * 2 + 10, notification_height // 2 - 12), message, self.WHITE)
+        self.font_notification.render_to(notification, (icon_radius * 2 + 12, notification_height // 2 - 10), message, self.BLACK)
+        self.font_notification.render_to(notification, (icon_radius * 2 + 10, notification_height // 2 - 12), message, self.WHITE)
+        
+        # Fade out at the end of the toast's duration
+        notification.set_alpha(int(255 * opacity))
         
         # Display notification at the top of the screen
         self.screen.blit(notification, (self.width // 2 - notification_width // 2, 20))
-        pygame.display.update(pygame.Rect(self.width // 2 - notification_width // 2, 20, 
-                                         notification_width, notification_height))
-        
-        # Pause briefly
-        time.sleep(1.5)
     
     def display_start_screen(self):
         """Display the game start screen.
@@ -824,7 +902,7 @@ class GUIInterface:
         self.font_large.render_to(self.screen, (self.width // 2 - 50, start_y + button_spacing * 2 + 15), "Quit", self.WHITE)
         
         # Update display
-        pygame.display.flip()
+        self._flip()
         
         # Wait for button click
         waiting = True
@@ -860,7 +938,7 @@ class GUIInterface:
                         start_game = False
                         waiting = False
             
-            self.clock.tick(self.fps)
+            self._pump_frame()
         
         return start_game
     
@@ -951,7 +1029,10 @@ class GUIInterface:
                 y_pos += 35  # Increased spacing between options
         
         # Update display
-        pygame.display.flip()
+        self._flip()
+        self.log_shown = True
+        self.message_log.mark_clean()
+        self.last_redraw = pygame.time.get_ticks()
     
     def _handle_events(self):
         """Handle pygame events."""
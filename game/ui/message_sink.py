@@ -0,0 +1,68 @@
+"""
+Message Sink - Buffers messages for interfaces that draw them in batches, or drops them
+"""
+from collections import deque
+
+class MessageLog:
+    """Keeps the most recent messages and remembers whether they changed.
+
+    Interfaces append to the log as messages arrive and redraw it when they
+    next draw a frame, instead of redrawing once per message.
+    """
+
+    def __init__(self, max_messages=None):
+        """Initialize the message log.
+
+        Args:
+            max_messages: The most messages kept; older ones are dropped (optional,
+                unlimited if None).
+        """
+        self.messages = deque(maxlen=max_messages)
+        self.dirty = False  # Whether messages arrived since the log was last drawn
+
+    def append(self, message):
+        """Add a message.
+
+        Args:
+            message: The message to add.
+        """
+        self.messages.append(message)
+        self.dirty = True
+
+    def mark_clean(self):
+        """Record that the log has been drawn."""
+        self.dirty = False
+
+    def clear(self):
+        """Drop every message."""
+        self.messages.clear()
+        self.dirty = True
+
+    def __iter__(self):
+        return iter(self.messages)
+
+    def __len__(self):
+        return len(self.messages)
+
+class NullMessageSink:
+    """Message sink that drops everything, for headless and batch runs."""
+
+    dirty = False
+
+    def append(self, message):
+        """Drop a message."""
+
+    def mark_clean(self):
+        """Nothing to draw."""
+
+    def clear(self):
+        """Nothing to clear."""
+
+    def __iter__(self):
+        return iter(())
+
+    def __len__(self):
+        return 0
+
+# Shared sink for interfaces that keep no messages
+NULL_MESSAGE_SINK = NullMessageSink()
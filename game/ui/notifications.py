@@ -0,0 +1,88 @@
+"""
+Notifications - Timed queue of toast notifications that never block the game
+"""
+import time
+
+class Toast:
+    """A single notification waiting to be shown or on screen."""
+
+    def __init__(self, message, duration):
+        """Initialize a toast.
+
+        Args:
+            message: The notification message.
+            duration: How long the toast stays on screen, in seconds.
+        """
+        self.message = message
+        self.duration = duration
+        self.shown_at = None  # Set when the toast reaches the front of the queue
+
+class NotificationQueue:
+    """Queue of toasts shown one after another, each fading out at the end.
+
+    Pushing a toast returns immediately; the interface asks the queue for the
+    current toast and its opacity whenever it draws a frame.
+    """
+
+    def __init__(self, duration=1.5, fade_time=0.5, max_queued=5, enabled=True, clock=time.monotonic):
+        """Initialize the notification queue.
+
+        Args:
+            duration: The default time each toast stays on screen, in seconds.
+            fade_time: The time at the end of a toast's duration spent fading out.
+            max_queued: The most toasts kept waiting; the oldest are dropped beyond it.
+            enabled: Whether notifications are shown at all.
+            clock: The time source (defaults to time.monotonic).
+        """
+        self.duration = duration
+        self.fade_time = fade_time
+        self.max_queued = max_queued
+        self.enabled = enabled
+        self.clock = clock
+        self.toasts = []
+
+    def push(self, message, duration=None):
+        """Queue a notification without waiting for it to be shown.
+
+        Args:
+            message: The notification message.
+            duration: How long to show it (optional, defaults to the queue's duration).
+        """
+        if not self.enabled:
+            return
+        self.toasts.append(Toast(message, self.duration if duration is None else duration))
+
+        # Drop the oldest waiting toasts, never the one on screen
+        while len(self.toasts) > self.max_queued + 1:
+            del self.toasts[1]
+
+    def current(self):
+        """Get the toast to draw now, expiring finished ones.
+
+        Returns:
+            A tuple of (message, opacity from 0.0 to 1.0), or None if nothing is shown.
+        """
+        now = self.clock()
+        while self.toasts:
+            toast = self.toasts[0]
+            if toast.shown_at is None:
+                toast.shown_at = now
+
+            remaining = toast.shown_at + toast.duration - now
+            if remaining <= 0:
+                self.toasts.pop(0)
+                continue
+
+            opacity = 1.0
+            if self.fade_time > 0 and remaining < self.fade_time:
+                opacity = remaining / self.fade_time
+            return toast.message, opacity
+        return None
+
+    def is_active(self):
+        """Check whether any toast is on screen or waiting."""
+        return bool(self.toasts)
+
+    def clear(self):
+        """Drop every toast."""
+        self.toasts = []
@@ -2,14 +2,18 @@
 Text Interface - Handles the text-based user interface for the game
 """
 import os
-import time
 
 class TextInterface:
     """Text-based user interface for the game."""
     
-    def __init__(self):
-        """Initialize the text interface."""
+    def __init__(self, notifications=True):
+        """Initialize the text interface.
+        
+        Args:
+            notifications: Whether to print notifications.
+        """
         self.width = 80
+        self.notifications_enabled = notifications
         self.running = True
         self.game_manager = None
     
@@ -89,5 +93,5 @@ class TextInterface:
         Args:
             message: The notification message.
         """
-        self.display_message(f"\n>>> {message} <<<\n")
-        time.sleep(1.5)  # Pause briefly to let the user read the notification 
\ No newline at end of file
+        if self.notifications_enabled:
+            self.display_message(f"\n>>> {message} <<<\n") 
\ No newline at end of file
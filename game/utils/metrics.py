@@ -0,0 +1,166 @@
+"""
+Metrics - Counters and timers for the simulation core, exported as JSON lines or Prometheus text
+"""
+import json
+
+class Metrics:
+    """Collects labelled counters and timers.
+
+    A disabled instance ignores every call after a single attribute check, so
+    instrumented code can call it unconditionally. Hot loops can also check
+    ``enabled`` themselves to skip building labels.
+    """
+
+    def __init__(self, enabled=True):
+        """Initialize the metrics.
+
+        Args:
+            enabled: Whether to record anything.
+        """
+        self.enabled = enabled
+        self.counters = {}  # Maps (name, labels) to a count
+        self.timers = {}  # Maps (name, labels) to [observations, total seconds]
+
+    def increment(self, name, amount=1, **labels):
+        """Add to a counter.
+
+        Args:
+            name: The counter name (e.g., 'npc_deaths_total').
+            amount: The amount to add.
+            **labels: Label names and values distinguishing the series.
+        """
+        if not self.enabled:
+            return
+        key = (name, tuple(sorted(labels.items())))
+        self.counters[key] = self.counters.get(key, 0) + amount
+
+    def observe_time(self, name, seconds, **labels):
+        """Record a duration.
+
+        Args:
+            name: The timer name (e.g., 'year_phase_seconds').
+            seconds: The duration in seconds.
+            **labels: Label names and values distinguishing the series.
+        """
+        if not self.enabled:
+            return
+        key = (name, tuple(sorted(labels.items())))
+        timer = self.timers.get(key)
+        if timer is None:
+            self.timers[key] = [1, seconds]
+        else:
+            timer[0] += 1
+            timer[1] += seconds
+
+    def get_count(self, name, **labels):
+        """Get the value of a counter, or 0 if it was never incremented."""
+        return self.counters.get((name, tuple(sorted(labels.items()))), 0)
+
+    def merge(self, other):
+        """Add the values of another Metrics instance to this one.
+
+        Args:
+            other: The Metrics to merge in.
+        """
+        for key, value in other.counters.items():
+            self.counters[key] = self.counters.get(key, 0) + value
+        for key, (count, total) in other.timers.items():
+            timer = self.timers.setdefault(key, [0, 0.0])
+            timer[0] += count
+            timer[1] += total
+
+    def reset(self):
+        """Clear every counter and timer."""
+        self.counters = {}
+        self.timers = {}
+
+    def samples(self):
+        """List every series as a plain dictionary.
+
+        Returns:
+            A list of dictionaries with the name, type, labels and values of each series.
+        """
+        samples = []
+        for (name, labels), value in sorted(self.counters.items()):
+            samples.append({"name": name, "type": "counter", "labels": dict(labels), "value": value})
+        for (name, labels), (count, total) in sorted(self.timers.items()):
+            samples.append({"name": name, "type": "timer", "labels": dict(labels),
+                            "count": count, "sum": total})
+        return samples
+
+    def to_json_lines(self, **context):
+        """Format every series as one JSON object per line.
+
+        Args:
+            **context: Extra fields added to every line (e.g., seed or year).
+
+        Returns:
+            The JSON lines as a string.
+        """
+        lines = []
+        for sample in self.samples():
+            sample.update(context)
+            lines.append(json.dumps(sample, sort_keys=True))
+        return "".join(line + "\n" for line in lines)
+
+    def to_prometheus(self, namespace="simgame"):
+        """Format every series in the Prometheus text exposition format.
+
+        Counters are exported as counters and timers as summaries with
+        ``_count`` and ``_sum`` series.
+
+        Args:
+            namespace: The prefix added to every metric name.
+
+        Returns:
+            The exposition text as a string.
+        """
+        lines = []
+        declared = set()
+        for sample in self.samples():
+            name = f"{namespace}_{sample['name']}" if namespace else sample["name"]
+            kind = "counter" if sample["type"] == "counter" else "summary"
+            if name not in declared:
+                lines.append(f"# TYPE {name} {kind}")
+                declared.add(name)
+
+            labels = _format_labels(sample["labels"])
+            if sample["type"] == "counter":
+                lines.append(f"{name}{labels} {sample['value']}")
+            else:
+                lines.append(f"{name}_count{labels} {sample['count']}")
+                lines.append(f"{name}_sum{labels} {sample['sum']}")
+        return "".join(line + "\n" for line in lines)
+
+    def write_json_lines(self, path, **context):
+        """Append every series to a JSON lines file.
+
+        Args:
+            path: The file to append to.
+            **context: Extra fields added to every line.
+        """
+        with open(path, "a") as f:
+            f.write(self.to_json_lines(**context))
+
+    def write_prometheus(self, path, namespace="simgame"):
+        """Write every series to a Prometheus text file, replacing its contents.
+
+        Args:
+            path: The file to write.
+            namespace: The prefix added to every metric name.
+        """
+        with open(path, "w") as f:
+            f.write(self.to_prometheus(namespace))
+
+def _format_labels(labels):
+    """Format a label dictionary as a Prometheus label set."""
+    if not labels:
+        return ""
+    parts = []
+    for key, value in sorted(labels.items()):
+        value = str(value).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+        parts.append(f'{key}="{value}"')
+    return "{" + ",".join(parts) + "}"
+
+# Shared disabled instance used when no metrics are wanted
+NULL_METRICS = Metrics(enabled=False)
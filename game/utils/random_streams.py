@@ -0,0 +1,49 @@
+"""
+Random Streams - Independent, reproducible random generators for each subsystem
+"""
+import hashlib
+import random
+
+class RandomStreams:
+    """Spawns named random generators from a single root seed.
+
+    Each stream is seeded from a hash of the root seed and the stream name, so
+    streams are independent of each other and of the order they are created in,
+    and the same root seed always replays the same run.
+    """
+
+    def __init__(self, seed=None):
+        """Initialize the random streams.
+
+        Args:
+            seed: The root seed (optional, a random one is drawn if None).
+        """
+        if seed is None:
+            seed = random.SystemRandom().getrandbits(64)
+        self.seed = seed
+        self.streams = {}
+
+    def get(self, name):
+        """Get the generator for a named stream, creating it on first use.
+
+        Args:
+            name: The name of the stream (e.g., 'events', 'npcs').
+
+        Returns:
+            A random.Random instance owned by that stream.
+        """
+        if name not in self.streams:
+            self.streams[name] = random.Random(self.derive_seed(name))
+        return self.streams[name]
+
+    def derive_seed(self, name):
+        """Derive the seed of a named stream from the root seed.
+
+        Args:
+            name: The name of the stream.
+
+        Returns:
+            An integer seed.
+        """
+        digest = hashlib.sha256(f"{self.seed}:{name}".encode("utf-8")).digest()
+        return int.from_bytes(digest[:16], "big")
@@ -6,8 +6,14 @@ import random
 class World:
     """Represents the game world."""
     
-    def __init__(self):
-        """Initialize the game world."""
+    def __init__(self, rng=None):
+        """Initialize the game world.
+        
+        Args:
+            rng: The random generator for the world (optional, defaults to
+                the global random module).
+        """
+        self.rng = rng or random
         self.kingdoms = []
         self.settlements = []
         self.resources = {}
@@ -20,7 +26,7 @@ class World:
         # Create kingdoms
         kingdom_names = ["Westria", "Eastmark", "Northland", "Southvale", "Midreach"]
         for name in kingdom_names:
-            self.kingdoms.append(Kingdom(name))
+            self.kingdoms.append(Kingdom(name, self.rng))
         
         # Create settlements
         settlement_types = ["city", "town", "village", "hamlet", "castle"]
@@ -32,17 +38,17 @@ class World:
         
         for i in range(15):
             name = settlement_names[i]
-            settlement_type = random.choice(settlement_types)
-            kingdom = random.choice(self.kingdoms)
+            settlement_type = self.rng.choice(settlement_types)
+            kingdom = self.rng.choice(self.kingdoms)
             
-            settlement = Settlement(name, settlement_type, kingdom)
+            settlement = Settlement(name, settlement_type, kingdom, self.rng)
             self.settlements.append(settlement)
             kingdom.add_settlement(settlement)
         
         # Generate resources
         resource_types = ["food", "wood", "stone", "iron", "gold", "cloth"]
         for resource_type in resource_types:
-            self.resources[resource_type] = random.randint(1000, 5000)
+            self.resources[resource_type] = self.rng.randint(1000, 5000)
     
     def get_kingdom_by_name(self, name):
         """Get a kingdom by name.
@@ -72,37 +78,46 @@ class World:
                 return settlement
         return None
     
-    def update_for_new_year(self):
-        """Update the world for a new year."""
+    def update_for_new_year(self, npc_counts=None):
+        """Update the world for a new year.
+        
+        Args:
+            npc_counts: A dictionary mapping settlement names to the number of
+                NPCs living there (optional).
+        """
+        npc_counts = npc_counts or {}
+        
         # Update kingdoms
         for kingdom in self.kingdoms:
             kingdom.update_for_new_year()
         
         # Update settlements
         for settlement in self.settlements:
-            settlement.update_for_new_year()
+            settlement.update_for_new_year(npc_counts.get(settlement.name, 0))
         
         # Update resources
         for resource_type in self.resources:
             # Random fluctuation in resources
-            change = random.randint(-500, 1000)
+            change = self.rng.randint(-500, 1000)
             self.resources[resource_type] = max(0, self.resources[resource_type] + change)
 
 class Kingdom:
     """Represents a kingdom in the game world."""
     
-    def __init__(self, name):
+    def __init__(self, name, rng=None):
         """Initialize a new kingdom.
         
         Args:
             name: The name of the kingdom.
+            rng: The random generator for the kingdom (optional).
         """
         self.name = name
+        self.rng = rng or random
         self.ruler = None
         self.settlements = []
-        self.wealth = random.randint(5000, 20000)
-        self.military_strength = random.randint(1000, 5000)
-        self.stability = random.randint(50, 100)
+        self.wealth = self.rng.randint(5000, 20000)
+        self.military_strength = self.rng.randint(1000, 5000)
+        self.stability = self.rng.randint(50, 100)
         self.relations = {}  # Other kingdoms -> relation value (-100 to 100)
     
     def add_settlement(self, settlement):
@@ -116,9 +131,9 @@ class Kingdom:
     def update_for_new_year(self):
         """Update the kingdom for a new year."""
         # Random events and changes
-        self.wealth += random.randint(-1000, 2000)
-        self.military_strength += random.randint(-200, 500)
-        self.stability += random.randint(-10, 5)
+        self.wealth += self.rng.randint(-1000, 2000)
+        self.military_strength += self.rng.randint(-200, 500)
+        self.stability += self.rng.randint(-10, 5)
         
         # Ensure values stay within bounds
         self.wealth = max(0, self.wealth)
@@ -127,56 +142,59 @@ class Kingdom:
         
         # Update relations with other kingdoms
         for kingdom, relation in self.relations.items():
-            change = random.randint(-5, 5)
+            change = self.rng.randint(-5, 5)
             self.relations[kingdom] = max(-100, min(100, relation + change))
 
 class Settlement:
     """Represents a settlement in the game world."""
     
-    def __init__(self, name, settlement_type, kingdom):
+    def __init__(self, name, settlement_type, kingdom, rng=None):
         """Initialize a new settlement.
         
         Args:
             name: The name of the settlement.
             settlement_type: The type of settlement (e.g., 'city', 'town').
             kingdom: The kingdom the settlement belongs to.
+            rng: The random generator for the settlement (optional).
         """
         self.name = name
+        self.rng = rng or random
         self.type = settlement_type
         self.kingdom = kingdom
         self.population = self._initial_population()
+        self.npc_count = 0  # Named NPCs living here, kept by the NPC manager
         self.wealth = self._initial_wealth()
         self.buildings = self._initial_buildings()
     
     def _initial_population(self):
         """Determine the initial population based on settlement type."""
         if self.type == "city":
-            return random.randint(5000, 10000)
+            return self.rng.randint(5000, 10000)
         elif self.type == "town":
-            return random.randint(1000, 5000)
+            return self.rng.randint(1000, 5000)
         elif self.type == "village":
-            return random.randint(200, 1000)
+            return self.rng.randint(200, 1000)
         elif self.type == "hamlet":
-            return random.randint(50, 200)
+            return self.rng.randint(50, 200)
         elif self.type == "castle":
-            return random.randint(100, 500)
+            return self.rng.randint(100, 500)
         else:
-            return random.randint(50, 100)
+            return self.rng.randint(50, 100)
     
     def _initial_wealth(self):
         """Determine the initial wealth based on settlement type."""
         if self.type == "city":
-            return random.randint(5000, 10000)
+            return self.rng.randint(5000, 10000)
         elif self.type == "town":
-            return random.randint(1000, 5000)
+            return self.rng.randint(1000, 5000)
         elif self.type == "village":
-            return random.randint(200, 1000)
+            return self.rng.randint(200, 1000)
         elif self.type == "hamlet":
-            return random.randint(50, 200)
+            return self.rng.randint(50, 200)
         elif self.type == "castle":
-            return random.randint(1000, 3000)
+            return self.rng.randint(1000, 3000)
         else:
-            return random.randint(50, 100)
+            return self.rng.randint(50, 100)
     
     def _initial_buildings(self):
         """Determine the initial buildings based on settlement type."""
@@ -187,46 +205,52 @@ class Settlement:
         
         # Type-specific buildings
         if self.type == "city":
-            buildings["market"] = random.randint(3, 5)
-            buildings["church"] = random.randint(2, 4)
-            buildings["tavern"] = random.randint(5, 10)
-            buildings["blacksmith"] = random.randint(3, 6)
-            buildings["barracks"] = random.randint(1, 3)
+            buildings["market"] = self.rng.randint(3, 5)
+            buildings["church"] = self.rng.randint(2, 4)
+            buildings["tavern"] = self.rng.randint(5, 10)
+            buildings["blacksmith"] = self.rng.randint(3, 6)
+            buildings["barracks"] = self.rng.randint(1, 3)
         elif self.type == "town":
-            buildings["market"] = random.randint(1, 3)
-            buildings["church"] = random.randint(1, 2)
-            buildings["tavern"] = random.randint(2, 5)
-            buildings["blacksmith"] = random.randint(1, 3)
-            buildings["barracks"] = random.randint(0, 1)
+            buildings["market"] = self.rng.randint(1, 3)
+            buildings["church"] = self.rng.randint(1, 2)
+            buildings["tavern"] = self.rng.randint(2, 5)
+            buildings["blacksmith"] = self.rng.randint(1, 3)
+            buildings["barracks"] = self.rng.randint(0, 1)
         elif self.type == "village":
-            buildings["market"] = random.randint(0, 1)
+            buildings["market"] = self.rng.randint(0, 1)
             buildings["church"] = 1
-            buildings["tavern"] = random.randint(1, 2)
+            buildings["tavern"] = self.rng.randint(1, 2)
             buildings["blacksmith"] = 1
         elif self.type == "hamlet":
-            buildings["church"] = random.randint(0, 1)
+            buildings["church"] = self.rng.randint(0, 1)
             buildings["tavern"] = 1
         elif self.type == "castle":
-            buildings["barracks"] = random.randint(2, 4)
+            buildings["barracks"] = self.rng.randint(2, 4)
             buildings["church"] = 1
             buildings["blacksmith"] = 1
         
         return buildings
     
-    def update_for_new_year(self):
-        """Update the settlement for a new year."""
-        # Population growth
-        growth_rate = random.uniform(-0.05, 0.1)  # -5% to 10% growth
-        self.population = int(self.population * (1 + growth_rate))
+    def update_for_new_year(self, npc_count=0):
+        """Update the settlement for a new year.
+        
+        Args:
+            npc_count: The number of named NPCs living in the settlement.
+        """
+        self.npc_count = npc_count
+        
+        # Population growth, never below the named NPCs living here
+        growth_rate = self.rng.uniform(-0.05, 0.1)  # -5% to 10% growth
+        self.population = max(npc_count, int(self.population * (1 + growth_rate)))
         
         # Wealth changes
-        wealth_change = random.uniform(-0.1, 0.2)  # -10% to 20% change
+        wealth_change = self.rng.uniform(-0.1, 0.2)  # -10% to 20% change
         self.wealth = int(self.wealth * (1 + wealth_change))
         
         # Update buildings
-        if random.random() < 0.2:  # 20% chance of new building
+        if self.rng.random() < 0.2:  # 20% chance of new building
             building_types = ["houses", "market", "church", "tavern", "blacksmith", "barracks"]
-            building_type = random.choice(building_types)
+            building_type = self.rng.choice(building_types)
             
             if building_type in self.buildings:
                 self.buildings[building_type] += 1
@@ -2,15 +2,14 @@
 """
 Medieval Life Simulator - A medieval life simulation game with a graphical interface
 """
-import os
 import sys
-import time
-import random
 from game.game_manager import GameManager
-from game.ui.gui_interface import GUIInterface
 
 def main():
     """Main entry point for the game."""
+    # Import the GUI here so that importing this module does not load pygame
+    from game.ui.gui_interface import GUIInterface
+    
     # Initialize the game with GUI interface
     interface = GUIInterface()
     
@@ -0,0 +1,38 @@
+"""
+Tests for the Monte Carlo campaign runner
+"""
+from game.simulation.campaign import SummaryStats, make_shards, run_campaign
+
+ROLES = ["merchant", "farmer"]
+
+def campaign(workers, seed=0, shard_size=None):
+    results = run_campaign(4, ROLES, workers=workers, seed=seed, max_years=15, shard_size=shard_size)
+    return {role: stats.to_dict() for role, stats in results.items()}
+
+def test_results_do_not_depend_on_the_workers():
+    expected = campaign(1)
+    assert [expected[role]["runs"] for role in ROLES] == [4, 4]
+    assert campaign(3) == expected
+    assert campaign(2, shard_size=1) == expected
+    assert campaign(1, shard_size=3) == expected
+
+def test_seeds_give_different_campaigns():
+    assert campaign(1, seed=1) != campaign(1, seed=2)
+
+def test_shards_cover_every_run_once():
+    shards = make_shards(7, ROLES, seed=0, max_years=10, shard_size=3)
+    assert [(shard.role, shard.start, shard.count) for shard in shards] == [
+        ("merchant", 0, 3), ("merchant", 3, 3), ("merchant", 6, 1),
+        ("farmer", 0, 3), ("farmer", 3, 3), ("farmer", 6, 1)]
+
+def test_merged_statistics_match_adding_every_value():
+    values = [5, 3, 9, 1, 7]
+    whole = SummaryStats()
+    first, second, empty = SummaryStats(), SummaryStats(), SummaryStats()
+    for index, value in enumerate(values):
+        whole.add(value)
+        (first if index < 2 else second).add(value)
+    first.merge(empty)
+    first.merge(second)
+    assert first == whole
+    assert whole.to_dict() == {"count": 5, "mean": 5.0, "min": 1, "max": 9}
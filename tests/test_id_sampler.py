@@ -0,0 +1,76 @@
+"""
+Tests for drawing random IDs from a changing set
+"""
+import random
+from collections import Counter
+
+import pytest
+
+from game.characters.id_sampler import IDSampler
+
+def make_sampler(ids):
+    sampler = IDSampler()
+    for item_id in ids:
+        sampler.add(item_id)
+    return sampler
+
+def test_add_and_discard_keep_the_array_dense():
+    sampler = make_sampler(range(10))
+    sampler.add(3)
+    assert len(sampler) == 10
+    for item_id in (0, 9, 4, 42):
+        sampler.discard(item_id)
+    assert len(sampler) == 7 and 4 not in sampler and 5 in sampler
+    assert sorted(sampler.ids) == [1, 2, 3, 5, 6, 7, 8]
+    assert all(sampler.ids[position] == item_id for item_id, position in sampler.positions.items())
+
+def test_removed_ids_are_never_drawn():
+    sampler = make_sampler(range(100))
+    for item_id in range(0, 100, 2):
+        sampler.discard(item_id)
+    rng = random.Random(1)
+    for _ in range(200):
+        drawn = sampler.sample(rng, 10)
+        assert len(drawn) == len(set(drawn)) == 10
+        assert all(item_id % 2 for item_id in drawn)
+
+def test_draws_are_uniform():
+    sampler = make_sampler(range(20))
+    sampler.discard(7)
+    rng = random.Random(2)
+    counts = Counter()
+    for _ in range(20000):
+        counts.update(sampler.sample(rng, 3, exclude={11}))
+    assert set(counts) == set(range(20)) - {7, 11}
+    for count in counts.values():
+        assert count / 20000 == pytest.approx(3 / 18, abs=0.015)
+
+@pytest.mark.parametrize("k", [5, 10])
+def test_taking_every_id_gives_a_random_order(k):
+    sampler = make_sampler(range(5))
+    rng = random.Random(3)
+    firsts = Counter()
+    for _ in range(5000):
+        drawn = sampler.sample(rng, k)
+        assert sorted(drawn) == [0, 1, 2, 3, 4]
+        firsts[drawn[0]] += 1
+    for count in firsts.values():
+        assert count / 5000 == pytest.approx(0.2, abs=0.03)
+
+def test_mostly_excluded_sets_are_still_uniform():
+    sampler = make_sampler(range(100))
+    rng = random.Random(4)
+    counts = Counter()
+    for _ in range(10000):
+        counts.update(sampler.sample(rng, 2, exclude=set(range(90))))
+    assert set(counts) == set(range(90, 100))
+    for count in counts.values():
+        assert count / 10000 == pytest.approx(0.2, abs=0.03)
+
+def test_accept_filters_draws():
+    sampler = make_sampler(range(50))
+    drawn = sampler.sample(random.Random(5), 5, accept=lambda item_id: item_id < 10, max_draws=1000)
+    assert len(drawn) == 5 and all(item_id < 10 for item_id in drawn)
+    assert sampler.sample(random.Random(5), 5, accept=lambda item_id: False, max_draws=30) == []
+    with pytest.raises(ValueError):
+        sampler.sample(random.Random(5), 5, accept=lambda item_id: True)
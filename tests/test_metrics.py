@@ -0,0 +1,89 @@
+"""
+Tests for the simulation metrics and their JSON lines and Prometheus exports
+"""
+import json
+
+from game.simulation import HeadlessSimulation, RandomPolicy
+from game.utils.metrics import Metrics, NULL_METRICS
+
+def make_metrics():
+    metrics = Metrics()
+    metrics.increment("npc_deaths_total", role="farmer")
+    metrics.increment("npc_deaths_total", 2, role="farmer")
+    metrics.increment("npc_deaths_total", role="noble")
+    metrics.increment("years_total")
+    metrics.observe_time("year_phase_seconds", 0.25, phase="npcs")
+    metrics.observe_time("year_phase_seconds", 0.5, phase="npcs")
+    return metrics
+
+def test_counters_and_timers_are_labelled():
+    metrics = make_metrics()
+    assert metrics.get_count("npc_deaths_total", role="farmer") == 3
+    assert metrics.get_count("npc_deaths_total", role="knight") == 0
+    assert metrics.timers[("year_phase_seconds", (("phase", "npcs"),))] == [2, 0.75]
+
+    other = Metrics()
+    other.increment("years_total", 4)
+    other.observe_time("year_phase_seconds", 0.25, phase="npcs")
+    metrics.merge(other)
+    assert metrics.get_count("years_total") == 5
+    assert metrics.timers[("year_phase_seconds", (("phase", "npcs"),))] == [3, 1.0]
+
+    metrics.reset()
+    assert metrics.samples() == []
+
+def test_disabled_metrics_record_nothing():
+    metrics = Metrics(enabled=False)
+    metrics.increment("years_total")
+    metrics.observe_time("year_phase_seconds", 1.0, phase="npcs")
+    assert metrics.samples() == [] and NULL_METRICS.samples() == []
+
+def test_json_lines_export():
+    lines = make_metrics().to_json_lines(seed=7).splitlines()
+    samples = [json.loads(line) for line in lines]
+    assert samples == [
+        {"name": "npc_deaths_total", "type": "counter", "labels": {"role": "farmer"}, "value": 3, "seed": 7},
+        {"name": "npc_deaths_total", "type": "counter", "labels": {"role": "noble"}, "value": 1, "seed": 7},
+        {"name": "years_total", "type": "counter", "labels": {}, "value": 1, "seed": 7},
+        {"name": "year_phase_seconds", "type": "timer", "labels": {"phase": "npcs"}, "count": 2, "sum": 0.75,
+         "seed": 7}
+    ]
+
+def test_prometheus_export():
+    metrics = make_metrics()
+    metrics.increment("events_total", event='The "Great" Fire\\Flood')
+    assert metrics.to_prometheus().splitlines() == [
+        "# TYPE simgame_events_total counter",
+        'simgame_events_total{event="The \\"Great\\" Fire\\\\Flood"} 1',
+        "# TYPE simgame_npc_deaths_total counter",
+        'simgame_npc_deaths_total{role="farmer"} 3',
+        'simgame_npc_deaths_total{role="noble"} 1',
+        "# TYPE simgame_years_total counter",
+        "simgame_years_total 1",
+        "# TYPE simgame_year_phase_seconds summary",
+        'simgame_year_phase_seconds_count{phase="npcs"} 2',
+        'simgame_year_phase_seconds_sum{phase="npcs"} 0.75'
+    ]
+    assert metrics.to_prometheus(namespace="").startswith("# TYPE events_total counter\n")
+
+def test_exports_are_written_to_files(tmp_path):
+    metrics = make_metrics()
+    path = tmp_path / "metrics.jsonl"
+    metrics.write_json_lines(path, run=1)
+    metrics.write_json_lines(path, run=2)
+    assert [json.loads(line)["run"] for line in path.read_text().splitlines()] == [1] * 4 + [2] * 4
+
+    path = tmp_path / "metrics.prom"
+    metrics.write_prometheus(path)
+    metrics.write_prometheus(path)
+    assert path.read_text() == metrics.to_prometheus()
+
+def test_a_game_records_its_years():
+    metrics = Metrics()
+    simulation = HeadlessSimulation(RandomPolicy(seed=2), seed=2, metrics=metrics)
+    trace = simulation.run("Aldric", "male", "merchant", max_years=10, follow_heirs=False)
+    years = metrics.get_count("years_total")
+    assert years == len(trace.to_dict()["years"]) > 0
+    phases = {sample["labels"]["phase"]: sample["count"] for sample in metrics.samples()
+              if sample["name"] == "year_phase_seconds"}
+    assert phases["events"] == years
@@ -0,0 +1,31 @@
+"""
+Tests for the archive of dead NPCs
+"""
+import pytest
+
+from game.characters.npc_archive import NPCArchive
+
+def test_entries_are_found_by_serial():
+    archive = NPCArchive(first_serial=100)
+    archive.append(105, "Edmund", "male", "farmer", 1100, 1160, kin_serials=(101, 103))
+    archive.append(101, "Matilda", "female", "noble", 1090, 1150)
+    archive.append(130, "Edmund", "male", "merchant", 1120, 1170, kin_serials=(105,))
+
+    assert len(archive) == 3
+    assert archive.get(105) == {"serial": 105, "name": "Edmund", "gender": "male", "role": "farmer",
+                                "birth_year": 1100, "death_year": 1160, "kin": [101, 103]}
+    assert archive.get(101)["kin"] == [] and archive.get_kin(130) == [105]
+    assert archive.strings.count("Edmund") == 1
+
+    # Serials never archived, including ones outside the index, are not found
+    for serial in (99, 100, 102, 129, 131, 10 ** 6):
+        assert serial not in archive
+        assert archive.get(serial) is None and archive.get_kin(serial) == []
+
+def test_serials_below_the_first_are_rejected():
+    archive = NPCArchive(first_serial=10)
+    with pytest.raises(ValueError):
+        archive.append(9, "Hugh", "male", "warrior", 1100, 1130)
+    assert len(archive) == 0 and archive.get(9) is None
+    assert archive.append(10, "Hugh", "male", "warrior", 1100, 1130) == 0
+    assert archive.get(10)["name"] == "Hugh"
@@ -0,0 +1,60 @@
+"""
+Tests for configurable NPC populations and bulk cohort generation
+"""
+from game.characters.npc_manager import PopulationConfig
+from game.simulation import HeadlessSimulation, RandomPolicy
+
+def make_game(seed=5, **config):
+    """Set up a seeded game with a configured population."""
+    simulation = HeadlessSimulation(RandomPolicy(seed=seed), seed=seed, population_config=PopulationConfig(**config))
+    game_manager = simulation.game_manager
+    game_manager.setup_new_game("Aldric", "male", "merchant")
+    return game_manager
+
+def test_cohort_keeps_fixed_constraints():
+    npc_manager = make_game(target_npcs=10).npc_manager
+    cohort = npc_manager.generate_npcs(50, gender="female", role="farmer", age_min=20, age_max=30,
+                                       location="Elsewhere", marital_status="widowed")
+    assert len(cohort) == 50
+    for npc_id, npc in cohort:
+        assert (npc.gender, npc.role, npc.marital_status) == ("female", "farmer", "widowed")
+        assert 20 <= npc.age <= 30
+        assert npc_manager.npc_locations[npc_id] == "Elsewhere"
+        assert npc_manager.npcs[npc_id] is npc
+    assert npc_manager.generate_npcs(0) == []
+
+def test_cohort_draws_valid_npcs():
+    game_manager = make_game(target_npcs=10)
+    npc_manager = game_manager.npc_manager
+    cohort = npc_manager.generate_npcs(500)
+    settlements = {settlement.name for settlement in game_manager.world.settlements}
+    constraints = game_manager.historical_constraints
+    for npc_id, npc in cohort:
+        assert npc.role in constraints.get_allowed_roles(npc.gender)
+        assert npc_manager.npc_locations[npc_id] in settlements
+    assert len({npc_id for npc_id, _ in cohort}) == len(cohort)
+    assert len({npc.serial for _, npc in cohort}) == len(cohort)
+    assert len({npc.gender for _, npc in cohort}) == 2
+
+def test_population_follows_the_configured_target():
+    game_manager = make_game(target_npcs=300)
+    npc_manager = game_manager.npc_manager
+    assert len(npc_manager.npcs) == 300
+    for _ in range(20):
+        npc_manager.update_for_new_year()
+        assert len(npc_manager.npcs) == 300
+    assert len(npc_manager.archive) > 0
+    assert npc_manager.next_serial == 301 + len(npc_manager.archive)  # The dead were replaced
+
+def test_density_scales_with_settlements():
+    game_manager = make_game(npcs_per_settlement=4)
+    expected = round(4 * len(game_manager.world.settlements))
+    assert game_manager.npc_manager.target_npc_count == expected
+    assert len(game_manager.npc_manager.npcs) == expected
+
+def test_target_wins_over_density():
+    config = PopulationConfig(target_npcs=7, npcs_per_settlement=100)
+    assert config.target_for(None) == 7
+    assert not config.is_default()
+    assert PopulationConfig().is_default()
+    assert PopulationConfig(npcs_per_settlement=3).target_for(None) == PopulationConfig().target_for(None)
@@ -0,0 +1,70 @@
+"""
+Tests for the secondary indexes of NPCs by role, location, gender, marital status and age
+"""
+import itertools
+
+from game.characters.npc_manager import PopulationConfig
+from game.simulation import HeadlessSimulation, RandomPolicy
+
+def make_npc_manager(years=20):
+    """Run a seeded game for some years, so NPCs have died, moved, married and changed role."""
+    simulation = HeadlessSimulation(RandomPolicy(seed=3), seed=3, population_config=PopulationConfig(target_npcs=400))
+    game_manager = simulation.game_manager
+    game_manager.setup_new_game("Aldric", "male", "merchant")
+    for _ in range(years):
+        game_manager.npc_manager.update_for_new_year()
+    return game_manager.npc_manager
+
+def brute_force(npc_manager, role=None, location=None, gender=None, marital_status=None,
+                age_min=None, age_max=None, exclude_ids=()):
+    """Find matching NPCs by checking every one."""
+    return [(npc_id, npc) for npc_id, npc in sorted(npc_manager.npcs.items())
+            if (role is None or npc.role == role)
+            and (location is None or npc_manager.npc_locations[npc_id] == location)
+            and (gender is None or npc.gender == gender)
+            and (marital_status is None or npc.marital_status == marital_status)
+            and (age_min is None or npc.age >= age_min)
+            and (age_max is None or npc.age <= age_max)
+            and npc_id not in exclude_ids]
+
+def test_indexes_match_the_npcs():
+    npc_manager = make_npc_manager()
+    assert len(npc_manager.archive) > 0  # Some NPCs died along the way
+    for index, value_of in ((npc_manager.role_index, lambda npc_id, npc: npc.role),
+                            (npc_manager.location_index, lambda npc_id, npc: npc_manager.npc_locations[npc_id]),
+                            (npc_manager.gender_index, lambda npc_id, npc: npc.gender),
+                            (npc_manager.marital_status_index, lambda npc_id, npc: npc.marital_status),
+                            (npc_manager.cohort_index, lambda npc_id, npc: npc.age - npc_manager.years_passed)):
+        expected = {}
+        for npc_id, npc in npc_manager.npcs.items():
+            expected.setdefault(value_of(npc_id, npc), set()).add(npc_id)
+        assert index == expected
+
+def test_find_npcs_matches_checking_every_npc():
+    npc_manager = make_npc_manager()
+    location = npc_manager.npc_locations[min(npc_manager.npcs)]
+    exclude_ids = set(sorted(npc_manager.npcs)[::7])
+    for role, place, gender, marital_status, (age_min, age_max) in itertools.product(
+            (None, "farmer", "noble"), (None, location), (None, "female"), (None, "married"),
+            ((None, None), (30, None), (None, 25), (20, 40))):
+        filters = dict(role=role, location=place, gender=gender, marital_status=marital_status,
+                       age_min=age_min, age_max=age_max)
+        assert npc_manager.find_npcs(**filters) == brute_force(npc_manager, **filters)
+        assert (npc_manager.find_npcs(exclude_ids=exclude_ids, **filters)
+                == brute_force(npc_manager, exclude_ids=exclude_ids, **filters))
+
+def test_setters_and_removal_keep_the_indexes_up_to_date():
+    npc_manager = make_npc_manager(years=0)
+    npc_id = min(npc_manager.npcs)
+    npc_manager.set_npc_location(npc_id, "Nowhere")
+    npc_manager.set_npc_role(npc_id, "priest")
+    npc_manager.set_npc_marital_status(npc_id, "widowed")
+    assert npc_manager.find_npcs(location="Nowhere") == [(npc_id, npc_manager.npcs[npc_id])]
+    assert npc_id in npc_manager.role_index["priest"] and npc_id in npc_manager.marital_status_index["widowed"]
+
+    age = npc_manager.npcs[npc_id].age
+    npc_manager.remove_npc(npc_id)
+    assert "Nowhere" not in npc_manager.location_index
+    assert npc_id not in npc_manager.role_index["priest"]
+    assert all(found_id != npc_id for found_id, _ in npc_manager.find_npcs(age_min=age, age_max=age))
+    assert npc_id not in npc_manager.id_sampler
@@ -0,0 +1,73 @@
+"""
+Tests for promoting background NPC records to full Characters and demoting them again
+"""
+from game.characters.character import Character
+from game.characters.npc_manager import NPCRecord, PopulationConfig
+from game.simulation import HeadlessSimulation, RandomPolicy
+
+def make_game(seed=9):
+    """Set up a seeded game with a small population."""
+    simulation = HeadlessSimulation(RandomPolicy(seed=seed), seed=seed, population_config=PopulationConfig(target_npcs=50))
+    game_manager = simulation.game_manager
+    game_manager.setup_new_game("Aldric", "male", "merchant")
+    return game_manager
+
+def background_npc_id(npc_manager):
+    """Get the ID of an NPC that is still a compact record."""
+    return next(npc_id for npc_id, npc in sorted(npc_manager.npcs.items()) if isinstance(npc, NPCRecord))
+
+def test_promotion_rebuilds_the_same_character():
+    npc_manager = make_game().npc_manager
+    npc_id = background_npc_id(npc_manager)
+    record = npc_manager.npcs[npc_id]
+    
+    character = npc_manager.promote_npc(npc_id)
+    assert isinstance(character, Character)
+    assert npc_manager.promote_npc(npc_id) is character  # Promoting again keeps the Character
+    assert (character.name, character.role, character.age, character.marital_status) == \
+        (record.name, record.role, record.age, record.marital_status)
+    attributes = dict(character.attributes)
+    
+    assert npc_manager.demote_npc(npc_id) is record
+    assert npc_manager.demote_npc(npc_id) is None
+    assert npc_manager.promote_npc(npc_id).attributes == attributes
+
+def test_demotion_keeps_changes():
+    npc_manager = make_game().npc_manager
+    npc_id = background_npc_id(npc_manager)
+    character = npc_manager.promote_npc(npc_id)
+    character.name = "Renamed"
+    character.age += 5
+    character.marital_status = "widowed"
+    
+    record = npc_manager.demote_npc(npc_id)
+    assert npc_manager.npcs[npc_id] is record
+    assert (record.name, record.age, record.marital_status) == ("Renamed", character.age, "widowed")
+
+def test_only_unreferenced_npcs_are_demoted():
+    game_manager = make_game()
+    npc_manager = game_manager.npc_manager
+    kept_id, dropped_id = sorted(npc_id for npc_id, npc in npc_manager.npcs.items() if isinstance(npc, NPCRecord))[:2]
+    npc_manager.promote_npc(kept_id)
+    npc_manager.promote_npc(dropped_id)
+    game_manager.story_arc_manager.arc_npcs["test_arc"] = [kept_id]
+    
+    npc_manager.demote_unreferenced_npcs()
+    assert isinstance(npc_manager.npcs[kept_id], Character)
+    assert isinstance(npc_manager.npcs[dropped_id], NPCRecord)
+    assert kept_id in npc_manager.promoted
+    assert dropped_id not in npc_manager.promoted
+
+def test_promoted_and_background_npcs_age_together():
+    game_manager = make_game()
+    npc_manager = game_manager.npc_manager
+    promoted_id, background_id = sorted(npc_id for npc_id, npc in npc_manager.npcs.items()
+                                        if isinstance(npc, NPCRecord))[:2]
+    character = npc_manager.promote_npc(promoted_id)
+    game_manager.story_arc_manager.arc_npcs["test_arc"] = [promoted_id]
+    ages = {promoted_id: character.age, background_id: npc_manager.npcs[background_id].age}
+    
+    npc_manager.update_for_new_year()
+    assert npc_manager.npcs[promoted_id] is character  # Still referenced, so still promoted
+    for npc_id, age in ages.items():
+        assert npc_manager.npcs[npc_id].age == age + 1
@@ -0,0 +1,97 @@
+"""
+Tests for the per-kingdom shards of the yearly NPC update and their worker processes
+"""
+import json
+
+from game.characters.npc_manager import PopulationConfig
+from game.characters.npc_shards import ShardSet, ShardUpdate, roll_shard_year
+from game.simulation import HeadlessSimulation, RandomPolicy
+
+def population_config(workers):
+    """Configure a small population, rolled in the given workers however small."""
+    return PopulationConfig(target_npcs=150, workers=workers, parallel_min_npcs=0)
+
+def run_population(workers, years=25):
+    """Run a seeded lifetime and return its trace and final NPCs as JSON."""
+    simulation = HeadlessSimulation(RandomPolicy(seed=5), seed=11, population_config=population_config(workers))
+    trace = simulation.run("Aldric", "male", "merchant", max_years=years, follow_heirs=False)
+    npc_manager = simulation.game_manager.npc_manager
+    npcs = sorted((npc_id, npc.name, npc.role, npc.age, npc_manager.npc_locations[npc_id], npc.marital_status)
+                  for npc_id, npc in npc_manager.npcs.items())
+    npc_manager.close()
+    return json.dumps([trace.to_dict(), npcs], sort_keys=True, default=str)
+
+def test_workers_give_the_same_results():
+    expected = run_population(None)
+    assert run_population(1) == expected
+    assert run_population(3) == expected
+
+def test_workers_resync_after_rolling_in_process():
+    def run_years(workers, switch):
+        simulation = HeadlessSimulation(RandomPolicy(seed=5), seed=11, population_config=population_config(workers))
+        game_manager = simulation.game_manager
+        game_manager.setup_new_game("Aldric", "male", "merchant")
+        npc_manager = game_manager.npc_manager
+        for year in range(12):
+            # Every third year the population is rolled here and the workers fall out of date
+            npc_manager.population_config.parallel_min_npcs = 10 ** 9 if switch and year % 3 == 2 else 0
+            npc_manager.update_for_new_year()
+        npcs = sorted((npc_id, npc.name, npc.role, npc.age, npc_manager.npc_locations[npc_id], npc.marital_status)
+                      for npc_id, npc in npc_manager.npcs.items())
+        npc_manager.close()
+        return npcs
+
+    assert run_years(3, switch=True) == run_years(None, switch=False)
+
+def test_workers_see_changes_to_promoted_npcs():
+    def run_years(workers):
+        simulation = HeadlessSimulation(RandomPolicy(seed=5), seed=11, population_config=population_config(workers))
+        game_manager = simulation.game_manager
+        game_manager.setup_new_game("Aldric", "male", "merchant")
+        npc_manager = game_manager.npc_manager
+        npc_manager.update_for_new_year()
+        # Promoted Characters cast in a story arc are changed directly, without
+        # the NPC manager's setters
+        cast = sorted(npc_manager.npcs)[:60]
+        game_manager.story_arc_manager.arc_npcs["test_arc"] = list(cast)
+        for npc_id in cast:
+            character = npc_manager.promote_npc(npc_id)
+            character.role = "merchant" if character.role == "farmer" else "farmer"
+            character.marital_status = "single"
+        for _ in range(6):
+            npc_manager.update_for_new_year()
+        npcs = sorted((npc_id, npc.name, npc.role, npc.age, npc_manager.npc_locations[npc_id], npc.marital_status)
+                      for npc_id, npc in npc_manager.npcs.items())
+        npc_manager.close()
+        return npcs
+
+    assert run_years(3) == run_years(None)
+
+def test_shard_set_rolls_the_same_shards():
+    simulation = HeadlessSimulation(RandomPolicy(seed=2), seed=3, population_config=PopulationConfig(target_npcs=300))
+    game_manager = simulation.game_manager
+    game_manager.setup_new_game("Aldric", "male", "farmer")
+    npc_manager = game_manager.npc_manager
+    npc_manager.years_passed += 4
+    shards = npc_manager._make_shards()
+
+    names, cum_weights = npc_manager._settlement_weights()
+    update = ShardUpdate(npc_manager.years_passed, True, names, cum_weights)
+    for shard in shards:
+        update.seeds[shard.name] = shard.seed
+        for npc_id, location, age, role, marital_status in zip(shard.npc_ids, shard.locations, shard.ages,
+                                                               shard.roles, shard.marital_statuses):
+            update.changed.append((npc_id, shard.name, location, age - npc_manager.years_passed,
+                                   role, marital_status))
+    shard_set = ShardSet()
+    shard_set.apply(update)
+    assert shard_set.roll(update) == [roll_shard_year(shard) for shard in shards if shard.npc_ids]
+
+def test_shard_set_applies_moves_and_removals():
+    update = ShardUpdate(0, True, ["A", "B"], [1, 2], changed=[(1, "North", "A", 30, "farmer", "single"),
+                                                                (2, "North", "A", 40, "noble", "married")])
+    shard_set = ShardSet()
+    shard_set.apply(update)
+    shard_set.apply(ShardUpdate(1, False, ["A", "B"], [1, 2], changed=[(1, "South", "B", 30, "farmer", "single")],
+                                removed=[(1, "North"), (2, "North")]))
+    assert shard_set.members == {"North": {}, "South": {1: ("B", 30, "farmer", "single")}}
@@ -0,0 +1,80 @@
+"""
+Tests for the columnar store of background NPCs, with and without NumPy
+"""
+import pytest
+
+from game.characters.npc_store import create_npc_store, ROLES
+from game.mechanics.historical_constraints import HISTORICAL_CONSTRAINTS
+from game.simulation import HeadlessSimulation, RandomPolicy
+
+try:
+    import numpy
+except ImportError:  # NumPy is optional; its tests are skipped without it
+    numpy = None
+
+# Each test runs without NumPy, and with it when it is installed
+PATHS = [False, pytest.param(True, marks=pytest.mark.skipif(numpy is None, reason="NumPy is not installed"))]
+SETTLEMENTS = ("Ashford", "Brookholm", "Crowmere", "Dunwick")
+
+def records(store):
+    return [store.get_record(row) for row in range(len(store))]
+
+@pytest.mark.parametrize("use_numpy", PATHS)
+def test_new_npcs_follow_the_generation_rules(use_numpy):
+    store = create_npc_store(5000, seed=1, use_numpy=use_numpy, locations=SETTLEMENTS)
+    assert len(store) == 5000
+    for record in records(store):
+        assert record["role"] in HISTORICAL_CONSTRAINTS.get_allowed_roles(record["gender"])
+        low, high = {"noble": (20, 60), "knight": (20, 60), "priest": (25, 70)}.get(record["role"], (16, 70))
+        assert low <= record["age"] <= high
+        if record["role"] == "priest":
+            assert record["marital_status"] == "single"
+    assert set(store.count_by("role")) == set(ROLES)
+
+@pytest.mark.parametrize("use_numpy", PATHS)
+def test_npcs_spread_over_the_settlements(use_numpy):
+    store = create_npc_store(8000, seed=2, use_numpy=use_numpy, locations=SETTLEMENTS)
+    relocated = 0
+    for _ in range(15):
+        relocated += store.update_for_new_year().relocated
+    assert relocated > 0
+    counts = store.count_by("location")
+    assert set(counts) == set(SETTLEMENTS)
+    for count in counts.values():
+        assert count / len(store) == pytest.approx(0.25, abs=0.03)
+
+@pytest.mark.parametrize("use_numpy", PATHS)
+def test_settlements_are_drawn_by_weight(use_numpy):
+    store = create_npc_store(8000, seed=3, use_numpy=use_numpy, locations=("Hamlet", "City"), cum_weights=[1, 4])
+    assert store.count_by("location")["City"] / len(store) == pytest.approx(0.75, abs=0.03)
+
+@pytest.mark.parametrize("use_numpy", PATHS)
+def test_years_keep_the_rules(use_numpy):
+    store = create_npc_store(5000, seed=4, use_numpy=use_numpy)
+    died = 0
+    for _ in range(30):
+        year = store.update_for_new_year()
+        assert sum(year.deaths_by_role.values()) == year.died
+        assert year.relocated == 0  # There is nowhere else to go
+        died += year.died
+    assert died > 0 and len(store) == 5000
+    assert store.count_by("location") == {"town": 5000}
+    for record in records(store):
+        assert record["role"] in HISTORICAL_CONSTRAINTS.get_allowed_roles(record["gender"])
+
+@pytest.mark.parametrize("use_numpy", PATHS)
+def test_same_seed_same_population(use_numpy):
+    first = create_npc_store(2000, seed=5, use_numpy=use_numpy, locations=SETTLEMENTS)
+    second = create_npc_store(2000, seed=5, use_numpy=use_numpy, locations=SETTLEMENTS)
+    for _ in range(5):
+        assert first.update_for_new_year() == second.update_for_new_year()
+    assert records(first) == records(second)
+
+def test_background_population_lives_in_the_world():
+    game_manager = HeadlessSimulation(RandomPolicy(seed=6), seed=6).game_manager
+    game_manager.setup_new_game("Aldric", "male", "merchant")
+    population = game_manager.npc_manager.enable_population_store(5000)
+    game_manager._advance_year()
+    settlements = {settlement.name for settlement in game_manager.world.settlements}
+    assert set(population.count_by("location")) <= settlements
+    assert len(population.count_by("location")) > 1
@@ -0,0 +1,152 @@
+"""
+Tests for the success chance and outcome tables, and for resolving actions in
+batches, with and without NumPy
+"""
+import random
+from types import SimpleNamespace
+
+import pytest
+
+from game.characters.character import Character
+from game.mechanics.outcome_manager import (
+    OutcomeManager, OUTCOME_TYPES, BASE_SUCCESS_RATES, CRITICAL_FAILURE, FAILURE, SUCCESS, CRITICAL_SUCCESS,
+    _gold_reward, outcome_code)
+
+try:
+    import numpy
+except ImportError:  # NumPy is optional; its tests are skipped without it
+    numpy = None
+
+needs_numpy = pytest.mark.skipif(numpy is None, reason="NumPy is not installed")
+# Each test runs without NumPy, and with it when it is installed
+PATHS = [False, pytest.param(True, marks=needs_numpy)]
+
+def old_success_chance(action_type, skills, attributes):
+    """The success chance as worked out before the tables."""
+    base_chance = BASE_SUCCESS_RATES.get(action_type, 50)
+    skill_bonus = skills[action_type] // 10 if action_type in skills else 0
+    attribute_bonus = 0
+    if action_type == "trade":
+        attribute_bonus = (attributes.get("charisma", 0) + attributes.get("intelligence", 0)) // 4
+    elif action_type == "combat":
+        attribute_bonus = (attributes.get("strength", 0) + attributes.get("dexterity", 0)) // 4
+    return max(5, min(95, base_chance + skill_bonus + attribute_bonus))
+
+def old_outcome_type(success_chance, roll):
+    """The outcome of a roll as worked out before the tables."""
+    if roll <= 5:
+        return "critical_failure"
+    elif roll >= 95:
+        return "critical_success"
+    elif roll <= success_chance:
+        return "success"
+    return "failure"
+
+def make_characters(count, seed=1):
+    roles = ("merchant", "warrior", "farmer", "noble")
+    return [Character(f"NPC {i}", "male", roles[i % len(roles)], rng=random.Random(seed + i)) for i in range(count)]
+
+def frequencies(codes):
+    codes = list(codes)
+    return [codes.count(code) / len(codes) for code in range(len(OUTCOME_TYPES))]
+
+@pytest.mark.parametrize("action_type", sorted(BASE_SUCCESS_RATES) + ["unknown"])
+def test_success_chances_match_the_old_formula(action_type):
+    manager = OutcomeManager()
+    # Stats outside 0-100 are not in the table, but must still be worked out the same
+    for skill in list(range(-10, 111)) + [None]:
+        skills = {} if skill is None else {action_type: skill}
+        for attribute_sum in range(-10, 211):
+            first = attribute_sum // 2
+            for names in (("charisma", "intelligence"), ("strength", "dexterity")):
+                attributes = {names[0]: first, names[1]: attribute_sum - first}
+                character = SimpleNamespace(skills=skills, attributes=attributes)
+                assert (manager.calculate_success_chance(character, action_type)
+                        == old_success_chance(action_type, skills, attributes))
+
+def test_outcome_codes_match_the_old_rules():
+    for success_chance in range(-50, 201):
+        for roll in range(1, 101):
+            assert OUTCOME_TYPES[outcome_code(success_chance, roll)] == old_outcome_type(success_chance, roll)
+
+@pytest.mark.parametrize("modifier", [-200, -20, 0, 20, 200])
+def test_get_outcome_matches_the_old_rules(modifier):
+    character = make_characters(1)[0]
+    success_chance = OutcomeManager().calculate_success_chance(character, "combat") + modifier
+    for seed in range(200):
+        # The first draw of get_outcome is the roll
+        roll = random.Random(seed).randint(1, 100)
+        outcome = OutcomeManager(random.Random(seed)).get_outcome(character, "combat", modifier)
+        outcome_type = old_outcome_type(success_chance, roll)
+        assert outcome.success == (outcome_type in ("success", "critical_success"))
+        assert outcome.is_critical == outcome_type.startswith("critical")
+        assert outcome.rewards["gold"] == _gold_reward("combat", outcome_type)
+
+@pytest.mark.parametrize("use_numpy", PATHS)
+def test_same_seed_same_outcomes(use_numpy):
+    characters = make_characters(50)
+    actions = ["trade", "combat", "craft", "social", "farm"] * 10
+    first = OutcomeManager(random.Random(5)).resolve_batch(characters, actions, use_numpy=use_numpy)
+    second = OutcomeManager(random.Random(5)).resolve_batch(characters, actions, use_numpy=use_numpy)
+    assert list(first.codes) == list(second.codes)
+    assert list(first.gold) == list(second.gold)
+
+@pytest.mark.parametrize("use_numpy", PATHS)
+def test_gold_follows_outcomes(use_numpy):
+    characters = make_characters(40)
+    actions = ["trade", "combat", "craft", "study"] * 10
+    outcomes = OutcomeManager(random.Random(2)).resolve_batch(characters, actions, use_numpy=use_numpy)
+    assert len(outcomes) == len(outcomes.gold) == 40
+    for index, action_type in enumerate(actions):
+        assert outcomes.gold[index] == _gold_reward(action_type, outcomes.outcome_type(index))
+
+@pytest.mark.parametrize("use_numpy", PATHS)
+def test_extreme_modifiers_leave_only_critical_outcomes_to_chance(use_numpy):
+    character = make_characters(1)[0]
+    manager = OutcomeManager(random.Random(3))
+    certain = manager.resolve_batch(character, ["combat"] * 2000, modifiers=200, use_numpy=use_numpy)
+    assert set(certain.codes) == {CRITICAL_FAILURE, SUCCESS, CRITICAL_SUCCESS}
+    hopeless = manager.resolve_batch(character, ["combat"] * 2000, modifiers=[-200] * 2000, use_numpy=use_numpy)
+    assert set(hopeless.codes) == {CRITICAL_FAILURE, FAILURE, CRITICAL_SUCCESS}
+
+@pytest.mark.parametrize("use_numpy", PATHS)
+def test_frequencies_follow_the_success_chance(use_numpy):
+    character = make_characters(1)[0]
+    manager = OutcomeManager(random.Random(4))
+    chance = min(94, manager.calculate_success_chance(character, "trade"))
+    count = 100000
+    outcomes = manager.resolve_batch([character] * count, "trade", use_numpy=use_numpy)
+    # Rolls of 1-5 are critical failures, 95-100 critical successes, and the rest succeed up to the chance
+    expected = [0.05, (94 - chance) / 100, (chance - 5) / 100, 0.06]
+    for observed, wanted in zip(frequencies(outcomes.codes), expected):
+        assert observed == pytest.approx(wanted, abs=0.01)
+
+@needs_numpy
+def test_numpy_and_python_agree():
+    characters = make_characters(20)
+    actions = ["trade", "combat", "diplomacy", "craft", "study"] * 4
+    count = 100000
+    batch = ([characters[i % 20] for i in range(count)], [actions[i % 20] for i in range(count)])
+    with_numpy = OutcomeManager(random.Random(6)).resolve_batch(*batch, modifiers=10, use_numpy=True)
+    without = OutcomeManager(random.Random(6)).resolve_batch(*batch, modifiers=10, use_numpy=False)
+    assert len(with_numpy) == len(without) == count
+    for observed, wanted in zip(frequencies(with_numpy.codes), frequencies(without.codes)):
+        assert observed == pytest.approx(wanted, abs=0.01)
+    assert sum(with_numpy.gold) / count == pytest.approx(sum(without.gold) / count, rel=0.02)
+
+@pytest.mark.parametrize("use_numpy", PATHS)
+def test_any_iterable_is_accepted(use_numpy):
+    characters = make_characters(10)
+    from_list = OutcomeManager(random.Random(7)).resolve_batch(characters, ["craft"] * 10, use_numpy=use_numpy)
+    from_generators = OutcomeManager(random.Random(7)).resolve_batch(
+        (character for character in characters), iter(["craft"] * 10), modifiers=(0 for _ in range(10)),
+        use_numpy=use_numpy)
+    assert list(from_generators.codes) == list(from_list.codes)
+
+def test_lengths_must_match():
+    characters = make_characters(3)
+    manager = OutcomeManager(random.Random(8))
+    with pytest.raises(ValueError):
+        manager.resolve_batch(characters, ["trade", "combat"])
+    with pytest.raises(ValueError):
+        manager.resolve_batch(characters, "trade", modifiers=[1, 2])
@@ -0,0 +1,58 @@
+"""
+Tests for the compact store of a character's relationships
+"""
+from game.characters.relationship_store import RelationshipStore, status_code, RELATIONSHIP_STATUSES
+
+def test_status_follows_level():
+    assert [RELATIONSHIP_STATUSES[status_code(level)] for level in (0, 19, 20, 40, 59, 60, 80, 100)] == [
+        "enemy", "enemy", "distant", "acquaintance", "acquaintance", "friend", "close friend", "close friend"]
+
+def test_add_adjust_and_get():
+    store = RelationshipStore()
+    assert len(store) == 0 and store.get(1) is None
+    store.add(1, 10)
+    store.add(2, 20, level=70)
+    assert store.get(1) == (10, 40, "acquaintance")
+    assert store.get(2) == (20, 70, "friend")
+    assert store.adjust(1, 25) == 65
+    assert store.get(1) == (10, 65, "friend")
+    assert store.adjust(1, 100) == 100
+    assert store.adjust(3, 5) is None
+
+    # Adding the same NPC again replaces the relationship
+    store.add(2, 21, level=10)
+    assert len(store) == 2 and store.get(2) == (21, 10, "enemy")
+
+def test_new_relationships_keep_their_status_as_they_drift():
+    store = RelationshipStore()
+    store.add(7, 3)
+    store.add_unknown("Joan", "farmer")
+    for _ in range(5):
+        for _, _, level, status in store.items():
+            assert status == RELATIONSHIP_STATUSES[status_code(level)] == "acquaintance"
+        store.drift(2)
+
+def test_top_and_drift():
+    store = RelationshipStore()
+    for serial, level in ((1, 90), (2, 10), (3, 50), (4, 41)):
+        store.add(serial, serial, level=level)
+    assert [serial for serial, *_ in store.top(2)] == [1, 3]
+
+    assert store.drift(2) == 0
+    assert [level for _, _, level, _ in store.items()] == [88, 12, 48, 40]
+    for _ in range(30):
+        store.drift(2)
+    assert {level for _, _, level, _ in store.items()} == {40}
+    assert {status for *_, status in store.items()} == {"acquaintance"}
+
+def test_retain_keeps_unknown_snapshots_in_step():
+    store = RelationshipStore()
+    store.add(1, 10)
+    first = store.add_unknown("Geoffrey", "merchant", 70)
+    second = store.add_unknown("Lucy", "noble", 20)
+    assert first < 0 and second < 0 and first != second
+    assert store.snapshot(first) == ("Geoffrey", "merchant") and store.snapshot(1) is None
+
+    assert store.retain(lambda serial, npc_id: serial != first) == 1
+    assert list(store.unknown()) == [("Lucy", "noble", 20, "distant")]
+    assert store.add_unknown("Joan", "farmer") not in (second, 1)
@@ -0,0 +1,77 @@
+"""
+Tests for saving and loading games, and the relationships saved with the player
+"""
+import pytest
+
+from game.simulation import HeadlessSimulation, RandomPolicy
+
+@pytest.fixture(autouse=True)
+def save_dir(tmp_path, monkeypatch):
+    """Keep the saves of every test in its own directory."""
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+def play(seed, years=15):
+    """Start a seeded game and socialize for some years."""
+    game_manager = HeadlessSimulation(RandomPolicy(seed=seed), seed=seed).game_manager
+    game_manager.setup_new_game("Aldric", "male", "merchant")
+    for _ in range(years):
+        for _ in range(3):
+            if "Socialize" in game_manager.player.get_actions():
+                game_manager._perform_action("Socialize")
+        game_manager._advance_year()
+    return game_manager
+
+def known_people(game_manager):
+    """Get the player's relationships as (name, role, level, status) tuples."""
+    relationships = game_manager.npc_manager.get_relationships(game_manager.player.relationships)
+    return sorted((npc.name, npc.role, level, status) for _, npc, level, status in relationships)
+
+def save(game_manager):
+    assert game_manager.save_system.save_game(game_manager)
+    return game_manager.save_system.get_save_files()[-1]
+
+def test_round_trip_keeps_the_player():
+    game_manager = play(3)
+    player = game_manager.player
+    save_file = save(game_manager)
+
+    other = play(4, years=0)
+    assert other.load_game(save_file)
+    loaded = other.player
+    assert (loaded.name, loaded.role, loaded.age, loaded.wealth) == (player.name, player.role, player.age, player.wealth)
+    assert dict(loaded.skills) == dict(player.skills)
+    assert dict(loaded.attributes) == dict(player.attributes)
+    assert dict(loaded.reputation.reputations) == dict(player.reputation.reputations)
+    assert other.game_year == game_manager.game_year
+
+def test_loading_into_the_same_game_keeps_relationships_bound():
+    game_manager = play(3)
+    people = known_people(game_manager)
+    assert people
+    save_file = save(game_manager)
+
+    assert game_manager.load_game(save_file)
+    assert known_people(game_manager) == people
+
+@pytest.mark.parametrize("seed", [3, 4])
+def test_loading_into_another_game_keeps_relationships_unknown(seed):
+    game_manager = play(3)
+    people = known_people(game_manager)
+    save_file = save(game_manager)
+
+    # The same seed regenerates NPCs with the same serial numbers, who must not be taken for the saved ones
+    other = play(seed, years=0)
+    assert other.load_game(save_file)
+    relationships = other.player.relationships
+    assert other.npc_manager.get_relationships(relationships) == []
+    assert sorted(relationships.unknown()) == people
+
+    # Unknown relationships survive the yearly pruning and another save
+    other._advance_year()
+    assert len(list(relationships.unknown())) == len(people)
+    save_file.unlink()
+    resaved = save(other)
+    third = play(5, years=0)
+    assert third.load_game(resaved)
+    assert sorted(name for name, *_ in third.player.relationships.unknown()) == sorted(name for name, *_ in people)
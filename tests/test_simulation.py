@@ -0,0 +1,25 @@
+"""
+Tests for the headless simulation driver and its seeded random streams
+"""
+import json
+
+from game.simulation import HeadlessSimulation, RandomPolicy
+
+def run_trace(seed, policy_seed=5, role="merchant", gender="male", max_years=40):
+    """Run one seeded lifetime and return its trace as JSON."""
+    simulation = HeadlessSimulation(RandomPolicy(seed=policy_seed), record_messages=True, seed=seed)
+    trace = simulation.run("Aldric", gender, role, max_years=max_years)
+    return json.dumps(trace.to_dict(), sort_keys=True, default=str)
+
+def test_same_seed_replays_exactly():
+    for role, gender in (("merchant", "male"), ("farmer", "female"), ("king", "male")):
+        assert run_trace(42, role=role, gender=gender) == run_trace(42, role=role, gender=gender)
+
+def test_different_seeds_differ():
+    assert run_trace(42) != run_trace(43)
+
+def test_trace_has_a_record_per_year():
+    simulation = HeadlessSimulation(RandomPolicy(seed=1), seed=7)
+    trace = simulation.run("Aldric", "male", "farmer", max_years=10, follow_heirs=False)
+    assert 1 <= len(trace.years) <= 10
+    assert [year.year for year in trace.years] == sorted(year.year for year in trace.years)
@@ -0,0 +1,69 @@
+"""
+Tests for the social graph between NPCs, and the decay of its fading ties
+"""
+import random
+
+import pytest
+
+from game.characters.social_graph import SocialGraph, DECAY_RATES, EDGE_TYPES
+
+def build_graph(seed=1, npcs=60, ties=400):
+    """Build a graph of random ties of every type."""
+    rng = random.Random(seed)
+    graph = SocialGraph()
+    for _ in range(ties):
+        npc_id, other_id = rng.sample(range(npcs), 2)
+        graph.add_edge(npc_id, other_id, rng.choice(EDGE_TYPES), round(rng.uniform(0.05, 1.0), 3))
+    return graph
+
+def ties(graph):
+    return {(npc_id, other_id, edge_type): weight for npc_id in graph.adjacency
+            for other_id, edge_type, weight in graph.neighbors(npc_id)}
+
+def test_ties_are_seen_from_both_ends():
+    graph = SocialGraph()
+    graph.add_edge(1, 2, "liege", 0.8)
+    graph.add_edge(1, 3, "friend", 0.5)
+    graph.add_edge(1, 1, "friend")
+    assert len(graph) == 2
+    assert graph.get_weight(2, 1, "vassal") == 0.8 and graph.get_weight(2, 1, "liege") is None
+    assert graph.neighbors(1) == [(2, "liege", 0.8), (3, "friend", 0.5)]
+    assert graph.neighbor_ids([1], ["friend"]) == {3}
+
+    assert graph.remove_edge(2, 1, "vassal") and not graph.remove_edge(2, 1, "vassal")
+    graph.remove_npc(3)
+    assert len(graph) == 0 and graph.adjacency == {}
+
+def test_lazy_decay_matches_decaying_every_tie():
+    lazy = build_graph()
+    eager = build_graph()
+    for year in range(40):
+        lazy.decay()
+        # Passing the rates decays every tie in one pass
+        eager.decay({EDGE_TYPES[code]: rate for code, rate in DECAY_RATES.items()})
+        lazy_ties = ties(lazy)
+        eager_ties = ties(eager)
+        assert lazy_ties.keys() == eager_ties.keys(), year
+        for key, weight in lazy_ties.items():
+            assert weight == pytest.approx(eager_ties[key])
+        assert len(lazy) == len(eager)
+
+def test_decay_takes_other_rates_and_minimum_weights():
+    graph = SocialGraph()
+    graph.add_edge(1, 2, "friend", 0.5)
+    graph.add_edge(1, 3, "rival", 0.5)
+    graph.add_edge(1, 4, "kin", 0.5)
+
+    assert graph.decay({"kin": 0.5}) == 0
+    assert graph.get_weight(1, 4, "kin") == pytest.approx(0.25)
+    assert graph.get_weight(1, 2, "friend") == pytest.approx(0.5)
+
+    # A higher minimum weight drops the ties it leaves too weak
+    assert graph.decay(min_weight=0.46) == 1
+    assert graph.get_weight(1, 2, "friend") is None
+    assert graph.get_weight(1, 3, "rival") == pytest.approx(0.475)
+
+    # The graph's own decay carries on from the decayed weights
+    graph.decay()
+    assert graph.get_weight(1, 3, "rival") == pytest.approx(0.475 * 0.95)
+    assert graph.get_weight(1, 4, "kin") == pytest.approx(0.25)
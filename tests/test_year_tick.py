@@ -0,0 +1,83 @@
+"""
+Tests for the phased year tick pipeline and the game's year
+"""
+import pytest
+
+from game.mechanics.year_tick import YearTickPipeline
+from game.simulation import HeadlessSimulation, RandomPolicy
+
+class FakeClock:
+    """A clock that moves one second every time it is read."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        self.now += 1.0
+        return self.now
+
+def make_pipeline(calls, observed=None):
+    """Build a pipeline of phases a, b and c, which note their names in calls when run."""
+    observer = None
+    if observed is not None:
+        def observer(name, seconds):
+            observed.append((name, seconds))
+    pipeline = YearTickPipeline(clock=FakeClock(), observer=observer)
+    for name in ("a", "b", "c"):
+        pipeline.add_phase(name, lambda name=name: calls.append(name))
+    return pipeline
+
+def test_phases_run_in_order_and_can_be_rearranged():
+    calls = []
+    pipeline = make_pipeline(calls)
+    pipeline.add_phase("first", lambda: calls.append("first"), before="a")
+    pipeline.add_phase("middle", lambda: calls.append("middle"), after="b")
+    assert pipeline.run()
+    assert calls == ["first", "a", "b", "middle", "c"]
+
+    pipeline.remove_phase("middle")
+    pipeline.reorder(["c", "b", "a", "first"])
+    calls.clear()
+    pipeline.run()
+    assert calls == ["c", "b", "a", "first"]
+
+    with pytest.raises(ValueError):
+        pipeline.add_phase("a", lambda: None)
+    with pytest.raises(ValueError):
+        pipeline.reorder(["a", "b"])
+    with pytest.raises(KeyError):
+        pipeline.get_phase("missing")
+
+def test_phases_are_timed_skipped_and_stopped():
+    calls = []
+    observed = []
+    pipeline = make_pipeline(calls, observed)
+    pipeline.set_enabled("b", False)
+    pipeline.run()
+    assert calls == ["a", "c"]
+    assert observed == [("a", 1.0), ("c", 1.0)]
+
+    assert not pipeline.run(should_stop=lambda: calls[-1] == "a")
+    stats = pipeline.get_stats()
+    assert list(stats) == ["a", "b", "c"]
+    assert stats["a"]["calls"] == 2 and stats["a"]["mean_time"] == 1.0
+    assert stats["b"]["calls"] == 0 and stats["b"]["skips"] == 1  # The stopped tick never reached it
+    assert stats["c"]["calls"] == 1
+    assert pipeline.ticks == 2
+
+    pipeline.reset_stats()
+    assert pipeline.ticks == 0
+    assert all(phase["calls"] == phase["skips"] == 0 for phase in pipeline.get_stats().values())
+
+def test_a_year_advances_the_calendar_and_player_once():
+    game_manager = HeadlessSimulation(RandomPolicy(seed=1), seed=1).game_manager
+    game_manager.setup_new_game("Aldric", "male", "merchant")
+    assert game_manager.year_pipeline.phase_names() == ["events", "story_arcs", "family", "npcs", "world", "ageing"]
+    for _ in range(5):
+        year, age = game_manager.game_year, game_manager.player.age
+        game_manager._advance_year()
+        if not game_manager.player.is_alive():
+            break
+        assert (game_manager.game_year, game_manager.player.age) == (year + 1, age + 1)
+    stats = game_manager.year_pipeline.get_stats()
+    assert stats["ageing"]["calls"] == game_manager.year_pipeline.ticks > 0